@@ -0,0 +1,156 @@
+"""
+Compares decoding hot /info payloads with the stdlib json module against hyperliquid.utils.fast_json (orjson when
+installed), and the cost of float()-ing the decoded strings on every read against parsing them once with
+hyperliquid.utils.parsers.
+
+Payloads are recorded from the live API into examples/recorded_payloads/ on the first run (pass --offline to use
+synthetic payloads of the same shape instead) and replayed from disk afterwards, so runs are comparable.
+
+    python examples/benchmark_json_decode.py [--offline] [--reads 20]
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+import tracemalloc
+
+from hyperliquid.api import API
+from hyperliquid.utils import constants, fast_json
+from hyperliquid.utils.parsers import parse_asset_ctxs, parse_l2_levels, parse_mids
+
+RECORD_DIR = os.path.join(os.path.dirname(__file__), "recorded_payloads")
+PAYLOADS = {
+    "allMids": {"type": "allMids"},
+    "l2Book": {"type": "l2Book", "coin": "BTC"},
+    "metaAndAssetCtxs": {"type": "metaAndAssetCtxs"},
+}
+
+
+def synthetic_payloads():
+    rng = random.Random(7)
+    coins = [f"COIN{i}" for i in range(400)]
+    mids = {coin: f"{rng.uniform(0.001, 100000):.6g}" for coin in coins}
+
+    def level(px):
+        return {"px": f"{px:.1f}", "sz": f"{rng.uniform(0, 10):.5f}", "n": rng.randint(1, 20)}
+
+    book = {
+        "coin": "BTC",
+        "time": 0,
+        "levels": [[level(100000 - i) for i in range(20)], [level(100001 + i) for i in range(20)]],
+    }
+    ctx_keys = ["markPx", "midPx", "oraclePx", "prevDayPx", "dayNtlVlm", "funding", "openInterest", "premium"]
+    meta_and_ctxs = [
+        {"universe": [{"name": coin, "szDecimals": 2, "maxLeverage": 20} for coin in coins]},
+        [{key: f"{rng.uniform(0, 1000):.6g}" for key in ctx_keys} for _ in coins],
+    ]
+    return {"allMids": mids, "l2Book": book, "metaAndAssetCtxs": meta_and_ctxs}
+
+
+def load_payloads(offline):
+    if offline:
+        return {name: json.dumps(payload).encode() for name, payload in synthetic_payloads().items()}
+    os.makedirs(RECORD_DIR, exist_ok=True)
+    api = None
+    recorded = {}
+    for name, request in PAYLOADS.items():
+        path = os.path.join(RECORD_DIR, f"{name}.json")
+        if not os.path.exists(path):
+            api = api or API(constants.MAINNET_API_URL)
+            response = api.transport.post(api.base_url + "/info", request)
+            with open(path, "wb") as f:
+                f.write(response.content)
+        with open(path, "rb") as f:
+            recorded[name] = f.read()
+    return recorded
+
+
+def measure(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def report(label, baseline, candidate):
+    (base_t, base_mem), (cand_t, cand_mem) = baseline, candidate
+    print(
+        f"  {label:<28} {base_t * 1e6:10.1f}us {base_mem / 1024:8.1f}KiB  ->  "
+        f"{cand_t * 1e6:10.1f}us {cand_mem / 1024:8.1f}KiB  ({base_t / cand_t:4.1f}x)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--offline", action="store_true", help="use synthetic payloads instead of recordings")
+    parser.add_argument("--reads", type=int, default=20, help="times each decoded payload is read per decode")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.offline)
+    print(f"fast_json backend: {fast_json.BACKEND}, {args.reads} reads per decode")
+
+    for name, raw in payloads.items():
+        print(f"{name} ({len(raw) / 1024:.1f}KiB)")
+        stdlib = measure(lambda: json.loads(raw.decode()), args.repeat)
+        report("decode", stdlib, measure(lambda: fast_json.loads(raw), args.repeat))
+
+    mids_raw = payloads["allMids"]
+    coins = list(json.loads(mids_raw))
+
+    def mids_strings():
+        mids = json.loads(mids_raw.decode())
+        for _ in range(args.reads):
+            sum(float(mids[coin]) for coin in coins)
+
+    def mids_parsed():
+        mids = parse_mids(fast_json.loads(mids_raw))
+        for _ in range(args.reads):
+            sum(mids.prices)
+
+    book_raw = payloads["l2Book"]
+
+    def book_strings():
+        book = json.loads(book_raw.decode())
+        for _ in range(args.reads):
+            sum(float(lvl["sz"]) * float(lvl["px"]) for lvl in book["levels"][0][:10])
+            sum(float(lvl["sz"]) * float(lvl["px"]) for lvl in book["levels"][1][:10])
+
+    def book_parsed():
+        book = parse_l2_levels(fast_json.loads(book_raw))
+        for _ in range(args.reads):
+            book.depth(10)
+
+    ctxs_raw = payloads["metaAndAssetCtxs"]
+
+    def ctxs_strings():
+        _, ctxs = json.loads(ctxs_raw.decode())
+        for _ in range(args.reads):
+            for ctx in ctxs:
+                float(ctx.get("markPx", 0)) - float(ctx.get("prevDayPx", 0))
+                float(ctx.get("dayNtlVlm", 0))
+
+    def ctxs_parsed():
+        ctxs = parse_asset_ctxs(fast_json.loads(ctxs_raw))
+        mark, prev, volume = ctxs["markPx"], ctxs["prevDayPx"], ctxs["dayNtlVlm"]
+        for _ in range(args.reads):
+            for i in range(len(ctxs)):
+                mark[i] - prev[i]
+                volume[i]
+
+    print("decode + repeated reads")
+    report("allMids", measure(mids_strings, args.repeat), measure(mids_parsed, args.repeat))
+    report("l2Book depth(10)", measure(book_strings, args.repeat), measure(book_parsed, args.repeat))
+    report("metaAndAssetCtxs", measure(ctxs_strings, args.repeat), measure(ctxs_parsed, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+import threading
+import time
+
+from hyperliquid.api import API
+from hyperliquid.user_streams import UserStreamPool, get_user_streams
+from hyperliquid.utils.types import Any, Dict, NamedTuple, Optional
+
+# Per-user clearinghouse state pushed by the webData2 stream (see user_streams), so positions, margin and withdrawable
+# are read from memory instead of a clearinghouseState request per trade. Once enable_account_cache(base_url) was
+# called, Info.user_state() for the default dex is answered from the cache while the state is fresh. Every state is
+# parsed once into an immutable AccountState that is swapped in whole, so a reader never sees a half-applied update.
+# A fill of the user (userFills channel) invalidates the state until a newer one arrives, so the bot's own trades are
+# never read back stale. Only the first max_streamed users get streams; the rest are refreshed over REST when stale.
+MAX_AGE = 5.0
+MAX_STREAMED = 100
+
+
+def _float(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+class MarginSummary(NamedTuple):
+    account_value: float
+    total_margin_used: float
+    total_ntl_pos: float
+    total_raw_usd: float
+
+
+def _margin_summary(raw: Dict[str, Any]) -> MarginSummary:
+    return MarginSummary(
+        float(raw.get("accountValue", 0)),
+        float(raw.get("totalMarginUsed", 0)),
+        float(raw.get("totalNtlPos", 0)),
+        float(raw.get("totalRawUsd", 0)),
+    )
+
+
+class Position(NamedTuple):
+    coin: str
+    szi: float
+    entry_px: Optional[float]
+    position_value: float
+    unrealized_pnl: float
+    return_on_equity: float
+    liquidation_px: Optional[float]
+    margin_used: float
+    leverage: int
+    leverage_type: str
+
+
+def _position(raw: Dict[str, Any]) -> Position:
+    leverage = raw.get("leverage") or {}
+    return Position(
+        raw["coin"],
+        float(raw["szi"]),
+        _float(raw.get("entryPx")),
+        float(raw.get("positionValue", 0)),
+        float(raw.get("unrealizedPnl", 0)),
+        float(raw.get("returnOnEquity", 0)),
+        _float(raw.get("liquidationPx")),
+        float(raw.get("marginUsed", 0)),
+        int(leverage.get("value", 0)),
+        leverage.get("type", "cross"),
+    )
+
+
+class AccountState:
+    """One clearinghouseState of a user, parsed to floats. raw is the response itself: treat it as read-only."""
+
+    def __init__(self, address: str, raw: Dict[str, Any]):
+        self.address = address
+        self.raw = raw
+        self.time: int = raw.get("time", 0)
+        self.received_at = time.time()
+        self.margin_summary = _margin_summary(raw.get("marginSummary", {}))
+        self.cross_margin_summary = _margin_summary(raw.get("crossMarginSummary", {}))
+        self.withdrawable = float(raw.get("withdrawable", 0))
+        positions = (_position(item["position"]) for item in raw.get("assetPositions", []))
+        self.positions: Dict[str, Position] = {position.coin: position for position in positions}
+
+    @property
+    def account_value(self) -> float:
+        return self.margin_summary.account_value
+
+    def position(self, coin: str) -> Optional[Position]:
+        return self.positions.get(coin)
+
+    def exposure(self) -> float:
+        """Notional of all open positions."""
+        return sum(abs(position.position_value) for position in self.positions.values())
+
+    def age(self) -> float:
+        return time.time() - self.received_at
+
+
+class AccountCache:
+    def __init__(
+        self,
+        base_url: str,
+        streams: Optional[UserStreamPool] = None,
+        max_age: float = MAX_AGE,
+        max_streamed: int = MAX_STREAMED,
+    ):
+        self.base_url = base_url
+        self.streams = streams
+        self.max_age = max_age
+        self.max_streamed = max_streamed
+        self._states: Dict[str, AccountState] = {}
+        # address -> time of the fill that invalidated its state
+        self._invalid: Dict[str, int] = {}
+        self._streamed: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        self._api = API(base_url)
+        self.hits = 0
+        self.rest_updates = 0
+        self.stream_updates = 0
+        self.invalidations = 0
+
+    def start(self, streams: Optional[UserStreamPool] = None) -> "AccountCache":
+        with self._lock:
+            if self.streams is None:
+                self.streams = streams or get_user_streams(self.base_url)
+        return self
+
+    def _follow(self, address: str) -> None:
+        if address in self._fetch_locks:
+            return
+        with self._lock:
+            if address in self._fetch_locks:
+                return
+            self._fetch_locks[address] = threading.Lock()
+            streams = self.streams if sum(self._streamed.values()) < self.max_streamed else None
+            self._streamed[address] = streams is not None
+        if streams is not None:
+            streams.subscribe("webData2", self._on_web_data, user=address)
+            streams.subscribe("userFills", self._on_fills, user=address)
+
+    def _live(self, address: str) -> bool:
+        return self.streams is not None and self.streams.connected_for(address)
+
+    def _on_web_data(self, message: Dict[str, Any]) -> None:
+        data = message.get("data")
+        if isinstance(data, dict) and isinstance(data.get("clearinghouseState"), dict):
+            self.update(data.get("user", "").lower(), data["clearinghouseState"])
+            self.stream_updates += 1
+
+    def _on_fills(self, message: Dict[str, Any]) -> None:
+        data = message.get("data")
+        if not isinstance(data, dict) or data.get("isSnapshot") or not data.get("fills"):
+            return
+        self.invalidate(data.get("user", ""), max(fill.get("time", 0) for fill in data["fills"]))
+
+    def update(self, address: str, raw: Dict[str, Any], from_rest: bool = False) -> AccountState:
+        """Apply a clearinghouseState of address, from the stream or from an /info response."""
+        state = AccountState(address, raw)
+        with self._lock:
+            current = self._states.get(address)
+            if current is not None and state.time and state.time < current.time:
+                # a push that was overtaken by a newer REST response
+                return current
+            self._states[address] = state
+            invalidated_at = self._invalid.get(address)
+            # a response to a request sent before the fill still predates it
+            if invalidated_at is not None and (state.time >= invalidated_at or not state.time):
+                del self._invalid[address]
+            if from_rest:
+                self.rest_updates += 1
+        return state
+
+    def invalidate(self, address: str, fill_time: Optional[int] = None) -> None:
+        """Force the next read of address over REST until a state as of fill_time (default: any newer) arrives."""
+        with self._lock:
+            self._invalid[address.lower()] = fill_time or 0
+            self.invalidations += 1
+
+    def cached(self, address: str) -> Optional[AccountState]:
+        """The state of address if it is fresh and valid, else None; never makes a request."""
+        address = address.lower()
+        self._follow(address)
+        state = self._states.get(address)
+        if state is None or address in self._invalid or state.age() > self.max_age:
+            return None
+        self.hits += 1
+        return state
+
+    def state(self, address: str) -> AccountState:
+        """The state of address, fetched over REST only when missing, stale or invalidated."""
+        state = self.cached(address)
+        if state is not None:
+            return state
+        address = address.lower()
+        with self._fetch_locks[address]:
+            # another thread may have refreshed it while this one waited
+            state = self.cached(address)
+            if state is None:
+                raw = self._api.post("/info", {"type": "clearinghouseState", "user": address, "dex": ""})
+                state = self.update(address, raw, from_rest=True)
+            return state
+
+    def user_state(self, address: str) -> Dict[str, Any]:
+        """Like Info.user_state(address): the raw response, served from memory when fresh."""
+        return self.state(address).raw
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "users": len(self._states),
+            "streamed": sum(self._streamed.values()),
+            "hits": self.hits,
+            "rest_updates": self.rest_updates,
+            "stream_updates": self.stream_updates,
+            "invalidations": self.invalidations,
+            "live": sum(1 for address, streamed in list(self._streamed.items()) if streamed and self._live(address)),
+        }
+
+
+_caches: Dict[str, AccountCache] = {}
+_caches_lock = threading.Lock()
+
+
+def enable_account_cache(base_url: str, max_age: float = MAX_AGE) -> AccountCache:
+    """Start the shared cache for base_url; Info.user_state() of every client for it is served from it afterwards."""
+    with _caches_lock:
+        cache = _caches.get(base_url)
+        if cache is None:
+            cache = AccountCache(base_url, max_age=max_age)
+            _caches[base_url] = cache
+        else:
+            cache.max_age = max_age
+    return cache.start()
+
+
+def get_account_cache(base_url: str) -> Optional[AccountCache]:
+    return _caches.get(base_url)
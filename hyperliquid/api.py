@@ -2,41 +2,71 @@ import json
 import logging
 from json import JSONDecodeError
 
-import requests
-
+from hyperliquid.rate_limiter import RateLimiter, get_rate_limiter, request_lane, request_weight, response_weight
+from hyperliquid.transport import get_transport
+from hyperliquid.utils import fast_json
 from hyperliquid.utils.constants import MAINNET_API_URL
 from hyperliquid.utils.error import ClientError, ServerError
-from hyperliquid.utils.types import Any
+from hyperliquid.utils.types import Any, Optional
+from hyperliquid.ws_transport import Transport
 
 
 class API:
-    def __init__(self, base_url=None):
+    # AsyncAPI lays out the same attributes, so AsyncInfo and AsyncExchange, which inherit from both, see one type for
+    # each. transport is None only on an AsyncAPI that posts through aiohttp; session is the requests.Session here (None
+    # over a websocket) and the aiohttp.ClientSession there.
+    base_url: str
+    transport: Optional[Transport]
+    session: Any
+    rate_limiter: RateLimiter
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         self.base_url = base_url or MAINNET_API_URL
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
+        self.transport = transport = transport or get_transport(self.base_url)
+        self.session = transport.session
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.base_url)
         self._logger = logging.getLogger(__name__)
 
     def post(self, url_path: str, payload: Any = None) -> Any:
         payload = payload or {}
         url = self.base_url + url_path
-        response = self.session.post(url, json=payload)
-        self._handle_exception(response)
+        self.rate_limiter.acquire(
+            request_weight(url_path, payload), request_lane(url_path, payload), self._rate_limit_address(url_path)
+        )
+        transport = self.transport
+        assert transport is not None
+        response = transport.post(url, payload)
+        self._handle_exception(response.status_code, response.text, response.headers)
         try:
-            return response.json()
+            result = fast_json.loads(response.content)
         except ValueError:
             return {"error": f"Could not parse JSON: {response.text}"}
+        self.rate_limiter.charge(response_weight(url_path, payload, result))
+        return result
+
+    def _rate_limit_address(self, url_path: str) -> Optional[str]:
+        # Address the per-address action budget is charged to; only Exchange has one.
+        return None
 
-    def _handle_exception(self, response):
-        status_code = response.status_code
-        if status_code < 400:
-            return
-        if 400 <= status_code < 500:
-            try:
-                err = json.loads(response.text)
-            except JSONDecodeError:
-                raise ClientError(status_code, None, response.text, None, response.headers)
-            if err is None:
-                raise ClientError(status_code, None, response.text, None, response.headers)
-            error_data = err.get("data")
-            raise ClientError(status_code, err["code"], err["msg"], response.headers, error_data)
-        raise ServerError(status_code, response.text)
+    def _handle_exception(self, status_code: int, text: str, headers: Any) -> None:
+        raise_for_status(status_code, text, headers)
+
+
+def raise_for_status(status_code: int, text: str, headers: Any) -> None:
+    if status_code < 400:
+        return
+    if 400 <= status_code < 500:
+        try:
+            err = json.loads(text)
+        except JSONDecodeError:
+            raise ClientError(status_code, None, text, None, headers)
+        if err is None:
+            raise ClientError(status_code, None, text, None, headers)
+        error_data = err.get("data")
+        raise ClientError(status_code, err["code"], err["msg"], headers, error_data)
+    raise ServerError(status_code, text)
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+import weakref
+
+import aiohttp
+
+from hyperliquid.api import raise_for_status
+from hyperliquid.rate_limiter import RateLimiter, get_rate_limiter, request_lane, request_weight, response_weight
+from hyperliquid.recording import get_recorder, get_replay
+from hyperliquid.utils import fast_json
+from hyperliquid.utils.constants import MAINNET_API_URL
+from hyperliquid.utils.types import Any, Optional
+from hyperliquid.ws_transport import AsyncTransport, Transport, WebsocketTransport
+
+# One pooled session per event loop is shared by every AsyncAPI instance that was not handed an explicit session, so
+# hundreds of per-user clients reuse the same keep-alive connections instead of opening a pool each.
+DEFAULT_POOL_SIZE = 100
+DEFAULT_TIMEOUT = 10.0
+
+_shared_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def shared_session() -> aiohttp.ClientSession:
+    loop = asyncio.get_running_loop()
+    session = _shared_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=DEFAULT_POOL_SIZE, keepalive_timeout=30)
+        session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Content-Type": "application/json"},
+            timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
+        )
+        _shared_sessions[loop] = session
+    return session
+
+
+async def close_shared_session() -> None:
+    session = _shared_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
+
+class AsyncAPI:
+    # The same layout as API; see there.
+    base_url: str
+    transport: Optional[Transport]
+    rate_limiter: RateLimiter
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[WebsocketTransport] = None,
+    ):
+        self.base_url = base_url or MAINNET_API_URL
+        self._session = session
+        # requests go over the websocket transport instead of aiohttp when one is given, or while replaying a recording
+        self._async_transport: Optional[AsyncTransport] = transport or get_replay()
+        self.transport = self._async_transport
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.base_url)
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is not None:
+            return self._session
+        return shared_session()
+
+    async def post(self, url_path: str, payload: Any = None) -> Any:
+        payload = payload or {}
+        url = self.base_url + url_path
+        await self.rate_limiter.acquire_async(
+            request_weight(url_path, payload), request_lane(url_path, payload), self._rate_limit_address(url_path)
+        )
+        if self._async_transport is not None:
+            ws_response = await self._async_transport.post_async(url, payload)
+            if ws_response.status_code >= 400:
+                self._handle_exception(ws_response.status_code, ws_response.text, ws_response.headers)
+            result = ws_response.data
+            self.rate_limiter.charge(response_weight(url_path, payload, result))
+            return result
+        recorder = get_recorder()
+        started = time.monotonic()
+        async with self.session.post(url, json=payload) as response:
+            body = await response.read()
+            if recorder is not None:
+                recorder.http(url, payload, response.status, body, response.headers, time.monotonic() - started)
+            if response.status >= 400:
+                self._handle_exception(response.status, body.decode("utf-8", "replace"), response.headers)
+        try:
+            result = fast_json.loads(body)
+        except ValueError:
+            return {"error": f"Could not parse JSON: {body.decode('utf-8', 'replace')}"}
+        self.rate_limiter.charge(response_weight(url_path, payload, result))
+        return result
+
+    def _rate_limit_address(self, url_path: str) -> Optional[str]:
+        return None
+
+    def _handle_exception(self, status_code: int, text: str, headers: Any) -> None:
+        raise_for_status(status_code, text, headers)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
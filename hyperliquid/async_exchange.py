@@ -0,0 +1,180 @@
+import asyncio
+import inspect
+import secrets
+
+import aiohttp
+import eth_account
+from eth_account.signers.local import LocalAccount
+
+from hyperliquid.async_api import AsyncAPI
+from hyperliquid.async_info import AsyncInfo
+from hyperliquid.batching import AsyncOrderBatcher
+from hyperliquid.exchange import Exchange
+from hyperliquid.nonce import NonceAllocator, get_nonce_allocator
+from hyperliquid.signing_executor import SigningExecutor
+from hyperliquid.utils.constants import MAINNET_API_URL
+from hyperliquid.utils.signing import sign_agent
+from hyperliquid.utils.types import Any, BuilderInfo, Cloid, List, Meta, Optional, SpotMeta, Tuple
+from hyperliquid.ws_transport import WebsocketTransport
+
+
+class AsyncExchange(AsyncAPI, Exchange):
+    """Awaitable counterpart of Exchange.
+
+    Every action method of Exchange is available with the same signature and returns a coroutine, e.g.
+    `await exchange.bulk_orders(orders)`. Construct with `await AsyncExchange.create(...)`.
+    """
+
+    def __init__(
+        self,
+        wallet: LocalAccount,
+        info: AsyncInfo,
+        vault_address: Optional[str] = None,
+        account_address: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        signing_executor: Optional[SigningExecutor] = None,
+        nonce_allocator: Optional[NonceAllocator] = None,
+        transport: Optional[WebsocketTransport] = None,
+    ):  # pylint: disable=super-init-not-called
+        AsyncAPI.__init__(self, info.base_url, session, transport=transport)
+        self.wallet = wallet
+        self.vault_address = vault_address
+        self.account_address = account_address
+        self.info = info
+        self.expires_after: Optional[int] = None
+        self.signing_executor = signing_executor
+        self.quantizers = None
+        self.nonce_allocator = nonce_allocator or get_nonce_allocator()
+        self.batcher = None
+
+    _batcher_cls = AsyncOrderBatcher  # type: ignore[assignment]
+
+    # AsyncAPI comes first in the MRO, so pick Exchange's per-address budget explicitly.
+    _rate_limit_address = Exchange._rate_limit_address
+
+    @classmethod
+    async def create(
+        cls,
+        wallet: LocalAccount,
+        base_url: Optional[str] = None,
+        meta: Optional[Meta] = None,
+        vault_address: Optional[str] = None,
+        account_address: Optional[str] = None,
+        spot_meta: Optional[SpotMeta] = None,
+        perp_dexs: Optional[List[str]] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        signing_executor: Optional[SigningExecutor] = None,
+        nonce_allocator: Optional[NonceAllocator] = None,
+        transport: Optional[WebsocketTransport] = None,
+    ) -> "AsyncExchange":
+        info = await AsyncInfo.create(base_url, meta, spot_meta, perp_dexs, session, transport=transport)
+        return cls(wallet, info, vault_address, account_address, session, signing_executor, nonce_allocator, transport)
+
+    def _sign_l1_action(self, action, active_pool, nonce, expires_after, is_mainnet):
+        if self.signing_executor is None:
+            return Exchange._sign_l1_action(self, action, active_pool, nonce, expires_after, is_mainnet)
+        # handed to _post_action unresolved, so the loop keeps running while the action is hashed and signed
+        return asyncio.wrap_future(
+            self.signing_executor.submit_l1_action(self.wallet, action, active_pool, nonce, expires_after, is_mainnet)
+        )
+
+    def _batching_calls(self) -> bool:
+        # the future order/cancel return is awaited by the caller like the coroutine they return without batching
+        return True
+
+    async def _post_action(self, action, signature, nonce):
+        if inspect.isawaitable(signature):
+            signature = await signature
+        response = await self.post("/exchange", self._action_payload(action, signature, nonce))
+        self._invalidate_caches(action, response)
+        return response
+
+    async def _slippage_price(  # type: ignore[override]
+        self,
+        name: str,
+        is_buy: bool,
+        slippage: float,
+        px: Optional[float] = None,
+    ) -> float:
+        if not px:
+            coin = self.info.name_to_coin[name]
+            px = float((await self.info.all_mids())[coin])
+        return Exchange._slippage_price(self, name, is_buy, slippage, px)
+
+    async def market_open(
+        self,
+        name: str,
+        is_buy: bool,
+        sz: float,
+        px: Optional[float] = None,
+        slippage: float = Exchange.DEFAULT_SLIPPAGE,
+        cloid: Optional[Cloid] = None,
+        builder: Optional[BuilderInfo] = None,
+    ) -> Any:
+        # Get aggressive Market Price
+        px = await self._slippage_price(name, is_buy, slippage, px)
+        # Market Order is an aggressive Limit Order IoC
+        return await self.order(
+            name, is_buy, sz, px, order_type={"limit": {"tif": "Ioc"}}, reduce_only=False, cloid=cloid, builder=builder
+        )
+
+    async def market_close(
+        self,
+        coin: str,
+        sz: Optional[float] = None,
+        px: Optional[float] = None,
+        slippage: float = Exchange.DEFAULT_SLIPPAGE,
+        cloid: Optional[Cloid] = None,
+        builder: Optional[BuilderInfo] = None,
+    ) -> Any:
+        address: str = self.wallet.address
+        if self.account_address:
+            address = self.account_address
+        if self.vault_address:
+            address = self.vault_address
+        positions = (await self.info.user_state(address))["assetPositions"]
+        for position in positions:
+            item = position["position"]
+            if coin != item["coin"]:
+                continue
+            szi = float(item["szi"])
+            if not sz:
+                sz = abs(szi)
+            is_buy = True if szi < 0 else False
+            # Get aggressive Market Price
+            px = await self._slippage_price(coin, is_buy, slippage, px)
+            # Market Order is an aggressive Limit Order IoC
+            return await self.order(
+                coin,
+                is_buy,
+                sz,
+                px,
+                order_type={"limit": {"tif": "Ioc"}},
+                reduce_only=True,
+                cloid=cloid,
+                builder=builder,
+            )
+
+    async def approve_agent(self, name: Optional[str] = None) -> Tuple[Any, str]:  # type: ignore[override]
+        agent_key = "0x" + secrets.token_hex(32)
+        account = eth_account.Account.from_key(agent_key)
+        timestamp = self._next_nonce()
+        is_mainnet = self.base_url == MAINNET_API_URL
+        action = {
+            "type": "approveAgent",
+            "agentAddress": account.address,
+            "agentName": name or "",
+            "nonce": timestamp,
+        }
+        signature = sign_agent(self.wallet, action, is_mainnet)
+        if name is None:
+            del action["agentName"]
+
+        return (
+            await self._post_action(
+                action,
+                signature,
+                timestamp,
+            ),
+            agent_key,
+        )
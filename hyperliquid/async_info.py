@@ -0,0 +1,161 @@
+import asyncio
+
+import aiohttp
+
+from hyperliquid.accounts import get_account_cache
+from hyperliquid.async_api import AsyncAPI
+from hyperliquid.coalescing import RequestCoalescer, get_coalescer
+from hyperliquid.info import Info
+from hyperliquid.metadata import MetadataRegistry, get_registry, perp_dex_offsets
+from hyperliquid.mids import get_mids_hub
+from hyperliquid.response_cache import ResponseCache, get_response_cache
+from hyperliquid.utils.types import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    List,
+    Meta,
+    Optional,
+    SpotMeta,
+    SpotMetaAndAssetCtxs,
+    Tuple,
+    cast,
+)
+from hyperliquid.ws_transport import WebsocketTransport
+
+
+class AsyncInfo(AsyncAPI, Info):
+    """Awaitable counterpart of Info.
+
+    Every query method of Info is available with the same signature and returns a coroutine, e.g.
+    `await info.user_state(address)`. Websocket subscriptions are not supported; use Info for those.
+
+    Construct with `await AsyncInfo.create(...)` so the asset metadata can be fetched without blocking the loop.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        transport: Optional[WebsocketTransport] = None,
+        response_cache: Optional[ResponseCache] = None,
+    ):  # pylint: disable=super-init-not-called
+        AsyncAPI.__init__(self, base_url, session, transport=transport)
+        self.coalescer = coalescer or get_coalescer(self.base_url)
+        self.response_cache = response_cache or get_response_cache(self.base_url)
+        self.ws_manager = None
+        self._metadata: Optional[MetadataRegistry] = None
+        self.coin_to_asset = {}
+        self.name_to_coin = {}
+        self.asset_to_sz_decimals = {}
+
+    async def post(self, url_path: str, payload: Any = None) -> Any:
+        cache = self.response_cache
+        if cache is None or not cache.cacheable(url_path, payload):
+            return await self._fetch(url_path, payload)
+        hit, result = cache.get(payload)
+        if hit:
+            return result
+        version = cache.version(payload)
+        result = await self._fetch(url_path, payload)
+        cache.put(payload, result, version)
+        return result
+
+    async def _fetch(self, url_path: str, payload: Any) -> Any:
+        if self.coalescer is None or url_path != "/info":
+            return await AsyncAPI.post(self, url_path, payload)
+        return await self.coalescer.call_async(
+            RequestCoalescer.key(url_path, payload), lambda: AsyncAPI.post(self, url_path, payload)
+        )
+
+    async def all_mids(self, dex: str = "") -> Any:
+        hub = get_mids_hub(self.base_url) if dex == "" else None
+        if hub is None:
+            return await self.post("/info", {"type": "allMids", "dex": dex})
+        latest = hub.latest()
+        if latest is None:
+            # the hub's own fallback would block the loop, so refresh it from here
+            latest = await self.post("/info", {"type": "allMids", "dex": dex})
+            hub.update(latest, from_rest=True)
+        return latest
+
+    async def user_state(self, address: str, dex: str = "") -> Any:
+        cache = get_account_cache(self.base_url) if dex == "" else None
+        if cache is None:
+            return await self.post("/info", {"type": "clearinghouseState", "user": address, "dex": dex})
+        state = cache.cached(address)
+        if state is None:
+            # the cache's own fallback would block the loop, so refresh it from here
+            raw = await self.post("/info", {"type": "clearinghouseState", "user": address, "dex": dex})
+            state = cache.update(address.lower(), raw, from_rest=True)
+        return state.raw
+
+    # Info types these three, so they are restated here to type the awaited result.
+    async def meta(self, dex: str = "") -> Meta:  # type: ignore[override]
+        return cast(Meta, await self.post("/info", {"type": "meta", "dex": dex}))
+
+    async def spot_meta(self) -> SpotMeta:  # type: ignore[override]
+        return cast(SpotMeta, await self.post("/info", {"type": "spotMeta"}))
+
+    async def spot_meta_and_asset_ctxs(self) -> SpotMetaAndAssetCtxs:  # type: ignore[override]
+        return cast(SpotMetaAndAssetCtxs, await self.post("/info", {"type": "spotMetaAndAssetCtxs"}))
+
+    async def user_states(  # type: ignore[override]
+        self, addresses: Iterable[str], concurrency: int = 16, dex: str = ""
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Like Info.user_states, with at most `concurrency` requests in flight on the event loop."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(address: str) -> Tuple[str, Any]:
+            async with semaphore:
+                try:
+                    return address, await self.user_state(address, dex)
+                except Exception as e:  # pylint: disable=broad-except
+                    return address, e
+
+        tasks = [asyncio.ensure_future(fetch(address)) for address in addresses]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @classmethod
+    async def create(
+        cls,
+        base_url: Optional[str] = None,
+        meta: Optional[Meta] = None,
+        spot_meta: Optional[SpotMeta] = None,
+        perp_dexs: Optional[List[str]] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        transport: Optional[WebsocketTransport] = None,
+    ) -> "AsyncInfo":
+        info = cls(base_url, session, coalescer, transport)
+        if meta is None and spot_meta is None:
+            registry = get_registry(info.base_url, perp_dexs)
+            # Only the first client per process pays for the fetch, and it runs off the loop.
+            await asyncio.get_running_loop().run_in_executor(None, registry.snapshot)
+            info._metadata = registry
+            return info
+
+        if spot_meta is None:
+            spot_meta = await info.spot_meta()
+        info.set_spot_meta(spot_meta)
+
+        perp_dex_to_offset = {"": 0}
+        if perp_dexs is None:
+            perp_dexs = [""]
+        else:
+            perp_dex_to_offset = perp_dex_offsets(await info.perp_dexs())
+
+        for perp_dex in perp_dexs:
+            offset = perp_dex_to_offset[perp_dex]
+            if perp_dex == "" and meta is not None:
+                info.set_perp_meta(meta, 0)
+            else:
+                fresh_meta = await info.meta(dex=perp_dex)
+                info.set_perp_meta(fresh_meta, offset)
+        return info
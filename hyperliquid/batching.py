@@ -0,0 +1,223 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from hyperliquid.utils.signing import CancelByCloidRequest, CancelRequest, OrderRequest
+from hyperliquid.utils.types import Any, BuilderInfo, Cloid, Dict, List, Optional, Set, Tuple
+
+# Collects single order / cancel calls made close together and sends them as one bulk action. An action weighs
+# 1 + floor(n / 40) against the IP limit, so 39 is the largest batch that still costs a single request.
+DEFAULT_WINDOW = 0.003
+DEFAULT_MAX_BATCH = 39
+# The flusher thread exits after this many idle seconds and is restarted by the next submit.
+IDLE_TIMEOUT = 5.0
+
+ORDER = "order"
+CANCEL = "cancel"
+CANCEL_BY_CLOID = "cancelByCloid"
+
+BatchKey = Tuple[str, str]
+
+logger = logging.getLogger(__name__)
+
+
+def split_response(response: Any, index: int) -> Any:
+    """The part of a bulk response that belongs to its index-th request, shaped like a single-request response."""
+    try:
+        statuses = response["response"]["data"]["statuses"]
+        status = statuses[index]
+    except (KeyError, IndexError, TypeError):
+        # errors for the whole action apply to every request in it
+        return response
+    return {
+        "status": response["status"],
+        "response": {"type": response["response"]["type"], "data": {"statuses": [status]}},
+    }
+
+
+def _builder_key(builder: Optional[BuilderInfo]) -> str:
+    return "" if builder is None else json.dumps(builder, sort_keys=True)
+
+
+class _BatcherBase:
+    def __init__(self, exchange: Any, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        self.exchange = exchange
+        self.window = window
+        self.max_batch = max_batch
+        self._builders: Dict[str, Optional[BuilderInfo]] = {"": None}
+        self.requests = 0
+        self.actions = 0
+
+    def _send(self, key: BatchKey, requests: List[Any]) -> Any:
+        kind, builder_key = key
+        self.actions += 1
+        if kind == ORDER:
+            return self.exchange.bulk_orders(requests, self._builders[builder_key])
+        if kind == CANCEL:
+            return self.exchange.bulk_cancel(requests)
+        return self.exchange.bulk_cancel_by_cloid(requests)
+
+    def _order_key(self, builder: Optional[BuilderInfo]) -> BatchKey:
+        key = _builder_key(builder)
+        self._builders.setdefault(key, builder)
+        return ORDER, key
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "actions": self.actions,
+            "saved": self.requests - self.actions,
+            "avg_batch": self.requests / self.actions if self.actions else 0.0,
+        }
+
+
+class OrderBatcher(_BatcherBase):
+    """Batches calls from any number of threads; a daemon thread flushes each batch when its window closes."""
+
+    def __init__(self, exchange: Any, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        super().__init__(exchange, window, max_batch)
+        self._cond = threading.Condition()
+        self._queues: Dict[BatchKey, List[Tuple[Any, "Future[Any]"]]] = {}
+        self._deadlines: Dict[BatchKey, float] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def submit_order(self, order: OrderRequest, builder: Optional[BuilderInfo] = None) -> "Future[Any]":
+        return self._submit(self._order_key(builder), order)
+
+    def submit_cancel(self, name: str, oid: int) -> "Future[Any]":
+        request: CancelRequest = {"coin": name, "oid": oid}
+        return self._submit((CANCEL, ""), request)
+
+    def submit_cancel_by_cloid(self, name: str, cloid: Cloid) -> "Future[Any]":
+        request: CancelByCloidRequest = {"coin": name, "cloid": cloid}
+        return self._submit((CANCEL_BY_CLOID, ""), request)
+
+    def _submit(self, key: BatchKey, request: Any) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+        full = None
+        with self._cond:
+            self.requests += 1
+            queue = self._queues.setdefault(key, [])
+            queue.append((request, future))
+            if len(queue) >= self.max_batch:
+                full = self._queues.pop(key)
+                self._deadlines.pop(key, None)
+            elif len(queue) == 1:
+                self._deadlines[key] = time.monotonic() + self.window
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="hyperliquid-order-batcher", daemon=True)
+                    self._thread.start()
+                self._cond.notify()
+        if full is not None:
+            self._flush(key, full)
+        return future
+
+    def flush(self) -> None:
+        with self._cond:
+            batches = list(self._queues.items())
+            self._queues.clear()
+            self._deadlines.clear()
+        for key, batch in batches:
+            self._flush(key, batch)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._deadlines:
+                    self._cond.wait(IDLE_TIMEOUT)
+                    if not self._deadlines:
+                        self._thread = None
+                        return
+                now = time.monotonic()
+                due = [key for key, deadline in self._deadlines.items() if deadline <= now]
+                if not due:
+                    self._cond.wait(min(self._deadlines.values()) - now)
+                    continue
+                batches = [(key, self._queues.pop(key)) for key in due]
+                for key in due:
+                    del self._deadlines[key]
+            for key, batch in batches:
+                self._flush(key, batch)
+
+    def _flush(self, key: BatchKey, batch: List[Tuple[Any, "Future[Any]"]]) -> None:
+        try:
+            response = self._send(key, [request for request, _ in batch])
+        except Exception as e:  # pylint: disable=broad-except
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        except BaseException:
+            # interrupted: nobody will answer these calls, so do not leave their callers waiting
+            for _, future in batch:
+                future.cancel()
+            raise
+        for i, (_, future) in enumerate(batch):
+            future.set_result(split_response(response, i))
+
+
+class AsyncOrderBatcher(_BatcherBase):
+    """Batches calls made on one event loop for an AsyncExchange."""
+
+    def __init__(self, exchange: Any, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH):
+        super().__init__(exchange, window, max_batch)
+        self._queues: Dict[BatchKey, List[Tuple[Any, "asyncio.Future[Any]"]]] = {}
+        self._timers: Dict[BatchKey, asyncio.TimerHandle] = {}
+        # the loop only keeps weak references to tasks, so a pending flush of live orders is held here until it is done
+        self._flushes: Set["asyncio.Task[None]"] = set()
+
+    def submit_order(self, order: OrderRequest, builder: Optional[BuilderInfo] = None) -> "asyncio.Future[Any]":
+        return self._submit(self._order_key(builder), order)
+
+    def submit_cancel(self, name: str, oid: int) -> "asyncio.Future[Any]":
+        request: CancelRequest = {"coin": name, "oid": oid}
+        return self._submit((CANCEL, ""), request)
+
+    def submit_cancel_by_cloid(self, name: str, cloid: Cloid) -> "asyncio.Future[Any]":
+        request: CancelByCloidRequest = {"coin": name, "cloid": cloid}
+        return self._submit((CANCEL_BY_CLOID, ""), request)
+
+    def _submit(self, key: BatchKey, request: Any) -> "asyncio.Future[Any]":
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.requests += 1
+        queue = self._queues.setdefault(key, [])
+        queue.append((request, future))
+        if len(queue) >= self.max_batch:
+            self._start_flush(key)
+        elif len(queue) == 1:
+            self._timers[key] = loop.call_later(self.window, self._start_flush, key)
+        return future
+
+    def flush(self) -> None:
+        for key in list(self._queues):
+            self._start_flush(key)
+
+    def _start_flush(self, key: BatchKey) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._queues.pop(key, None)
+        if batch:
+            task = asyncio.ensure_future(self._flush(key, batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, key: BatchKey, batch: List[Tuple[Any, "asyncio.Future[Any]"]]) -> None:
+        try:
+            response = await self._send(key, [request for request, _ in batch])
+        except Exception as e:  # pylint: disable=broad-except
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            # the flush was cancelled (or the loop is going down): so are the calls it carried
+            for _, future in batch:
+                future.cancel()
+            raise
+        for i, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(split_response(response, i))
@@ -0,0 +1,237 @@
+import logging
+import threading
+import time
+
+import numpy as np
+
+from hyperliquid.api import API
+from hyperliquid.market_feed import MarketDataFeed, get_market_feed
+from hyperliquid.utils.types import Any, Dict, List, Optional, Tuple
+
+# Shared candle history per (coin, interval) in fixed-size ring buffers. A series is backfilled with candleSnapshot
+# (proper startTime/endTime in milliseconds) the first time more bars are asked for than it holds, and kept current
+# by the candle channel of the shared market-data feed, so "last N bars" is answered from memory. A gap left by a
+# dropped socket is backfilled from the last bar held. Bars come out as a structured array with the candle fields
+# t (open time, ms), o, h, l, c, v, so bars["c"] is the close column and bars[-1]["h"] reads like the candle dicts.
+DEFAULT_CAPACITY = 1000
+# candleSnapshot serves at most this many of the most recent candles
+MAX_SNAPSHOT_CANDLES = 5000
+
+INTERVAL_MS = {
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 3_600_000,
+    "2h": 2 * 3_600_000,
+    "4h": 4 * 3_600_000,
+    "8h": 8 * 3_600_000,
+    "12h": 12 * 3_600_000,
+    "1d": 86_400_000,
+    "3d": 3 * 86_400_000,
+    "1w": 7 * 86_400_000,
+    "1M": 30 * 86_400_000,  # approximate; only used to size backfill windows
+}
+
+BAR_DTYPE = np.dtype([("t", np.int64), ("o", float), ("h", float), ("l", float), ("c", float), ("v", float)])
+
+logger = logging.getLogger(__name__)
+
+
+def _bar(candle: Dict[str, Any]) -> Tuple[int, float, float, float, float, float]:
+    return (
+        candle["t"],
+        float(candle["o"]),
+        float(candle["h"]),
+        float(candle["l"]),
+        float(candle["c"]),
+        float(candle["v"]),
+    )
+
+
+class CandleSeries:
+    """Ring buffer of the most recent `capacity` bars of one coin and interval, oldest first when read."""
+
+    def __init__(self, coin: str, interval: str, capacity: int = DEFAULT_CAPACITY):
+        self.coin = coin
+        self.interval = interval
+        self.interval_ms = INTERVAL_MS[interval]
+        self.capacity = capacity
+        self._bars = np.zeros(capacity, dtype=BAR_DTYPE)
+        self._head = 0  # slot of the next bar
+        self._count = 0
+        self._lock = threading.Lock()
+        # open time before which the exchange has no candles for this series, once a backfill came back short
+        self.history_start: Optional[int] = None
+        self.updated_at = 0.0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _slot(self, i: int) -> int:
+        # i-th bar counted from the oldest
+        return (self._head - self._count + i) % self.capacity
+
+    def last_time(self) -> Optional[int]:
+        with self._lock:
+            return int(self._bars[(self._head - 1) % self.capacity]["t"]) if self._count else None
+
+    def first_time(self) -> Optional[int]:
+        with self._lock:
+            return int(self._bars[self._slot(0)]["t"]) if self._count else None
+
+    def apply(self, candle: Dict[str, Any]) -> None:
+        """Add a candle from the stream or a snapshot: the newest bar is updated in place, a later one appended."""
+        self.merge([candle])
+
+    def merge(self, candles: List[Dict[str, Any]]) -> None:
+        if not candles:
+            return
+        with self._lock:
+            if self._count:
+                newest = int(self._bars[(self._head - 1) % self.capacity]["t"])
+                if candles[0]["t"] > newest:
+                    for candle in candles:
+                        self._append(_bar(candle))
+                    self.updated_at = time.time()
+                    return
+                if len(candles) == 1 and candles[0]["t"] == newest:
+                    self._bars[(self._head - 1) % self.capacity] = _bar(candles[0])
+                    self.updated_at = time.time()
+                    return
+            # overlapping or older history: merge by open time and keep the newest `capacity` bars
+            incoming = np.array([_bar(candle) for candle in candles], dtype=BAR_DTYPE)
+            merged = np.concatenate([incoming, self._ordered()])
+            _, first = np.unique(merged["t"], return_index=True)
+            merged = merged[first][-self.capacity :]
+            self._bars[: len(merged)] = merged
+            self._count = len(merged)
+            self._head = self._count % self.capacity
+            self.updated_at = time.time()
+
+    def _append(self, bar: Tuple[int, float, float, float, float, float]) -> None:
+        self._bars[self._head] = bar
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _ordered(self) -> np.ndarray:
+        if self._count < self.capacity:
+            return np.array(self._bars[self._head - self._count : self._head])
+        return np.concatenate([self._bars[self._head :], self._bars[: self._head]])
+
+    def last(self, n: int) -> np.ndarray:
+        """Copy of the newest n bars (fewer if the series holds fewer), oldest first."""
+        with self._lock:
+            n = min(n, self._count)
+            end = self._head
+            start = end - n
+            if start >= 0:
+                return np.array(self._bars[start:end])
+            return np.concatenate([self._bars[start:], self._bars[:end]])
+
+
+class CandleStore:
+    """Candle series shared by every strategy of one base_url."""
+
+    def __init__(self, base_url: str, capacity: int = DEFAULT_CAPACITY, feed: Optional[MarketDataFeed] = None):
+        self.base_url = base_url
+        self.capacity = capacity
+        self.feed = feed or get_market_feed(base_url)
+        self.series: Dict[Tuple[str, str], CandleSeries] = {}
+        self._lock = threading.Lock()
+        self._backfill_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._api = API(base_url)
+        self.hits = 0
+        self.backfills = 0
+
+    def _series(self, coin: str, interval: str) -> CandleSeries:
+        key = (coin, interval)
+        series = self.series.get(key)
+        if series is not None:
+            return series
+        with self._lock:
+            series = self.series.get(key)
+            if series is not None:
+                return series
+            series = CandleSeries(coin, interval, self.capacity)
+            self.series[key] = series
+            self._backfill_locks[key] = threading.Lock()
+        self.feed.subscribe("candle", self._on_message, coin=coin, interval=interval)
+        return series
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        candle = message.get("data")
+        if not isinstance(candle, dict):
+            return
+        coin, interval = candle.get("s"), candle.get("i")
+        if not isinstance(coin, str) or not isinstance(interval, str):
+            return
+        series = self.series.get((coin, interval))
+        if series is not None:
+            series.apply(candle)
+
+    def _missing_since(self, series: CandleSeries, n: int, now_ms: int) -> Optional[int]:
+        """Open time to backfill from, or None when the series already holds the newest n bars."""
+        current_open = now_ms - now_ms % series.interval_ms
+        wanted_from = current_open - (n - 1) * series.interval_ms
+        if series.history_start is not None:
+            wanted_from = max(wanted_from, series.history_start)
+        first, last = series.first_time(), series.last_time()
+        if first is None or last is None or first > wanted_from:
+            return wanted_from
+        if last < current_open - series.interval_ms:
+            # the stream missed bars, e.g. while the socket was reconnecting
+            return last
+        return None
+
+    def backfill(self, coin: str, interval: str, start_ms: int, end_ms: Optional[int] = None) -> int:
+        """Fetch [start_ms, end_ms] with candleSnapshot into the series; returns the number of candles received."""
+        series = self._series(coin, interval)
+        end_ms = end_ms if end_ms is not None else int(time.time() * 1000)
+        req = {"coin": coin, "interval": interval, "startTime": start_ms, "endTime": end_ms}
+        candles = self._api.post("/info", {"type": "candleSnapshot", "req": req})
+        self.backfills += 1
+        if not candles or candles[0]["t"] > start_ms:
+            # the coin has no older history (or the snapshot limit was hit); do not ask for it again
+            series.history_start = candles[0]["t"] if candles else end_ms
+        series.merge(candles)
+        return len(candles)
+
+    def last(self, coin: str, interval: str, n: int) -> np.ndarray:
+        """The newest n bars of coin at interval (the current, still open bar last), backfilling if needed."""
+        n = min(n, self.capacity, MAX_SNAPSHOT_CANDLES)
+        series = self._series(coin, interval)
+        now_ms = int(time.time() * 1000)
+        if self._missing_since(series, n, now_ms) is None:
+            self.hits += 1
+            return series.last(n)
+        with self._backfill_locks[(coin, interval)]:
+            # a concurrent caller may have filled it meanwhile
+            start_ms = self._missing_since(series, n, now_ms)
+            if start_ms is not None:
+                self.backfill(coin, interval, start_ms, now_ms)
+        return series.last(n)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "series": len(self.series),
+            "bars": sum(len(series) for series in list(self.series.values())),
+            "hits": self.hits,
+            "backfills": self.backfills,
+            "connected": self.feed.connected,
+        }
+
+
+_candle_stores: Dict[str, CandleStore] = {}
+_candle_stores_lock = threading.Lock()
+
+
+def get_candle_store(base_url: str) -> CandleStore:
+    store = _candle_stores.get(base_url)
+    if store is not None:
+        return store
+    with _candle_stores_lock:
+        if base_url not in _candle_stores:
+            _candle_stores[base_url] = CandleStore(base_url)
+        return _candle_stores[base_url]
@@ -0,0 +1,165 @@
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+
+from hyperliquid.utils.types import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+# Single-flight for idempotent /info queries: concurrent identical requests share one in-flight response, and with a
+# non-zero ttl the finished response keeps being served for that many seconds. Callers receive the same object, so
+# results must be treated as read-only. Expired responses are dropped as new ones are remembered, so keys that are
+# never asked for again (per-user, per-coin and time-windowed queries) do not accumulate.
+CoalesceKey = Tuple[str, str]
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    def __init__(self, ttl: float = 0.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._flights: Dict[CoalesceKey, _Flight] = {}
+        self._async_flights: Dict[Any, "asyncio.Task[Any]"] = {}
+        self._recent: Dict[CoalesceKey, Tuple[float, Any]] = {}
+        # (expires_at, key) in the order responses were remembered
+        self._expiry: Deque[Tuple[float, CoalesceKey]] = deque()
+        self.requests = 0
+        self.executed = 0
+        self.joined = 0
+        self.ttl_hits = 0
+
+    @staticmethod
+    def key(url_path: str, payload: Any) -> CoalesceKey:
+        return url_path, json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+    def _recent_result(self, key: CoalesceKey) -> Tuple[bool, Any]:
+        cached = self._recent.get(key)
+        if cached is None:
+            return False, None
+        expires_at, result = cached
+        if time.monotonic() >= expires_at:
+            del self._recent[key]
+            return False, None
+        self.ttl_hits += 1
+        return True, result
+
+    def _remember(self, key: CoalesceKey, result: Any) -> None:
+        now = time.monotonic()
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            expires_at, expired = expiry.popleft()
+            cached = self._recent.get(expired)
+            # the key may have been remembered again since
+            if cached is not None and cached[0] == expires_at:
+                del self._recent[expired]
+        if self.ttl > 0:
+            expires_at = now + self.ttl
+            self._recent[key] = (expires_at, result)
+            expiry.append((expires_at, key))
+
+    def call(self, key: CoalesceKey, fetch: Callable[[], Any]) -> Any:
+        with self._lock:
+            self.requests += 1
+            hit, result = self._recent_result(key)
+            if hit:
+                return result
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+                self.executed += 1
+            else:
+                self.joined += 1
+        assert flight is not None
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fetch()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                if flight.error is None:
+                    self._remember(key, flight.result)
+            flight.done.set()
+        return flight.result
+
+    async def call_async(self, key: CoalesceKey, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        with self._lock:
+            self.requests += 1
+            hit, result = self._recent_result(key)
+            if hit:
+                return result
+            task = self._async_flights.get(flight_key)
+            if task is None:
+                task = loop.create_task(self._run_async(flight_key, key, fetch))
+                self._async_flights[flight_key] = task
+                self.executed += 1
+            else:
+                self.joined += 1
+        # The fetch runs in its own task so a cancelled caller never cancels the response the others are waiting on.
+        return await asyncio.shield(task)
+
+    async def _run_async(self, flight_key: Any, key: CoalesceKey, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            result = await fetch()
+        except BaseException:
+            with self._lock:
+                self._async_flights.pop(flight_key, None)
+            raise
+        with self._lock:
+            self._async_flights.pop(flight_key, None)
+            self._remember(key, result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        saved = self.joined + self.ttl_hits
+        return {
+            "requests": self.requests,
+            "executed": self.executed,
+            "joined_in_flight": self.joined,
+            "ttl_hits": self.ttl_hits,
+            "cached": len(self._recent),
+            "saved": saved,
+            "saved_ratio": saved / self.requests if self.requests else 0.0,
+        }
+
+
+_coalescers: Dict[str, RequestCoalescer] = {}
+_coalescers_lock = threading.Lock()
+
+
+def enable_coalescing(base_url: str, ttl: float = 0.0) -> RequestCoalescer:
+    """Opt every Info for base_url created afterwards (without an explicit coalescer) into a shared coalescer."""
+    with _coalescers_lock:
+        coalescer = _coalescers.get(base_url)
+        if coalescer is None:
+            coalescer = RequestCoalescer(ttl)
+            _coalescers[base_url] = coalescer
+        else:
+            coalescer.ttl = ttl
+        return coalescer
+
+
+def get_coalescer(base_url: str) -> Optional[RequestCoalescer]:
+    return _coalescers.get(base_url)
+
+
+def coalescing_stats() -> Dict[str, Dict[str, Any]]:
+    return {base_url: coalescer.stats() for base_url, coalescer in list(_coalescers.items())}
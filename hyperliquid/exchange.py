@@ -5,8 +5,13 @@ import secrets
 import eth_account
 from eth_account.signers.local import LocalAccount
 
+from hyperliquid.accounts import get_account_cache
 from hyperliquid.api import API
+from hyperliquid.batching import DEFAULT_MAX_BATCH, DEFAULT_WINDOW, OrderBatcher
 from hyperliquid.info import Info
+from hyperliquid.nonce import NonceAllocator, get_nonce_allocator
+from hyperliquid.quantizer import QuantizerTable
+from hyperliquid.response_cache import get_response_cache
 from hyperliquid.utils.constants import MAINNET_API_URL
 from hyperliquid.utils.signing import (
     CancelByCloidRequest,
@@ -18,7 +23,6 @@ from hyperliquid.utils.signing import (
     OrderWire,
     ScheduleCancelAction,
     float_to_usd_int,
-    get_timestamp_ms,
     order_request_to_order_wire,
     order_wires_to_order_action,
     sign_agent,
@@ -45,6 +49,7 @@ from hyperliquid.utils.types import (
     SpotMeta,
     Tuple,
 )
+from hyperliquid.ws_transport import Transport
 
 
 class Exchange(API):
@@ -60,15 +65,31 @@ class Exchange(API):
         account_address: Optional[str] = None,
         spot_meta: Optional[SpotMeta] = None,
         perp_dexs: Optional[List[str]] = None,
+        transport: Optional[Transport] = None,
+        nonce_allocator: Optional[NonceAllocator] = None,
     ):
-        super().__init__(base_url)
+        super().__init__(base_url, transport)
         self.wallet = wallet
         self.vault_address = vault_address
         self.account_address = account_address
-        self.info = Info(base_url, True, meta, spot_meta, perp_dexs)
+        self.info = Info(base_url, True, meta, spot_meta, perp_dexs, transport)
         self.expires_after: Optional[int] = None
+        self.quantizers: Optional[QuantizerTable] = None
+        self.nonce_allocator = nonce_allocator or get_nonce_allocator()
+        self.batcher: Optional[OrderBatcher] = None
 
-    def _post_action(self, action, signature, nonce):
+    _batcher_cls = OrderBatcher
+
+    def _next_nonce(self) -> int:
+        # nonces are tracked per signing key, which for agents is the agent rather than the account
+        return self.nonce_allocator.next(self.wallet.address)
+
+    # Signs on the calling thread: a sync caller waits for the signature either way, so handing it to a
+    # SigningExecutor would only add a thread hop (and pickling, with processes). AsyncExchange takes one instead.
+    def _sign_l1_action(self, action, active_pool, nonce, expires_after, is_mainnet):
+        return sign_l1_action(self.wallet, action, active_pool, nonce, expires_after, is_mainnet)
+
+    def _action_payload(self, action, signature, nonce):
         payload = {
             "action": action,
             "nonce": nonce,
@@ -77,7 +98,39 @@ class Exchange(API):
             "expiresAfter": self.expires_after,
         }
         logging.debug(payload)
-        return self.post("/exchange", payload)
+        return payload
+
+    def _post_action(self, action, signature, nonce):
+        response = self.post("/exchange", self._action_payload(action, signature, nonce))
+        self._invalidate_caches(action, response)
+        return response
+
+    def _invalidate_caches(self, action: Dict[str, Any], response: Any) -> None:
+        # answers cached about the users an action touched are stale as soon as it went through
+        if not isinstance(response, dict) or response.get("status") != "ok":
+            return
+        address = self.vault_address or self.account_address or self.wallet.address
+        response_cache = get_response_cache(self.base_url)
+        if response_cache is not None:
+            response_cache.invalidate_user(address)
+            # transfers also change the receiving side
+            for field in ("destination", "subAccountUser", "vaultAddress"):
+                if isinstance(action.get(field), str):
+                    response_cache.invalidate_user(action[field])
+        account_cache = get_account_cache(self.base_url)
+        if account_cache is None or action["type"] in ("cancel", "cancelByCloid", "scheduleCancel", "noop"):
+            return
+        if action["type"] in ("order", "modify", "batchModify"):
+            # the clearinghouse state only changes when an order fills
+            statuses = response.get("response", {}).get("data", {}).get("statuses", [])
+            if not any(isinstance(status, dict) and "filled" in status for status in statuses):
+                return
+        account_cache.invalidate(address)
+
+    def _rate_limit_address(self, url_path: str) -> Optional[str]:
+        if url_path != "/exchange":
+            return None
+        return self.vault_address or self.account_address or self.wallet.address
 
     def _slippage_price(
         self,
@@ -106,6 +159,29 @@ class Exchange(API):
     def set_expires_after(self, expires_after: Optional[int]) -> None:
         self.expires_after = expires_after
 
+    # With quantization enabled, order prices and sizes are snapped to the nearest valid tick and lot size of their
+    # asset instead of raising when they carry too much precision.
+    def set_quantization(self, enabled: bool) -> None:
+        self.quantizers = QuantizerTable(self.info) if enabled else None
+
+    def _order_wire(self, order: OrderRequest) -> OrderWire:
+        asset = self.info.name_to_asset(order["coin"])
+        quantizer = self.quantizers.for_asset(asset) if self.quantizers is not None else None
+        return order_request_to_order_wire(order, asset, quantizer)
+
+    # With batching enabled, self.batcher merges requests submitted within `window` seconds of each other (from any
+    # thread) into bulk actions of at most max_batch requests; each future resolves to a response shaped like its own
+    # single-request action. Queue with self.batcher.submit_* and call flush() once the burst is queued. Plain order,
+    # cancel and cancel_by_cloid calls are only routed through it on AsyncExchange, where concurrent callers overlap:
+    # a sequential sync caller would wait out every window for a batch of one, so those calls still go out directly.
+    def set_batching(self, enabled: bool, window: float = DEFAULT_WINDOW, max_batch: int = DEFAULT_MAX_BATCH) -> None:
+        if self.batcher is not None:
+            self.batcher.flush()
+        self.batcher = self._batcher_cls(self, window, max_batch) if enabled else None
+
+    def _batching_calls(self) -> bool:
+        return False
+
     def order(
         self,
         name: str,
@@ -127,20 +203,19 @@ class Exchange(API):
         }
         if cloid:
             order["cloid"] = cloid
+        if self.batcher is not None and self._batching_calls():
+            return self.batcher.submit_order(order, builder)
         return self.bulk_orders([order], builder)
 
     def bulk_orders(self, order_requests: List[OrderRequest], builder: Optional[BuilderInfo] = None) -> Any:
-        order_wires: List[OrderWire] = [
-            order_request_to_order_wire(order, self.info.name_to_asset(order["coin"])) for order in order_requests
-        ]
-        timestamp = get_timestamp_ms()
+        order_wires: List[OrderWire] = [self._order_wire(order) for order in order_requests]
+        timestamp = self._next_nonce()
 
         if builder:
             builder["b"] = builder["b"].lower()
         order_action = order_wires_to_order_action(order_wires, builder)
 
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             order_action,
             self.vault_address,
             timestamp,
@@ -180,11 +255,11 @@ class Exchange(API):
         return self.bulk_modify_orders_new([modify])
 
     def bulk_modify_orders_new(self, modify_requests: List[ModifyRequest]) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         modify_wires = [
             {
                 "oid": modify["oid"].to_raw() if isinstance(modify["oid"], Cloid) else modify["oid"],
-                "order": order_request_to_order_wire(modify["order"], self.info.name_to_asset(modify["order"]["coin"])),
+                "order": self._order_wire(modify["order"]),
             }
             for modify in modify_requests
         ]
@@ -194,8 +269,7 @@ class Exchange(API):
             "modifies": modify_wires,
         }
 
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             modify_action,
             self.vault_address,
             timestamp,
@@ -264,13 +338,17 @@ class Exchange(API):
             )
 
     def cancel(self, name: str, oid: int) -> Any:
+        if self.batcher is not None and self._batching_calls():
+            return self.batcher.submit_cancel(name, oid)
         return self.bulk_cancel([{"coin": name, "oid": oid}])
 
     def cancel_by_cloid(self, name: str, cloid: Cloid) -> Any:
+        if self.batcher is not None and self._batching_calls():
+            return self.batcher.submit_cancel_by_cloid(name, cloid)
         return self.bulk_cancel_by_cloid([{"coin": name, "cloid": cloid}])
 
     def bulk_cancel(self, cancel_requests: List[CancelRequest]) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         cancel_action = {
             "type": "cancel",
             "cancels": [
@@ -281,8 +359,7 @@ class Exchange(API):
                 for cancel in cancel_requests
             ],
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             cancel_action,
             self.vault_address,
             timestamp,
@@ -297,7 +374,7 @@ class Exchange(API):
         )
 
     def bulk_cancel_by_cloid(self, cancel_requests: List[CancelByCloidRequest]) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
 
         cancel_action = {
             "type": "cancelByCloid",
@@ -309,8 +386,7 @@ class Exchange(API):
                 for cancel in cancel_requests
             ],
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             cancel_action,
             self.vault_address,
             timestamp,
@@ -332,14 +408,13 @@ class Exchange(API):
         Args:
             time (int): if time is not None, then set the cancel time in the future. If None, then unsets any cancel time in the future.
         """
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         schedule_cancel_action: ScheduleCancelAction = {
             "type": "scheduleCancel",
         }
         if time is not None:
             schedule_cancel_action["time"] = time
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             schedule_cancel_action,
             self.vault_address,
             timestamp,
@@ -353,15 +428,14 @@ class Exchange(API):
         )
 
     def update_leverage(self, leverage: int, name: str, is_cross: bool = True) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         update_leverage_action = {
             "type": "updateLeverage",
             "asset": self.info.name_to_asset(name),
             "isCross": is_cross,
             "leverage": leverage,
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             update_leverage_action,
             self.vault_address,
             timestamp,
@@ -375,7 +449,7 @@ class Exchange(API):
         )
 
     def update_isolated_margin(self, amount: float, name: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         amount = float_to_usd_int(amount)
         update_isolated_margin_action = {
             "type": "updateIsolatedMargin",
@@ -383,8 +457,7 @@ class Exchange(API):
             "isBuy": True,
             "ntli": amount,
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             update_isolated_margin_action,
             self.vault_address,
             timestamp,
@@ -398,13 +471,12 @@ class Exchange(API):
         )
 
     def set_referrer(self, code: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         set_referrer_action = {
             "type": "setReferrer",
             "code": code,
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             set_referrer_action,
             None,
             timestamp,
@@ -418,13 +490,12 @@ class Exchange(API):
         )
 
     def create_sub_account(self, name: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         create_sub_account_action = {
             "type": "createSubAccount",
             "name": name,
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             create_sub_account_action,
             None,
             timestamp,
@@ -438,7 +509,7 @@ class Exchange(API):
         )
 
     def usd_class_transfer(self, amount: float, to_perp: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         str_amount = str(amount)
         if self.vault_address:
             str_amount += f" subaccount:{self.vault_address}"
@@ -457,7 +528,7 @@ class Exchange(API):
         )
 
     def perp_dex_class_transfer(self, dex: str, token: str, amount: float, to_perp: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         str_amount = str(amount)
         if self.vault_address:
             str_amount += f" subaccount:{self.vault_address}"
@@ -478,15 +549,14 @@ class Exchange(API):
         )
 
     def sub_account_transfer(self, sub_account_user: str, is_deposit: bool, usd: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         sub_account_transfer_action = {
             "type": "subAccountTransfer",
             "subAccountUser": sub_account_user,
             "isDeposit": is_deposit,
             "usd": usd,
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             sub_account_transfer_action,
             None,
             timestamp,
@@ -500,7 +570,7 @@ class Exchange(API):
         )
 
     def sub_account_spot_transfer(self, sub_account_user: str, is_deposit: bool, token: str, amount: float) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         sub_account_transfer_action = {
             "type": "subAccountSpotTransfer",
             "subAccountUser": sub_account_user,
@@ -508,8 +578,7 @@ class Exchange(API):
             "token": token,
             "amount": str(amount),
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             sub_account_transfer_action,
             None,
             timestamp,
@@ -523,7 +592,7 @@ class Exchange(API):
         )
 
     def vault_usd_transfer(self, vault_address: str, is_deposit: bool, usd: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         vault_transfer_action = {
             "type": "vaultTransfer",
             "vaultAddress": vault_address,
@@ -531,7 +600,7 @@ class Exchange(API):
             "usd": usd,
         }
         is_mainnet = self.base_url == MAINNET_API_URL
-        signature = sign_l1_action(self.wallet, vault_transfer_action, None, timestamp, self.expires_after, is_mainnet)
+        signature = self._sign_l1_action(vault_transfer_action, None, timestamp, self.expires_after, is_mainnet)
         return self._post_action(
             vault_transfer_action,
             signature,
@@ -539,7 +608,7 @@ class Exchange(API):
         )
 
     def usd_transfer(self, amount: float, destination: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {"destination": destination, "amount": str(amount), "time": timestamp, "type": "usdSend"}
         is_mainnet = self.base_url == MAINNET_API_URL
         signature = sign_usd_transfer_action(self.wallet, action, is_mainnet)
@@ -550,7 +619,7 @@ class Exchange(API):
         )
 
     def spot_transfer(self, amount: float, destination: str, token: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "destination": destination,
             "amount": str(amount),
@@ -567,7 +636,7 @@ class Exchange(API):
         )
 
     def token_delegate(self, validator: str, wei: int, is_undelegate: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "validator": validator,
             "wei": wei,
@@ -584,7 +653,7 @@ class Exchange(API):
         )
 
     def withdraw_from_bridge(self, amount: float, destination: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {"destination": destination, "amount": str(amount), "time": timestamp, "type": "withdraw3"}
         is_mainnet = self.base_url == MAINNET_API_URL
         signature = sign_withdraw_from_bridge_action(self.wallet, action, is_mainnet)
@@ -597,7 +666,7 @@ class Exchange(API):
     def approve_agent(self, name: Optional[str] = None) -> Tuple[Any, str]:
         agent_key = "0x" + secrets.token_hex(32)
         account = eth_account.Account.from_key(agent_key)
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         is_mainnet = self.base_url == MAINNET_API_URL
         action = {
             "type": "approveAgent",
@@ -619,14 +688,14 @@ class Exchange(API):
         )
 
     def approve_builder_fee(self, builder: str, max_fee_rate: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
 
         action = {"maxFeeRate": max_fee_rate, "builder": builder, "nonce": timestamp, "type": "approveBuilderFee"}
         signature = sign_approve_builder_fee(self.wallet, action, self.base_url == MAINNET_API_URL)
         return self._post_action(action, signature, timestamp)
 
     def convert_to_multi_sig_user(self, authorized_users: List[str], threshold: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         authorized_users = sorted(authorized_users)
         signers = {
             "authorizedUsers": authorized_users,
@@ -647,7 +716,7 @@ class Exchange(API):
     def spot_deploy_register_token(
         self, token_name: str, sz_decimals: int, wei_decimals: int, max_gas: int, full_name: str
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "spotDeploy",
             "registerToken2": {
@@ -656,8 +725,7 @@ class Exchange(API):
                 "fullName": full_name,
             },
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -673,7 +741,7 @@ class Exchange(API):
     def spot_deploy_user_genesis(
         self, token: int, user_and_wei: List[Tuple[str, str]], existing_token_and_wei: List[Tuple[int, str]]
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "spotDeploy",
             "userGenesis": {
@@ -682,8 +750,7 @@ class Exchange(API):
                 "existingTokenAndWei": existing_token_and_wei,
             },
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -697,15 +764,14 @@ class Exchange(API):
         )
 
     def spot_deploy_enable_freeze_privilege(self, token: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "spotDeploy",
             "enableFreezePrivilege": {
                 "token": token,
             },
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -719,7 +785,7 @@ class Exchange(API):
         )
 
     def spot_deploy_freeze_user(self, token: int, user: str, freeze: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "spotDeploy",
             "freezeUser": {
@@ -728,8 +794,7 @@ class Exchange(API):
                 "freeze": freeze,
             },
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -743,15 +808,14 @@ class Exchange(API):
         )
 
     def spot_deploy_revoke_freeze_privilege(self, token: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "spotDeploy",
             "revokeFreezePrivilege": {
                 "token": token,
             },
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -765,7 +829,7 @@ class Exchange(API):
         )
 
     def spot_deploy_genesis(self, token: int, max_supply: str, no_hyperliquidity: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         genesis = {
             "token": token,
             "maxSupply": max_supply,
@@ -776,8 +840,7 @@ class Exchange(API):
             "type": "spotDeploy",
             "genesis": genesis,
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -791,15 +854,14 @@ class Exchange(API):
         )
 
     def spot_deploy_register_spot(self, base_token: int, quote_token: int) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "spotDeploy",
             "registerSpot": {
                 "tokens": [base_token, quote_token],
             },
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -815,7 +877,7 @@ class Exchange(API):
     def spot_deploy_register_hyperliquidity(
         self, spot: int, start_px: float, order_sz: float, n_orders: int, n_seeded_levels: Optional[int]
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         register_hyperliquidity = {
             "spot": spot,
             "startPx": str(start_px),
@@ -828,8 +890,7 @@ class Exchange(API):
             "type": "spotDeploy",
             "registerHyperliquidity": register_hyperliquidity,
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -843,7 +904,7 @@ class Exchange(API):
         )
 
     def spot_deploy_set_deployer_trading_fee_share(self, token: int, share: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "spotDeploy",
             "setDeployerTradingFeeShare": {
@@ -851,8 +912,7 @@ class Exchange(API):
                 "share": share,
             },
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -876,7 +936,7 @@ class Exchange(API):
         only_isolated: bool,
         schema: Optional[PerpDexSchemaInput],
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         schema_wire = None
         if schema is not None:
             schema_wire = {
@@ -899,8 +959,7 @@ class Exchange(API):
                 "schema": schema_wire,
             },
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -919,7 +978,7 @@ class Exchange(API):
         oracle_pxs: Dict[str, str],
         mark_pxs: Optional[Dict[str, str]],
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         oracle_pxs_wire = sorted(list(oracle_pxs.items()))
         mark_pxs_wire = None
         if mark_pxs is not None:
@@ -932,8 +991,7 @@ class Exchange(API):
                 "markPxs": mark_pxs_wire,
             },
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -953,13 +1011,12 @@ class Exchange(API):
         return self.c_signer_inner("jailSelf")
 
     def c_signer_inner(self, variant: str) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "CSignerAction",
             variant: None,
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -983,7 +1040,7 @@ class Exchange(API):
         unjailed: bool,
         initial_wei: int,
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "CValidatorAction",
             "register": {
@@ -999,8 +1056,7 @@ class Exchange(API):
                 "initial_wei": initial_wei,
             },
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -1023,7 +1079,7 @@ class Exchange(API):
         commission_bps: Optional[int],
         signer: Optional[str],
     ) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "CValidatorAction",
             "changeProfile": {
@@ -1036,8 +1092,7 @@ class Exchange(API):
                 "signer": signer,
             },
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -1051,13 +1106,12 @@ class Exchange(API):
         )
 
     def c_validator_unregister(self) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "CValidatorAction",
             "unregister": None,
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -1098,13 +1152,12 @@ class Exchange(API):
         )
 
     def use_big_blocks(self, enable: bool) -> Any:
-        timestamp = get_timestamp_ms()
+        timestamp = self._next_nonce()
         action = {
             "type": "evmUserModify",
             "usingBigBlocks": enable,
         }
-        signature = sign_l1_action(
-            self.wallet,
+        signature = self._sign_l1_action(
             action,
             None,
             timestamp,
@@ -0,0 +1,200 @@
+import bisect
+import threading
+import time
+
+from hyperliquid.api import API
+from hyperliquid.user_streams import UserStreamPool, get_user_streams
+from hyperliquid.utils.types import Any, Dict, List, Optional, Set, Tuple
+
+# Local fill history per address, so performance and volume numbers are computed from memory instead of downloading
+# the whole userFills history on every call. Each address has a cursor (the time of the newest fill a sync returned);
+# a sync pulls only userFillsByTime from the cursor on, page by page, and the userFills stream (see user_streams)
+# appends fills as they happen in between. Only syncs move the cursor: the stream can miss fills around a reconnect,
+# so everything after the last synced fill is read again by the next sync. Fills are deduplicated by trade id (the
+# cursor is inclusive, and the stream and REST overlap) and indexed by time, overall and per coin, so range queries
+# are two bisects. Fills are the raw API dicts and are shared between readers: treat them as read-only.
+
+# userFillsByTime returns at most this many fills per response
+PAGE_SIZE = 2000
+# without a live stream, history is at most this many seconds behind
+REFRESH_AFTER = 5.0
+# with a live stream, REST only re-checks this often for fills missed around a reconnect
+RESYNC_AFTER = 60.0
+
+Fill = Dict[str, Any]
+
+
+def _fill_key(fill: Fill) -> Any:
+    tid = fill.get("tid")
+    if tid is not None:
+        return tid
+    return fill.get("hash"), fill.get("oid"), fill.get("time"), fill.get("px"), fill.get("sz")
+
+
+def _insert(times: List[int], fills: List[Fill], fill: Fill) -> None:
+    t = fill["time"]
+    if not times or t >= times[-1]:
+        times.append(t)
+        fills.append(fill)
+    else:
+        i = bisect.bisect_right(times, t)
+        times.insert(i, t)
+        fills.insert(i, fill)
+
+
+class AccountFills:
+    """Deduplicated fills of one address, ordered by time and indexed by coin."""
+
+    def __init__(self, address: str):
+        self.address = address
+        # time of the newest fill returned by a sync; None until the history was loaded once
+        self.cursor: Optional[int] = None
+        self.synced_at = 0.0
+        self._seen: Set[Any] = set()
+        self._times: List[int] = []
+        self._fills: List[Fill] = []
+        self._coins: Dict[str, Tuple[List[int], List[Fill]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._fills)
+
+    def add(self, fills: List[Fill], advance: bool = True) -> int:
+        """Ingest fills not seen yet, moving the cursor past all of them if advance; returns how many were new."""
+        added = 0
+        with self._lock:
+            for fill in fills:
+                # fills the stream delivered first still move the cursor once a sync confirms them
+                if advance and (self.cursor is None or fill["time"] > self.cursor):
+                    self.cursor = fill["time"]
+                key = _fill_key(fill)
+                if key in self._seen:
+                    continue
+                self._seen.add(key)
+                _insert(self._times, self._fills, fill)
+                _insert(*self._coins.setdefault(fill["coin"], ([], [])), fill)
+                added += 1
+        return added
+
+    def query(
+        self, coin: Optional[str] = None, start_ms: Optional[int] = None, end_ms: Optional[int] = None
+    ) -> List[Fill]:
+        """Fills of coin (all coins if None) with start_ms <= time <= end_ms, oldest first."""
+        with self._lock:
+            if coin is None:
+                times, fills = self._times, self._fills
+            else:
+                times, fills = self._coins.get(coin, ([], []))
+            lo = 0 if start_ms is None else bisect.bisect_left(times, start_ms)
+            hi = len(times) if end_ms is None else bisect.bisect_right(times, end_ms)
+            return fills[lo:hi]
+
+
+class FillStore:
+    """Fill histories of every address followed on one base_url."""
+
+    def __init__(
+        self,
+        base_url: str,
+        streams: Optional[UserStreamPool] = None,
+        stream: bool = True,
+        start_ms: int = 0,
+        refresh_after: float = REFRESH_AFTER,
+        resync_after: float = RESYNC_AFTER,
+    ):
+        self.base_url = base_url
+        self.streams = (streams or get_user_streams(base_url)) if stream else None
+        # where the first sync of an address starts; the exchange only serves the most recent fills anyway
+        self.start_ms = start_ms
+        self.refresh_after = refresh_after
+        self.resync_after = resync_after
+        self.accounts: Dict[str, AccountFills] = {}
+        self._lock = threading.Lock()
+        self._sync_locks: Dict[str, threading.Lock] = {}
+        self._api = API(base_url)
+        self.requests = 0
+        self.streamed = 0
+
+    def account(self, address: str) -> AccountFills:
+        """The fills of address, following its userFills stream from first use."""
+        address = address.lower()
+        account = self.accounts.get(address)
+        if account is not None:
+            return account
+        with self._lock:
+            account = self.accounts.get(address)
+            if account is not None:
+                return account
+            account = AccountFills(address)
+            self.accounts[address] = account
+            self._sync_locks[address] = threading.Lock()
+        if self.streams is not None:
+            self.streams.subscribe("userFills", self._on_message, user=address)
+        return account
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        data = message.get("data")
+        if not isinstance(data, dict):
+            return
+        account = self.accounts.get(data.get("user", "").lower())
+        if account is not None:
+            self.streamed += account.add(data.get("fills", []), advance=False)
+
+    def sync(self, address: str) -> int:
+        """Pull the fills since the cursor of address; returns how many were new."""
+        account = self.account(address)
+        with self._sync_locks[account.address]:
+            start = account.cursor if account.cursor is not None else self.start_ms
+            added = 0
+            while True:
+                page = self._api.post("/info", {"type": "userFillsByTime", "user": account.address, "startTime": start})
+                self.requests += 1
+                added += account.add(page)
+                if len(page) < PAGE_SIZE:
+                    break
+                newest = max(fill["time"] for fill in page)
+                # a full page within a single millisecond cannot be paged by time; step past it
+                start = newest if newest > start else start + 1
+            if account.cursor is None:
+                account.cursor = start
+            account.synced_at = time.time()
+        return added
+
+    def _live(self, address: str) -> bool:
+        return self.streams is not None and self.streams.connected_for(address)
+
+    def _stale(self, account: AccountFills) -> bool:
+        live = self._live(account.address)
+        return time.time() - account.synced_at > (self.resync_after if live else self.refresh_after)
+
+    def fills(
+        self, address: str, coin: Optional[str] = None, start_ms: Optional[int] = None, end_ms: Optional[int] = None
+    ) -> List[Fill]:
+        """Fills of address (optionally one coin, start_ms <= time <= end_ms), oldest first, synced if stale."""
+        account = self.account(address)
+        if self._stale(account):
+            self.sync(address)
+        return account.query(coin, start_ms, end_ms)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "accounts": len(self.accounts),
+            "fills": sum(len(account) for account in list(self.accounts.values())),
+            "requests": self.requests,
+            "streamed": self.streamed,
+            "live": sum(1 for address in list(self.accounts) if self._live(address)),
+        }
+
+
+_fill_stores: Dict[str, FillStore] = {}
+_fill_stores_lock = threading.Lock()
+
+
+def get_fill_store(base_url: str) -> FillStore:
+    store = _fill_stores.get(base_url)
+    if store is not None:
+        return store
+    with _fill_stores_lock:
+        if base_url not in _fill_stores:
+            _fill_stores[base_url] = FillStore(base_url)
+        return _fill_stores[base_url]
@@ -0,0 +1,451 @@
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from hyperliquid.candles import INTERVAL_MS, CandleStore, get_candle_store
+from hyperliquid.utils.types import Any, Dict, Optional, Sequence, Tuple
+
+# Technical indicators in two forms:
+# - streaming: per (coin, interval) state that advances by one closed bar in constant time, however long the history.
+#   Every indicator is a pure step function over an immutable state, so the still-open bar can be evaluated with
+#   peek() without committing it; the bar is committed with update() once it has closed.
+# - batch: NumPy functions over a (coins, bars) matrix that return the latest value of every coin at once, for
+#   screening the whole universe.
+# Smoothing follows the usual definitions: EMAs are seeded with the SMA of their first `period` values, RSI, ATR and
+# ADX use Wilder's smoothing.
+Bar = Tuple[float, float, float, float]  # high, low, close, volume
+
+NAN = float("nan")
+
+
+class _Streaming(ABC):
+    """Indicator over a stream of bars; subclasses define the initial state and the pure _next step."""
+
+    def __init__(self):
+        self.state: Any = self._initial()
+        self.value: Any = self._empty()
+
+    @abstractmethod
+    def _initial(self) -> Any:
+        """The state before the first bar."""
+
+    def _empty(self) -> Any:
+        return NAN
+
+    @abstractmethod
+    def _next(self, state: Any, bar: Bar) -> Tuple[Any, Any]:
+        """The state and indicator value after bar, without mutating state."""
+
+    def update(self, bar: Bar) -> Any:
+        """Commit a closed bar and return the indicator after it."""
+        self.state, self.value = self._next(self.state, bar)
+        return self.value
+
+    def peek(self, bar: Bar) -> Any:
+        """The indicator if `bar` closed now, without committing it."""
+        return self._next(self.state, bar)[1]
+
+
+def _ema_step(state: Tuple[int, float], x: float, period: int) -> Tuple[Tuple[int, float], float]:
+    count, value = state
+    if count < period:
+        # seed: running SMA of the first `period` values
+        value = (value * count + x) / (count + 1)
+        count += 1
+        return (count, value), value if count == period else NAN
+    value += (x - value) * 2 / (period + 1)
+    return (count + 1, value), value
+
+
+class EMA(_Streaming):
+    def __init__(self, period: int):
+        self.period = period
+        super().__init__()
+
+    def _initial(self) -> Any:
+        return 0, 0.0
+
+    def _next(self, state: Any, bar: Bar) -> Tuple[Any, Any]:
+        return _ema_step(state, bar[2], self.period)
+
+
+class MACD(_Streaming):
+    """(macd, signal, histogram) of the close."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast, self.slow, self.signal = fast, slow, signal
+        super().__init__()
+
+    def _initial(self) -> Any:
+        return (0, 0.0), (0, 0.0), (0, 0.0)
+
+    def _empty(self) -> Any:
+        return NAN, NAN, NAN
+
+    def _next(self, state: Any, bar: Bar) -> Tuple[Any, Any]:
+        fast_state, slow_state, signal_state = state
+        fast_state, fast = _ema_step(fast_state, bar[2], self.fast)
+        slow_state, slow = _ema_step(slow_state, bar[2], self.slow)
+        macd = fast - slow
+        if math.isnan(macd):
+            return (fast_state, slow_state, signal_state), (NAN, NAN, NAN)
+        signal_state, signal = _ema_step(signal_state, macd, self.signal)
+        return (fast_state, slow_state, signal_state), (macd, signal, macd - signal)
+
+
+class RSI(_Streaming):
+    def __init__(self, period: int = 14):
+        self.period = period
+        super().__init__()
+
+    def _initial(self) -> Any:
+        return None, 0, 0.0, 0.0  # previous close, changes seen, average gain, average loss
+
+    def _next(self, state: Any, bar: Bar) -> Tuple[Any, Any]:
+        prev, count, gain, loss = state
+        close = bar[2]
+        if prev is None:
+            return (close, 0, 0.0, 0.0), NAN
+        change = close - prev
+        up, down = max(change, 0.0), max(-change, 0.0)
+        n = self.period if count >= self.period else count + 1
+        gain += (up - gain) / n
+        loss += (down - loss) / n
+        count += 1
+        if count < self.period:
+            return (close, count, gain, loss), NAN
+        rsi = 100.0 if loss == 0 else 100 - 100 / (1 + gain / loss)
+        return (close, count, gain, loss), rsi
+
+
+def _true_range(high: float, low: float, prev_close: Optional[float]) -> float:
+    if prev_close is None:
+        return high - low
+    return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+
+class ATR(_Streaming):
+    def __init__(self, period: int = 14):
+        self.period = period
+        super().__init__()
+
+    def _initial(self) -> Any:
+        return None, 0, 0.0
+
+    def _next(self, state: Any, bar: Bar) -> Tuple[Any, Any]:
+        prev_close, count, atr = state
+        tr = _true_range(bar[0], bar[1], prev_close)
+        count += 1
+        atr += (tr - atr) / min(count, self.period)
+        return (bar[2], count, atr), atr if count >= self.period else NAN
+
+
+class ADX(_Streaming):
+    """Wilder's ADX from +DI/-DI; value is (adx, plus_di, minus_di)."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        super().__init__()
+
+    def _initial(self) -> Any:
+        # previous bar (high, low, close), bars seen, smoothed TR, +DM, -DM, ADX
+        return None, 0, 0.0, 0.0, 0.0, 0.0
+
+    def _empty(self) -> Any:
+        return NAN, NAN, NAN
+
+    def _next(self, state: Any, bar: Bar) -> Tuple[Any, Any]:
+        prev, count, tr_avg, plus_avg, minus_avg, adx = state
+        high, low, close = bar[0], bar[1], bar[2]
+        if prev is None:
+            return ((high, low, close), 0, 0.0, 0.0, 0.0, 0.0), (NAN, NAN, NAN)
+        up, down = high - prev[0], prev[1] - low
+        plus_dm = up if up > down and up > 0 else 0.0
+        minus_dm = down if down > up and down > 0 else 0.0
+        count += 1
+        n = min(count, self.period)
+        tr_avg += (_true_range(high, low, prev[2]) - tr_avg) / n
+        plus_avg += (plus_dm - plus_avg) / n
+        minus_avg += (minus_dm - minus_avg) / n
+        plus_di = 100 * plus_avg / tr_avg if tr_avg > 0 else 0.0
+        minus_di = 100 * minus_avg / tr_avg if tr_avg > 0 else 0.0
+        di_sum = plus_di + minus_di
+        dx = 100 * abs(plus_di - minus_di) / di_sum if di_sum > 0 else 0.0
+        # the ADX smooths DX from the first full DI onwards, so it is defined after 2 * period - 1 changes
+        if count >= self.period:
+            adx += (dx - adx) / min(count - self.period + 1, self.period)
+        state = ((high, low, close), count, tr_avg, plus_avg, minus_avg, adx)
+        if count < 2 * self.period - 1:
+            return state, (NAN, plus_di, minus_di)
+        return state, (adx, plus_di, minus_di)
+
+
+class Stochastic(_Streaming):
+    """(%K, %D) over `period` bars, %D the `smooth`-bar SMA of %K."""
+
+    def __init__(self, period: int = 14, smooth: int = 3):
+        self.period, self.smooth = period, smooth
+        super().__init__()
+
+    def _initial(self) -> Any:
+        return (), ()  # last `period` (high, low) pairs, last `smooth` %K values
+
+    def _empty(self) -> Any:
+        return NAN, NAN
+
+    def _next(self, state: Any, bar: Bar) -> Tuple[Any, Any]:
+        window, ks = state
+        window = (window + ((bar[0], bar[1]),))[-self.period :]
+        if len(window) < self.period:
+            return (window, ks), (NAN, NAN)
+        high = max(h for h, _ in window)
+        low = min(l for _, l in window)
+        k = 50.0 if high == low else 100 * (bar[2] - low) / (high - low)
+        ks = (ks + (k,))[-self.smooth :]
+        d = sum(ks) / len(ks) if len(ks) == self.smooth else NAN
+        return (window, ks), (k, d)
+
+
+class Bollinger(_Streaming):
+    """(lower, middle, upper) bands: SMA of the close +/- k population standard deviations."""
+
+    def __init__(self, period: int = 20, k: float = 2.0):
+        self.period, self.k = period, k
+        super().__init__()
+
+    def _initial(self) -> Any:
+        return (), 0.0, 0.0  # last `period` closes, their sum and sum of squares
+
+    def _empty(self) -> Any:
+        return NAN, NAN, NAN
+
+    def _next(self, state: Any, bar: Bar) -> Tuple[Any, Any]:
+        window, total, squares = state
+        close = bar[2]
+        total, squares = total + close, squares + close * close
+        if len(window) == self.period:
+            total, squares = total - window[0], squares - window[0] * window[0]
+            window = window[1:]
+        window = window + (close,)
+        if len(window) < self.period:
+            return (window, total, squares), (NAN, NAN, NAN)
+        mean = total / self.period
+        std = math.sqrt(max(squares / self.period - mean * mean, 0.0))
+        return (window, total, squares), (mean - self.k * std, mean, mean + self.k * std)
+
+
+def default_indicators() -> Dict[str, _Streaming]:
+    return {
+        "ema12": EMA(12),
+        "ema26": EMA(26),
+        "macd": MACD(),
+        "rsi": RSI(),
+        "atr": ATR(),
+        "adx": ADX(),
+        "stochastic": Stochastic(),
+        "bollinger": Bollinger(),
+    }
+
+
+class IndicatorSet:
+    """Streaming indicators of one (coin, interval), advanced over the closed bars of its candle series."""
+
+    def __init__(self, coin: str, interval: str, indicators: Optional[Dict[str, _Streaming]] = None):
+        self.coin = coin
+        self.interval = interval
+        self.indicators = indicators or default_indicators()
+        self.last_closed: Optional[int] = None  # open time of the last committed bar
+        self.previous: Dict[str, Any] = {}  # values after the bar before the last committed one
+        self.bars = 0
+        self._lock = threading.Lock()
+
+    def advance(self, bars: np.ndarray, interval_ms: int, now_ms: int) -> Dict[str, Any]:
+        """Commit the closed bars newer than the last one committed and return the values including the open bar."""
+        with self._lock:
+            if self.last_closed is not None:
+                bars = bars[bars["t"] > self.last_closed]
+            closed = bars[bars["t"] + interval_ms <= now_ms]
+            for t, high, low, close, volume in zip(
+                closed["t"].tolist(),
+                closed["h"].tolist(),
+                closed["l"].tolist(),
+                closed["c"].tolist(),
+                closed["v"].tolist(),
+            ):
+                self.previous = {name: indicator.value for name, indicator in self.indicators.items()}
+                for indicator in self.indicators.values():
+                    indicator.update((high, low, close, volume))
+                self.last_closed = t
+                self.bars += 1
+            values = {name: indicator.value for name, indicator in self.indicators.items()}
+            if len(bars) > len(closed):
+                open_bar = bars[-1]
+                bar = (float(open_bar["h"]), float(open_bar["l"]), float(open_bar["c"]), float(open_bar["v"]))
+                values = {name: indicator.peek(bar) for name, indicator in self.indicators.items()}
+                values["previous"] = {name: indicator.value for name, indicator in self.indicators.items()}
+            else:
+                values["previous"] = dict(self.previous)
+            return values
+
+
+class IndicatorEngine:
+    """Indicator sets shared by every strategy of one base_url, fed from its candle store."""
+
+    def __init__(self, candles: CandleStore, warmup: int = 200):
+        self.candles = candles
+        self.warmup = warmup
+        self.sets: Dict[Tuple[str, str], IndicatorSet] = {}
+        self._lock = threading.Lock()
+
+    def values(self, coin: str, interval: str, lookback: int = 0) -> Dict[str, Any]:
+        """Latest indicator values of coin at interval, the open bar included; "previous" holds the bar before.
+
+        The first call warms the indicators up over max(warmup, lookback) bars; later calls only step over the bars
+        that closed since.
+        """
+        key = (coin, interval)
+        indicator_set = self.sets.get(key)
+        if indicator_set is None:
+            with self._lock:
+                indicator_set = self.sets.setdefault(key, IndicatorSet(coin, interval))
+        interval_ms = INTERVAL_MS[interval]
+        now_ms = int(time.time() * 1000)
+        if indicator_set.last_closed is None:
+            n = max(self.warmup, lookback)
+        else:
+            # the bars closed since the last call and the open one; lookback keeps the series backfilled that deep
+            n = max(lookback, (now_ms - indicator_set.last_closed) // interval_ms + 1)
+        return indicator_set.advance(self.candles.last(coin, interval, n), interval_ms, now_ms)
+
+
+# Batch mode: rows are coins, columns bars (oldest first); every function returns the latest value per coin, NaN where
+# a coin has too little history. universe_bars left-pads coins with a shorter history with NaN.
+
+
+def universe_bars(candles: CandleStore, coins: Sequence[str], interval: str, n: int) -> Dict[str, np.ndarray]:
+    """(len(coins), n) matrices of h, l, c and v from the candle store, aligned on the newest bar."""
+    matrices = {field: np.full((len(coins), n), np.nan) for field in ("h", "l", "c", "v")}
+    for row, coin in enumerate(coins):
+        bars = candles.last(coin, interval, n)
+        if len(bars):
+            for field, matrix in matrices.items():
+                matrix[row, n - len(bars) :] = bars[field]
+    return matrices
+
+
+def _first_valid(x: np.ndarray) -> np.ndarray:
+    valid = ~np.isnan(x)
+    first: np.ndarray = np.where(valid.any(axis=1), valid.argmax(axis=1), x.shape[1])
+    return first
+
+
+def ema_batch(x: np.ndarray, period: int, full: bool = False) -> np.ndarray:
+    """EMA of every row, seeded with the SMA of each row's first `period` valid values."""
+    rows, cols = x.shape
+    out = np.full((rows, cols), np.nan)
+    start = _first_valid(x)
+    alpha = 2 / (period + 1)
+    value = np.full(rows, np.nan)
+    for col in range(cols):
+        seed_end = start + period - 1
+        seeding = np.equal(seed_end, col)
+        if seeding.any():
+            idx = np.nonzero(seeding)[0]
+            value[idx] = np.nanmean(x[idx, col - period + 1 : col + 1], axis=1)
+        stepping = col > seed_end
+        value = np.where(stepping, value + (x[:, col] - value) * alpha, value)
+        out[:, col] = np.where(col >= seed_end, value, np.nan)
+    return out if full else out[:, -1]
+
+
+def macd_batch(
+    closes: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    macd = ema_batch(closes, fast, full=True) - ema_batch(closes, slow, full=True)
+    signal_line = ema_batch(macd, signal, full=True)[:, -1]
+    return macd[:, -1], signal_line, macd[:, -1] - signal_line
+
+
+def _wilder(x: np.ndarray, period: int, start: np.ndarray) -> np.ndarray:
+    """Wilder's running average of every row from its `start` column (average of the first `period` values)."""
+    rows, cols = x.shape
+    value = np.zeros(rows)
+    out = np.full((rows, cols), np.nan)
+    for col in range(cols):
+        seen = col - start + 1
+        active = seen >= 1
+        n = np.clip(seen, 1, period)
+        value = np.where(active, value + (np.nan_to_num(x[:, col]) - value) / n, value)
+        out[:, col] = np.where(seen >= period, value, np.nan)
+    return out
+
+
+def rsi_batch(closes: np.ndarray, period: int = 14) -> np.ndarray:
+    change = np.diff(closes, axis=1)
+    start = _first_valid(change)
+    gain = _wilder(np.clip(change, 0, None), period, start)[:, -1]
+    loss = _wilder(np.clip(-change, 0, None), period, start)[:, -1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - 100 / (1 + gain / loss)
+    return np.where(loss == 0, np.where(np.isnan(gain), np.nan, 100.0), rsi)
+
+
+def _true_range_batch(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> np.ndarray:
+    prev = np.concatenate([np.full((closes.shape[0], 1), np.nan), closes[:, :-1]], axis=1)
+    tr = np.maximum(highs - lows, np.maximum(np.abs(highs - prev), np.abs(lows - prev)))
+    true_range: np.ndarray = np.where(np.isnan(prev), highs - lows, tr)
+    return true_range
+
+
+def atr_batch(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14) -> np.ndarray:
+    tr = _true_range_batch(highs, lows, closes)
+    return _wilder(tr, period, _first_valid(tr))[:, -1]
+
+
+def adx_batch(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14) -> np.ndarray:
+    up = np.diff(highs, axis=1)
+    down = -np.diff(lows, axis=1)
+    plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+    tr = _true_range_batch(highs, lows, closes)[:, 1:]
+    start = _first_valid(np.where(np.isnan(up), np.nan, tr))
+    tr_avg = _wilder(tr, period, start)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = 100 * _wilder(plus_dm, period, start) / tr_avg
+        minus_di = 100 * _wilder(minus_dm, period, start) / tr_avg
+        dx = np.nan_to_num(100 * np.abs(plus_di - minus_di) / (plus_di + minus_di))
+    dx = np.where(np.isnan(tr_avg), np.nan, dx)
+    return _wilder(dx, period, start + period - 1)[:, -1]
+
+
+def stochastic_batch(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14) -> np.ndarray:
+    """%K of every row over its last `period` bars."""
+    high = highs[:, -period:].max(axis=1)
+    low = lows[:, -period:].min(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = 100 * (closes[:, -1] - low) / (high - low)
+    return np.where(high == low, 50.0, k)
+
+
+def bollinger_batch(closes: np.ndarray, period: int = 20, k: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    window = closes[:, -period:]
+    mean = window.mean(axis=1)
+    std = window.std(axis=1)
+    return mean - k * std, mean, mean + k * std
+
+
+_engines: Dict[str, IndicatorEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_indicator_engine(base_url: str) -> IndicatorEngine:
+    engine = _engines.get(base_url)
+    if engine is not None:
+        return engine
+    with _engines_lock:
+        if base_url not in _engines:
+            _engines[base_url] = IndicatorEngine(get_candle_store(base_url))
+        return _engines[base_url]
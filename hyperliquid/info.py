@@ -1,17 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from hyperliquid.accounts import get_account_cache
 from hyperliquid.api import API
+from hyperliquid.coalescing import RequestCoalescer, get_coalescer
+from hyperliquid.metadata import MetadataRegistry, add_perp_meta, add_spot_meta, get_registry, perp_dex_offsets
+from hyperliquid.mids import get_mids_hub
+from hyperliquid.response_cache import ResponseCache, get_response_cache
 from hyperliquid.utils.types import (
     Any,
     Callable,
     Cloid,
+    Dict,
+    Iterable,
+    Iterator,
     List,
     Meta,
     Optional,
     SpotMeta,
     SpotMetaAndAssetCtxs,
     Subscription,
+    Tuple,
     cast,
 )
 from hyperliquid.websocket_manager import WebsocketManager
+from hyperliquid.ws_transport import Transport
 
 
 class Info(API):
@@ -24,40 +36,41 @@ class Info(API):
         # Note that when perp_dexs is None, then "" is used as the perp dex. "" represents
         # the original dex.
         perp_dexs: Optional[List[str]] = None,
+        transport: Optional[Transport] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):  # pylint: disable=too-many-locals
-        super().__init__(base_url)
+        super().__init__(base_url, transport)
+        # Opt-in single-flight for /info queries; defaults to the shared coalescer if enable_coalescing was called.
+        self.coalescer = coalescer or get_coalescer(self.base_url)
+        # Opt-in TTL cache for slow-changing queries; defaults to the shared one if enable_response_cache was called.
+        self.response_cache = response_cache or get_response_cache(self.base_url)
         self.ws_manager: Optional[WebsocketManager] = None
         if not skip_ws:
             self.ws_manager = WebsocketManager(self.base_url)
             self.ws_manager.start()
 
+        # Without pinned metadata, asset lookups are served by the process-wide registry, so constructing an Info
+        # costs no round-trips once any client for this base_url has loaded it.
+        self._metadata: Optional[MetadataRegistry] = None
+        if meta is None and spot_meta is None:
+            self._metadata = get_registry(self.base_url, perp_dexs)
+            self._metadata.snapshot()
+            return
+
         if spot_meta is None:
             spot_meta = self.spot_meta()
 
         self.coin_to_asset = {}
         self.name_to_coin = {}
         self.asset_to_sz_decimals = {}
-
-        # spot assets start at 10000
-        for spot_info in spot_meta["universe"]:
-            asset = spot_info["index"] + 10000
-            self.coin_to_asset[spot_info["name"]] = asset
-            self.name_to_coin[spot_info["name"]] = spot_info["name"]
-            base, quote = spot_info["tokens"]
-            base_info = spot_meta["tokens"][base]
-            quote_info = spot_meta["tokens"][quote]
-            self.asset_to_sz_decimals[asset] = base_info["szDecimals"]
-            name = f'{base_info["name"]}/{quote_info["name"]}'
-            if name not in self.name_to_coin:
-                self.name_to_coin[name] = spot_info["name"]
+        self.set_spot_meta(spot_meta)
 
         perp_dex_to_offset = {"": 0}
         if perp_dexs is None:
             perp_dexs = [""]
         else:
-            for i, perp_dex in enumerate(self.perp_dexs()[1:]):
-                # builder-deployed perp dexs start at 110000
-                perp_dex_to_offset[perp_dex["name"]] = 110000 + i * 10000
+            perp_dex_to_offset = perp_dex_offsets(self.perp_dexs())
 
         for perp_dex in perp_dexs:
             offset = perp_dex_to_offset[perp_dex]
@@ -67,12 +80,76 @@ class Info(API):
                 fresh_meta = self.meta(dex=perp_dex)
                 self.set_perp_meta(fresh_meta, offset)
 
+    def post(self, url_path: str, payload: Any = None) -> Any:
+        cache = self.response_cache
+        if cache is None or not cache.cacheable(url_path, payload):
+            return self._fetch(url_path, payload)
+        hit, result = cache.get(payload)
+        if hit:
+            return result
+        version = cache.version(payload)
+        result = self._fetch(url_path, payload)
+        cache.put(payload, result, version)
+        return result
+
+    def _fetch(self, url_path: str, payload: Any) -> Any:
+        if self.coalescer is None or url_path != "/info":
+            return super().post(url_path, payload)
+        return self.coalescer.call(
+            RequestCoalescer.key(url_path, payload), lambda: super(Info, self).post(url_path, payload)
+        )
+
+    @property
+    def coin_to_asset(self) -> Dict[str, int]:
+        if self._metadata is not None:
+            return self._metadata.snapshot().coin_to_asset
+        return self._coin_to_asset
+
+    @coin_to_asset.setter
+    def coin_to_asset(self, coin_to_asset: Dict[str, int]) -> None:
+        self._detach_metadata()
+        self._coin_to_asset = coin_to_asset
+
+    @property
+    def name_to_coin(self) -> Dict[str, str]:
+        if self._metadata is not None:
+            return self._metadata.snapshot().name_to_coin
+        return self._name_to_coin
+
+    @name_to_coin.setter
+    def name_to_coin(self, name_to_coin: Dict[str, str]) -> None:
+        self._detach_metadata()
+        self._name_to_coin = name_to_coin
+
+    @property
+    def asset_to_sz_decimals(self) -> Dict[int, int]:
+        if self._metadata is not None:
+            return self._metadata.snapshot().asset_to_sz_decimals
+        return self._asset_to_sz_decimals
+
+    @asset_to_sz_decimals.setter
+    def asset_to_sz_decimals(self, asset_to_sz_decimals: Dict[int, int]) -> None:
+        self._detach_metadata()
+        self._asset_to_sz_decimals = asset_to_sz_decimals
+
+    def _detach_metadata(self) -> None:
+        # Copy-on-write: take private copies of the shared maps before this instance changes any of them.
+        metadata = getattr(self, "_metadata", None)
+        if metadata is None:
+            return
+        snapshot = metadata.snapshot()
+        self._metadata = None
+        self._coin_to_asset = dict(snapshot.coin_to_asset)
+        self._name_to_coin = dict(snapshot.name_to_coin)
+        self._asset_to_sz_decimals = dict(snapshot.asset_to_sz_decimals)
+
+    def set_spot_meta(self, spot_meta: SpotMeta) -> Any:
+        self._detach_metadata()
+        add_spot_meta(self.coin_to_asset, self.name_to_coin, self.asset_to_sz_decimals, spot_meta)
+
     def set_perp_meta(self, meta: Meta, offset: int) -> Any:
-        for asset, asset_info in enumerate(meta["universe"]):
-            asset += offset
-            self.coin_to_asset[asset_info["name"]] = asset
-            self.name_to_coin[asset_info["name"]] = asset_info["name"]
-            self.asset_to_sz_decimals[asset] = asset_info["szDecimals"]
+        self._detach_metadata()
+        add_perp_meta(self.coin_to_asset, self.name_to_coin, self.asset_to_sz_decimals, meta, offset)
 
     def disconnect_websocket(self):
         if self.ws_manager is None:
@@ -122,8 +199,33 @@ class Info(API):
                     totalRawUsd: float string,
                 }
         """
+        cache = get_account_cache(self.base_url) if dex == "" else None
+        if cache is not None:
+            # streamed; only costs a request when the state is stale or one of the user's orders just filled
+            return cache.user_state(address)
         return self.post("/info", {"type": "clearinghouseState", "user": address, "dex": dex})
 
+    def user_states(self, addresses: Iterable[str], concurrency: int = 16, dex: str = "") -> Iterator[Tuple[str, Any]]:
+        """Retrieve trading details for many users, streaming results as they arrive.
+
+        Requests fan out over `concurrency` worker threads and go through the rate limiter like any other query.
+
+        Args:
+            addresses (Iterable[str]): Onchain addresses in 42-character hexadecimal format.
+            concurrency (int): Maximum number of requests in flight.
+        Yields:
+            (address, state) in completion order, where state is the user_state response or, if that request failed,
+            the exception it raised.
+        """
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="hyperliquid-user-states")
+        try:
+            futures = {executor.submit(self.user_state, address, dex): address for address in addresses}
+            for future in as_completed(futures):
+                error = future.exception()
+                yield futures[future], error if error is not None else future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def spot_user_state(self, address: str) -> Any:
         return self.post("/info", {"type": "spotClearinghouseState", "user": address})
 
@@ -193,6 +295,10 @@ class Info(API):
               any other coins which are trading: float string
             }
         """
+        hub = get_mids_hub(self.base_url) if dex == "" else None
+        if hub is not None:
+            # streamed; only costs a request when the stream is stale
+            return hub.all_mids()
         return self.post("/info", {"type": "allMids", "dex": dex})
 
     def user_fills(self, address: str) -> Any:
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+
+from hyperliquid.utils.types import Any, Callable, Dict, Optional
+from hyperliquid.websocket_manager import WebsocketManager
+
+# One websocket per base_url, owned by a background event loop, shared by the in-process market data stores (books,
+# mids, candles); per-user streams go through hyperliquid.user_streams instead. Subscriptions can be made from any
+# thread; callbacks run on the feed's loop and must not block.
+
+
+class MarketDataFeed:
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws: Optional[WebsocketManager] = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="hyperliquid-market-feed", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    async def _subscribe(self, subscription_type: str, callback: Callable[[Any], None], params: Dict[str, Any]) -> None:
+        if self._ws is None:
+            self._ws = WebsocketManager(self.base_url, max_reconnect_attempts=None)
+            if not await self._ws.connect():
+                self._ws.reconnect()
+        await self._ws.subscribe(subscription_type, callback, **params)
+
+    def subscribe(self, subscription_type: str, callback: Callable[[Any], None], **params: Any) -> None:
+        """Subscribe without waiting for the socket; the subscription is replayed whenever it reconnects."""
+        asyncio.run_coroutine_threadsafe(self._subscribe(subscription_type, callback, params), self._ensure_loop())
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and self._ws.connected
+
+    def stats(self) -> Dict[str, Any]:
+        if self._ws is None:
+            return {"connected": False}
+        return self._ws.get_status()
+
+    def close(self) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        if self._ws is not None:
+            asyncio.run_coroutine_threadsafe(self._ws.close(), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        with self._lock:
+            self._loop = None
+            self._ws = None
+
+
+_feeds: Dict[str, MarketDataFeed] = {}
+_feeds_lock = threading.Lock()
+
+
+def get_market_feed(base_url: str) -> MarketDataFeed:
+    feed = _feeds.get(base_url)
+    if feed is not None:
+        return feed
+    with _feeds_lock:
+        if base_url not in _feeds:
+            _feeds[base_url] = MarketDataFeed(base_url)
+        return _feeds[base_url]
@@ -0,0 +1,253 @@
+import json
+import logging
+import os
+import threading
+import time
+
+from hyperliquid.api import API
+from hyperliquid.transport import HttpTransport
+from hyperliquid.utils.types import Any, Dict, List, Meta, Optional, SpotMeta, Tuple
+
+# Exchange metadata changes rarely (new listings), so every Info/Exchange shares one registry per (base_url, perp_dexs)
+# instead of fetching spotMeta/meta on construction. Stale snapshots keep serving reads while a background thread
+# refreshes them, and an unknown coin triggers at most one refresh per MISS_REFRESH_INTERVAL.
+DEFAULT_TTL = 300.0
+MISS_REFRESH_INTERVAL = 5.0
+
+logger = logging.getLogger(__name__)
+
+
+def perp_dex_offsets(perp_dexs: Any) -> Dict[str, int]:
+    perp_dex_to_offset = {"": 0}
+    for i, perp_dex in enumerate(perp_dexs[1:]):
+        # builder-deployed perp dexs start at 110000
+        perp_dex_to_offset[perp_dex["name"]] = 110000 + i * 10000
+    return perp_dex_to_offset
+
+
+def add_spot_meta(
+    coin_to_asset: Dict[str, int],
+    name_to_coin: Dict[str, str],
+    asset_to_sz_decimals: Dict[int, int],
+    spot_meta: SpotMeta,
+) -> None:
+    # spot assets start at 10000
+    for spot_info in spot_meta["universe"]:
+        asset = spot_info["index"] + 10000
+        coin_to_asset[spot_info["name"]] = asset
+        name_to_coin[spot_info["name"]] = spot_info["name"]
+        base, quote = spot_info["tokens"]
+        base_info = spot_meta["tokens"][base]
+        quote_info = spot_meta["tokens"][quote]
+        asset_to_sz_decimals[asset] = base_info["szDecimals"]
+        name = f'{base_info["name"]}/{quote_info["name"]}'
+        if name not in name_to_coin:
+            name_to_coin[name] = spot_info["name"]
+
+
+def add_perp_meta(
+    coin_to_asset: Dict[str, int],
+    name_to_coin: Dict[str, str],
+    asset_to_sz_decimals: Dict[int, int],
+    meta: Meta,
+    offset: int,
+) -> None:
+    for asset, asset_info in enumerate(meta["universe"]):
+        asset += offset
+        coin_to_asset[asset_info["name"]] = asset
+        name_to_coin[asset_info["name"]] = asset_info["name"]
+        asset_to_sz_decimals[asset] = asset_info["szDecimals"]
+
+
+class SharedMap(dict):  # type: ignore[type-arg]
+    """Read-only mapping shared by every client of a registry. A missing key asks the registry for a refresh."""
+
+    def __init__(self, data: Dict[Any, Any], registry: "MetadataRegistry", field: str):
+        super().__init__(data)
+        self._registry = registry
+        self._field = field
+
+    def __missing__(self, key):
+        fresh = getattr(self._registry.refresh_on_miss(), self._field)
+        if fresh is self:
+            raise KeyError(key)
+        return fresh[key]
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("shared exchange metadata is read-only, use Info.set_perp_meta/set_spot_meta to extend it")
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+
+class MetadataSnapshot:
+    def __init__(
+        self,
+        registry: "MetadataRegistry",
+        coin_to_asset: Dict[str, int],
+        name_to_coin: Dict[str, str],
+        asset_to_sz_decimals: Dict[int, int],
+        fetched_at: float,
+    ):
+        self.coin_to_asset = SharedMap(coin_to_asset, registry, "coin_to_asset")
+        self.name_to_coin = SharedMap(name_to_coin, registry, "name_to_coin")
+        self.asset_to_sz_decimals = SharedMap(asset_to_sz_decimals, registry, "asset_to_sz_decimals")
+        self.fetched_at = fetched_at
+
+
+class MetadataRegistry:
+    def __init__(
+        self,
+        base_url: str,
+        perp_dexs: Optional[List[str]] = None,
+        ttl: float = DEFAULT_TTL,
+        snapshot_path: Optional[str] = None,
+        transport: Optional[HttpTransport] = None,
+    ):
+        self.base_url = base_url
+        self.perp_dexs = perp_dexs
+        self.ttl = ttl
+        self.snapshot_path = snapshot_path
+        self._api = API(base_url, transport)
+        self._lock = threading.Lock()
+        self._snapshot: Optional[MetadataSnapshot] = None
+        self._refreshing = False
+        self._miss_refreshing = False
+        self._last_miss_refresh = 0.0
+        if snapshot_path is not None:
+            self._snapshot = self._load(snapshot_path)
+
+    def snapshot(self) -> MetadataSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = self._fetch()
+                return self._snapshot
+        if time.time() - snapshot.fetched_at > self.ttl:
+            self._refresh_in_background()
+        return snapshot
+
+    def refresh(self) -> MetadataSnapshot:
+        # fetched without the lock, so lookups and other refreshes never wait on the round trip
+        snapshot = self._fetch()
+        with self._lock:
+            self._snapshot = snapshot
+        return snapshot
+
+    def refresh_on_miss(self) -> MetadataSnapshot:
+        """Refresh for a lookup miss; while one is in flight or was just made, other misses get the current snapshot."""
+        with self._lock:
+            now = time.time()
+            if self._snapshot is not None and (
+                self._miss_refreshing or now - self._last_miss_refresh < MISS_REFRESH_INTERVAL
+            ):
+                return self._snapshot
+            self._last_miss_refresh = now
+            self._miss_refreshing = True
+        try:
+            return self.refresh()
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f"Metadata refresh after lookup miss failed: {e}")
+            if self._snapshot is None:
+                raise
+            return self._snapshot
+        finally:
+            self._miss_refreshing = False
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, name="hyperliquid-metadata-refresh", daemon=True).start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f"Background metadata refresh failed: {e}")
+        finally:
+            self._refreshing = False
+
+    def _fetch(self) -> MetadataSnapshot:
+        coin_to_asset: Dict[str, int] = {}
+        name_to_coin: Dict[str, str] = {}
+        asset_to_sz_decimals: Dict[int, int] = {}
+        spot_meta = self._api.post("/info", {"type": "spotMeta"})
+        add_spot_meta(coin_to_asset, name_to_coin, asset_to_sz_decimals, spot_meta)
+
+        perp_dex_to_offset = {"": 0}
+        perp_dexs = self.perp_dexs
+        if perp_dexs is None:
+            perp_dexs = [""]
+        else:
+            perp_dex_to_offset = perp_dex_offsets(self._api.post("/info", {"type": "perpDexs"}))
+
+        for perp_dex in perp_dexs:
+            meta = self._api.post("/info", {"type": "meta", "dex": perp_dex})
+            add_perp_meta(coin_to_asset, name_to_coin, asset_to_sz_decimals, meta, perp_dex_to_offset[perp_dex])
+
+        snapshot = MetadataSnapshot(self, coin_to_asset, name_to_coin, asset_to_sz_decimals, time.time())
+        if self.snapshot_path is not None:
+            self._save(self.snapshot_path, snapshot)
+        return snapshot
+
+    def _save(self, path: str, snapshot: MetadataSnapshot) -> None:
+        data = {
+            "base_url": self.base_url,
+            "perp_dexs": self.perp_dexs,
+            "fetched_at": snapshot.fetched_at,
+            "coin_to_asset": dict(snapshot.coin_to_asset),
+            "name_to_coin": dict(snapshot.name_to_coin),
+            "asset_to_sz_decimals": {str(asset): sz for asset, sz in snapshot.asset_to_sz_decimals.items()},
+        }
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist metadata snapshot to {path}: {e}")
+
+    def _load(self, path: str) -> Optional[MetadataSnapshot]:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("base_url") != self.base_url or data.get("perp_dexs") != self.perp_dexs:
+            return None
+        return MetadataSnapshot(
+            self,
+            data["coin_to_asset"],
+            data["name_to_coin"],
+            {int(asset): sz for asset, sz in data["asset_to_sz_decimals"].items()},
+            data["fetched_at"],
+        )
+
+
+_registries: Dict[Tuple[str, Optional[Tuple[str, ...]]], MetadataRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(
+    base_url: str,
+    perp_dexs: Optional[List[str]] = None,
+    ttl: float = DEFAULT_TTL,
+    snapshot_path: Optional[str] = None,
+) -> MetadataRegistry:
+    """Return the process-wide registry for base_url; ttl and snapshot_path only apply when it is first created."""
+    key = (base_url, tuple(perp_dexs) if perp_dexs is not None else None)
+    registry = _registries.get(key)
+    if registry is not None:
+        return registry
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = MetadataRegistry(base_url, perp_dexs, ttl, snapshot_path)
+        return _registries[key]
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import threading
+import time
+
+import numpy as np
+
+from hyperliquid.api import API
+from hyperliquid.market_feed import MarketDataFeed, get_market_feed
+from hyperliquid.metadata import get_registry
+from hyperliquid.utils.types import Any, Dict, List, Optional, Tuple
+
+# Process-wide mid prices pushed by the allMids channel of the shared market-data feed. Once
+# enable_mids_hub(base_url) was called, Info.all_mids() for the default dex is answered from memory while the stream
+# is fresh and falls back to one /info request when it is stale (every response it gets is fed back into the hub).
+# Besides the raw {coin: px} payload, every update is parsed once into a float vector with a column per coin and the
+# coin's asset id, so readers index floats instead of calling float() on the same strings.
+STALE_AFTER = 3.0
+
+logger = logging.getLogger(__name__)
+
+
+class MidsHub:
+    def __init__(self, base_url: str, stale_after: float = STALE_AFTER):
+        self.base_url = base_url
+        self.stale_after = stale_after
+        self.updated_at = 0.0
+        self.seq = 0
+        self.stream_updates = 0
+        self.rest_updates = 0
+        self._raw: Dict[str, str] = {}
+        self._mids: Dict[str, float] = {}
+        # columns only grow, so a coin keeps its slot for the life of the hub
+        self._slots: Dict[str, int] = {}
+        self._asset_slots: Dict[int, int] = {}
+        self.asset_ids = np.empty(0, dtype=np.int64)
+        self.prices = np.empty(0)
+        self._cond = threading.Condition()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[int]"]] = []
+        self.feed: Optional[MarketDataFeed] = None
+        self._api = API(base_url)
+        self._fetch_lock = threading.Lock()
+
+    def start(self, feed: Optional[MarketDataFeed] = None) -> "MidsHub":
+        with self._cond:
+            if self.feed is None:
+                self.feed = feed or get_market_feed(self.base_url)
+                self.feed.subscribe("allMids", self._on_message)
+        return self
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        data = message.get("data")
+        if isinstance(data, dict) and "mids" in data:
+            self.update(data["mids"])
+            self.stream_updates += 1
+
+    def update(self, raw: Dict[str, str], from_rest: bool = False) -> None:
+        """Apply an allMids payload, from the stream or from an /info response."""
+        mids = {coin: float(px) for coin, px in raw.items()}
+        with self._cond:
+            new = [coin for coin in raw if coin not in self._slots]
+            if new:
+                # .get does not trigger the registry's refresh-on-miss, so coins it does not know get asset id -1
+                coin_to_asset = get_registry(self.base_url).snapshot().coin_to_asset
+                for coin in new:
+                    self._slots[coin] = len(self._slots)
+                self.asset_ids = np.concatenate(
+                    [self.asset_ids, np.array([coin_to_asset.get(coin, -1) for coin in new], dtype=np.int64)]
+                )
+                self._asset_slots = {int(asset): slot for slot, asset in enumerate(self.asset_ids) if asset >= 0}
+                prices = np.full(len(self._slots), np.nan)
+                prices[: len(self.prices)] = self.prices
+            else:
+                prices = self.prices.copy()
+            # a new array per update, so a vector handed out earlier never changes under its reader
+            prices[[self._slots[coin] for coin in mids]] = list(mids.values())
+            self.prices = prices
+            self._raw, self._mids = raw, mids
+            self.updated_at = time.time()
+            self.seq += 1
+            if from_rest:
+                self.rest_updates += 1
+            self._cond.notify_all()
+            waiters, self._waiters = self._waiters, []
+            seq = self.seq
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future, seq)
+
+    def stale(self) -> bool:
+        return time.time() - self.updated_at > self.stale_after
+
+    def latest(self) -> Optional[Dict[str, str]]:
+        """The raw allMids payload if the hub is fresh, else None. Shared: treat it as read-only."""
+        if self.stale():
+            return None
+        return self._raw
+
+    def all_mids(self) -> Dict[str, str]:
+        """Like Info.all_mids(), served from memory and fetched over REST only when stale."""
+        latest = self.latest()
+        if latest is not None:
+            return latest
+        with self._fetch_lock:
+            # another thread may have refreshed it while this one waited
+            latest = self.latest()
+            if latest is None:
+                latest = self._api.post("/info", {"type": "allMids", "dex": ""})
+                self.update(latest, from_rest=True)
+            return latest
+
+    def mids(self) -> Dict[str, float]:
+        """{coin: mid} as floats, refreshed over REST when stale. Shared: treat it as read-only."""
+        self.all_mids()
+        return self._mids
+
+    def price(self, coin: str) -> Optional[float]:
+        return self.mids().get(coin)
+
+    def asset_price(self, asset: int) -> Optional[float]:
+        self.all_mids()
+        slot = self._asset_slots.get(asset)
+        return None if slot is None else float(self.prices[slot])
+
+    def vector(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(asset_ids, prices) of every coin seen so far; asset id -1 for coins missing from the metadata."""
+        self.all_mids()
+        with self._cond:
+            return self.asset_ids, self.prices
+
+    def wait(self, after: Optional[int] = None, timeout: Optional[float] = None) -> int:
+        """Block until an update newer than seq `after` (default: the current one) arrives; returns the new seq."""
+        with self._cond:
+            after = self.seq if after is None else after
+            self._cond.wait_for(lambda: self.seq > after, timeout)
+            return self.seq
+
+    async def wait_async(self, after: Optional[int] = None, timeout: Optional[float] = None) -> int:
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            after = self.seq if after is None else after
+            if self.seq > after:
+                return self.seq
+            future: "asyncio.Future[int]" = loop.create_future()
+            self._waiters.append((loop, future))
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return self.seq
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "coins": len(self._slots),
+            "seq": self.seq,
+            "stream_updates": self.stream_updates,
+            "rest_updates": self.rest_updates,
+            "age": time.time() - self.updated_at if self.updated_at else None,
+            "connected": self.feed is not None and self.feed.connected,
+        }
+
+
+def _resolve(future: "asyncio.Future[int]", seq: int) -> None:
+    if not future.done():
+        future.set_result(seq)
+
+
+_hubs: Dict[str, MidsHub] = {}
+_hubs_lock = threading.Lock()
+
+
+def enable_mids_hub(base_url: str, stale_after: float = STALE_AFTER) -> MidsHub:
+    """Start the shared hub for base_url; Info.all_mids() of every client for it is served from the hub afterwards."""
+    with _hubs_lock:
+        hub = _hubs.get(base_url)
+        if hub is None:
+            hub = MidsHub(base_url, stale_after)
+            _hubs[base_url] = hub
+        else:
+            hub.stale_after = stale_after
+    return hub.start()
+
+
+def get_mids_hub(base_url: str) -> Optional[MidsHub]:
+    return _hubs.get(base_url)
@@ -0,0 +1,74 @@
+import os
+import threading
+
+from hyperliquid.utils.signing import get_timestamp_ms
+from hyperliquid.utils.types import Dict, Optional
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:  # pragma: no cover
+    HAS_FCNTL = False
+
+# Hyperliquid keeps the 100 highest nonces per signer and rejects duplicates, so two actions signed by the same key in
+# the same millisecond collide when the nonce is just the timestamp. The allocator hands out max(now, last + 1) per
+# signer: it follows the clock, never repeats, and under bursts runs ahead of the clock by at most one nonce per
+# action (the exchange accepts nonces up to a day ahead).
+#
+# Given a directory, the last nonce of each signer also lives in a small file there, updated under an exclusive flock,
+# so processes that share the directory share the sequence. Without fcntl (Windows) the allocator is per-process only.
+
+
+class NonceAllocator:
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._last: Dict[str, int] = {}
+        self._files: Dict[str, int] = {}
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def next(self, signer: str) -> int:
+        signer = signer.lower()
+        with self._lock:
+            if self.directory is None or not HAS_FCNTL:
+                nonce = max(get_timestamp_ms(), self._last.get(signer, 0) + 1)
+                self._last[signer] = nonce
+                return nonce
+            return self._next_shared(self.directory, signer)
+
+    def _next_shared(self, directory: str, signer: str) -> int:
+        fd = self._files.get(signer)
+        if fd is None:
+            fd = os.open(os.path.join(directory, f"{signer}.nonce"), os.O_RDWR | os.O_CREAT, 0o600)
+            self._files[signer] = fd
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            stored = os.pread(fd, 8, 0)
+            last = int.from_bytes(stored, "big") if len(stored) == 8 else 0
+            nonce = max(get_timestamp_ms(), last + 1)
+            os.pwrite(fd, nonce.to_bytes(8, "big"), 0)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        self._last[signer] = nonce
+        return nonce
+
+    def close(self) -> None:
+        with self._lock:
+            for fd in self._files.values():
+                os.close(fd)
+            self._files.clear()
+
+
+_allocator = NonceAllocator(os.environ.get("HYPERLIQUID_NONCE_DIR"))
+
+
+def get_nonce_allocator() -> NonceAllocator:
+    return _allocator
+
+
+def set_nonce_allocator(allocator: NonceAllocator) -> None:
+    """Replace the process-wide allocator, e.g. with one backed by a directory shared with other worker processes."""
+    global _allocator
+    _allocator = allocator
@@ -0,0 +1,229 @@
+import logging
+import threading
+import time
+
+import numpy as np
+
+from hyperliquid.api import API
+from hyperliquid.market_feed import MarketDataFeed, get_market_feed
+from hyperliquid.utils.types import Any, Dict, Optional, Tuple
+
+# In-process L2 books kept current by the l2Book and bbo websocket streams, so strategies read depth from memory
+# instead of polling l2_snapshot and parsing decimal strings on every pass. Every l2Book message is a full snapshot
+# of the top levels, so a book is replaced wholesale (one tuple of float64 arrays, best level first) and readers on
+# other threads always see a consistent book. bbo messages arrive on every top-of-book change and only move the
+# best bid/ask. One store per base_url is shared by every strategy; each coin is subscribed once on the shared
+# market-data feed, and a book that has not received its first snapshot yet is seeded with a single l2Book request.
+
+logger = logging.getLogger(__name__)
+
+_EMPTY = np.empty(0)
+
+
+def _side_arrays(levels: Any) -> Tuple[np.ndarray, np.ndarray]:
+    if not levels:
+        return _EMPTY, _EMPTY
+    px = np.fromiter((level["px"] for level in levels), dtype=float, count=len(levels))
+    sz = np.fromiter((level["sz"] for level in levels), dtype=float, count=len(levels))
+    return px, sz
+
+
+class OrderBook:
+    """Array-backed L2 book of one coin. Prices and sizes are float64 arrays, best level first."""
+
+    def __init__(self, coin: str):
+        self.coin = coin
+        self.time = 0
+        self.updates = 0
+        # (bid_px, bid_sz, ask_px, ask_sz), swapped in as a whole on every snapshot
+        self._levels: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] = (_EMPTY, _EMPTY, _EMPTY, _EMPTY)
+        # (time, bid_px, bid_sz, ask_px, ask_sz) of the last bbo message; nan when that side was empty
+        self._bbo: Optional[Tuple[int, float, float, float, float]] = None
+        self.ready = threading.Event()
+
+    def apply_l2(self, data: Dict[str, Any]) -> None:
+        """Replace the book with an l2Book snapshot (websocket data or the l2_snapshot response)."""
+        bids, asks = data["levels"]
+        bid_px, bid_sz = _side_arrays(bids)
+        ask_px, ask_sz = _side_arrays(asks)
+        self._levels = (bid_px, bid_sz, ask_px, ask_sz)
+        self.time = data.get("time", 0)
+        self.updates += 1
+        self.ready.set()
+
+    def apply_bbo(self, data: Dict[str, Any]) -> None:
+        bid, ask = data["bbo"]
+        self._bbo = (
+            data.get("time", 0),
+            float(bid["px"]) if bid else float("nan"),
+            float(bid["sz"]) if bid else float("nan"),
+            float(ask["px"]) if ask else float("nan"),
+            float(ask["sz"]) if ask else float("nan"),
+        )
+        self.updates += 1
+
+    def levels(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(bid_px, bid_sz, ask_px, ask_sz) of the latest snapshot; read-only."""
+        return self._levels
+
+    def snapshot(self) -> Dict[str, Any]:
+        """The book in the l2Book response shape, with float prices and sizes."""
+        bid_px, bid_sz, ask_px, ask_sz = self._levels
+        return {
+            "coin": self.coin,
+            "time": self.time,
+            "levels": [
+                [{"px": px, "sz": sz} for px, sz in zip(bid_px.tolist(), bid_sz.tolist())],
+                [{"px": px, "sz": sz} for px, sz in zip(ask_px.tolist(), ask_sz.tolist())],
+            ],
+        }
+
+    def age(self) -> float:
+        """Seconds since the exchange timestamp of the latest update."""
+        latest = max(self.time, self._bbo[0] if self._bbo else 0)
+        return time.time() - latest / 1000 if latest else float("inf")
+
+    def _top(self) -> Tuple[float, float]:
+        bid_px, _, ask_px, _ = self._levels
+        bid = bid_px[0] if len(bid_px) else float("nan")
+        ask = ask_px[0] if len(ask_px) else float("nan")
+        bbo = self._bbo
+        if bbo is not None and bbo[0] >= self.time:
+            return bbo[1], bbo[3]
+        return bid, ask
+
+    def best_bid(self) -> Optional[float]:
+        bid, _ = self._top()
+        return None if bid != bid else float(bid)
+
+    def best_ask(self) -> Optional[float]:
+        _, ask = self._top()
+        return None if ask != ask else float(ask)
+
+    def mid(self) -> Optional[float]:
+        bid, ask = self._top()
+        mid = (bid + ask) / 2
+        return None if mid != mid else float(mid)
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self._top()
+        spread = ask - bid
+        return None if spread != spread else float(spread)
+
+    def spread_bps(self) -> Optional[float]:
+        bid, ask = self._top()
+        bps = (ask - bid) / ((ask + bid) / 2) * 10000
+        return None if bps != bps else float(bps)
+
+    def depth(self, levels: int) -> Tuple[float, float]:
+        """Notional resting on the best `levels` bid and ask levels."""
+        bid_px, bid_sz, ask_px, ask_sz = self._levels
+        return float(bid_px[:levels] @ bid_sz[:levels]), float(ask_px[:levels] @ ask_sz[:levels])
+
+    def depth_within(self, pct: float) -> Tuple[float, float]:
+        """Notional resting within pct (0.02 = 2%) of the mid on each side."""
+        bid_px, bid_sz, ask_px, ask_sz = self._levels
+        mid = self.mid()
+        if mid is None:
+            return 0.0, 0.0
+        bids = bid_px >= mid * (1 - pct)
+        asks = ask_px <= mid * (1 + pct)
+        return float(bid_px[bids] @ bid_sz[bids]), float(ask_px[asks] @ ask_sz[asks])
+
+    def imbalance(self, levels: int = 10) -> Optional[float]:
+        """(bid size - ask size) / total size over the best `levels` levels, in [-1, 1]."""
+        _, bid_sz, _, ask_sz = self._levels
+        bid, ask = float(bid_sz[:levels].sum()), float(ask_sz[:levels].sum())
+        total = bid + ask
+        return (bid - ask) / total if total > 0 else None
+
+    def vwap(self, is_buy: bool, sz: float) -> Optional[float]:
+        """Average price of a market order of sz walking the book; None if the book is too thin to fill it."""
+        bid_px, bid_sz, ask_px, ask_sz = self._levels
+        px, level_sz = (ask_px, ask_sz) if is_buy else (bid_px, bid_sz)
+        if sz <= 0 or not len(px):
+            return None
+        filled = np.cumsum(level_sz)
+        last = int(np.searchsorted(filled, sz))
+        if last >= len(px):
+            return None
+        taken = level_sz[: last + 1].copy()
+        taken[last] -= filled[last] - sz
+        return float(px[: last + 1] @ taken / sz)
+
+
+class OrderBookStore:
+    """Shared books for one base_url, fed by the base_url's market-data feed."""
+
+    def __init__(self, base_url: str, feed: Optional[MarketDataFeed] = None):
+        self.base_url = base_url
+        self.books: Dict[str, OrderBook] = {}
+        self.feed = feed or get_market_feed(base_url)
+        self._lock = threading.Lock()
+        self._api = API(base_url)
+        self.seeded = 0
+
+    def _on_message(self, message: Dict[str, Any]) -> None:
+        data = message.get("data")
+        if not isinstance(data, dict):
+            return
+        book = self.books.get(data.get("coin", ""))
+        if book is None:
+            return
+        if message["channel"] == "l2Book":
+            book.apply_l2(data)
+        else:
+            book.apply_bbo(data)
+
+    def book(self, coin: str, wait: bool = True) -> OrderBook:
+        """The shared book of coin, subscribing on first use; with wait, an empty book is seeded over REST first."""
+        book = self.books.get(coin)
+        if book is None:
+            with self._lock:
+                book = self.books.get(coin)
+                created = book is None
+                if book is None:
+                    book = OrderBook(coin)
+                    self.books[coin] = book
+            if created:
+                self.feed.subscribe("l2Book", self._on_message, coin=coin)
+                self.feed.subscribe("bbo", self._on_message, coin=coin)
+        if wait and not book.ready.is_set():
+            self.seed(coin)
+        return book
+
+    def seed(self, coin: str) -> OrderBook:
+        """Load the book once over REST, e.g. while the stream is still connecting."""
+        book = self.books.get(coin) or self.book(coin, wait=False)
+        snapshot = self._api.post("/info", {"type": "l2Book", "coin": coin})
+        if snapshot and snapshot.get("levels") and snapshot.get("time", 0) >= book.time:
+            book.apply_l2(snapshot)
+            self.seeded += 1
+        return book
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "books": len(self.books),
+            "connected": self.feed.connected,
+            "updates": sum(book.updates for book in list(self.books.values())),
+            "seeded": self.seeded,
+        }
+
+
+_book_stores: Dict[str, OrderBookStore] = {}
+_book_stores_lock = threading.Lock()
+
+
+def get_book_store(base_url: str) -> OrderBookStore:
+    store = _book_stores.get(base_url)
+    if store is not None:
+        return store
+    with _book_stores_lock:
+        if base_url not in _book_stores:
+            _book_stores[base_url] = OrderBookStore(base_url)
+        return _book_stores[base_url]
+
+
+def set_book_store(base_url: str, store: OrderBookStore) -> None:
+    with _book_stores_lock:
+        _book_stores[base_url] = store
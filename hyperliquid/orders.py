@@ -0,0 +1,219 @@
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal
+
+from hyperliquid.api import API
+from hyperliquid.user_streams import UserStreamPool, get_user_streams
+from hyperliquid.utils.types import Any, Dict, List, Optional
+
+# Local state of one user's open orders, so "is this order still open?" is a dict lookup instead of an openOrders
+# request per order. Orders are indexed by oid, cloid and coin. The webData2 stream pushes the user's open orders as a
+# snapshot that replaces the registry (orders placed after it are kept), and the userFills stream shrinks partially
+# filled orders and closes filled ones in between. Both channels name their user, so the registries of every user
+# share the sockets of the user stream pool. A frontendOpenOrders request resyncs the registry when no snapshot arrived
+# for a while. An order that leaves the book without a fill is reported as "closed": a snapshot does not say whether it
+# was canceled, rejected or expired.
+
+# while the stream is live, snapshots keep the registry current; a resync only runs when none arrived for this long
+RESYNC_INTERVAL = 30.0
+# without a live stream the registry is at most this many seconds behind
+REFRESH_AFTER = 2.0
+# closed oids and seen fill ids remembered, so a late event or snapshot cannot resurrect an order
+MAX_REMEMBERED = 10000
+
+Order = Dict[str, Any]
+
+
+def _remember(seen: "OrderedDict[Any, Any]", key: Any, value: Any) -> None:
+    seen[key] = value
+    if len(seen) > MAX_REMEMBERED:
+        seen.popitem(last=False)
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class OrderRegistry:
+    def __init__(
+        self,
+        base_url: str,
+        address: str,
+        stream: bool = True,
+        resync_interval: float = RESYNC_INTERVAL,
+        refresh_after: float = REFRESH_AFTER,
+        dex: str = "",
+        streams: Optional[UserStreamPool] = None,
+    ):
+        self.base_url = base_url
+        self.address = address.lower()
+        self.dex = dex
+        self.resync_interval = resync_interval
+        self.refresh_after = refresh_after
+        self._orders: Dict[int, Order] = {}
+        # oid -> time (ms) of the snapshot the order's size is as of; fills up to it are already reflected
+        self._as_of: Dict[int, int] = {}
+        self._cloids: Dict[str, int] = {}
+        self._coins: Dict[str, Dict[int, Order]] = {}
+        self._closed: "OrderedDict[int, str]" = OrderedDict()
+        self._fills: "OrderedDict[Any, None]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._resync_lock = threading.Lock()
+        self._api = API(base_url)
+        self.synced_at = 0.0
+        self.resyncs = 0
+        self.snapshots = 0
+        self.updates = 0
+        self.streams: Optional[UserStreamPool] = None
+        self._handles: List[int] = []
+        # webData2 only carries the orders of the default dex
+        if stream and not dex:
+            self.streams = streams or get_user_streams(base_url)
+            self._handles = [
+                self.streams.subscribe("webData2", self._on_web_data, user=self.address),
+                self.streams.subscribe("userFills", self._on_fills, user=self.address),
+            ]
+
+    def _add(self, order: Order, as_of: int) -> None:
+        oid = order["oid"]
+        self._remove(oid)
+        self._orders[oid] = order
+        self._as_of[oid] = as_of
+        self._coins.setdefault(order["coin"], {})[oid] = order
+        if order.get("cloid"):
+            self._cloids[order["cloid"]] = oid
+
+    def _remove(self, oid: int) -> Optional[Order]:
+        order = self._orders.pop(oid, None)
+        if order is not None:
+            self._as_of.pop(oid, None)
+            self._coins.get(order["coin"], {}).pop(oid, None)
+            if order.get("cloid"):
+                self._cloids.pop(order["cloid"], None)
+        return order
+
+    def _close(self, oid: int, status: str) -> None:
+        self._remove(oid)
+        _remember(self._closed, oid, status)
+
+    def _replace(self, orders: List[Order], as_of: int) -> None:
+        """Apply the open orders as of as_of (ms): unlisted orders older than it are closed, newer ones kept."""
+        listed = {order["oid"] for order in orders}
+        for oid, order in list(self._orders.items()):
+            if oid not in listed and order.get("timestamp", 0) <= as_of:
+                self._close(oid, "closed")
+        for order in orders:
+            oid = order["oid"]
+            # a closed order cannot come back, and a newer size must not be replaced by an older one
+            if oid not in self._closed and self._as_of.get(oid, 0) <= as_of:
+                self._add(order, as_of)
+
+    def _on_web_data(self, message: Dict[str, Any]) -> None:
+        data = message.get("data")
+        if not isinstance(data, dict) or not isinstance(data.get("openOrders"), list):
+            return
+        state = data.get("clearinghouseState")
+        as_of = (state.get("time") if isinstance(state, dict) else None) or _now_ms()
+        with self._lock:
+            self._replace(data["openOrders"], as_of)
+            self.synced_at = time.time()
+            self.snapshots += 1
+
+    def _on_fills(self, message: Dict[str, Any]) -> None:
+        data = message.get("data")
+        # the snapshot sent on subscribing holds past fills, already reflected in the orders' sizes
+        if not isinstance(data, dict) or data.get("isSnapshot"):
+            return
+        with self._lock:
+            for fill in data.get("fills", []):
+                key = fill.get("tid", (fill.get("hash"), fill.get("oid"), fill.get("time")))
+                if key in self._fills:
+                    continue
+                _remember(self._fills, key, None)
+                order = self._orders.get(fill.get("oid"))
+                if order is None or fill.get("time", 0) <= self._as_of[order["oid"]]:
+                    continue
+                remaining = Decimal(order["sz"]) - Decimal(fill["sz"])
+                if remaining <= 0:
+                    self._close(order["oid"], "filled")
+                else:
+                    self._add(dict(order, sz=str(remaining)), self._as_of[order["oid"]])
+                self.updates += 1
+
+    def resync(self) -> int:
+        """Apply one frontendOpenOrders response; returns the number of open orders."""
+        with self._resync_lock:
+            started_ms = _now_ms()
+            orders = self._api.post("/info", {"type": "frontendOpenOrders", "user": self.address, "dex": self.dex})
+            with self._lock:
+                # orders placed while the request was in flight are not in the response and are kept
+                self._replace(orders, started_ms)
+                self.synced_at = time.time()
+                self.resyncs += 1
+                return len(self._orders)
+
+    def _live(self) -> bool:
+        return self.streams is not None and self.streams.connected_for(self.address)
+
+    def _refresh(self) -> None:
+        if time.time() - self.synced_at > (self.resync_interval if self._live() else self.refresh_after):
+            self.resync()
+
+    def is_open(self, oid: int) -> bool:
+        self._refresh()
+        return oid in self._orders
+
+    def get(self, oid: int) -> Optional[Order]:
+        self._refresh()
+        return self._orders.get(oid)
+
+    def by_cloid(self, cloid: str) -> Optional[Order]:
+        self._refresh()
+        oid = self._cloids.get(cloid)
+        return None if oid is None else self._orders.get(oid)
+
+    def status(self, oid: int) -> Optional[str]:
+        """The status of oid: "open" while it rests, its final status if it closed recently, None if unknown."""
+        if self.is_open(oid):
+            return "open"
+        return self._closed.get(oid)
+
+    def open_orders(self, coin: Optional[str] = None) -> List[Order]:
+        """Open orders (of one coin), in the frontendOpenOrders shape: a superset of the openOrders fields."""
+        self._refresh()
+        with self._lock:
+            if coin is None:
+                return list(self._orders.values())
+            return list(self._coins.get(coin, {}).values())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "open": len(self._orders),
+            "updates": self.updates,
+            "snapshots": self.snapshots,
+            "resyncs": self.resyncs,
+            "age": time.time() - self.synced_at if self.synced_at else None,
+            "live": self._live(),
+        }
+
+    def close(self) -> None:
+        if self.streams is not None:
+            for handle in self._handles:
+                self.streams.unsubscribe(handle)
+            self._handles = []
+
+
+_registries: Dict[str, OrderRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_order_registry(base_url: str, address: str) -> OrderRegistry:
+    key = f"{base_url}|{address.lower()}"
+    registry = _registries.get(key)
+    if registry is not None:
+        return registry
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = OrderRegistry(base_url, address)
+        return _registries[key]
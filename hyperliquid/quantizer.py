@@ -0,0 +1,102 @@
+import math
+
+import numpy as np
+
+from hyperliquid.utils.types import Any, Dict, List, Optional, Sequence, Tuple
+
+# Snaps prices and sizes to what the exchange accepts and serializes them in the same step, working on integers so the
+# wire string never carries float noise:
+# - sizes have at most szDecimals decimals,
+# - prices have at most 5 significant figures and MAX_DECIMALS - szDecimals decimals (6 for perps, 8 for spot);
+#   integer prices are always valid, whatever their number of significant figures.
+# See https://hyperliquid.gitbook.io/hyperliquid-docs/for-developers/api/tick-and-lot-size
+PERP_MAX_DECIMALS = 6
+SPOT_MAX_DECIMALS = 8
+PRICE_SIG_FIGS = 5
+
+
+def _int_to_wire(n: int, decimals: int) -> str:
+    """n * 10**-decimals as the shortest decimal string, e.g. (123450, 2) -> "1234.5"."""
+    if decimals == 0 or n == 0:
+        return str(n)
+    sign = "-" if n < 0 else ""
+    digits = str(abs(n)).rjust(decimals + 1, "0")
+    fraction = digits[-decimals:].rstrip("0")
+    if not fraction:
+        return sign + digits[:-decimals]
+    return f"{sign}{digits[:-decimals]}.{fraction}"
+
+
+class AssetQuantizer:
+    __slots__ = ("sz_decimals", "px_decimals", "_px_scales", "_sz_scale")
+
+    def __init__(self, sz_decimals: int, is_spot: bool = False):
+        self.sz_decimals = sz_decimals
+        self.px_decimals = max((SPOT_MAX_DECIMALS if is_spot else PERP_MAX_DECIMALS) - sz_decimals, 0)
+        self._px_scales = [10**decimals for decimals in range(self.px_decimals + 1)]
+        self._sz_scale = 10**sz_decimals
+
+    def _price_decimals(self, px: float) -> int:
+        if px <= 0:
+            raise ValueError("price must be positive", px)
+        magnitude = math.floor(math.log10(px))
+        return min(self.px_decimals, max(PRICE_SIG_FIGS - 1 - magnitude, 0))
+
+    def price(self, px: float) -> Tuple[float, str]:
+        """Nearest valid price and its wire string."""
+        decimals = self._price_decimals(px)
+        scale = self._px_scales[decimals]
+        n = round(px * scale)
+        return n / scale, _int_to_wire(n, decimals)
+
+    def size(self, sz: float) -> Tuple[float, str]:
+        """Nearest valid size and its wire string."""
+        n = round(sz * self._sz_scale)
+        return n / self._sz_scale, _int_to_wire(n, self.sz_decimals)
+
+    def snap_price(self, px: float) -> float:
+        return self.price(px)[0]
+
+    def snap_size(self, sz: float) -> float:
+        return self.size(sz)[0]
+
+    def price_wire(self, px: float) -> str:
+        return self.price(px)[1]
+
+    def size_wire(self, sz: float) -> str:
+        return self.size(sz)[1]
+
+    def price_ladder(self, prices: Sequence[float]) -> Tuple[List[float], List[str]]:
+        """Snap and serialize a whole ladder of prices (e.g. grid levels) at once, vectorized."""
+        px = np.asarray(prices, dtype=np.float64)
+        if px.size and px.min() <= 0:
+            raise ValueError("price must be positive", float(px.min()))
+        magnitudes = np.floor(np.log10(px)).astype(np.int64)
+        decimals = np.clip(PRICE_SIG_FIGS - 1 - magnitudes, 0, self.px_decimals)
+        scales = np.power(10.0, decimals)
+        ns = np.rint(px * scales).astype(np.int64)
+        return (ns / scales).tolist(), [_int_to_wire(n, d) for n, d in zip(ns.tolist(), decimals.tolist())]
+
+    def size_ladder(self, sizes: Sequence[float]) -> Tuple[List[float], List[str]]:
+        ns = np.rint(np.asarray(sizes, dtype=np.float64) * self._sz_scale).astype(np.int64)
+        return (ns / self._sz_scale).tolist(), [_int_to_wire(n, self.sz_decimals) for n in ns.tolist()]
+
+
+class QuantizerTable:
+    """Per-asset quantizers built from an Info's metadata on first use."""
+
+    def __init__(self, info: Any):
+        self.info = info
+        self._quantizers: Dict[int, AssetQuantizer] = {}
+
+    def for_asset(self, asset: int) -> AssetQuantizer:
+        sz_decimals = self.info.asset_to_sz_decimals[asset]
+        quantizer: Optional[AssetQuantizer] = self._quantizers.get(asset)
+        if quantizer is None or quantizer.sz_decimals != sz_decimals:
+            # spot assets start at 10000
+            quantizer = AssetQuantizer(sz_decimals, is_spot=10_000 <= asset < 100_000)
+            self._quantizers[asset] = quantizer
+        return quantizer
+
+    def __getitem__(self, name: str) -> AssetQuantizer:
+        return self.for_asset(self.info.name_to_asset(name))
@@ -0,0 +1,332 @@
+import asyncio
+import contextlib
+import contextvars
+import threading
+import time
+from enum import IntEnum
+
+from hyperliquid.utils.error import Error
+from hyperliquid.utils.types import Any, Dict, Iterator, List, Optional, Tuple
+
+# Client-side mirror of Hyperliquid's REST limits (https://hyperliquid.gitbook.io/hyperliquid-docs/for-developers/api/rate-limits-and-user-limits):
+# - 1200 weight per minute per IP, shared by /info and /exchange.
+# - /exchange actions weigh 1 + floor(batch_length / 40).
+# - /info weighs 2 for the light queries below, 60 for userRole and 20 otherwise, plus extra weight per returned item
+#   for the history endpoints, which can only be charged once the response is in.
+# - Actions are also limited per address. That budget grows with traded volume, so it is modelled as a bucket seeded
+#   with the initial 10000 request buffer and refilled at the throttled rate of one request per 10 seconds;
+#   credit_address() adds budget as volume is traded. Cancels may overdraw it by another full bucket.
+#
+# Requests are put in a lane by endpoint: cancels are CRITICAL, other actions ORDER, queries INFO. The ANALYTICS lane
+# is opt-in, since the endpoint does not tell a strategy's query from a report's: run background analysis inside
+# request_priority(Priority.ANALYTICS), as TradingAnalytics does. AsyncAPI waits for its turn with asyncio.sleep; a
+# sync client called from a coroutine cannot without stalling the event loop. There a cancel or order that would have
+# to wait is sent at once and overdraws the buckets, so later requests wait the debt off, and a query is shed.
+# Cancels and orders sent from a coroutine still belong on AsyncExchange.
+IP_WEIGHT_PER_MINUTE = 1200
+ADDRESS_CAPACITY = 10000
+ADDRESS_REFILL_PER_SECOND = 0.1
+
+LIGHT_INFO_TYPES = {
+    "l2Book",
+    "allMids",
+    "clearinghouseState",
+    "orderStatus",
+    "spotClearinghouseState",
+    "exchangeStatus",
+}
+HEAVY_INFO_TYPES = {"userRole": 60}
+ITEM_WEIGHTED_INFO_TYPES = {
+    "candleSnapshot": 60,
+    "recentTrades": 20,
+    "historicalOrders": 20,
+    "userFills": 20,
+    "userFillsByTime": 20,
+    "fundingHistory": 20,
+    "userFunding": 20,
+    "nonUserFundingUpdates": 20,
+    "twapHistory": 20,
+    "userTwapSliceFills": 20,
+    "userTwapSliceFillsByTime": 20,
+}
+CANCEL_ACTION_TYPES = {"cancel", "cancelByCloid", "scheduleCancel"}
+
+
+class Priority(IntEnum):
+    CRITICAL = 0  # cancels, emergency stops
+    ORDER = 1  # new orders, modifies and other actions
+    INFO = 2  # polling account and market state
+    ANALYTICS = 3  # background analysis, safe to delay or drop
+
+
+# Fraction of the IP budget each lane must leave untouched, so that cancels still go through when polling has
+# drained the bucket.
+LANE_RESERVE = {Priority.CRITICAL: 0.0, Priority.ORDER: 0.05, Priority.INFO: 0.15, Priority.ANALYTICS: 0.35}
+# How long a request may queue before it is shed with RateLimitShed instead of being sent into a 429.
+LANE_MAX_WAIT = {Priority.CRITICAL: 60.0, Priority.ORDER: 30.0, Priority.INFO: 10.0, Priority.ANALYTICS: 2.0}
+# Lanes a sync request on the event loop may overdraw rather than be shed in
+OVERDRAW_LANES = {Priority.CRITICAL, Priority.ORDER}
+
+_priority_override: contextvars.ContextVar[Optional[Priority]] = contextvars.ContextVar(
+    "hyperliquid_request_priority", default=None
+)
+
+
+class RateLimitShed(Error):
+    def __init__(self, priority: Priority, weight: int, waited: float):
+        super().__init__(f"{priority.name} request of weight {weight} shed after queueing {waited:.2f}s")
+        self.priority = priority
+        self.weight = weight
+        self.waited = waited
+
+
+@contextlib.contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Run every request issued in this block (thread or task) in the given lane, e.g. around an emergency stop."""
+    token = _priority_override.set(priority)
+    try:
+        yield
+    finally:
+        _priority_override.reset(token)
+
+
+def request_weight(url_path: str, payload: Any) -> int:
+    if url_path == "/exchange":
+        action = payload.get("action", {})
+        batch = action.get("orders") or action.get("cancels") or action.get("modifies") or []
+        return 1 + len(batch) // 40
+    request_type = payload.get("type")
+    if request_type in LIGHT_INFO_TYPES:
+        return 2
+    return HEAVY_INFO_TYPES.get(request_type, 20)
+
+
+def response_weight(url_path: str, payload: Any, response: Any) -> int:
+    if url_path != "/info" or not isinstance(response, list):
+        return 0
+    per_items = ITEM_WEIGHTED_INFO_TYPES.get(payload.get("type"))
+    if per_items is None:
+        return 0
+    return len(response) // per_items
+
+
+def request_lane(url_path: str, payload: Any) -> Priority:
+    override = _priority_override.get()
+    if override is not None:
+        return override
+    if url_path == "/exchange":
+        if payload.get("action", {}).get("type") in CANCEL_ACTION_TYPES:
+            return Priority.CRITICAL
+        return Priority.ORDER
+    return Priority.INFO
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class TokenBucket:
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self._updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    def time_until(self, level: float) -> float:
+        if self.tokens >= level:
+            return 0.0
+        if self.refill_per_second <= 0:
+            return float("inf")
+        return (level - self.tokens) / self.refill_per_second
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        ip_weight_per_minute: int = IP_WEIGHT_PER_MINUTE,
+        address_capacity: float = ADDRESS_CAPACITY,
+        address_refill_per_second: float = ADDRESS_REFILL_PER_SECOND,
+        lane_reserve: Optional[Dict[Priority, float]] = None,
+        lane_max_wait: Optional[Dict[Priority, Optional[float]]] = None,
+    ):
+        self.ip_bucket = TokenBucket(ip_weight_per_minute, ip_weight_per_minute / 60)
+        self.address_capacity = address_capacity
+        self.address_refill_per_second = address_refill_per_second
+        self.address_buckets: Dict[str, TokenBucket] = {}
+        self.lane_reserve = lane_reserve or LANE_RESERVE
+        self.lane_max_wait = lane_max_wait or LANE_MAX_WAIT
+        self._lock = threading.Lock()
+        self._waiting = [0] * len(Priority)
+        self.sent = [0] * len(Priority)
+        self.delayed = [0] * len(Priority)
+        self.shed = [0] * len(Priority)
+        self.overdrawn = [0] * len(Priority)
+        self.wait_total = [0.0] * len(Priority)
+
+    def _address_bucket(self, address: str) -> TokenBucket:
+        bucket = self.address_buckets.get(address)
+        if bucket is None:
+            bucket = TokenBucket(self.address_capacity, self.address_refill_per_second)
+            self.address_buckets[address] = bucket
+        return bucket
+
+    def _try_acquire(self, weight: int, lane: Priority, address: Optional[str]) -> float:
+        """Take the tokens and return 0, or return how long to wait before trying again."""
+        now = time.monotonic()
+        with self._lock:
+            if any(self._waiting[higher] for higher in range(lane)):
+                return 0.01
+            self.ip_bucket.refill(now)
+            wait = self.ip_bucket.time_until(weight + self.lane_reserve[lane] * self.ip_bucket.capacity)
+            address_bucket = None
+            if address is not None:
+                address_bucket = self._address_bucket(address.lower())
+                address_bucket.refill(now)
+                # cancels may overdraw the address budget by one more bucket
+                floor = -address_bucket.capacity if lane == Priority.CRITICAL else 0
+                wait = max(wait, address_bucket.time_until(floor + 1))
+            if wait > 0:
+                return wait
+            self.ip_bucket.tokens -= weight
+            if address_bucket is not None:
+                address_bucket.tokens -= 1
+            return 0.0
+
+    def _overdraw(self, weight: int, lane: Priority, address: Optional[str]) -> None:
+        """Take the tokens now even if that leaves the buckets negative."""
+        now = time.monotonic()
+        with self._lock:
+            self.ip_bucket.refill(now)
+            self.ip_bucket.tokens -= weight
+            if address is not None:
+                address_bucket = self._address_bucket(address.lower())
+                address_bucket.refill(now)
+                address_bucket.tokens -= 1
+            self.overdrawn[lane] += 1
+            self.sent[lane] += 1
+
+    def _queue(self, lane: Priority, delta: int) -> None:
+        with self._lock:
+            self._waiting[lane] += delta
+
+    def _done(self, lane: Priority, waited: float) -> None:
+        with self._lock:
+            self.sent[lane] += 1
+            if waited > 0:
+                self.delayed[lane] += 1
+                self.wait_total[lane] += waited
+
+    def _shed(self, lane: Priority, weight: int, waited: float) -> RateLimitShed:
+        with self._lock:
+            self.shed[lane] += 1
+        return RateLimitShed(lane, weight, waited)
+
+    def _next_sleep(self, wait: float, start: float, lane: Priority, weight: int) -> float:
+        max_wait = self.lane_max_wait[lane]
+        waited = time.monotonic() - start
+        if max_wait is not None and waited + min(wait, 0.25) > max_wait:
+            raise self._shed(lane, weight, waited)
+        # re-check at least every 250ms so a higher lane that queued meanwhile gets its turn first
+        return min(wait, 0.25)
+
+    def acquire(self, weight: int, lane: Priority, address: Optional[str] = None) -> None:
+        wait = self._try_acquire(weight, lane, address)
+        if wait == 0:
+            self._done(lane, 0.0)
+            return
+        if _on_event_loop():
+            # time.sleep here would stall every task on the loop, including the ones sending cancels
+            if lane in OVERDRAW_LANES:
+                self._overdraw(weight, lane, address)
+                return
+            raise self._shed(lane, weight, 0.0)
+        start = time.monotonic()
+        self._queue(lane, 1)
+        try:
+            while wait > 0:
+                time.sleep(self._next_sleep(wait, start, lane, weight))
+                wait = self._try_acquire(weight, lane, address)
+        finally:
+            self._queue(lane, -1)
+        self._done(lane, time.monotonic() - start)
+
+    async def acquire_async(self, weight: int, lane: Priority, address: Optional[str] = None) -> None:
+        wait = self._try_acquire(weight, lane, address)
+        if wait == 0:
+            self._done(lane, 0.0)
+            return
+        start = time.monotonic()
+        self._queue(lane, 1)
+        try:
+            while wait > 0:
+                await asyncio.sleep(self._next_sleep(wait, start, lane, weight))
+                wait = self._try_acquire(weight, lane, address)
+        finally:
+            self._queue(lane, -1)
+        self._done(lane, time.monotonic() - start)
+
+    def charge(self, weight: int) -> None:
+        """Debit weight that is only known after the response arrived; the bucket may go negative."""
+        if weight <= 0:
+            return
+        with self._lock:
+            self.ip_bucket.refill(time.monotonic())
+            self.ip_bucket.tokens -= weight
+
+    def credit_address(self, address: str, requests: float) -> None:
+        """Grow an address budget, e.g. by one request per USDC of newly traded volume."""
+        with self._lock:
+            bucket = self._address_bucket(address.lower())
+            bucket.capacity += requests
+            bucket.tokens += requests
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self.ip_bucket.refill(time.monotonic())
+            lanes: List[Tuple[str, Dict[str, Any]]] = [
+                (
+                    lane.name.lower(),
+                    {
+                        "sent": self.sent[lane],
+                        "delayed": self.delayed[lane],
+                        "shed": self.shed[lane],
+                        "overdrawn": self.overdrawn[lane],
+                        "waiting": self._waiting[lane],
+                        "avg_wait": self.wait_total[lane] / self.delayed[lane] if self.delayed[lane] else 0.0,
+                    },
+                )
+                for lane in Priority
+            ]
+            return {
+                "ip_tokens": self.ip_bucket.tokens,
+                "ip_capacity": self.ip_bucket.capacity,
+                "addresses": len(self.address_buckets),
+                "lanes": dict(lanes),
+            }
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(base_url: str) -> RateLimiter:
+    limiter = _limiters.get(base_url)
+    if limiter is not None:
+        return limiter
+    with _limiters_lock:
+        if base_url not in _limiters:
+            _limiters[base_url] = RateLimiter()
+        return _limiters[base_url]
+
+
+def set_rate_limiter(base_url: str, limiter: RateLimiter) -> None:
+    with _limiters_lock:
+        _limiters[base_url] = limiter
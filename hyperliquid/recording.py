@@ -0,0 +1,445 @@
+import asyncio
+import atexit
+import glob
+import gzip
+import itertools
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+from hyperliquid.utils import fast_json
+from hyperliquid.utils.error import Error
+from hyperliquid.utils.types import Any, Dict, List, Optional, Tuple, cast
+
+try:
+    import websockets
+
+    HAS_WEBSOCKETS = True
+except ImportError:  # pragma: no cover
+    HAS_WEBSOCKETS = False
+
+# Record/replay of the SDK's network traffic, so the engine, strategies and bots can be benchmarked and profiled
+# repeatably without a network. While recording, every HTTP request/response pair (API, AsyncAPI and websocket
+# posts) and every websocket frame is appended to gzip-compressed JSON-lines segments in a directory, each event
+# stamped with its wall-clock time; a background thread compresses, and segments roll over by age and size. While
+# replaying, the same entry points are served from the recording: responses are matched on the request (minus the
+# nonce and signature, which change on every signing), falling back to the next recorded response of the same request
+# type, and websocket connections to a URL receive the frames of the recorded connections to it, in order. Recorded
+# latencies and frame timings are reproduced divided by speed (0 serves everything immediately).
+#
+# Transports and connections created after start_recording()/start_replay() are affected, so call it first, or set
+# HYPERLIQUID_RECORD_DIR or HYPERLIQUID_REPLAY_DIR (and HYPERLIQUID_REPLAY_SPEED) in the environment.
+SEGMENT_SECONDS = 300.0
+SEGMENT_EVENTS = 100000
+SEGMENT_PATTERN = "segment-*.jsonl.gz"
+
+# request fields that differ on every signing and so cannot be matched on replay
+VOLATILE_FIELDS = ("nonce", "signature", "expiresAfter")
+
+logger = logging.getLogger(__name__)
+
+Frames = List[Tuple[float, str]]
+
+
+class ReplayMiss(Error):
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+def _request_key(payload: Any) -> str:
+    if isinstance(payload, dict):
+        payload = {key: value for key, value in payload.items() if key not in VOLATILE_FIELDS}
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
+def _request_type(payload: Any) -> Optional[str]:
+    if not isinstance(payload, dict):
+        return None
+    action = payload.get("action")
+    return action.get("type") if isinstance(action, dict) else payload.get("type")
+
+
+def _text(body: Any) -> str:
+    return body.decode("utf-8", "replace") if isinstance(body, (bytes, bytearray)) else body
+
+
+class Recorder:
+    def __init__(self, directory: str, segment_seconds: float = SEGMENT_SECONDS, segment_events: int = SEGMENT_EVENTS):
+        self.directory = directory
+        self.segment_seconds = segment_seconds
+        self.segment_events = segment_events
+        os.makedirs(directory, exist_ok=True)
+        self._prefix = f"{int(time.time() * 1000)}-"
+        self._connections = itertools.count(1)
+        self._queue: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._write, name="hyperliquid-recorder", daemon=True)
+        self._thread.start()
+        self.events = 0
+        self.segments = 0
+
+    def _put(self, event: Dict[str, Any]) -> None:
+        # serialized by the caller, so a payload mutated after the call is recorded as it was sent
+        event["t"] = time.time()
+        self._queue.put(fast_json.dumps(event))
+
+    def http(self, url: str, payload: Any, status: int, body: Any, headers: Any, elapsed: float) -> None:
+        event = {"kind": "http", "url": url, "payload": payload, "status": status, "body": _text(body)}
+        if status >= 400:
+            event["headers"] = dict(headers or {})
+        event["elapsed"] = elapsed
+        self._put(event)
+
+    def post(self, request_type: str, payload: Any, response: Any, elapsed: float) -> None:
+        """A websocket post request and its raw {"type", "payload"} response."""
+        self._put({"kind": "post", "type": request_type, "payload": payload, "response": response, "elapsed": elapsed})
+
+    def open_connection(self, url: str) -> str:
+        conn = self._prefix + str(next(self._connections))
+        self._put({"kind": "ws_open", "url": url, "conn": conn})
+        return conn
+
+    def frame(self, conn: str, direction: str, frame: Any) -> None:
+        self._put({"kind": "ws_" + direction, "conn": conn, "frame": _text(frame)})
+
+    def _write(self) -> None:
+        segment: Any = None
+        opened_at = 0.0
+        written = 0
+        while True:
+            line = self._queue.get()
+            if line is None:
+                break
+            rotate = written >= self.segment_events or time.time() - opened_at >= self.segment_seconds
+            if segment is not None and rotate:
+                segment.close()
+                segment = None
+            if segment is None:
+                # the recorder prefix keeps recorders that start in the same second from sharing a file
+                stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+                name = f"segment-{stamp}-{self._prefix}{self.segments:05d}.jsonl.gz"
+                segment = gzip.open(os.path.join(self.directory, name), "wb", compresslevel=6)
+                opened_at, written = time.time(), 0
+                self.segments += 1
+            segment.write(line + b"\n")
+            written += 1
+            self.events += 1
+        if segment is not None:
+            segment.close()
+
+    def close(self) -> None:
+        """Flush and close the current segment; events recorded afterwards are dropped."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"directory": self.directory, "events": self.events, "segments": self.segments}
+
+
+class RecordingTransport:
+    """Stands in for an HttpTransport or WebsocketTransport and records every exchange that goes through it."""
+
+    def __init__(self, inner: Any, recorder: Recorder):
+        self.inner = inner
+        self.recorder = recorder
+        self.session = inner.session
+
+    def post(self, url: str, payload: Any) -> Any:
+        started = time.monotonic()
+        response = self.inner.post(url, payload)
+        elapsed = time.monotonic() - started
+        self.recorder.http(url, payload, response.status_code, response.content, response.headers, elapsed)
+        return response
+
+    async def post_async(self, url: str, payload: Any) -> Any:
+        started = time.monotonic()
+        response = await self.inner.post_async(url, payload)
+        elapsed = time.monotonic() - started
+        self.recorder.http(url, payload, response.status_code, response.content, response.headers, elapsed)
+        return response
+
+    def request(self, request_type: str, payload: Any) -> Any:
+        started = time.monotonic()
+        response = self.inner.request(request_type, payload)
+        self.recorder.post(request_type, payload, response, time.monotonic() - started)
+        return response
+
+    async def request_async(self, request_type: str, payload: Any) -> Any:
+        started = time.monotonic()
+        response = await self.inner.request_async(request_type, payload)
+        self.recorder.post(request_type, payload, response, time.monotonic() - started)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        return cast(Dict[str, Any], self.inner.stats())
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class RecordingConnection:
+    """A websocket client connection whose frames, sent and received, are recorded."""
+
+    def __init__(self, ws: Any, recorder: Recorder, url: str):
+        self.ws = ws
+        self.recorder = recorder
+        self.conn = recorder.open_connection(url)
+
+    async def send(self, message: Any) -> None:
+        self.recorder.frame(self.conn, "send", message)
+        await self.ws.send(message)
+
+    async def recv(self) -> Any:
+        frame = await self.ws.recv()
+        self.recorder.frame(self.conn, "recv", frame)
+        return frame
+
+    async def close(self) -> None:
+        await self.ws.close()
+
+
+class _Responses:
+    """Recorded responses to one request, served in recorded order; the last one repeats once they run out."""
+
+    __slots__ = ("events", "next")
+
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+        self.next = 0
+
+    def take(self) -> Dict[str, Any]:
+        event = self.events[min(self.next, len(self.events) - 1)]
+        self.next += 1
+        return event
+
+
+def _read_events(path: str) -> Any:
+    with gzip.open(path, "rb") as segment:
+        try:
+            for line in segment:
+                yield fast_json.loads(line)
+        except (EOFError, OSError, ValueError) as e:
+            # the tail of a segment whose recorder was not closed
+            logger.warning(f"Recording segment {path} is truncated: {e}")
+
+
+class Cassette:
+    """Every segment of a recording directory, indexed for replay."""
+
+    def __init__(self, directory: str):
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"no recording in {directory}")
+        self.directory = directory
+        self.segments = sorted(glob.glob(os.path.join(directory, SEGMENT_PATTERN)))
+        # (kind, url or post type, request key) and (kind, url or post type, request type) -> responses
+        self._exact: Dict[Tuple[str, str, str], _Responses] = {}
+        self._loose: Dict[Tuple[str, str, Optional[str]], _Responses] = {}
+        self._connections: Dict[str, Tuple[str, float, Frames]] = {}
+        # url -> frames of each recorded connection to it, in the order they were opened
+        self._by_url: Dict[str, List[Frames]] = {}
+        self.events = 0
+        for path in self.segments:
+            for event in _read_events(path):
+                self._index(event)
+                self.events += 1
+
+    def _index(self, event: Dict[str, Any]) -> None:
+        kind = event["kind"]
+        if kind in ("http", "post"):
+            target = event["url"] if kind == "http" else event["type"]
+            payload = event["payload"]
+            self._exact.setdefault((kind, target, _request_key(payload)), _Responses()).events.append(event)
+            self._loose.setdefault((kind, target, _request_type(payload)), _Responses()).events.append(event)
+        elif kind == "ws_open":
+            frames: Frames = []
+            self._connections[event["conn"]] = (event["url"], event["t"], frames)
+            self._by_url.setdefault(event["url"], []).append(frames)
+        elif kind == "ws_recv":
+            connection = self._connections.get(event["conn"])
+            if connection is not None:
+                connection[2].append((event["t"] - connection[1], event["frame"]))
+
+    def response(self, kind: str, target: str, payload: Any) -> Optional[Dict[str, Any]]:
+        responses = self._exact.get((kind, target, _request_key(payload)))
+        if responses is None:
+            responses = self._loose.get((kind, target, _request_type(payload)))
+        return None if responses is None else responses.take()
+
+    def connection(self, url: str) -> Frames:
+        """Frames of the next recorded connection to url not replayed yet; none once they are used up."""
+        connections = self._by_url.get(url)
+        return connections.pop(0) if connections else []
+
+
+class RecordedResponse:
+    """The parts of requests.Response that API.post and AsyncAPI.post read, for a response served from a recording."""
+
+    def __init__(self, status_code: int, text: str, headers: Optional[Dict[str, str]] = None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
+
+    @property
+    def data(self) -> Any:
+        return fast_json.loads(self.text)
+
+
+class ReplayTransport:
+    """Stands in for every HttpTransport and WebsocketTransport, answering from a Cassette."""
+
+    def __init__(self, cassette: Cassette, speed: float = 1.0):
+        self.cassette = cassette
+        self.speed = speed
+        self.session = None
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.misses = 0
+
+    def _take(self, kind: str, target: str, payload: Any) -> Tuple[Dict[str, Any], float]:
+        with self._lock:
+            self.requests += 1
+            event = self.cassette.response(kind, target, payload)
+            if event is None:
+                self.misses += 1
+                raise ReplayMiss(f"no recorded response to {target} {_request_type(payload)}")
+        return event, event.get("elapsed", 0.0) / self.speed if self.speed else 0.0
+
+    @staticmethod
+    def _response(event: Dict[str, Any]) -> RecordedResponse:
+        return RecordedResponse(event["status"], event["body"], event.get("headers"))
+
+    def post(self, url: str, payload: Any) -> RecordedResponse:
+        event, delay = self._take("http", url, payload)
+        if delay:
+            time.sleep(delay)
+        return self._response(event)
+
+    async def post_async(self, url: str, payload: Any) -> RecordedResponse:
+        event, delay = self._take("http", url, payload)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._response(event)
+
+    def request(self, request_type: str, payload: Any) -> Any:
+        event, delay = self._take("post", request_type, payload)
+        if delay:
+            time.sleep(delay)
+        return event["response"]
+
+    async def request_async(self, request_type: str, payload: Any) -> Any:
+        event, delay = self._take("post", request_type, payload)
+        if delay:
+            await asyncio.sleep(delay)
+        return event["response"]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"requests": self.requests, "misses": self.misses, "speed": self.speed}
+
+    def close(self) -> None:
+        pass
+
+
+class ReplayConnection:
+    """A websocket client connection that receives recorded frames at their recorded offsets divided by speed."""
+
+    def __init__(self, frames: Frames, speed: float = 1.0):
+        self.frames = frames
+        self.speed = speed
+        self._next = 0
+        self._opened_at = time.monotonic()
+        self._closed = asyncio.Event()
+
+    async def send(self, message: Any) -> None:
+        if self._closed.is_set():
+            raise ConnectionError("replayed connection is closed")
+
+    async def recv(self) -> str:
+        if self._next < len(self.frames) and not self._closed.is_set():
+            offset, frame = self.frames[self._next]
+            self._next += 1
+            if self.speed:
+                delay = self._opened_at + offset / self.speed - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            return frame
+        # the recording of this connection is over: stay silent until closed, like an idle socket
+        await self._closed.wait()
+        raise ConnectionError("replayed connection is closed")
+
+    async def close(self) -> None:
+        self._closed.set()
+
+
+_recorder: Optional[Recorder] = None
+_replay: Optional[ReplayTransport] = None
+
+
+def start_recording(
+    directory: str, segment_seconds: float = SEGMENT_SECONDS, segment_events: int = SEGMENT_EVENTS
+) -> Recorder:
+    """Record the traffic of every transport and websocket connection created afterwards into directory."""
+    global _recorder
+    stop()
+    _recorder = Recorder(directory, segment_seconds, segment_events)
+    return _recorder
+
+
+def start_replay(directory: str, speed: float = 1.0) -> ReplayTransport:
+    """Serve every transport and websocket connection created afterwards from the recording in directory."""
+    global _replay
+    stop()
+    _replay = ReplayTransport(Cassette(directory), speed)
+    return _replay
+
+
+def stop() -> None:
+    global _recorder, _replay
+    if _recorder is not None:
+        _recorder.close()
+    _recorder = None
+    _replay = None
+
+
+def get_recorder() -> Optional[Recorder]:
+    return _recorder
+
+
+def get_replay() -> Optional[ReplayTransport]:
+    return _replay
+
+
+def wrap_transport(transport: Any) -> Any:
+    """The transport to use in place of a newly created one while recording or replaying."""
+    if _replay is not None:
+        return _replay
+    if _recorder is not None:
+        return RecordingTransport(transport, _recorder)
+    return transport
+
+
+async def connect(url: str, **kwargs: Any) -> Any:
+    """websockets.connect(url, **kwargs), recorded or replayed while a recording or replay is active."""
+    if _replay is not None:
+        return ReplayConnection(_replay.cassette.connection(url), _replay.speed)
+    if not HAS_WEBSOCKETS:
+        raise ImportError("websocket connections require the websockets package")
+    ws = await websockets.connect(url, **kwargs)
+    recorder = _recorder
+    return ws if recorder is None else RecordingConnection(ws, recorder, url)
+
+
+# flush the last segment when the process exits
+atexit.register(stop)
+
+if os.environ.get("HYPERLIQUID_REPLAY_DIR"):
+    start_replay(os.environ["HYPERLIQUID_REPLAY_DIR"], float(os.environ.get("HYPERLIQUID_REPLAY_SPEED", "1")))
+elif os.environ.get("HYPERLIQUID_RECORD_DIR"):
+    start_recording(os.environ["HYPERLIQUID_RECORD_DIR"])
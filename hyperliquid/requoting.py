@@ -0,0 +1,188 @@
+import logging
+import threading
+
+from hyperliquid.utils.signing import CancelRequest, ModifyRequest, OrderRequest
+from hyperliquid.utils.types import Any, Dict, List, Optional, Side, Tuple, TypedDict
+
+# Re-quotes a ladder by diffing it against the orders already resting instead of cancelling and placing everything:
+# - a level whose price and size are unchanged is left alone and keeps its queue position
+# - a changed level is paired with a resting order on the same side and moved with batchModify
+# - remaining levels are placed, remaining resting orders cancelled
+# Each group is sent as one bulk action, so a re-quote costs at most 3 requests however many levels moved.
+RestingOrder = TypedDict("RestingOrder", {"coin": str, "side": Side, "limitPx": str, "sz": str, "oid": int})
+
+logger = logging.getLogger(__name__)
+
+
+def _wire(x: float) -> str:
+    # the precision float_to_wire sends, so quotes that would hit the wire unchanged compare equal
+    return f"{x:.8f}".rstrip("0").rstrip(".")
+
+
+def _same(a: float, b: float) -> bool:
+    return _wire(a) == _wire(b)
+
+
+def _side(order: OrderRequest) -> Side:
+    return "B" if order["is_buy"] else "A"
+
+
+def _best_first(side: Side, price: float) -> float:
+    # bids sort high to low and asks low to high, so orders closest to the mid are paired first
+    return -price if side == "B" else price
+
+
+class QuoteDiff:
+    def __init__(self):
+        self.keep: List[RestingOrder] = []
+        self.modify: List[Tuple[RestingOrder, OrderRequest]] = []
+        self.place: List[OrderRequest] = []
+        self.cancel: List[RestingOrder] = []
+
+    def actions(self) -> int:
+        return sum(1 for group in (self.cancel, self.modify, self.place) if group)
+
+    def naive_requests(self) -> int:
+        # cancelling every resting order and placing every level one request at a time
+        live = len(self.keep) + len(self.modify) + len(self.cancel)
+        desired = len(self.keep) + len(self.modify) + len(self.place)
+        return live + desired
+
+
+def diff_quotes(desired: List[OrderRequest], live: List[RestingOrder]) -> QuoteDiff:
+    """Split the desired ladder against the resting orders (the openOrders shape) into keep/modify/place/cancel."""
+    diff = QuoteDiff()
+    books: Dict[Tuple[str, Side], Tuple[List[OrderRequest], List[RestingOrder]]] = {}
+    for order in desired:
+        books.setdefault((order["coin"], _side(order)), ([], []))[0].append(order)
+    for resting in live:
+        books.setdefault((resting["coin"], resting["side"]), ([], []))[1].append(resting)
+
+    for (_, side), (wanted, resting_orders) in books.items():
+        unmatched: List[RestingOrder] = []
+        remaining = list(wanted)
+        for resting in resting_orders:
+            px, sz = float(resting["limitPx"]), float(resting["sz"])
+            for i, order in enumerate(remaining):
+                if _same(order["limit_px"], px) and _same(order["sz"], sz):
+                    diff.keep.append(resting)
+                    del remaining[i]
+                    break
+            else:
+                unmatched.append(resting)
+
+        remaining.sort(key=lambda order: _best_first(side, order["limit_px"]))
+        unmatched.sort(key=lambda resting: _best_first(side, float(resting["limitPx"])))
+        paired = min(len(remaining), len(unmatched))
+        diff.modify.extend(zip(unmatched[:paired], remaining[:paired]))
+        diff.place.extend(remaining[paired:])
+        diff.cancel.extend(unmatched[paired:])
+    return diff
+
+
+def _statuses(response: Any, count: int) -> List[Any]:
+    try:
+        if response["status"] == "ok":
+            return list(response["response"]["data"]["statuses"])
+    except (KeyError, TypeError):
+        pass
+    return [{"error": str(response)}] * count
+
+
+def _resting(order: OrderRequest, status: Any) -> Optional[RestingOrder]:
+    if not isinstance(status, dict) or "resting" not in status:
+        return None
+    return {
+        "coin": order["coin"],
+        "side": _side(order),
+        "limitPx": _wire(order["limit_px"]),
+        "sz": _wire(order["sz"]),
+        "oid": status["resting"]["oid"],
+    }
+
+
+class Requoter:
+    def __init__(self, exchange: Any):
+        self.exchange = exchange
+        self._lock = threading.Lock()
+        self.requotes = 0
+        self.actions = 0
+        self.naive_requests = 0
+        self.kept = 0
+        self.modified = 0
+        self.placed = 0
+        self.cancelled = 0
+
+    def requote(self, desired: List[OrderRequest], live: List[RestingOrder]) -> Dict[str, Any]:
+        """Move the resting orders in `live` to the `desired` ladder.
+
+        Returns the orders resting afterwards (in the openOrders shape, to pass as `live` next time), the raw
+        responses and the requests this re-quote saved over cancelling and re-placing every level.
+        """
+        diff = diff_quotes(desired, live)
+        now_live: List[RestingOrder] = list(diff.keep)
+        responses: Dict[str, Any] = {}
+
+        # cancels go first so the margin they free is available to the new and modified orders
+        if diff.cancel:
+            cancels: List[CancelRequest] = [{"coin": resting["coin"], "oid": resting["oid"]} for resting in diff.cancel]
+            responses["cancel"] = self.exchange.bulk_cancel(cancels)
+            for resting, status in zip(diff.cancel, _statuses(responses["cancel"], len(cancels))):
+                if status != "success":
+                    logger.warning(f"Re-quote cancel of {resting['coin']} oid {resting['oid']} failed: {status}")
+
+        if diff.modify:
+            modifies: List[ModifyRequest] = [{"oid": resting["oid"], "order": order} for resting, order in diff.modify]
+            responses["modify"] = self.exchange.bulk_modify_orders_new(modifies)
+            for (resting, order), status in zip(diff.modify, _statuses(responses["modify"], len(modifies))):
+                moved = _resting(order, status)
+                if moved is not None:
+                    now_live.append(moved)
+                elif isinstance(status, dict) and "error" in status:
+                    logger.warning(f"Re-quote modify of {resting['coin']} oid {resting['oid']} failed: {status}")
+
+        if diff.place:
+            responses["order"] = self.exchange.bulk_orders(diff.place)
+            for order, status in zip(diff.place, _statuses(responses["order"], len(diff.place))):
+                placed = _resting(order, status)
+                if placed is not None:
+                    now_live.append(placed)
+                elif isinstance(status, dict) and "error" in status:
+                    logger.warning(f"Re-quote order {order['coin']} {order['sz']}@{order['limit_px']} failed: {status}")
+
+        actions = diff.actions()
+        naive = diff.naive_requests()
+        with self._lock:
+            self.requotes += 1
+            self.actions += actions
+            self.naive_requests += naive
+            self.kept += len(diff.keep)
+            self.modified += len(diff.modify)
+            self.placed += len(diff.place)
+            self.cancelled += len(diff.cancel)
+
+        return {
+            "live": now_live,
+            "responses": responses,
+            "kept": len(diff.keep),
+            "modified": len(diff.modify),
+            "placed": len(diff.place),
+            "cancelled": len(diff.cancel),
+            "requests": actions,
+            "requests_saved": naive - actions,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            saved = self.naive_requests - self.actions
+            return {
+                "requotes": self.requotes,
+                "requests": self.actions,
+                "naive_requests": self.naive_requests,
+                "saved": saved,
+                "saved_per_requote": saved / self.requotes if self.requotes else 0.0,
+                "kept": self.kept,
+                "modified": self.modified,
+                "placed": self.placed,
+                "cancelled": self.cancelled,
+            }
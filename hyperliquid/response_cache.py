@@ -0,0 +1,176 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from hyperliquid.utils import fast_json
+from hyperliquid.utils.types import Any, Dict, Optional, Set, Tuple
+
+# Response cache for /info queries whose answers tolerate some staleness. Each query type has a TTL (types without
+# one are never cached), entries are evicted least-recently-used once the cached responses exceed max_bytes, and
+# every entry is indexed by the user it is about, so an Exchange action sent by this process drops the cached answers
+# about the users it affects. Callers receive the cached object itself, so results must be treated as read-only.
+DEFAULT_TTLS: Dict[str, float] = {
+    "meta": 300.0,
+    "spotMeta": 300.0,
+    "perpDexs": 300.0,
+    "userFees": 3600.0,
+    "referral": 300.0,
+    "subAccounts": 300.0,
+    "userToMultiSigSigners": 300.0,
+    "delegatorSummary": 300.0,
+    "delegations": 300.0,
+    "delegatorRewards": 300.0,
+    "fundingHistory": 60.0,
+    "userFunding": 60.0,
+}
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+CacheKey = Tuple[str, str]
+
+
+class _Entry:
+    __slots__ = ("expires_at", "size", "result", "user")
+
+    def __init__(self, expires_at: float, size: int, result: Any, user: Optional[str]):
+        self.expires_at = expires_at
+        self.size = size
+        self.result = result
+        self.user = user
+
+
+def _user(payload: Dict[str, Any]) -> Optional[str]:
+    user = payload.get("user")
+    return user.lower() if isinstance(user, str) else None
+
+
+class ResponseCache:
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._users: Dict[str, Set[CacheKey]] = {}
+        # bumped by every invalidation of a user, so a response fetched before it is not cached after it
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(payload: Dict[str, Any]) -> CacheKey:
+        return payload["type"], json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+    def cacheable(self, url_path: str, payload: Any) -> bool:
+        if url_path != "/info" or not isinstance(payload, dict):
+            return False
+        request_type = payload.get("type")
+        return isinstance(request_type, str) and self.ttls.get(request_type, 0) > 0
+
+    def get(self, payload: Dict[str, Any]) -> Tuple[bool, Any]:
+        """(True, response) for a live entry of the query, else (False, None)."""
+        key = self.key(payload)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() >= entry.expires_at:
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses[key[0]] = self.misses.get(key[0], 0) + 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits[key[0]] = self.hits.get(key[0], 0) + 1
+            return True, entry.result
+
+    def version(self, payload: Dict[str, Any]) -> int:
+        """Taken before fetching a missed query and handed back to put()."""
+        user = _user(payload)
+        return 0 if user is None else self._versions.get(user, 0)
+
+    def put(self, payload: Dict[str, Any], result: Any, version: int = 0) -> None:
+        key = self.key(payload)
+        size = len(key[1]) + len(fast_json.dumps(result))
+        if size > self.max_bytes:
+            return
+        user = _user(payload)
+        with self._lock:
+            if user is not None and self._versions.get(user, 0) != version:
+                # the user was invalidated while this response was in flight
+                return
+            self._drop(key)
+            self._entries[key] = _Entry(time.monotonic() + self.ttls[key[0]], size, result, user)
+            self.bytes += size
+            if user is not None:
+                self._users.setdefault(user, set()).add(key)
+            while self.bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _drop(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.bytes -= entry.size
+        if entry.user is not None:
+            keys = self._users.get(entry.user)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._users[entry.user]
+
+    def invalidate_user(self, user: str) -> int:
+        """Drop every cached response about user; returns how many there were."""
+        user = user.lower()
+        with self._lock:
+            self._versions[user] = self._versions.get(user, 0) + 1
+            keys = list(self._users.get(user, ()))
+            for key in keys:
+                self._drop(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._users.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            types = sorted(set(self.hits) | set(self.misses))
+            hits, misses = sum(self.hits.values()), sum(self.misses.values())
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "by_type": {t: {"hits": self.hits.get(t, 0), "misses": self.misses.get(t, 0)} for t in types},
+            }
+
+
+_caches: Dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def enable_response_cache(
+    base_url: str, ttls: Optional[Dict[str, float]] = None, max_bytes: int = DEFAULT_MAX_BYTES
+) -> ResponseCache:
+    """Opt every Info for base_url created afterwards (without an explicit cache) into a shared response cache."""
+    with _caches_lock:
+        cache = _caches.get(base_url)
+        if cache is None:
+            cache = ResponseCache(ttls, max_bytes)
+            _caches[base_url] = cache
+        else:
+            cache.ttls.update(ttls or {})
+            cache.max_bytes = max_bytes
+        return cache
+
+
+def get_response_cache(base_url: str) -> Optional[ResponseCache]:
+    return _caches.get(base_url)
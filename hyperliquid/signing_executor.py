@@ -0,0 +1,113 @@
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import eth_account
+from eth_account.signers.local import LocalAccount
+
+from hyperliquid.utils.signing import sign_l1_action
+from hyperliquid.utils.types import Any, Deque, Dict, List, Optional, Set
+
+# Moves msgpack hashing and secp256k1 signing of L1 actions off the event loop of an AsyncExchange. Every
+# signer is pinned to one single-worker shard, so its actions are signed strictly in submission (and therefore nonce)
+# order, while different signers are spread over the shards. With processes=True each shard is a separate process that
+# keeps the keys it was handed, which also sidesteps the GIL; with threads the loop stays free but signing shares it.
+# The sync Exchange signs inline: its caller blocks until the action is posted, so there is nothing to overlap.
+THROUGHPUT_WINDOW = 10.0
+
+# keys registered with this worker process, by address
+_worker_wallets: Dict[str, LocalAccount] = {}
+
+
+def _register_key(key: bytes) -> None:
+    wallet = eth_account.Account.from_key(key)
+    _worker_wallets[wallet.address] = wallet
+
+
+def _sign_with_registered_key(address, action, active_pool, nonce, expires_after, is_mainnet):
+    return sign_l1_action(_worker_wallets[address], action, active_pool, nonce, expires_after, is_mainnet)
+
+
+class SigningExecutor:
+    def __init__(self, shards: int = 4, processes: bool = False):
+        self.processes = processes
+        self._shards: List[Executor] = [
+            (
+                ProcessPoolExecutor(max_workers=1)
+                if processes
+                else ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"hyperliquid-signer-{i}")
+            )
+            for i in range(shards)
+        ]
+        self._registered: List[Set[str]] = [set() for _ in range(shards)]
+        self._lock = threading.Lock()
+        self._completed: Deque[float] = deque()
+        self.submitted = 0
+        self.signed = 0
+        self.failed = 0
+        self.latency_total = 0.0
+
+    def _shard(self, address: str) -> int:
+        return zlib.crc32(address.lower().encode()) % len(self._shards)
+
+    def submit_l1_action(
+        self,
+        wallet: LocalAccount,
+        action: Any,
+        active_pool: Optional[str],
+        nonce: int,
+        expires_after: Optional[int],
+        is_mainnet: bool,
+    ) -> "Future[Any]":
+        shard = self._shard(wallet.address)
+        executor = self._shards[shard]
+        submitted_at = time.monotonic()
+        with self._lock:
+            self.submitted += 1
+            if self.processes and wallet.address not in self._registered[shard]:
+                # queued ahead of the signature on the same single worker, so it is always registered in time
+                executor.submit(_register_key, bytes(wallet.key))
+                self._registered[shard].add(wallet.address)
+        if self.processes:
+            future = executor.submit(
+                _sign_with_registered_key, wallet.address, action, active_pool, nonce, expires_after, is_mainnet
+            )
+        else:
+            future = executor.submit(sign_l1_action, wallet, action, active_pool, nonce, expires_after, is_mainnet)
+        future.add_done_callback(lambda f: self._on_done(f, submitted_at))
+        return future
+
+    def _on_done(self, future: "Future[Any]", submitted_at: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if future.cancelled() or future.exception() is not None:
+                self.failed += 1
+                return
+            self.signed += 1
+            self.latency_total += now - submitted_at
+            self._completed.append(now)
+            while self._completed and now - self._completed[0] > THROUGHPUT_WINDOW:
+                self._completed.popleft()
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            while self._completed and now - self._completed[0] > THROUGHPUT_WINDOW:
+                self._completed.popleft()
+            window = min(THROUGHPUT_WINDOW, now - self._completed[0]) if self._completed else 0.0
+            return {
+                "mode": "processes" if self.processes else "threads",
+                "shards": len(self._shards),
+                "submitted": self.submitted,
+                "signed": self.signed,
+                "failed": self.failed,
+                "in_flight": self.submitted - self.signed - self.failed,
+                "signatures_per_second": len(self._completed) / window if window > 0 else 0.0,
+                "avg_latency": self.latency_total / self.signed if self.signed else 0.0,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        for executor in self._shards:
+            executor.shutdown(wait=wait)
@@ -0,0 +1,145 @@
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from hyperliquid.recording import wrap_transport
+from hyperliquid.utils.types import Any, Dict, Optional
+
+# Every API instance talking to the same base_url shares one HttpTransport, and therefore one bounded keep-alive
+# connection pool, unless it is explicitly handed its own. While traffic is recorded or replayed (see recording.py),
+# the shared transport is the recording or replaying stand-in.
+DEFAULT_POOL_SIZE = 32
+DEFAULT_TIMEOUT = 10.0
+
+
+class ConnectionStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.in_use = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+
+    def on_acquire(self, wait: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_use += 1
+            self.queue_wait_total += wait
+            if wait > self.queue_wait_max:
+                self.queue_wait_max = wait
+
+    def on_new_connection(self) -> None:
+        with self._lock:
+            self.new_connections += 1
+
+    def on_release(self) -> None:
+        with self._lock:
+            self.in_use = max(self.in_use - 1, 0)
+
+
+def _instrumented_pool(pool_cls: Any, stats: ConnectionStats) -> Any:
+    class InstrumentedPool(pool_cls):
+        def _get_conn(self, timeout=None):
+            start = time.monotonic()
+            conn = super()._get_conn(timeout)
+            stats.on_acquire(time.monotonic() - start)
+            return conn
+
+        def _new_conn(self):
+            stats.on_new_connection()
+            return super()._new_conn()
+
+        def _put_conn(self, conn):
+            stats.on_release()
+            super()._put_conn(conn)
+
+    return InstrumentedPool
+
+
+class _InstrumentedAdapter(HTTPAdapter):
+    def __init__(self, stats: ConnectionStats, pool_size: int):
+        self._stats = stats
+        # pool_block makes callers wait for a free connection instead of opening sockets beyond pool_size.
+        super().__init__(pool_connections=4, pool_maxsize=pool_size, pool_block=True)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _instrumented_pool(HTTPConnectionPool, self._stats),
+            "https": _instrumented_pool(HTTPSConnectionPool, self._stats),
+        }
+
+    def idle_sockets(self) -> int:
+        idle = 0
+        for key in list(self.poolmanager.pools.keys()):
+            pool = self.poolmanager.pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            idle += sum(1 for conn in list(pool.pool.queue) if conn is not None and conn.sock is not None)
+        return idle
+
+
+class HttpTransport:
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, timeout: Optional[float] = DEFAULT_TIMEOUT):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.connection_stats = ConnectionStats()
+        self._adapter = _InstrumentedAdapter(self.connection_stats, pool_size)
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+
+    def post(self, url: str, payload: Any) -> requests.Response:
+        return self.session.post(url, json=payload, timeout=self.timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.connection_stats
+        reused = max(stats.requests - stats.new_connections, 0)
+        return {
+            "pool_size": self.pool_size,
+            "requests": stats.requests,
+            "new_connections": stats.new_connections,
+            "reuse_ratio": reused / stats.requests if stats.requests else 0.0,
+            "in_use": stats.in_use,
+            "open_sockets": stats.in_use + self._adapter.idle_sockets(),
+            "queue_wait_avg": stats.queue_wait_total / stats.requests if stats.requests else 0.0,
+            "queue_wait_max": stats.queue_wait_max,
+        }
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_transports: Dict[str, HttpTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(base_url: str) -> HttpTransport:
+    transport = _transports.get(base_url)
+    if transport is not None:
+        return transport
+    with _transports_lock:
+        if base_url not in _transports:
+            _transports[base_url] = wrap_transport(HttpTransport())
+        return _transports[base_url]
+
+
+def set_transport(base_url: str, transport: HttpTransport) -> None:
+    with _transports_lock:
+        _transports[base_url] = transport
+
+
+def transport_stats() -> Dict[str, Dict[str, Any]]:
+    return {base_url: transport.stats() for base_url, transport in list(_transports.items())}
+
+
+def close_transports() -> None:
+    with _transports_lock:
+        for transport in _transports.values():
+            transport.close()
+        _transports.clear()
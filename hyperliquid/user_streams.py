@@ -0,0 +1,373 @@
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from hyperliquid.utils.types import Any, Callable, Dict, List, Optional, Set, Tuple
+from hyperliquid.websocket_manager import (
+    USER_SUBSCRIPTIONS,
+    WebsocketManager,
+    subscription_channel,
+    subscription_id,
+    subscription_key,
+)
+
+# Per-user streams (fills, account state, open orders) of every user followed on one base_url, spread over a pool of
+# sockets ("shards") instead of one socket per user. All subscriptions of a user live on the same shard, so a user's
+# streams fail and recover together, and a shard carries at most max_subscriptions_per_shard server-side subscriptions.
+# Stores following the same user share its subscriptions. userEvents and orderUpdates messages do not name their user,
+# so a shard carries those channels for one user only: prefer userFills and webData2, which users can share.
+# Subscriptions can be made from any thread; callbacks run on the pool's loop and must not block. While a user is moved
+# to another shard (see rebalance) a message may be delivered twice, so callbacks must be idempotent.
+DEFAULT_MAX_SUBSCRIPTIONS_PER_SHARD = 100
+KEYLESS_USER_CHANNELS = {"userEvents", "orderUpdates"}
+# how often per-shard message rates are sampled and quiet shards reported
+METRICS_INTERVAL = 30.0
+
+logger = logging.getLogger(__name__)
+
+
+class _Stream:
+    """One server-side subscription of a user and the callbacks sharing it, by handle."""
+
+    def __init__(self, subscription: Dict[str, Any]):
+        self.subscription = subscription
+        self.keyless = subscription["type"] in KEYLESS_USER_CHANNELS
+        self.callbacks: Dict[int, Callable[[Any], None]] = {}
+        # handle -> subscriber id on the shard the stream currently lives on
+        self.subscriber_ids: Dict[int, int] = {}
+
+
+class _UserStreams:
+    def __init__(self, shard: "_Shard"):
+        self.shard = shard
+        self.streams: Dict[str, _Stream] = {}
+
+    def keyless(self) -> bool:
+        return any(stream.keyless for stream in self.streams.values())
+
+
+class _Shard:
+    """One websocket connection of the pool and the users assigned to it."""
+
+    def __init__(self, index: int, ws: WebsocketManager):
+        self.index = index
+        self.ws = ws
+        self.users: Set[str] = set()
+        self.subscriptions = 0
+        self.keyless_user: Optional[str] = None
+        self.sampled_at = time.time()
+        self.sampled_messages = 0
+        self.message_rate = 0.0
+
+
+class UserStreamPool:
+    def __init__(
+        self,
+        base_url: str,
+        max_subscriptions_per_shard: int = DEFAULT_MAX_SUBSCRIPTIONS_PER_SHARD,
+        metrics_interval: float = METRICS_INTERVAL,
+    ):
+        self.base_url = base_url
+        self.max_subscriptions_per_shard = max_subscriptions_per_shard
+        self.metrics_interval = metrics_interval
+        self.shards: Dict[int, _Shard] = {}
+        self.users: Dict[str, _UserStreams] = {}
+        # handle -> (user, subscription id)
+        self._handles: Dict[int, Tuple[str, str]] = {}
+        self._handle_ids = itertools.count(1)
+        self._next_shard = 0
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # created on the pool's loop, which is the only thread touching shards and users
+        self._pool_lock: Optional[asyncio.Lock] = None
+        self._monitor_task: "Optional[Future[None]]" = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="hyperliquid-user-streams", daemon=True).start()
+                self._loop = loop
+                self._monitor_task = asyncio.run_coroutine_threadsafe(self._monitor(), loop)
+            return self._loop
+
+    def _locked(self) -> asyncio.Lock:
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        return self._pool_lock
+
+    def subscribe(self, subscription_type: str, callback: Callable[[Any], None], user: str, **params: Any) -> int:
+        """Subscribe without waiting for the socket; returns a handle for unsubscribe. Replayed on every reconnect."""
+        if subscription_type not in USER_SUBSCRIPTIONS:
+            raise ValueError("not a per-user subscription", subscription_type)
+        handle = next(self._handle_ids)
+        subscription = {"type": subscription_type, "user": user.lower(), **params}
+        asyncio.run_coroutine_threadsafe(self._subscribe(handle, subscription, callback), self._ensure_loop())
+        return handle
+
+    def unsubscribe(self, handle: int) -> None:
+        """Drop the callback of handle; the server-side subscription goes with its last callback."""
+        asyncio.run_coroutine_threadsafe(self._unsubscribe(handle), self._ensure_loop())
+
+    def rebalance(self, timeout: Optional[float] = None) -> int:
+        """Consolidate users onto fewer shards after users left; returns the number of shards closed."""
+        return asyncio.run_coroutine_threadsafe(self._rebalance(), self._ensure_loop()).result(timeout)
+
+    def connected_for(self, user: str) -> bool:
+        """Whether the streams of user are subscribed on a connected shard."""
+        streams = self.users.get(user.lower())
+        return streams is not None and streams.shard.ws.connected
+
+    async def _subscribe(self, handle: int, subscription: Dict[str, Any], callback: Callable[[Any], None]) -> None:
+        async with self._locked():
+            user = subscription["user"]
+            sub_id = subscription_id(subscription)
+            streams = self.users.get(user)
+            stream = streams.streams.get(sub_id) if streams is not None else None
+            if stream is None:
+                stream = _Stream(subscription)
+                shard = await self._shard_for(user, stream.keyless)
+                await self._attach(shard, user, stream)
+                self.users[user].streams[sub_id] = stream
+            shard = self.users[user].shard
+            stream.callbacks[handle] = callback
+            stream.subscriber_ids[handle] = self._add_subscriber(shard, stream, callback)
+            self._handles[handle] = (user, sub_id)
+        logger.info(f"Subscribed {user} to {subscription['type']} on shard {shard.index}")
+
+    async def _unsubscribe(self, handle: int) -> None:
+        async with self._locked():
+            entry = self._handles.pop(handle, None)
+            if entry is None:
+                return
+            user, sub_id = entry
+            streams = self.users[user]
+            stream = streams.streams[sub_id]
+            shard = streams.shard
+            del stream.callbacks[handle]
+            shard.ws.remove_subscriber(stream.subscriber_ids.pop(handle))
+            if stream.callbacks:
+                return
+            await shard.ws.unsubscribe(sub_id)
+            shard.subscriptions -= 1
+            del streams.streams[sub_id]
+            if shard.keyless_user == user and not streams.keyless():
+                shard.keyless_user = None
+            if not streams.streams:
+                del self.users[user]
+                shard.users.discard(user)
+                if not shard.users:
+                    await self._close_shard(shard)
+
+    def _accepts(self, shard: _Shard, user: str, subscriptions: int, keyless: bool) -> bool:
+        if shard.subscriptions + subscriptions > self.max_subscriptions_per_shard:
+            return False
+        return not keyless or shard.keyless_user in (None, user)
+
+    async def _open_shard(self) -> _Shard:
+        """Open a new connection for the pool; if it cannot connect now, it keeps retrying in the background."""
+        ws = WebsocketManager(self.base_url, max_reconnect_attempts=None)
+        shard = _Shard(self._next_shard, ws)
+        self._next_shard += 1
+        self.shards[shard.index] = shard
+        if not await ws.connect():
+            ws.reconnect()
+        logger.info(f"Opened user stream shard {shard.index} ({len(self.shards)} shards)")
+        return shard
+
+    async def _close_shard(self, shard: _Shard) -> None:
+        del self.shards[shard.index]
+        await shard.ws.close()
+        logger.info(f"Closed user stream shard {shard.index} ({len(self.shards)} shards)")
+
+    async def _pick_shard(
+        self, user: str, subscriptions: int, keyless: bool, exclude: Optional[_Shard] = None
+    ) -> _Shard:
+        # fill the fullest shard that still fits, so connections stay few and emptied ones can be closed
+        candidates = [
+            shard
+            for shard in self.shards.values()
+            if shard is not exclude and self._accepts(shard, user, subscriptions, keyless)
+        ]
+        if candidates:
+            return max(candidates, key=lambda shard: shard.subscriptions)
+        return await self._open_shard()
+
+    async def _shard_for(self, user: str, keyless: bool) -> _Shard:
+        """The shard a new subscription of user goes to, moving all of the user's streams if theirs is full."""
+        streams = self.users.get(user)
+        if streams is None:
+            shard = await self._pick_shard(user, 1, keyless)
+            self.users[user] = _UserStreams(shard)
+            return shard
+        if not self._accepts(streams.shard, user, 1, keyless):
+            needed = len(streams.streams) + 1
+            target = await self._pick_shard(user, needed, keyless or streams.keyless(), exclude=streams.shard)
+            await self._move(user, target)
+        return streams.shard
+
+    def _add_subscriber(self, shard: _Shard, stream: _Stream, callback: Callable[[Any], None]) -> int:
+        subscription = stream.subscription
+        return shard.ws.add_subscriber(subscription_channel(subscription), callback, subscription_key(subscription))
+
+    async def _attach(self, shard: _Shard, user: str, stream: _Stream) -> None:
+        params = {key: value for key, value in stream.subscription.items() if key != "type"}
+        await shard.ws.subscribe(stream.subscription["type"], **params)
+        for handle, callback in stream.callbacks.items():
+            stream.subscriber_ids[handle] = self._add_subscriber(shard, stream, callback)
+        shard.users.add(user)
+        shard.subscriptions += 1
+        if stream.keyless:
+            shard.keyless_user = user
+
+    async def _move(self, user: str, target: _Shard) -> None:
+        """Subscribe the user on the target shard before leaving the old one, so no update is missed."""
+        streams = self.users[user]
+        source = streams.shard
+        old_ids = {sub_id: list(stream.subscriber_ids.values()) for sub_id, stream in streams.streams.items()}
+        for stream in streams.streams.values():
+            await self._attach(target, user, stream)
+        for sub_id, subscriber_ids in old_ids.items():
+            for subscriber_id in subscriber_ids:
+                source.ws.remove_subscriber(subscriber_id)
+            await source.ws.unsubscribe(sub_id)
+            source.subscriptions -= 1
+        source.users.discard(user)
+        if source.keyless_user == user:
+            source.keyless_user = None
+        streams.shard = target
+
+    async def _rebalance(self) -> int:
+        async with self._locked():
+            closed = 0
+            for shard in sorted(self.shards.values(), key=lambda shard: shard.subscriptions):
+                if not shard.users:
+                    await self._close_shard(shard)
+                    closed += 1
+                    continue
+                # empty the least loaded shard into the others when they have room for all of its users
+                spare = sum(
+                    self.max_subscriptions_per_shard - other.subscriptions
+                    for other in self.shards.values()
+                    if other is not shard
+                )
+                if spare < shard.subscriptions:
+                    break
+                targets: Dict[str, _Shard] = {}
+                keyless_targets: Set[int] = set()
+                for user in shard.users:
+                    needed = len(self.users[user].streams)
+                    keyless = self.users[user].keyless()
+                    target = next(
+                        (
+                            other
+                            for other in self.shards.values()
+                            if other is not shard
+                            and self._accepts(other, user, needed, keyless)
+                            and not (keyless and other.index in keyless_targets)
+                        ),
+                        None,
+                    )
+                    if target is None:
+                        break
+                    if keyless:
+                        keyless_targets.add(target.index)
+                    targets[user] = target
+                    target.subscriptions += needed  # reserve room while planning
+                for user, target in targets.items():
+                    target.subscriptions -= len(self.users[user].streams)
+                if len(targets) < len(shard.users):
+                    continue
+                for user, target in targets.items():
+                    await self._move(user, target)
+                await self._close_shard(shard)
+                closed += 1
+            return closed
+
+    async def _monitor(self) -> None:
+        """Sample per-shard message rates, report shards that went quiet and restart reconnects that stopped."""
+        while True:
+            await asyncio.sleep(self.metrics_interval)
+            now = time.time()
+            for shard in list(self.shards.values()):
+                messages = shard.ws.messages_received
+                shard.message_rate = (messages - shard.sampled_messages) / max(now - shard.sampled_at, 1e-9)
+                shard.sampled_messages = messages
+                shard.sampled_at = now
+                lag = now - shard.ws.last_ping if shard.ws.last_ping else None
+                if lag is not None and lag > shard.ws.connection_timeout:
+                    logger.warning(
+                        f"Shard {shard.index} has received nothing for {lag:.0f}s ({len(shard.users)} users)"
+                    )
+                if not shard.ws.connected and not shard.ws.reconnecting:
+                    logger.warning(f"Shard {shard.index} is down, reconnecting ({len(shard.users)} users)")
+                    shard.ws.reconnect()
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """Per-shard connection state, load, message rate and lag (seconds since the shard last received data)."""
+        now = time.time()
+        metrics = []
+        for shard in list(self.shards.values()):
+            status = shard.ws.get_status()
+            metrics.append(
+                {
+                    "shard": shard.index,
+                    "connected": shard.ws.connected,
+                    "users": len(shard.users),
+                    "subscriptions": shard.subscriptions,
+                    "capacity": self.max_subscriptions_per_shard,
+                    "messages": shard.ws.messages_received,
+                    "message_rate": shard.message_rate,
+                    "lag": now - shard.ws.last_ping if shard.ws.last_ping else None,
+                    "backlog": status["queued_for_subscribers"],
+                    "dropped": status["dropped_messages"],
+                    "reconnects": shard.ws.reconnects,
+                }
+            )
+        return metrics
+
+    def stats(self) -> Dict[str, Any]:
+        shards = list(self.shards.values())
+        return {
+            "users": len(self.users),
+            "shards": len(shards),
+            "connected_shards": sum(1 for shard in shards if shard.ws.connected),
+            "subscriptions": sum(shard.subscriptions for shard in shards),
+            "callbacks": len(self._handles),
+        }
+
+    async def _close(self) -> None:
+        async with self._locked():
+            for shard in list(self.shards.values()):
+                await self._close_shard(shard)
+            self.users.clear()
+            self._handles.clear()
+
+    def close(self) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+        asyncio.run_coroutine_threadsafe(self._close(), loop).result(5)
+        loop.call_soon_threadsafe(loop.stop)
+        with self._lock:
+            self._loop = None
+            self._pool_lock = None
+
+
+_pools: Dict[str, UserStreamPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_user_streams(base_url: str) -> UserStreamPool:
+    pool = _pools.get(base_url)
+    if pool is not None:
+        return pool
+    with _pools_lock:
+        if base_url not in _pools:
+            _pools[base_url] = UserStreamPool(base_url)
+        return _pools[base_url]
@@ -0,0 +1,28 @@
+import json
+
+from hyperliquid.utils.types import Any, Union
+
+# orjson decodes straight from the response bytes and is several times faster than the stdlib on the large /info
+# payloads (metaAndAssetCtxs, l2Book, userFills). It is optional: without it the stdlib decoder is used.
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+
+BACKEND = "orjson" if HAS_ORJSON else "json"
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
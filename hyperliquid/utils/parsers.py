@@ -0,0 +1,127 @@
+from array import array
+
+from hyperliquid.utils.types import Any, Dict, List, Optional, Sequence, Tuple
+
+# The API sends every price and size as a decimal string. These parsers convert the hot payloads into flat float64
+# arrays once, where they are decoded, so strategy code indexes plain floats instead of calling float() on the same
+# strings on every pass. The arrays support the buffer protocol: numpy.frombuffer(mids.prices) wraps them without
+# copying.
+
+
+def _to_float(value: Any) -> float:
+    if value is None:
+        return float("nan")
+    return float(value)
+
+
+class Mids:
+    """allMids parsed into a coin index and a price array."""
+
+    __slots__ = ("coins", "prices", "_index")
+
+    def __init__(self, raw: Dict[str, str]):
+        self.coins: List[str] = list(raw)
+        self.prices = array("d", map(float, raw.values()))
+        self._index = {coin: i for i, coin in enumerate(self.coins)}
+
+    def __getitem__(self, coin: str) -> float:
+        return self.prices[self._index[coin]]
+
+    def __contains__(self, coin: object) -> bool:
+        return coin in self._index
+
+    def __len__(self) -> int:
+        return len(self.coins)
+
+    def get(self, coin: str, default: Optional[float] = None) -> Optional[float]:
+        i = self._index.get(coin)
+        return default if i is None else self.prices[i]
+
+
+class L2Levels:
+    """One side-by-side l2Book snapshot as price, size and order-count arrays, best level first."""
+
+    __slots__ = ("coin", "time", "bid_px", "bid_sz", "bid_n", "ask_px", "ask_sz", "ask_n")
+
+    def __init__(self, raw: Dict[str, Any]):
+        bids, asks = raw["levels"]
+        self.coin: str = raw.get("coin", "")
+        self.time: int = raw.get("time", 0)
+        self.bid_px = array("d", [float(level["px"]) for level in bids])
+        self.bid_sz = array("d", [float(level["sz"]) for level in bids])
+        self.bid_n = array("l", [level["n"] for level in bids])
+        self.ask_px = array("d", [float(level["px"]) for level in asks])
+        self.ask_sz = array("d", [float(level["sz"]) for level in asks])
+        self.ask_n = array("l", [level["n"] for level in asks])
+
+    def best_bid(self) -> Optional[float]:
+        return self.bid_px[0] if self.bid_px else None
+
+    def best_ask(self) -> Optional[float]:
+        return self.ask_px[0] if self.ask_px else None
+
+    def mid(self) -> Optional[float]:
+        if not self.bid_px or not self.ask_px:
+            return None
+        return (self.bid_px[0] + self.ask_px[0]) / 2
+
+    def depth(self, levels: int) -> Tuple[float, float]:
+        """Notional resting on the best `levels` bid and ask levels."""
+        bid = sum(px * sz for px, sz in zip(self.bid_px[:levels], self.bid_sz[:levels]))
+        ask = sum(px * sz for px, sz in zip(self.ask_px[:levels], self.ask_sz[:levels]))
+        return bid, ask
+
+
+PERP_CTX_FIELDS = ("markPx", "midPx", "oraclePx", "prevDayPx", "dayNtlVlm", "funding", "openInterest", "premium")
+SPOT_CTX_FIELDS = ("markPx", "midPx", "prevDayPx", "dayNtlVlm", "circulatingSupply")
+
+
+class AssetCtxs:
+    """metaAndAssetCtxs / spotMetaAndAssetCtxs as one float array per numeric field, indexed like the universe.
+
+    Missing or null values (e.g. midPx of an asset without a book) become NaN.
+    """
+
+    def __init__(self, names: List[str], ctxs: Sequence[Dict[str, Any]], fields: Sequence[str]):
+        self.names = names
+        self.fields = tuple(fields)
+        self._index = {name: i for i, name in enumerate(names)}
+        self.columns: Dict[str, "array[float]"] = {
+            field: array("d", [_to_float(ctx.get(field)) for ctx in ctxs]) for field in self.fields
+        }
+
+    def __getitem__(self, field: str) -> "array[float]":
+        return self.columns[field]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def index(self, name: str) -> int:
+        return self._index[name]
+
+    def value(self, name: str, field: str) -> float:
+        return self.columns[field][self._index[name]]
+
+    def row(self, name: str) -> Dict[str, float]:
+        i = self._index[name]
+        return {field: column[i] for field, column in self.columns.items()}
+
+
+def parse_mids(raw: Dict[str, str]) -> Mids:
+    return Mids(raw)
+
+
+def parse_l2_levels(raw: Dict[str, Any]) -> L2Levels:
+    return L2Levels(raw)
+
+
+def parse_asset_ctxs(raw: Any, fields: Sequence[str] = PERP_CTX_FIELDS) -> AssetCtxs:
+    meta, ctxs = raw
+    names = [asset["name"] for asset in meta["universe"]]
+    return AssetCtxs(names[: len(ctxs)], ctxs[: len(names)], fields)
+
+
+def parse_spot_asset_ctxs(raw: Any, fields: Sequence[str] = SPOT_CTX_FIELDS) -> AssetCtxs:
+    # spot contexts carry their own coin name ("PURR/USDC", "@107", ...) and are not aligned with the universe
+    _, ctxs = raw
+    return AssetCtxs([ctx["coin"] for ctx in ctxs], ctxs, fields)
@@ -1,11 +1,11 @@
 import time
-from decimal import Decimal
 
 import msgpack
 from eth_account import Account
-from eth_account.messages import encode_typed_data
+from eth_account.messages import SignableMessage, encode_typed_data
 from eth_utils import keccak, to_hex
 
+from hyperliquid.quantizer import AssetQuantizer
 from hyperliquid.utils.types import Cloid, Literal, NotRequired, Optional, TypedDict, Union
 
 Tif = Union[Literal["Alo"], Literal["Ioc"], Literal["Gtc"]]
@@ -218,11 +218,22 @@ def user_signed_payload(primary_type, payload_types, action):
     }
 
 
+# The L1 domain and the Agent type never change, so the EIP-712 domain separator and struct type hash are computed
+# once instead of running every action through encode_typed_data. The resulting digest is identical.
+L1_DOMAIN_SEPARATOR = encode_typed_data(full_message=l1_payload(construct_phantom_agent(bytes(32), True))).header
+AGENT_TYPE_HASH = keccak(b"Agent(string source,bytes32 connectionId)")
+PHANTOM_AGENT_SOURCE_HASHES = {True: keccak(b"a"), False: keccak(b"b")}
+
+
+def l1_signable_message(hash, is_mainnet):
+    struct_hash = keccak(AGENT_TYPE_HASH + PHANTOM_AGENT_SOURCE_HASHES[is_mainnet] + hash)
+    return SignableMessage(b"\x01", L1_DOMAIN_SEPARATOR, struct_hash)
+
+
 def sign_l1_action(wallet, action, active_pool, nonce, expires_after, is_mainnet):
     hash = action_hash(action, active_pool, nonce, expires_after)
-    phantom_agent = construct_phantom_agent(hash, is_mainnet)
-    data = l1_payload(phantom_agent)
-    return sign_inner(wallet, data)
+    signed = wallet.sign_message(l1_signable_message(hash, is_mainnet))
+    return {"r": to_hex(signed["r"]), "s": to_hex(signed["s"]), "v": signed["v"]}
 
 
 def sign_user_signed_action(wallet, action, payload_types, primary_type, is_mainnet):
@@ -418,9 +429,7 @@ def sign_inner(wallet, data):
 
 def recover_agent_or_user_from_l1_action(action, signature, active_pool, nonce, expires_after, is_mainnet):
     hash = action_hash(action, active_pool, nonce, expires_after)
-    phantom_agent = construct_phantom_agent(hash, is_mainnet)
-    data = l1_payload(phantom_agent)
-    structured_data = encode_typed_data(full_message=data)
+    structured_data = l1_signable_message(hash, is_mainnet)
     address = Account.recover_message(structured_data, vrs=[signature["v"], signature["r"], signature["s"]])
     return address
 
@@ -437,10 +446,8 @@ def float_to_wire(x: float) -> str:
     rounded = f"{x:.8f}"
     if abs(float(rounded) - x) >= 1e-12:
         raise ValueError("float_to_wire causes rounding", x)
-    if rounded == "-0":
-        rounded = "0"
-    normalized = Decimal(rounded).normalize()
-    return f"{normalized:f}"
+    # trailing zeros stripped from the fixed 8 decimals, same result as Decimal(rounded).normalize() without the cost
+    return rounded.rstrip("0").rstrip(".")
 
 
 def float_to_int_for_hashing(x: float) -> int:
@@ -463,12 +470,20 @@ def get_timestamp_ms() -> int:
     return int(time.time() * 1000)
 
 
-def order_request_to_order_wire(order: OrderRequest, asset: int) -> OrderWire:
+def order_request_to_order_wire(
+    order: OrderRequest, asset: int, quantizer: Optional[AssetQuantizer] = None
+) -> OrderWire:
+    # with a quantizer (see hyperliquid.quantizer) price and size are snapped to the asset's ticks instead of
+    # having to be valid already
+    if quantizer is None:
+        px, sz = float_to_wire(order["limit_px"]), float_to_wire(order["sz"])
+    else:
+        px, sz = quantizer.price_wire(order["limit_px"]), quantizer.size_wire(order["sz"])
     order_wire: OrderWire = {
         "a": asset,
         "b": order["is_buy"],
-        "p": float_to_wire(order["limit_px"]),
-        "s": float_to_wire(order["sz"]),
+        "p": px,
+        "s": sz,
         "r": order["reduce_only"],
         "t": order_type_to_wire(order["order_type"]),
     }
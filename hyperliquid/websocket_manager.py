@@ -3,12 +3,16 @@ WebSocket manager for Hyperliquid API
 Implements proper connection handling and subscription management
 """
 import asyncio
+import itertools
 import json
 import logging
 import time
-from typing import Dict, List, Optional, Any, Callable, Union, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Callable, Coroutine, Set, Tuple, Union, TYPE_CHECKING
 from datetime import datetime
 
+from hyperliquid import recording
+from hyperliquid.utils import fast_json
+
 if TYPE_CHECKING:
     try:
         from websockets import WebSocketServerProtocol
@@ -18,6 +22,109 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Market data is superseded by the next update, so a slow subscriber skips stale messages instead of falling behind.
+# User data (fills, order updates, ledger) must not be lost, so a full queue makes the dispatcher wait instead.
+MARKET_DATA_CHANNELS = {"allMids", "l2Book", "bbo", "trades", "candle", "activeAssetCtx", "activeAssetData"}
+DEFAULT_MARKET_QUEUE_SIZE = 100
+DEFAULT_USER_QUEUE_SIZE = 10000
+# Reconnect backoff doubles per failed attempt up to this many seconds
+MAX_RECONNECT_BACKOFF = 60
+
+# Channels whose messages name the user they belong to; userEvents and orderUpdates messages do not.
+USER_KEYED_CHANNELS = {"userFills", "webData2", "userFundings", "userNonFundingLedgerUpdates"}
+USER_SUBSCRIPTIONS = {"userEvents", "orderUpdates"} | USER_KEYED_CHANNELS
+# Subscription types whose messages arrive on a differently named channel
+SUBSCRIPTION_CHANNELS = {"userEvents": "user"}
+
+DispatchKey = Tuple[str, Optional[str]]
+MessageCallback = Callable[[Any], Any]
+
+
+def subscription_channel(subscription: Dict[str, Any]) -> str:
+    subscription_type: str = subscription["type"]
+    return SUBSCRIPTION_CHANNELS.get(subscription_type, subscription_type)
+
+
+def subscription_key(subscription: Dict[str, Any]) -> Optional[str]:
+    """Dispatch key of a subscription: its coin, user or coin:interval; None for channels carrying no identifier"""
+    if subscription["type"] == "candle":
+        return f"{subscription['coin']}:{subscription['interval']}"
+    if "coin" in subscription:
+        return str(subscription["coin"])
+    if subscription["type"] in USER_KEYED_CHANNELS:
+        return str(subscription["user"]).lower()
+    return None
+
+
+def subscription_id(subscription: Dict[str, Any]) -> str:
+    """Stable ID of a server-side subscription, e.g. "bbo_BTC", "candle_ETH_1m" or "userFills_0xabc..." """
+    if subscription["type"] == "candle":
+        return f"candle_{subscription['coin']}_{subscription['interval']}"
+    if "coin" in subscription:
+        return f"{subscription['type']}_{subscription['coin']}"
+    if "user" in subscription:
+        return f"{subscription['type']}_{subscription['user'].lower()}"
+    return str(subscription["type"])
+
+
+def message_key(channel: str, data: Any) -> Optional[str]:
+    """Dispatch key of an incoming message, matching subscription_key of the subscription it belongs to"""
+    if channel == "candle":
+        return f"{data['s']}:{data['i']}"
+    if channel == "trades":
+        return str(data[0]["coin"]) if data else None
+    if isinstance(data, dict):
+        if "coin" in data:
+            return str(data["coin"])
+        if "user" in data:
+            return str(data["user"]).lower()
+    return None
+
+
+class _Subscriber:
+    """One callback with its own bounded queue and delivery task, so a slow callback only delays itself"""
+
+    def __init__(
+        self, subscriber_id: int, key: DispatchKey, callback: MessageCallback, max_queue: int, drop_oldest: bool
+    ):
+        self.id = subscriber_id
+        self.key = key
+        self.callback = callback
+        self.is_async = asyncio.iscoroutinefunction(callback)
+        self.queue: "asyncio.Queue[Any]" = asyncio.Queue(max_queue)
+        self.drop_oldest = drop_oldest
+        self.task: "Optional[asyncio.Task[None]]" = None
+        self.delivered = 0
+        self.dropped = 0
+
+    async def put(self, message: Any) -> None:
+        if self.task is None:
+            self.task = asyncio.create_task(self._deliver())
+        if self.drop_oldest:
+            if self.queue.full():
+                self.queue.get_nowait()
+                self.dropped += 1
+            self.queue.put_nowait(message)
+        else:
+            await self.queue.put(message)
+
+    async def _deliver(self) -> None:
+        while True:
+            message = await self.queue.get()
+            try:
+                if self.is_async:
+                    await self.callback(message)
+                else:
+                    self.callback(message)
+                self.delivered += 1
+            except Exception as e:
+                logger.error(f"Error in subscriber {self.id} for {self.key}: {e}")
+
+    def cancel(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+
+
 class WebsocketManager:
     """
     WebSocket manager for Hyperliquid API
@@ -25,7 +132,7 @@ class WebsocketManager:
     """
     
     def __init__(self, base_url: str, address: Optional[str] = None, 
-                 info=None, exchange=None):
+                 info: Any = None, exchange: Any = None, max_reconnect_attempts: Optional[int] = 5):
         """
         Initialize WebSocket manager
         
@@ -34,6 +141,7 @@ class WebsocketManager:
             address: User address for subscriptions
             info: Info client instance
             exchange: Exchange client instance
+            max_reconnect_attempts: Reconnect attempts before giving up; None keeps retrying until closed
         """
         self.base_url = base_url
         self.ws_url = base_url.replace('https://', 'wss://').replace('http://', 'ws://')
@@ -45,16 +153,30 @@ class WebsocketManager:
         self.websocket: Optional[Any] = None
         self.connected = False
         self.reconnecting = False
+        self.closing = False
+        self.max_reconnect_attempts = max_reconnect_attempts
+        # The loop only holds weak references to tasks, so the listener, monitor and reconnects are kept here
+        self._tasks: Set["asyncio.Task[None]"] = set()
         
         # Subscription management
         self.subscriptions: Dict[str, Dict[str, Any]] = {}
-        self.message_handlers: Dict[str, Callable] = {}
+        
+        # Dispatch index: (channel, coin/user/coin:interval) -> subscribers; a None key receives the whole channel
+        self._dispatch: Dict[DispatchKey, List[_Subscriber]] = {}
+        self._subscribers: Dict[int, _Subscriber] = {}
+        self._subscriber_ids = itertools.count(1)
+        # Server-side subscription ID -> subscribers added through subscribe(callback=...), removed by unsubscribe
+        self._subscription_subscribers: Dict[str, List[int]] = {}
         
         # Connection monitoring
-        self.last_ping = 0
+        self.last_ping = 0.0
         self.ping_interval = 30  # 30 seconds
         self.connection_timeout = 60  # 60 seconds
         
+        # Counters for connection metrics
+        self.messages_received = 0
+        self.reconnects = 0
+        
         # Message queue for when disconnected
         self.message_queue: List[Dict[str, Any]] = []
         self.max_queue_size = 1000
@@ -69,28 +191,27 @@ class WebsocketManager:
             bool: True if connection successful
         """
         try:
-            # Try to import websockets
+            # Recorded or served from a recording while one is active (see hyperliquid.recording)
             try:
-                import websockets
+                self.websocket = await recording.connect(
+                    f"{self.ws_url}/ws",
+                    ping_interval=self.ping_interval,
+                    ping_timeout=10,
+                    close_timeout=10
+                )
             except ImportError:
                 logger.warning("websockets package not installed, WebSocket functionality disabled")
                 return False
             
-            self.websocket = await websockets.connect(
-                f"{self.ws_url}/ws",
-                ping_interval=self.ping_interval,
-                ping_timeout=10,
-                close_timeout=10
-            )
-            
             self.connected = True
+            self.closing = False
             self.last_ping = time.time()
             
             logger.info("WebSocket connection established")
             
             # Start background tasks
-            asyncio.create_task(self._message_listener())
-            asyncio.create_task(self._connection_monitor())
+            self._spawn(self._message_listener())
+            self._spawn(self._connection_monitor())
             
             return True
             
@@ -102,10 +223,12 @@ class WebsocketManager:
     async def disconnect(self) -> None:
         """Close WebSocket connection"""
         try:
-            if self.websocket and not self.websocket.closed:
+            # Closed on purpose: the listener and monitor must not reconnect
+            self.closing = True
+            self.connected = False
+            if self.websocket:
                 await self.websocket.close()
             
-            self.connected = False
             self.websocket = None
             
             logger.info("WebSocket disconnected")
@@ -113,21 +236,23 @@ class WebsocketManager:
         except Exception as e:
             logger.error(f"Error disconnecting WebSocket: {e}")
     
-    async def subscribe(self, subscription_type: str, **kwargs) -> bool:
+    async def subscribe(self, subscription_type: str, callback: Optional[MessageCallback] = None,
+                        **kwargs: Any) -> bool:
         """
         Subscribe to a WebSocket channel
         
         Args:
             subscription_type: Type of subscription
+            callback: Optional sync or async callback for this subscription's messages (see add_subscriber);
+                      unsubscribe removes it along with the subscription
             **kwargs: Additional subscription parameters
             
         Returns:
             bool: True if subscription successful
         """
         try:
-            subscription_id = f"{subscription_type}_{int(time.time())}"
-            
             # Build subscription message based on type
+            message: Dict[str, Any]
             if subscription_type == "allMids":
                 message = {
                     "method": "subscribe",
@@ -145,25 +270,53 @@ class WebsocketManager:
                     "method": "subscribe",
                     "subscription": {"type": "trades", "coin": coin}
                 }
-            elif subscription_type == "userEvents" and self.address:
+            elif subscription_type in ("bbo", "activeAssetCtx"):
+                coin = kwargs.get("coin", "BTC")
+                message = {
+                    "method": "subscribe",
+                    "subscription": {"type": subscription_type, "coin": coin}
+                }
+            elif subscription_type == "candle":
+                coin = kwargs.get("coin", "BTC")
+                interval = kwargs.get("interval", "1m")
                 message = {
                     "method": "subscribe",
-                    "subscription": {"type": "userEvents", "user": self.address}
+                    "subscription": {"type": "candle", "coin": coin, "interval": interval}
+                }
+            elif subscription_type in USER_SUBSCRIPTIONS and (kwargs.get("user") or self.address):
+                # Messages of userEvents and orderUpdates do not name their user, so their callbacks receive the
+                # updates of every user subscribed on this connection
+                message = {
+                    "method": "subscribe",
+                    "subscription": {"type": subscription_type, "user": kwargs.get("user") or self.address}
                 }
             else:
                 logger.error(f"Unknown subscription type: {subscription_type}")
                 return False
             
+            subscription = message["subscription"]
+            sub_id = subscription_id(subscription)
+            if callback is not None:
+                subscriber_id = self.add_subscriber(
+                    subscription_channel(subscription), callback, subscription_key(subscription)
+                )
+                self._subscription_subscribers.setdefault(sub_id, []).append(subscriber_id)
+            
+            # Several subscribers may share one server-side subscription
+            if sub_id in self.subscriptions:
+                return True
+            
+            # Recorded even while disconnected, so that the reconnect resubscribes it
+            self.subscriptions[sub_id] = {
+                "type": subscription_type,
+                "message": message,
+                "kwargs": kwargs,
+                "created_at": time.time()
+            }
+            
             # Send subscription
-            if await self._send_message(message):
-                self.subscriptions[subscription_id] = {
-                    "type": subscription_type,
-                    "message": message,
-                    "kwargs": kwargs,
-                    "created_at": time.time()
-                }
-                
-                logger.info(f"Subscribed to {subscription_type} with ID {subscription_id}")
+            if self.connected and await self._send_message(message):
+                logger.info(f"Subscribed to {subscription_type} with ID {sub_id}")
                 return True
             
             return False
@@ -195,28 +348,71 @@ class WebsocketManager:
                 "subscription": subscription["message"]["subscription"]
             }
             
-            if await self._send_message(message):
-                del self.subscriptions[subscription_id]
-                logger.info(f"Unsubscribed from {subscription_id}")
-                return True
-            
-            return False
+            # Forgotten even while disconnected, so a reconnect does not resubscribe it
+            del self.subscriptions[subscription_id]
+            for subscriber_id in self._subscription_subscribers.pop(subscription_id, []):
+                self.remove_subscriber(subscriber_id)
+            if self.connected and not await self._send_message(message):
+                return False
+            logger.info(f"Unsubscribed from {subscription_id}")
+            return True
             
         except Exception as e:
             logger.error(f"Error unsubscribing from {subscription_id}: {e}")
             return False
     
-    def add_message_handler(self, message_type: str, handler: Callable) -> None:
+    def add_message_handler(self, message_type: str, handler: MessageCallback) -> None:
         """
-        Add a message handler for specific message types
+        Add a message handler for every message of a channel, whatever its coin or user
         
         Args:
             message_type: Type of message to handle
             handler: Callback function to handle messages
         """
-        self.message_handlers[message_type] = handler
+        self.add_subscriber(message_type, handler)
         logger.info(f"Added handler for {message_type}")
     
+    def add_subscriber(self, channel: str, callback: MessageCallback, key: Optional[str] = None,
+                       max_queue: Optional[int] = None) -> int:
+        """
+        Register a callback for one channel and key; any number of callbacks may share a key
+        
+        Args:
+            channel: Channel name, e.g. "l2Book" or "userFills"
+            callback: Sync or async function called with each message, in order, from its own task
+            key: Coin ("ETH"), user address, or "coin:interval" for candles; None for every message of the channel
+            max_queue: Messages buffered for this callback. Market data drops the oldest when full,
+                       user data makes the dispatcher wait for space.
+            
+        Returns:
+            int: Subscriber ID for remove_subscriber
+        """
+        drop_oldest = channel in MARKET_DATA_CHANNELS
+        if max_queue is None:
+            max_queue = DEFAULT_MARKET_QUEUE_SIZE if drop_oldest else DEFAULT_USER_QUEUE_SIZE
+        dispatch_key = (channel, key.lower() if key is not None and key.startswith("0x") else key)
+        subscriber = _Subscriber(next(self._subscriber_ids), dispatch_key, callback, max_queue, drop_oldest)
+        self._subscribers[subscriber.id] = subscriber
+        self._dispatch.setdefault(dispatch_key, []).append(subscriber)
+        return subscriber.id
+    
+    def remove_subscriber(self, subscriber_id: int) -> bool:
+        """
+        Remove a callback registered with add_subscriber
+        
+        Returns:
+            bool: True if the subscriber existed
+        """
+        subscriber = self._subscribers.pop(subscriber_id, None)
+        if subscriber is None:
+            return False
+        subscribers = self._dispatch[subscriber.key]
+        subscribers.remove(subscriber)
+        if not subscribers:
+            del self._dispatch[subscriber.key]
+        subscriber.cancel()
+        return True
+    
     async def _send_message(self, message: Dict[str, Any]) -> bool:
         """
         Send message to WebSocket
@@ -258,15 +454,16 @@ class WebsocketManager:
                     logger.warning("WebSocket message timeout")
                     break
                 except Exception as e:
-                    logger.error(f"Error in message listener: {e}")
+                    if not self.closing:
+                        logger.error(f"Error in message listener: {e}")
                     break
                     
         except Exception as e:
             logger.error(f"Message listener crashed: {e}")
         finally:
             self.connected = False
-            if not self.reconnecting:
-                asyncio.create_task(self._reconnect())
+            if not self.reconnecting and not self.closing:
+                self._spawn(self._reconnect())
     
     async def _handle_message(self, raw_message: str) -> None:
         """
@@ -276,23 +473,29 @@ class WebsocketManager:
             raw_message: Raw message string
         """
         try:
-            message = json.loads(raw_message)
+            message = fast_json.loads(raw_message)
             message_type = message.get("channel", "unknown")
             
             # Update last ping time for any message
             self.last_ping = time.time()
+            self.messages_received += 1
             
-            # Call appropriate handler
-            if message_type in self.message_handlers:
-                try:
-                    await self.message_handlers[message_type](message)
-                except Exception as e:
-                    logger.error(f"Error in message handler for {message_type}: {e}")
+            # Hand the message to the subscribers of its key and of the whole channel
+            channel_subscribers = self._dispatch.get((message_type, None))
+            key = message_key(message_type, message.get("data"))
+            key_subscribers = self._dispatch.get((message_type, key)) if key is not None else None
+            if channel_subscribers:
+                for subscriber in channel_subscribers:
+                    await subscriber.put(message)
+            if key_subscribers:
+                for subscriber in key_subscribers:
+                    await subscriber.put(message)
             
-            # Log message for debugging
-            logger.debug(f"Received {message_type}: {message}")
+            # Formatting every message is expensive, so only pay for it when debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Received {message_type}: {message}")
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Invalid JSON message received: {e}")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
@@ -320,8 +523,22 @@ class WebsocketManager:
                 break
         
         # Start reconnection if needed
-        if not self.reconnecting:
-            asyncio.create_task(self._reconnect())
+        if not self.reconnecting and not self.closing:
+            self._spawn(self._reconnect())
+    
+    def _spawn(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    def reconnect(self) -> None:
+        """
+        Reconnect in the background with exponential backoff, resubscribing every subscription once connected
+        
+        Call from the manager's event loop, e.g. after connect() failed; does nothing while a reconnect is running.
+        """
+        if not self.connected and not self.reconnecting and not self.closing:
+            self._spawn(self._reconnect())
     
     async def _reconnect(self) -> None:
         """Attempt to reconnect WebSocket"""
@@ -330,16 +547,20 @@ class WebsocketManager:
             
         self.reconnecting = True
         reconnect_attempts = 0
-        max_attempts = 5
+        max_attempts = self.max_reconnect_attempts
         
         logger.info("Starting WebSocket reconnection...")
         
-        while reconnect_attempts < max_attempts:
+        while max_attempts is None or reconnect_attempts < max_attempts:
             try:
-                await asyncio.sleep(2 ** reconnect_attempts)  # Exponential backoff
+                # Exponential backoff
+                await asyncio.sleep(min(2 ** reconnect_attempts, MAX_RECONNECT_BACKOFF))
+                if self.closing:
+                    break
                 
                 if await self.connect():
                     logger.info("WebSocket reconnected successfully")
+                    self.reconnects += 1
                     
                     # Resubscribe to all channels
                     await self._resubscribe_all()
@@ -416,7 +637,10 @@ class WebsocketManager:
             "subscriptions": len(self.subscriptions),
             "queued_messages": len(self.message_queue),
             "last_ping": self.last_ping,
-            "handlers": list(self.message_handlers.keys())
+            "handlers": sorted({channel for channel, _ in self._dispatch}),
+            "subscribers": len(self._subscribers),
+            "dropped_messages": sum(subscriber.dropped for subscriber in self._subscribers.values()),
+            "queued_for_subscribers": sum(subscriber.queue.qsize() for subscriber in self._subscribers.values())
         }
     
     async def close(self) -> None:
@@ -424,7 +648,9 @@ class WebsocketManager:
         try:
             await self.disconnect()
             self.subscriptions.clear()
-            self.message_handlers.clear()
+            self._subscription_subscribers.clear()
+            for subscriber_id in list(self._subscribers):
+                self.remove_subscriber(subscriber_id)
             self.message_queue.clear()
             
             logger.info("WebSocket manager closed")
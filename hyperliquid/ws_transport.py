@@ -0,0 +1,366 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from hyperliquid.recording import RecordingTransport, ReplayTransport, wrap_transport
+from hyperliquid.transport import HttpTransport
+from hyperliquid.utils import fast_json
+from hyperliquid.utils.error import Error
+from hyperliquid.utils.types import Any, Deque, Dict, List, Optional, Tuple, Union
+
+try:
+    import websockets
+
+    HAS_WEBSOCKETS = True
+except ImportError:  # pragma: no cover
+    HAS_WEBSOCKETS = False
+
+# Sends /info queries and /exchange actions as websocket "post" requests over one long-lived connection per
+# base_url, which saves the HTTP round-trip overhead (and TLS on reconnects) of every request. Requests are correlated
+# by id. The server allows at most 100 posts in flight per connection and drops connections that stay silent for a
+# minute, hence max_in_flight and the application-level ping.
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_IN_FLIGHT = 100
+PING_INTERVAL = 50.0
+
+logger = logging.getLogger(__name__)
+
+
+class WebsocketPostError(Error):
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+class WebsocketPostTimeout(WebsocketPostError):
+    pass
+
+
+class WsResponse:
+    """The parts of requests.Response that API.post reads, for a response that arrived over the websocket."""
+
+    def __init__(self, status_code: int, data: Any = None, text: Optional[str] = None):
+        self.status_code = status_code
+        self.headers: Dict[str, str] = {}
+        self.data = data
+        self._text = text
+
+    @property
+    def content(self) -> bytes:
+        if self._text is not None:
+            return self._text.encode("utf-8")
+        return fast_json.dumps(self.data)
+
+    @property
+    def text(self) -> str:
+        if self._text is not None:
+            return self._text
+        return self.content.decode("utf-8")
+
+
+def to_response(response: Any) -> WsResponse:
+    """Map a post response ({"type": "info" | "action" | "error", "payload": ...}) to what the HTTP API returns."""
+    kind = response.get("type")
+    payload = response.get("payload")
+    if kind == "error":
+        return WsResponse(400, text=payload if isinstance(payload, str) else fast_json.dumps(payload).decode("utf-8"))
+    if kind == "info":
+        return WsResponse(200, payload["data"])
+    return WsResponse(200, payload)
+
+
+class InFlightSlots:
+    """The max_in_flight post slots of one connection, shared by blocking callers and coroutines on any loop.
+
+    A released slot is handed straight to the longest waiting caller: a thread through its Event, a coroutine by
+    resolving its future on its own loop, so neither side polls.
+    """
+
+    def __init__(self, size: int):
+        self._lock = threading.Lock()
+        self._free = size
+        # (None, Event) for a blocked thread, (loop, future) for a coroutine
+        self._waiters: Deque[Tuple[Optional[asyncio.AbstractEventLoop], Any]] = deque()
+
+    def _take(self) -> bool:
+        if self._free and not self._waiters:
+            self._free -= 1
+            return True
+        return False
+
+    def _withdraw(self, waiter: Tuple[Optional[asyncio.AbstractEventLoop], Any]) -> bool:
+        """Stop waiting; False if a slot was already handed to the waiter."""
+        with self._lock:
+            try:
+                self._waiters.remove(waiter)
+                return True
+            except ValueError:
+                return False
+
+    def acquire(self, timeout: float) -> bool:
+        with self._lock:
+            if self._take():
+                return True
+            waiter = (None, threading.Event())
+            self._waiters.append(waiter)
+        if waiter[1].wait(timeout):
+            return True
+        # a slot handed over just as the wait timed out is kept
+        return not self._withdraw(waiter)
+
+    async def acquire_async(self, timeout: float) -> bool:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._take():
+                return True
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter[1], timeout)
+            return True
+        except asyncio.TimeoutError:
+            self._give_up(waiter)
+            return False
+        except asyncio.CancelledError:
+            self._give_up(waiter)
+            raise
+
+    def _give_up(self, waiter: Tuple[Optional[asyncio.AbstractEventLoop], Any]) -> None:
+        future = waiter[1]
+        # a slot that reached the future is passed on here; one still on its way finds the future cancelled in _wake
+        if not self._withdraw(waiter) and future.done() and not future.cancelled():
+            self.release()
+
+    def release(self) -> None:
+        with self._lock:
+            if not self._waiters:
+                self._free += 1
+                return
+            loop, waiter = self._waiters.popleft()
+        if loop is None:
+            waiter.set()
+            return
+        try:
+            loop.call_soon_threadsafe(self._wake, waiter)
+        except RuntimeError:
+            # the waiter's loop is closed
+            self.release()
+
+    def _wake(self, future: "asyncio.Future[None]") -> None:
+        if future.done():
+            # the waiter gave up before the slot reached it
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class WebsocketTransport:
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ):
+        if not HAS_WEBSOCKETS:
+            raise ImportError("WebsocketTransport requires the websockets package")
+        self.base_url = base_url
+        self.ws_url = base_url.replace("https://", "wss://").replace("http://", "ws://") + "/ws"
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        # API reads transport.session; there is no HTTP session behind a websocket
+        self.session = None
+        self._lock = threading.Lock()
+        self._slots = InFlightSlots(max_in_flight)
+        # request id -> (future, sent at, connection it went out on)
+        self._pending: Dict[int, List[Any]] = {}
+        self._next_id = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws: Any = None
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self.requests = 0
+        self.responses = 0
+        self.timeouts = 0
+        self.connections = 0
+        self.latency_total = 0.0
+
+    def post(self, url: str, payload: Any) -> WsResponse:
+        return to_response(self.request(_request_type(url), payload))
+
+    async def post_async(self, url: str, payload: Any) -> WsResponse:
+        return to_response(await self.request_async(_request_type(url), payload))
+
+    def request(self, request_type: str, payload: Any) -> Any:
+        """Send one post request ("info" or "action") and return the raw {"type", "payload"} response."""
+        if not self._slots.acquire(self.timeout):
+            raise WebsocketPostTimeout(f"no free slot among {self.max_in_flight} in-flight posts")
+        request_id = None
+        try:
+            request_id, future = self._submit(request_type, payload)
+            return future.result(self.timeout)
+        except FutureTimeoutError:
+            self._abandon(request_id)
+            raise WebsocketPostTimeout(f"no response to post {request_id} within {self.timeout}s")
+        finally:
+            self._slots.release()
+
+    async def request_async(self, request_type: str, payload: Any) -> Any:
+        deadline = time.monotonic() + self.timeout
+        if not await self._slots.acquire_async(self.timeout):
+            raise WebsocketPostTimeout(f"no free slot among {self.max_in_flight} in-flight posts")
+        request_id = None
+        try:
+            request_id, future = self._submit(request_type, payload)
+            return await asyncio.wait_for(asyncio.wrap_future(future), max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            self._abandon(request_id)
+            raise WebsocketPostTimeout(f"no response to post {request_id} within {self.timeout}s")
+        finally:
+            self._slots.release()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="hyperliquid-ws-post", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def _submit(self, request_type: str, payload: Any) -> Tuple[int, "Future[Any]"]:
+        loop = self._ensure_loop()
+        future: "Future[Any]" = Future()
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            self._pending[request_id] = [future, time.monotonic(), None]
+            self.requests += 1
+        message = {"method": "post", "id": request_id, "request": {"type": request_type, "payload": payload}}
+        asyncio.run_coroutine_threadsafe(self._send(request_id, message), loop)
+        return request_id, future
+
+    def _abandon(self, request_id: Optional[int]) -> None:
+        with self._lock:
+            self.timeouts += 1
+            if request_id is not None:
+                # a late response is then dropped by _resolve
+                self._pending.pop(request_id, None)
+
+    def _resolve(self, request_id: int, response: Any = None, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            entry = self._pending.pop(request_id, None)
+            if entry is None:
+                return
+            future, sent_at, _ = entry
+            if error is None:
+                self.responses += 1
+                self.latency_total += time.monotonic() - sent_at
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(response)
+
+    async def _connection(self) -> Any:
+        if self._ws is not None:
+            return self._ws
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._ws is None:
+                ws = await websockets.connect(self.ws_url, max_size=None)
+                self._ws = ws
+                self.connections += 1
+                loop = asyncio.get_running_loop()
+                loop.create_task(self._read(ws))
+                loop.create_task(self._keepalive(ws))
+        return self._ws
+
+    async def _send(self, request_id: int, message: Any) -> None:
+        try:
+            ws = await self._connection()
+            with self._lock:
+                entry = self._pending.get(request_id)
+                if entry is None:
+                    return
+                entry[2] = ws
+            await ws.send(fast_json.dumps(message).decode("utf-8"))
+        except Exception as e:  # pylint: disable=broad-except
+            self._resolve(request_id, error=WebsocketPostError(f"could not send post {request_id}: {e}"))
+
+    async def _read(self, ws: Any) -> None:
+        try:
+            async for raw in ws:
+                message = fast_json.loads(raw)
+                if message.get("channel") != "post":
+                    continue
+                data = message["data"]
+                self._resolve(data["id"], data["response"])
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning(f"Websocket post connection to {self.ws_url} lost: {e}")
+        finally:
+            if self._ws is ws:
+                self._ws = None
+            with self._lock:
+                lost = [request_id for request_id, entry in self._pending.items() if entry[2] is ws]
+            # an action that was sent may or may not have been executed; callers decide whether to retry
+            for request_id in lost:
+                error = WebsocketPostError(f"connection closed before post {request_id} was answered")
+                self._resolve(request_id, error=error)
+
+    async def _keepalive(self, ws: Any) -> None:
+        while self._ws is ws:
+            await asyncio.sleep(PING_INTERVAL)
+            if self._ws is not ws:
+                return
+            try:
+                await ws.send('{"method":"ping"}')
+            except Exception:  # pylint: disable=broad-except
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "in_flight": len(self._pending),
+                "max_in_flight": self.max_in_flight,
+                "timeouts": self.timeouts,
+                "connections": self.connections,
+                "avg_latency": self.latency_total / self.responses if self.responses else 0.0,
+            }
+
+    def close(self) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        ws = self._ws
+        if ws is not None:
+            asyncio.run_coroutine_threadsafe(ws.close(), loop).result(self.timeout)
+        loop.call_soon_threadsafe(loop.stop)
+        self._loop = None
+        self._ws = None
+        self._connect_lock = None
+
+
+def _request_type(url: str) -> str:
+    return "action" if url.endswith("/exchange") else "info"
+
+
+# What API.post sends through, including the stand-ins while traffic is recorded or replayed. AsyncAPI needs
+# post_async, which HttpTransport lacks.
+Transport = Union[HttpTransport, WebsocketTransport, RecordingTransport, ReplayTransport]
+AsyncTransport = Union[WebsocketTransport, RecordingTransport, ReplayTransport]
+
+_ws_transports: Dict[str, WebsocketTransport] = {}
+_ws_transports_lock = threading.Lock()
+
+
+def get_ws_transport(base_url: str) -> WebsocketTransport:
+    transport = _ws_transports.get(base_url)
+    if transport is not None:
+        return transport
+    with _ws_transports_lock:
+        if base_url not in _ws_transports:
+            _ws_transports[base_url] = wrap_transport(WebsocketTransport(base_url))
+        return _ws_transports[base_url]
@@ -15,6 +15,7 @@ from telegram.ext import Application, CommandHandler, CallbackQueryHandler, Cont
 # Hyperliquid SDK - REAL imports
 from hyperliquid.info import Info
 from hyperliquid.exchange import Exchange
+from hyperliquid.orders import get_order_registry
 from hyperliquid.utils import constants
 import example_utils
 
@@ -47,6 +48,9 @@ class RealHyperliquidBot:
             skip_ws=True
         )
         
+        # Open orders tracked locally from the user streams instead of polled
+        self.orders = get_order_registry(self.info.base_url, self.address)
+        
         logger.info(f"Initialized for address: {self.address}")
         
         # Bot configuration from our config system
@@ -1276,13 +1280,11 @@ Use /vault to manage your vault positions.
                             logger.info(f"Rebalancing {coin} grid: price changed {price_change:.1%}")
                             
                             # Cancel existing orders
-                            open_orders = self.info.open_orders(self.address)
-                            for order in open_orders:
-                                if order['coin'] == coin:
-                                    try:
-                                        self.exchange.cancel(coin, order['oid'])
-                                    except Exception as e:
-                                        logger.error(f"Failed to cancel {order['oid']}: {e}")
+                            for order in self.orders.open_orders(coin):
+                                try:
+                                    self.exchange.cancel(coin, order['oid'])
+                                except Exception as e:
+                                    logger.error(f"Failed to cancel {order['oid']}: {e}")
                             
                             # Restart grid with new price
                             result = await self.start_grid_trading(
@@ -15,8 +15,15 @@ import math
 from collections import deque
 
 # Real Hyperliquid imports
+from hyperliquid.candles import get_candle_store
 from hyperliquid.info import Info
 from hyperliquid.exchange import Exchange
+from hyperliquid.fills import get_fill_store
+from hyperliquid.indicators import get_indicator_engine
+from hyperliquid.orderbook import get_book_store
+from hyperliquid.orders import OrderRegistry, get_order_registry
+from hyperliquid.quantizer import QuantizerTable
+from hyperliquid.requoting import Requoter
 from hyperliquid.utils import constants
 
 # Import actual examples for real patterns
@@ -52,7 +59,8 @@ class AutomatedTrading:
         if exchange and info:
             self.exchange = exchange
             self.info = info
-            self.address = exchange.account_address
+            # Orders rest under the vault or account the exchange trades for, else under its own wallet
+            self.address = exchange.vault_address or exchange.account_address or exchange.wallet.address
         else:
             # Use example_utils.setup like all real examples
             self.address, self.info, self.exchange = example_utils.setup(
@@ -75,8 +83,34 @@ class AutomatedTrading:
         self.strategy_performance = {}
         self.logger = logging.getLogger(__name__)
         
+        # Market making quotes resting per coin, re-quoted in place rather than cancelled and re-placed
+        self.quantizers = QuantizerTable(self.info)
+        self.requoter = Requoter(self.exchange)
+        self.mm_quotes = {}
+        
+        # L2 books shared with every other strategy in the process, kept current by the l2Book/bbo streams
+        self.books = get_book_store(self.info.base_url)
+        
+        # Candle history shared the same way: backfilled once, then kept current by the candle stream
+        self.candles = get_candle_store(self.info.base_url)
+        
+        # Streaming indicators per (coin, interval) over those candles, stepped only by bars that closed since last read
+        self.indicators = get_indicator_engine(self.info.base_url)
+        
+        # Fill history synced incrementally per address and indexed by coin and time
+        self.fills = get_fill_store(self.info.base_url)
+        
+        # Open orders of self.address, kept current by the orderUpdates stream; created on first use
+        self._orders: Optional[OrderRegistry] = None
+        
         logger.info("AutomatedTrading initialized with real Hyperliquid API")
 
+    @property
+    def orders(self) -> OrderRegistry:
+        if self._orders is None:
+            self._orders = get_order_registry(self.info.base_url, self.address)
+        return self._orders
+
     async def momentum_strategy(self, coin: str, position_size: float = 0.1) -> Dict:
         """
         Momentum strategy using real market data and basic_tpsl.py patterns
@@ -90,13 +124,12 @@ class AutomatedTrading:
             current_price = float(all_mids[coin])
             
             # Get order book imbalance using real L2 data
-            l2_book = self.info.l2_snapshot(coin)
-            if not l2_book or 'levels' not in l2_book or len(l2_book['levels']) < 2:
+            book = self.books.book(coin)
+            if not book.ready.is_set():
                 return {'status': 'error', 'message': f'No L2 data for {coin}'}
             
             # Calculate real order book depth (top 10 levels)
-            bid_depth = sum(float(lvl['sz']) * float(lvl['px']) for lvl in l2_book['levels'][0][:10])
-            ask_depth = sum(float(lvl['sz']) * float(lvl['px']) for lvl in l2_book['levels'][1][:10])
+            bid_depth, ask_depth = book.depth(10)
             
             if bid_depth + ask_depth == 0:
                 return {'status': 'error', 'message': f'No liquidity for {coin}'}
@@ -282,13 +315,15 @@ class AutomatedTrading:
         """
         try:
             # Get real L2 data
-            l2_book = self.info.l2_snapshot(coin)
-            if not l2_book or 'levels' not in l2_book or len(l2_book['levels']) < 2:
+            book = self.books.book(coin)
+            if not book.ready.is_set():
                 return {'status': 'error', 'message': f'No L2 data for {coin}'}
             
             # Get best bid/ask
-            best_bid = float(l2_book['levels'][0][0]['px'])
-            best_ask = float(l2_book['levels'][1][0]['px'])
+            best_bid = book.best_bid()
+            best_ask = book.best_ask()
+            if best_bid is None or best_ask is None:
+                return {'status': 'error', 'message': f'No liquidity for {coin}'}
             mid_price = (best_bid + best_ask) / 2
             spread_bps = ((best_ask - best_bid) / mid_price) * 10000
             
@@ -389,7 +424,7 @@ class AutomatedTrading:
         """Get performance metrics for a strategy"""
         try:
             # Get user fills for performance tracking
-            user_fills = self.info.user_fills(self.address)
+            user_fills = self.fills.fills(self.address)
             
             # Calculate performance metrics
             total_pnl = sum(float(fill.get('closedPnl', 0)) for fill in user_fills)
@@ -417,19 +452,20 @@ class AutomatedTrading:
         """
         try:
             # Get L2 book data
-            l2_book = self.info.l2_snapshot(coin)
-            if not l2_book or 'levels' not in l2_book or len(l2_book['levels']) < 2:
+            book = self.books.book(coin)
+            if not book.ready.is_set():
                 return {'status': 'error', 'message': f'No L2 data for {coin}'}
             
             # Get best bid/ask
-            best_bid = float(l2_book['levels'][0][0]['px'])
-            best_ask = float(l2_book['levels'][1][0]['px'])
+            best_bid = book.best_bid()
+            best_ask = book.best_ask()
+            if best_bid is None or best_ask is None:
+                return {'status': 'error', 'message': f'No liquidity for {coin}'}
             mid_price = (best_bid + best_ask) / 2
             spread_bps = ((best_ask - best_bid) / mid_price) * 10000
             
             # Calculate order book imbalance
-            bid_depth = sum(float(lvl['sz']) * float(lvl['px']) for lvl in l2_book['levels'][0][:5])
-            ask_depth = sum(float(lvl['sz']) * float(lvl['px']) for lvl in l2_book['levels'][1][:5])
+            bid_depth, ask_depth = book.depth(5)
             
             if bid_depth + ask_depth == 0:
                 return {'status': 'error', 'message': f'No liquidity for {coin}'}
@@ -452,24 +488,22 @@ class AutomatedTrading:
             ask_position = 0.3 + (imbalance * 0.3)  # 0-60% of spread from ask
             ask_position = max(0.01, min(0.6, ask_position))
             
-            # Calculate actual prices
-            bid_price = best_bid + (spread * bid_position)
-            ask_price = best_ask - (spread * ask_position)
-            
-            # Place orders
-            bid_result = await self.place_adding_liquidity_order(
-                coin=coin,
-                is_buy=True,
-                size=position_size,
-                price=bid_price
-            )
-            
-            ask_result = await self.place_adding_liquidity_order(
-                coin=coin,
-                is_buy=False,
-                size=position_size,
-                price=ask_price
-            )
+            # Calculate actual prices, snapped to valid ticks so unchanged quotes are recognised as such
+            quantizer = self.quantizers[coin]
+            bid_price = quantizer.snap_price(best_bid + (spread * bid_position))
+            ask_price = quantizer.snap_price(best_ask - (spread * ask_position))
+            size = quantizer.snap_size(position_size)
+            
+            # Re-quote: quotes that did not move keep their queue position, the rest are modified in one action
+            alo = {"limit": {"tif": "Alo"}}
+            quotes = [
+                {"coin": coin, "is_buy": is_buy, "sz": size, "limit_px": px, "order_type": alo, "reduce_only": False}
+                for is_buy, px in ((True, bid_price), (False, ask_price))
+            ]
+            requote = self.requoter.requote(quotes, self._resting_quotes(coin))
+            self.mm_quotes[coin] = requote['live']
+            bid_result = self._quote_result(requote['live'], 'B')
+            ask_result = self._quote_result(requote['live'], 'A')
             
             return {
                 'status': 'success',
@@ -478,13 +512,44 @@ class AutomatedTrading:
                 'imbalance': imbalance,
                 'spread_bps': spread_bps,
                 'bid': {'price': bid_price, 'position': bid_position, 'result': bid_result},
-                'ask': {'price': ask_price, 'position': ask_position, 'result': ask_result}
+                'ask': {'price': ask_price, 'position': ask_position, 'result': ask_result},
+                'requote': {key: requote[key] for key in ('kept', 'modified', 'placed', 'cancelled', 'requests_saved')},
+                'execution': requote['responses']
             }
             
         except Exception as e:
             self.logger.error(f"Error in adaptive market making for {coin}: {e}")
             return {'status': 'error', 'message': str(e)}
 
+    def _resting_quotes(self, coin: str) -> List[Dict]:
+        """
+        The market making quotes of coin still resting, in the openOrders shape. Quotes that filled or were
+        cancelled drop out, so their side is quoted again; quotes the registry has not seen yet are kept as placed
+        """
+        placed = {order['oid']: order for order in self.mm_quotes.get(coin, [])}
+        live = [
+            order for order in self.orders.open_orders(coin)
+            if order['oid'] in placed and not order.get('isTrigger')
+        ]
+        seen = {order['oid'] for order in live}
+        for oid, order in placed.items():
+            if oid not in seen and self.orders.status(oid) is None:
+                live.append(order)
+        return live
+
+    def _quote_result(self, live: List[Dict], side: str) -> Dict:
+        """Result entry for the resting market making quote on one side ('B' or 'A'), if any"""
+        for order in live:
+            if order['side'] == side:
+                return {
+                    'status': 'success',
+                    'side': 'buy' if side == 'B' else 'sell',
+                    'price': float(order['limitPx']),
+                    'size': float(order['sz']),
+                    'oid': order['oid']
+                }
+        return {'status': 'error', 'message': 'Quote failed to rest'}
+
     async def place_adding_liquidity_order(self, coin: str, is_buy: bool, size: float, price: float) -> Dict:
         """Place order with Add Liquidity Only flag for guaranteed maker rebates"""
         try:
@@ -530,44 +595,38 @@ class AutomatedTrading:
         """
         try:
             # Get historical candle data (hourly)
-            candles = self.info.candles_snapshot(coin, "1h", lookback_periods + 10)  # Extra candles for calculation
+            candles = self.candles.last(coin, "1h", lookback_periods + 10)  # Extra candles for calculation
             
             if len(candles) < lookback_periods:
                 return {'status': 'error', 'message': f'Insufficient candle data for {coin}'}
             
             # Calculate technical indicators
-            prices = [float(candle['c']) for candle in candles]  # Close prices
-            volumes = [float(candle['v']) for candle in candles]  # Volumes
+            prices = candles['c'].tolist()  # Close prices
+            volumes = candles['v'].tolist()  # Volumes
             
-            # 1. Calculate momentum oscillators
-            # RSI - Relative Strength Index
-            rsi = self._calculate_rsi(prices, period=14)
-            
-            # MACD - Moving Average Convergence Divergence
-            macd_line, signal_line, macd_histogram = self._calculate_macd(prices)
-            
-            # 2. Calculate trend strength
-            # ADX - Average Directional Index (simplified)
-            adx = self._calculate_adx_simplified(candles)
+            # 1. Momentum oscillators (RSI, MACD) and 2. trend strength (ADX) from the shared indicator engine
+            values = self.indicators.values(coin, "1h", lookback_periods + 10)
+            rsi = self._indicator_or(values['rsi'], 50.0)
+            macd_line, signal_line, macd_histogram = (self._indicator_or(v, 0.0) for v in values['macd'])
+            adx = self._indicator_or(values['adx'][0], 25.0)
             
             # 3. Calculate volume profile
             volume_sma = sum(volumes[-5:]) / 5
             relative_volume = volumes[-1] / volume_sma if volume_sma > 0 else 1.0
             
             # 4. Get orderbook imbalance
-            l2_book = self.info.l2_snapshot(coin)
+            book = self.books.book(coin)
             imbalance = 0
             
-            if l2_book and 'levels' in l2_book and len(l2_book['levels']) >= 2:
-                bid_depth = sum(float(lvl['sz']) * float(lvl['px']) for lvl in l2_book['levels'][0][:5])
-                ask_depth = sum(float(lvl['sz']) * float(lvl['px']) for lvl in l2_book['levels'][1][:5])
+            if book.ready.is_set():
+                bid_depth, ask_depth = book.depth(5)
                 
                 if bid_depth + ask_depth > 0:
                     imbalance = (bid_depth - ask_depth) / (bid_depth + ask_depth)
             
             # 5. Price breakout detection
-            recent_high = max(float(c['h']) for c in candles[-10:])
-            recent_low = min(float(c['l']) for c in candles[-10:])
+            recent_high = float(candles['h'][-10:].max())
+            recent_low = float(candles['l'][-10:].min())
             latest_close = prices[-1]
             
             # Calculate overall momentum score (-100 to +100)
@@ -641,111 +700,10 @@ class AutomatedTrading:
             logger.error(f"Error in advanced momentum detection for {coin}: {e}")
             return {'status': 'error', 'message': str(e)}
 
-    def _calculate_rsi(self, prices: List[float], period: int = 14) -> float:
-        """Calculate RSI - Relative Strength Index"""
-        if len(prices) <= period:
-            return 50.0  # Not enough data
-            
-        # Calculate price changes
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        
-        # Separate gains and losses
-        gains = [delta if delta > 0 else 0 for delta in deltas]
-        losses = [-delta if delta < 0 else 0 for delta in deltas]
-        
-        # Calculate average gains and losses
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
-        
-        if avg_loss == 0:
-            return 100.0  # No losses = RSI 100
-            
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
-
-    def _calculate_macd(self, prices: List[float]) -> Tuple[float, float, float]:
-        """Calculate MACD - Moving Average Convergence Divergence"""
-        if len(prices) < 26:
-            return 0.0, 0.0, 0.0  # Not enough data
-            
-        # Calculate EMAs
-        ema12 = self._calculate_ema(prices, 12)
-        ema26 = self._calculate_ema(prices, 26)
-        
-        # MACD line = 12-period EMA - 26-period EMA
-        macd_line = ema12 - ema26
-        
-        # Signal line = 9-period EMA of MACD line
-        macd_history = []
-        for i in range(len(prices) - 26 + 1):
-            short_ema = self._calculate_ema(prices[i:i+26], 12)
-            long_ema = self._calculate_ema(prices[i:i+26], 26)
-            macd_history.append(short_ema - long_ema)
-            
-        signal_line = self._calculate_ema(macd_history, 9) if len(macd_history) >= 9 else macd_line
-        
-        # Histogram = MACD line - Signal line
-        histogram = macd_line - signal_line
-        
-        return macd_line, signal_line, histogram
-
-    def _calculate_ema(self, prices: List[float], period: int) -> float:
-        """Calculate EMA - Exponential Moving Average"""
-        if len(prices) < period:
-            return sum(prices) / len(prices)  # Simple average if not enough data
-            
-        multiplier = 2 / (period + 1)
-        initial_sma = sum(prices[:period]) / period
-        
-        ema = initial_sma
-        for i in range(period, len(prices)):
-            ema = (prices[i] * multiplier) + (ema * (1 - multiplier))
-            
-        return ema
-
-    def _calculate_adx_simplified(self, candles: List[Dict]) -> float:
-        """Calculate simplified ADX (Average Directional Index)"""
-        if len(candles) < 14:
-            return 25.0  # Not enough data, return neutral value
-            
-        # Extract price data
-        highs = [float(c['h']) for c in candles]
-        lows = [float(c['l']) for c in candles]
-        closes = [float(c['c']) for c in candles]
-        
-        # Calculate True Range
-        tr_sum = 0
-        for i in range(1, len(candles)):
-            high = highs[i]
-            low = lows[i]
-            prev_close = closes[i-1]
-            
-            tr1 = high - low
-            tr2 = abs(high - prev_close)
-            tr3 = abs(low - prev_close)
-            
-            tr = max(tr1, tr2, tr3)
-            tr_sum += tr
-            
-        atr = tr_sum / (len(candles) - 1)
-        
-        # Calculate price movement directional strength (simplified)
-        up_moves = 0
-        down_moves = 0
-        for i in range(1, len(candles)):
-            if closes[i] > closes[i-1]:
-                up_moves += closes[i] - closes[i-1]
-            else:
-                down_moves += closes[i-1] - closes[i]
-                
-        # Calculate simplified ADX
-        di_diff = abs(up_moves - down_moves)
-        di_sum = up_moves + down_moves
-        
-        adx = 100 * di_diff / di_sum if di_sum > 0 else 25.0
-        return adx
+    @staticmethod
+    def _indicator_or(value: float, default: float) -> float:
+        """Indicator value, or a neutral default while the indicator is still warming up (NaN)"""
+        return default if math.isnan(value) else value
 
     def _calculate_momentum_score(self, rsi: float, macd_histogram: float, 
                                 adx: float, relative_volume: float,
@@ -789,28 +747,27 @@ class AutomatedTrading:
         """
         try:
             # Get historical candles
-            candles = self.info.candles_snapshot(coin, "1h", lookback_periods)
+            candles = self.candles.last(coin, "1h", lookback_periods)
             
             if len(candles) < lookback_periods:
                 return {'status': 'error', 'message': f'Insufficient candle data for {coin}'}
             
             # Extract price data
-            closes = [float(c['c']) for c in candles]
-            highs = [float(c['h']) for c in candles]
-            lows = [float(c['l']) for c in candles]
+            closes = candles['c'].tolist()
+            highs = candles['h'].tolist()
+            lows = candles['l'].tolist()
             
-            # Calculate technical indicators
-            rsi = self._calculate_rsi(closes)
-            macd_line, signal_line, macd_histogram = self._calculate_macd(closes)
+            # Technical indicators from the shared engine; "previous" holds them as of the bar before
+            values = self.indicators.values(coin, "1h", lookback_periods)
+            rsi = self._indicator_or(values['rsi'], 50.0)
+            macd_line, signal_line, macd_histogram = (self._indicator_or(v, 0.0) for v in values['macd'])
+            prev_macd_line = self._indicator_or(values['previous'].get('macd', (math.nan,))[0], macd_line)
             
-            # Calculate Bollinger Bands
-            sma20 = sum(closes[-20:]) / 20
-            std_dev = np.std(closes[-20:])
-            upper_band = sma20 + (2 * std_dev)
-            lower_band = sma20 - (2 * std_dev)
+            # Bollinger Bands (20, 2)
+            lower_band, sma20, upper_band = values['bollinger']
             
-            # Calculate Stochastic
-            stoch_k = self._calculate_stochastic_k(closes, highs, lows, 14)
+            # Stochastic %K (14)
+            stoch_k = self._indicator_or(values['stochastic'][0], 50.0)
             
             # Get latest price
             latest_close = closes[-1]
@@ -848,7 +805,7 @@ class AutomatedTrading:
                 reasoning = f"Overbought conditions: RSI={rsi:.1f}, Stoch={stoch_k:.1f}, price above upper band"
                 
                 # Extra confidence if divergence present
-                if price_making_higher_highs and macd_line < macd_line[-2]:
+                if price_making_higher_highs and macd_line < prev_macd_line:
                     confidence += 0.1
                     reasoning += " with bearish divergence"
             
@@ -860,7 +817,7 @@ class AutomatedTrading:
                 reasoning = f"Oversold conditions: RSI={rsi:.1f}, Stoch={stoch_k:.1f}, price below lower band"
                 
                 # Extra confidence if divergence present
-                if price_making_lower_lows and macd_line > macd_line[-2]:
+                if price_making_lower_lows and macd_line > prev_macd_line:
                     confidence += 0.1
                     reasoning += " with bullish divergence"
             
@@ -940,24 +897,6 @@ class AutomatedTrading:
             logger.error(f"Error in counter-trend strategy for {coin}: {e}")
             return {'status': 'error', 'message': str(e)}
     
-    def _calculate_stochastic_k(self, closes: List[float], highs: List[float], 
-                             lows: List[float], period: int = 14) -> float:
-        """Calculate Stochastic oscillator %K value"""
-        if len(closes) < period:
-            return 50.0  # Not enough data
-            
-        recent_range = min(period, len(closes))
-        recent_low = min(lows[-recent_range:])
-        recent_high = max(highs[-recent_range:])
-        
-        if recent_high == recent_low:
-            return 50.0  # Avoid division by zero
-            
-        latest_close = closes[-1]
-        k_value = 100 * (latest_close - recent_low) / (recent_high - recent_low)
-        
-        return k_value
-    
     async def _execute_counter_trend_buy(self, coin: str, entry_price: float, 
                                      stop_price: float, target_price: float, 
                                      size: float) -> Dict:
@@ -1101,15 +1040,15 @@ class AutomatedTrading:
         """
         try:
             # Get historical candles for different timeframes
-            hourly_candles = self.info.candles_snapshot(coin, "1h", 48)  # 2 days of hourly
-            daily_candles = self.info.candles_snapshot(coin, "1d", 30)   # 30 days of daily
+            hourly_candles = self.candles.last(coin, "1h", 48)  # 2 days of hourly
+            daily_candles = self.candles.last(coin, "1d", 30)   # 30 days of daily
             
             if len(hourly_candles) < 24 or len(daily_candles) < 7:
                 return {'status': 'error', 'message': f'Insufficient historical data for {coin}'}
             
             # Extract prices
-            hourly_closes = [float(c['c']) for c in hourly_candles]
-            daily_closes = [float(c['c']) for c in daily_candles]
+            hourly_closes = hourly_candles['c'].tolist()
+            daily_closes = daily_candles['c'].tolist()
             
             # Calculate short-term volatility (hourly)
             short_term_returns = [hourly_closes[i]/hourly_closes[i-1]-1 for i in range(1, len(hourly_closes))]
@@ -1315,13 +1254,13 @@ class AutomatedTrading:
         """Calculate coin volatility based on recent price history"""
         try:
             # Get hourly candles
-            candles = self.info.candles_snapshot(coin, "1h", lookback_hours)
+            candles = self.candles.last(coin, "1h", lookback_hours)
             
             if len(candles) < 6:  # Need at least 6 hours of data
                 return 0.02  # Default 2% if insufficient data
             
             # Calculate returns
-            prices = [float(c['c']) for c in candles]
+            prices = candles['c'].tolist()
             returns = [prices[i]/prices[i-1]-1 for i in range(1, len(prices))]
             
             # Calculate annualized volatility
@@ -9,9 +9,18 @@ import os
 import numpy as np
 
 # Real Hyperliquid imports
+from hyperliquid.async_exchange import AsyncExchange
+from hyperliquid.batching import AsyncOrderBatcher
+from hyperliquid.candles import get_candle_store
 from hyperliquid.exchange import Exchange
+from hyperliquid.fills import get_fill_store
 from hyperliquid.info import Info
+from hyperliquid.orderbook import OrderBook, get_book_store
+from hyperliquid.orders import OrderRegistry, get_order_registry
+from hyperliquid.quantizer import QuantizerTable
+from hyperliquid.requoting import Requoter
 from hyperliquid.utils import constants
+from hyperliquid.utils.signing import OrderRequest
 
 # Import actual examples for real patterns
 examples_dir = os.path.join(os.path.dirname(__file__), '..', 'examples')
@@ -45,7 +54,8 @@ class GridTradingEngine:
         if exchange and info:
             self.exchange = exchange
             self.info = info
-            self.address = exchange.account_address
+            # Orders rest under the vault or account the exchange trades for, else under its own wallet
+            self.address = exchange.vault_address or exchange.account_address or exchange.wallet.address
         else:
             # Use example_utils.setup like all real examples
             self.address, self.info, self.exchange = example_utils.setup(
@@ -56,6 +66,30 @@ class GridTradingEngine:
         self.active_grids = {}
         self.logger = logging.getLogger(__name__)
         
+        # Per-asset tick/lot size tables for snapping grid ladders
+        self.quantizers = QuantizerTable(self.info)
+        
+        # Grid orders and cancels are queued together and sent as bulk actions instead of one request per level,
+        # through an AsyncExchange so the engine's coroutines await them instead of blocking the loop.
+        # Created on first use
+        self._batcher: Optional[AsyncOrderBatcher] = None
+        
+        # Rebalances move resting orders with modifies instead of cancelling and re-placing the whole grid
+        self.requoter = Requoter(self.exchange)
+        
+        # L2 books shared with every other strategy in the process, kept current by the l2Book/bbo streams
+        self.books = get_book_store(self.info.base_url)
+        
+        # Candle history shared the same way: backfilled once, then kept current by the candle stream
+        self.candles = get_candle_store(self.info.base_url)
+        
+        # Fill history synced incrementally per address and indexed by coin and time
+        self.fills = get_fill_store(self.info.base_url)
+        
+        # Open orders tracked locally from the user streams, so status checks need no openOrders request.
+        # Created on first use: constructing the engine opens no socket
+        self._orders: Optional[OrderRegistry] = None
+        
         # Risk management parameters
         self.risk_limits = {
             "max_position_size": 50000,  # $50K max position
@@ -66,6 +100,94 @@ class GridTradingEngine:
         
         self.logger.info("GridTradingEngine initialized with real Hyperliquid API")
 
+    @property
+    def orders(self) -> OrderRegistry:
+        if self._orders is None:
+            self._orders = get_order_registry(self.info.base_url, self.address)
+        return self._orders
+
+    async def _order_batcher(self) -> AsyncOrderBatcher:
+        if self._batcher is None:
+            async_exchange = await AsyncExchange.create(
+                self.exchange.wallet,
+                self.info.base_url,
+                vault_address=self.exchange.vault_address,
+                account_address=self.exchange.account_address
+            )
+            self._batcher = AsyncOrderBatcher(async_exchange)
+        return self._batcher
+
+    @staticmethod
+    def _alo_order(coin: str, is_buy: bool, size: float, price: float) -> OrderRequest:
+        """Add Liquidity Only limit order request, as placed by basic_adding.py"""
+        return {
+            "coin": coin,
+            "is_buy": is_buy,
+            "sz": size,
+            "limit_px": price,
+            "order_type": {"limit": {"tif": "Alo"}},
+            "reduce_only": False,
+        }
+
+    def _grid_ladder(self, coin: str, mid_price: float, spacing: float, level_sizes: List[float]) -> List[OrderRequest]:
+        """Snapped ALO buy and sell ladder around mid_price, with level_sizes[i] at i + 1 spacings from mid"""
+        quantizer = self.quantizers[coin]
+        steps = range(1, len(level_sizes) + 1)
+        buy_prices, _ = quantizer.price_ladder([mid_price * (1 - spacing * i) for i in steps])
+        sell_prices, _ = quantizer.price_ladder([mid_price * (1 + spacing * i) for i in steps])
+        sizes, _ = quantizer.size_ladder(level_sizes)
+        return [self._alo_order(coin, True, sz, px) for sz, px in zip(sizes, buy_prices) if sz > 0] + [
+            self._alo_order(coin, False, sz, px) for sz, px in zip(sizes, sell_prices) if sz > 0
+        ]
+
+    def _grid_resting_orders(self, coin: str, grid: Dict) -> List[Dict]:
+        """
+        The grid's own orders still resting, in the openOrders shape. Other orders on the coin (manual orders,
+        other strategies, TP/SL triggers) are never re-quoted; grid orders the registry has not seen yet are kept
+        as placed rather than placed a second time
+        """
+        grid_orders = {order['oid']: order for order in grid['orders'] if order.get('oid') is not None}
+        live = [
+            order for order in self.orders.open_orders(coin)
+            if order['oid'] in grid_orders and not order.get('isTrigger')
+        ]
+        seen = {order['oid'] for order in live}
+        for oid, order in grid_orders.items():
+            if oid not in seen and self.orders.status(oid) is None:
+                live.append({
+                    'coin': coin,
+                    'side': 'B' if order['side'] == 'buy' else 'A',
+                    'limitPx': str(order['price']),
+                    'sz': str(order['size']),
+                    'oid': oid
+                })
+        return live
+
+    def _requote_grid(self, coin: str, desired: List[OrderRequest]) -> Dict:
+        """
+        Move the grid's resting orders onto the desired ladder: unchanged levels keep their queue position,
+        moved levels are modified and only the difference is placed or cancelled, in at most 3 bulk actions
+        """
+        grid = self.active_grids[coin]
+        requote = self.requoter.requote(desired, self._grid_resting_orders(coin, grid))
+        
+        grid['orders'] = [
+            {
+                'side': 'buy' if order['side'] == 'B' else 'sell',
+                'price': float(order['limitPx']),
+                'size': float(order['sz']),
+                'oid': order['oid'],
+                'status': 'resting'
+            }
+            for order in requote['live']
+        ]
+        grid['total_orders_placed'] += requote['placed'] + requote['modified']
+        
+        self.logger.info(f"Re-quoted {coin} grid: kept {requote['kept']}, modified {requote['modified']}, "
+                         f"placed {requote['placed']}, cancelled {requote['cancelled']} "
+                         f"in {requote['requests']} requests ({requote['requests_saved']} saved)")
+        return requote
+
     async def start_grid(self, coin: str, levels: int = 10, spacing: float = 0.002, size_per_level: Optional[float] = None) -> Dict:
         """
         Start grid trading using real Hyperliquid orders
@@ -92,18 +214,30 @@ class GridTradingEngine:
                 if size_per_level <= 0:
                     return {'status': 'error', 'message': 'Insufficient balance for grid trading'}
             
+            # Snap every grid level to a valid tick and the size to the asset's lot size in one pass
+            quantizer = self.quantizers[coin]
+            buy_prices, _ = quantizer.price_ladder([mid_price * (1 - spacing * i) for i in range(1, levels + 1)])
+            sell_prices, _ = quantizer.price_ladder([mid_price * (1 + spacing * i) for i in range(1, levels + 1)])
+            size_per_level = quantizer.snap_size(size_per_level)
+            if size_per_level <= 0:
+                return {'status': 'error', 'message': f'Grid size per level is below the minimum size for {coin}'}
+            
             orders = []
             
+            # Queue every level before waiting on any, so the whole grid goes out in one or two bulk actions
+            batcher = await self._order_batcher()
+            buy_futures = [
+                batcher.submit_order(self._alo_order(coin, True, size_per_level, px)) for px in buy_prices
+            ]
+            sell_futures = [
+                batcher.submit_order(self._alo_order(coin, False, size_per_level, px)) for px in sell_prices
+            ]
+            batcher.flush()
+            
             # Place buy orders following basic_adding.py pattern for maker rebates
             for i in range(1, levels + 1):
-                buy_price = mid_price * (1 - spacing * i)
-                buy_price = round(buy_price, 2)
-                
-                # Use basic_adding.py exact pattern with Add Liquidity Only
-                order_result = self.exchange.order(
-                    coin, True, size_per_level, buy_price,
-                    {"limit": {"tif": "Alo"}}, reduce_only=False
-                )
+                buy_price = buy_prices[i - 1]
+                order_result = await buy_futures[i - 1]
                 print(order_result)  # Print like basic_order.py
                 
                 if order_result.get('status') == 'ok':
@@ -131,14 +265,8 @@ class GridTradingEngine:
             
             # Place sell orders following basic_adding.py pattern
             for i in range(1, levels + 1):
-                sell_price = mid_price * (1 + spacing * i)
-                sell_price = round(sell_price, 2)
-                
-                # Use basic_adding.py exact pattern with Add Liquidity Only
-                order_result = self.exchange.order(
-                    coin, False, size_per_level, sell_price,
-                    {"limit": {"tif": "Alo"}}, reduce_only=False
-                )
+                sell_price = sell_prices[i - 1]
+                order_result = await sell_futures[i - 1]
                 print(order_result)  # Print like basic_order.py
                 
                 if order_result.get('status') == 'ok':
@@ -195,15 +323,12 @@ class GridTradingEngine:
             
             grid = self.active_grids[coin]
             
-            # Get real fills from Info API
-            user_fills = self.info.user_fills(self.exchange.account_address)
-            
-            # Filter fills for this grid (after grid creation time)
-            grid_fills = []
-            for fill in user_fills:
-                if (fill.get('coin') == coin and 
-                    int(fill.get('time', 0)) > grid['created_at'].timestamp() * 1000):
-                    grid_fills.append(fill)
+            # Fills of this grid's coin since the grid was created
+            grid_fills = self.fills.fills(
+                self.address,
+                coin=coin,
+                start_ms=int(grid['created_at'].timestamp() * 1000) + 1
+            )
             
             # Calculate performance metrics
             total_fill_volume = sum(float(fill.get('sz', 0)) * float(fill.get('px', 0)) for fill in grid_fills)
@@ -216,10 +341,7 @@ class GridTradingEngine:
             
             for order in grid['orders']:
                 # Check if order is still open
-                open_orders = self.info.open_orders(self.exchange.account_address)
-                is_open = any(open_order['oid'] == order['oid'] for open_order in open_orders)
-                
-                if is_open:
+                if self.orders.is_open(order['oid']):
                     active_orders.append(order)
                 else:
                     filled_orders.append(order)
@@ -256,14 +378,17 @@ class GridTradingEngine:
             grid = self.active_grids[coin]
             cancelled_orders = []
             
-            # Cancel all orders in the grid using cancel_open_orders.py pattern
-            for order in grid['orders']:
+            # Cancel all orders in the grid using cancel_open_orders.py pattern, batched into bulk cancels
+            batcher = await self._order_batcher()
+            cancel_futures = [batcher.submit_cancel(coin, order['oid']) for order in grid['orders']]
+            batcher.flush()
+            for order, cancel_future in zip(grid['orders'], cancel_futures):
                 try:
-                    # Use cancel_open_orders.py exact pattern
                     print(f"cancelling order {order}")
-                    cancel_result = self.exchange.cancel(order['oid'])
+                    cancel_result = await cancel_future
                     
-                    if cancel_result.get('status') == 'ok':
+                    cancel_ok = cancel_result.get('status') == 'ok'
+                    if cancel_ok and cancel_result["response"]["data"]["statuses"][0] == "success":
                         cancelled_orders.append(order['oid'])
                         self.logger.info(f"Cancelled order {order['oid']} for {coin}")
                     else:
@@ -301,30 +426,22 @@ class GridTradingEngine:
             if price_deviation < 0.05:
                 return {'status': 'info', 'message': 'No rebalancing needed'}
             
-            # Stop current grid
-            stop_result = await self.stop_grid(coin)
-            if stop_result['status'] != 'success':
-                return stop_result
-            
-            # Start new grid at current price
-            start_result = await self.start_grid(
-                coin, 
-                levels=grid['levels'], 
-                spacing=grid['spacing'],
-                size_per_level=grid['size_per_level']
-            )
+            # Move the grid to the current price, re-using resting orders instead of cancelling them all
+            desired = self._grid_ladder(coin, current_mid, grid['spacing'], [grid['size_per_level']] * grid['levels'])
+            requote = self._requote_grid(coin, desired)
+            grid['mid_price'] = current_mid
             
-            if start_result['status'] == 'success':
-                return {
-                    'status': 'success',
-                    'message': f'Grid rebalanced for {coin}',
-                    'old_center': original_mid,
-                    'new_center': current_mid,
-                    'price_move': f"{price_deviation:.2%}",
-                    'new_orders': start_result['orders_placed']
-                }
-            else:
-                return start_result
+            return {
+                'status': 'success',
+                'message': f'Grid rebalanced for {coin}',
+                'old_center': original_mid,
+                'new_center': current_mid,
+                'price_move': f"{price_deviation:.2%}",
+                'new_orders': requote['placed'] + requote['modified'],
+                'kept_orders': requote['kept'],
+                'cancelled_orders': requote['cancelled'],
+                'requests_saved': requote['requests_saved']
+            }
                 
         except Exception as e:
             self.logger.error(f"Error rebalancing grid for {coin}: {e}")
@@ -363,6 +480,9 @@ class GridTradingEngine:
             summary += f"  • Active Orders: {total_orders}\n"
             summary += f"  • Total Rebates: ${total_estimated_rebates:.4f}\n"
             summary += f"  • Grids Running: {len(self.active_grids)}\n"
+            requote_stats = self.requoter.stats()
+            if requote_stats['requotes']:
+                summary += f"  • Re-quotes: {requote_stats['requotes']}, {requote_stats['saved']} requests saved\n"
             summary += f"\n⚡ All orders use Add Liquidity Only = guaranteed maker rebates!"
             
             return summary
@@ -397,13 +517,13 @@ class GridTradingEngine:
         """Calculate 24h volatility for a coin"""
         try:
             # Get candle data
-            candles = self.info.candles_snapshot(coin, "1h", 24)
+            candles = self.candles.last(coin, "1h", 24)
             
-            if not candles or len(candles) < 12:
+            if len(candles) < 12:
                 return 0.02  # Default 2% if no data
                 
             # Calculate returns
-            prices = [float(candle['c']) for candle in candles]
+            prices = candles['c'].tolist()
             returns = [prices[i]/prices[i-1]-1 for i in range(1, len(prices))]
             
             # Calculate volatility (standard deviation of returns)
@@ -500,8 +620,8 @@ class GridTradingEngine:
         """
         try:
             # Get orderbook to analyze liquidity
-            orderbook = self.info.l2_snapshot(coin)
-            if not orderbook or 'levels' not in orderbook:
+            orderbook = self.books.book(coin)
+            if not orderbook.ready.is_set():
                 return {'status': 'error', 'message': 'Could not get orderbook data'}
             
             # Calculate liquidity factor
@@ -521,26 +641,34 @@ class GridTradingEngine:
             # Scale size by liquidity (more liquidity = larger orders)
             size_per_level = base_size * liquidity_factor
             
+            # Snap prices and sizes of the whole ladder at once
+            # Size is scaled by distance from mid price (further = larger), for a more natural liquidity curve
+            quantizer = self.quantizers[coin]
+            steps = range(1, levels + 1)
+            buy_prices, _ = quantizer.price_ladder([mid_price * (1 - optimal_spacing * i) for i in steps])
+            sell_prices, _ = quantizer.price_ladder([mid_price * (1 + optimal_spacing * i) for i in steps])
+            level_sizes, _ = quantizer.size_ladder([size_per_level * (1 + ((i - 1) / levels)) for i in steps])  # 1.0x to 2.0x
+            
             # Place orders with variable sizes at different price levels
             orders = []
             total_buy_size = 0
             total_sell_size = 0
             
+            # Queue both sides of the ladder before waiting on any order, so they are sent as bulk actions
+            batcher = await self._order_batcher()
+            buy_futures = [
+                batcher.submit_order(self._alo_order(coin, True, sz, px)) for sz, px in zip(level_sizes, buy_prices)
+            ]
+            sell_futures = [
+                batcher.submit_order(self._alo_order(coin, False, sz, px)) for sz, px in zip(level_sizes, sell_prices)
+            ]
+            batcher.flush()
+            
             # Place buy orders with size scaled by distance from midpoint
             for i in range(1, levels + 1):
-                # Scale size by distance from mid price (further = larger)
-                # This creates a more natural liquidity curve
-                distance_factor = 1 + ((i - 1) / levels)  # 1.0 to 2.0
-                level_size = size_per_level * distance_factor
-                
-                buy_price = mid_price * (1 - optimal_spacing * i)
-                buy_price = round(buy_price, 2)
-                
-                # Use basic_adding.py exact pattern with Add Liquidity Only
-                order_result = self.exchange.order(
-                    coin, True, level_size, buy_price,
-                    {"limit": {"tif": "Alo"}}, reduce_only=False
-                )
+                level_size = level_sizes[i - 1]
+                buy_price = buy_prices[i - 1]
+                order_result = await buy_futures[i - 1]
                 
                 if order_result.get('status') == 'ok':
                     status = order_result["response"]["data"]["statuses"][0]
@@ -558,18 +686,9 @@ class GridTradingEngine:
             
             # Place sell orders with size scaled by distance from midpoint
             for i in range(1, levels + 1):
-                # Scale size by distance from mid price (further = larger)
-                distance_factor = 1 + ((i - 1) / levels)  # 1.0 to 2.0
-                level_size = size_per_level * distance_factor
-                
-                sell_price = mid_price * (1 + optimal_spacing * i)
-                sell_price = round(sell_price, 2)
-                
-                # Use basic_adding.py exact pattern with Add Liquidity Only
-                order_result = self.exchange.order(
-                    coin, False, level_size, sell_price,
-                    {"limit": {"tif": "Alo"}}, reduce_only=False
-                )
+                level_size = level_sizes[i - 1]
+                sell_price = sell_prices[i - 1]
+                order_result = await sell_futures[i - 1]
                 
                 if order_result.get('status') == 'ok':
                     status = order_result["response"]["data"]["statuses"][0]
@@ -595,6 +714,7 @@ class GridTradingEngine:
                 'created_at': datetime.now(),
                 'total_orders_placed': len(orders),
                 'liquidity_factor': liquidity_factor,
+                'max_size': max_size,
                 'total_buy_size': total_buy_size,
                 'total_sell_size': total_sell_size,
                 'liquidity_scaled': True
@@ -614,37 +734,17 @@ class GridTradingEngine:
             self.logger.error(f"Error starting liquidity scaled grid: {e}")
             return {'status': 'error', 'message': str(e)}
     
-    async def _calculate_liquidity_factor(self, coin: str, orderbook: Dict) -> float:
+    async def _calculate_liquidity_factor(self, coin: str, orderbook: OrderBook) -> float:
         """
         Calculate liquidity factor based on orderbook depth
         Returns a number between 0.5 and 2.0 to scale order sizes
         """
         try:
-            # Extract orderbook data
-            bid_levels = orderbook['levels'][0] if len(orderbook['levels']) > 0 else []
-            ask_levels = orderbook['levels'][1] if len(orderbook['levels']) > 1 else []
-            
-            # Calculate 2% depth for buy and sell sides
-            mid_price = float(self.info.all_mids().get(coin, 0))
-            if mid_price <= 0:
+            if orderbook.mid() is None:
                 return 1.0  # Default factor
             
-            lower_bound = mid_price * 0.98  # 2% down
-            upper_bound = mid_price * 1.02  # 2% up
-            
-            bid_depth = 0
-            for bid in bid_levels:
-                bid_price = float(bid[0])
-                bid_size = float(bid[1])
-                if bid_price >= lower_bound:
-                    bid_depth += bid_size * bid_price
-            
-            ask_depth = 0
-            for ask in ask_levels:
-                ask_price = float(ask[0])
-                ask_size = float(ask[1])
-                if ask_price <= upper_bound:
-                    ask_depth += ask_size * ask_price
+            # Notional within 2% of mid on the buy and sell sides
+            bid_depth, ask_depth = orderbook.depth_within(0.02)
             
             total_depth = bid_depth + ask_depth
             
@@ -689,7 +789,7 @@ class GridTradingEngine:
             need_spacing_update = spacing_change > 0.3  # 30% change in optimal spacing
             
             # Check liquidity change
-            orderbook = self.info.l2_snapshot(coin)
+            orderbook = self.books.book(coin)
             current_liquidity = await self._calculate_liquidity_factor(coin, orderbook)
             original_liquidity = grid.get('liquidity_factor', 1.0)
             liquidity_change = abs(current_liquidity - original_liquidity) / original_liquidity
@@ -709,12 +809,9 @@ class GridTradingEngine:
                 else:
                     rebates_earned = 0
                 
-                # Stop current grid
-                await self.stop_grid(coin)
-                
-                # Calculate new size accounting for profits
+                # Calculate new liquidity-scaled size accounting for profits
                 levels = grid['levels']
-                size_per_level = grid['size_per_level']
+                size_per_level = grid.get('max_size', 1000) / levels / 2 * current_liquidity
                 
                 # Compound profits if available
                 if rebates_earned > 0.1:  # Only if we have at least $0.1 in profits
@@ -722,21 +819,36 @@ class GridTradingEngine:
                     additional_coin_size = compound_amount / current_mid / (2 * levels)
                     size_per_level += additional_coin_size
                 
-                # Start new optimized grid
-                result = await self.start_liquidity_scaled_grid(coin, levels)
+                # Re-quote the grid onto the optimized ladder (1.0x to 2.0x size away from mid, as in
+                # start_liquidity_scaled_grid) instead of cancelling and re-placing every order
+                level_sizes = [size_per_level * (1 + ((i - 1) / levels)) for i in range(1, levels + 1)]
+                desired = self._grid_ladder(coin, current_mid, optimal_spacing, level_sizes)
+                requote = self._requote_grid(coin, desired)
+                grid.update({
+                    'mid_price': current_mid,
+                    'spacing': optimal_spacing,
+                    'size_per_level': size_per_level,
+                    'liquidity_factor': current_liquidity,
+                    'liquidity_scaled': True
+                })
                 
-                if result['status'] == 'success':
-                    return {
+                return {
+                    'status': 'success',
+                    'message': 'Grid auto-adjusted successfully',
+                    'price_deviation': f"{price_deviation:.2%}",
+                    'spacing_change': f"{spacing_change:.2%}",
+                    'liquidity_change': f"{liquidity_change:.2%}",
+                    'profits_compounded': rebates_earned * 0.5 if rebates_earned > 0.1 else 0,
+                    'new_grid': {
                         'status': 'success',
-                        'message': 'Grid auto-adjusted successfully',
-                        'price_deviation': f"{price_deviation:.2%}",
-                        'spacing_change': f"{spacing_change:.2%}",
-                        'liquidity_change': f"{liquidity_change:.2%}",
-                        'profits_compounded': rebates_earned * 0.5 if rebates_earned > 0.1 else 0,
-                        'new_grid': result
+                        'orders_live': len(grid['orders']),
+                        'kept_orders': requote['kept'],
+                        'modified_orders': requote['modified'],
+                        'placed_orders': requote['placed'],
+                        'cancelled_orders': requote['cancelled'],
+                        'requests_saved': requote['requests_saved']
                     }
-                else:
-                    return result
+                }
             else:
                 return {
                     'status': 'info',
@@ -8,6 +8,9 @@ import logging
 import time
 import requests
 
+from hyperliquid.nonce import get_nonce_allocator
+from hyperliquid.orderbook import OrderBook, get_book_store
+
 @dataclass
 class HyperEVMTransaction:
     """Data class for HyperEVM transactions"""
@@ -144,6 +147,9 @@ class HyperliquidApiConnector:
     def __init__(self, network: str = "testnet"):
         self.logger = logging.getLogger(__name__)
         
+        # Nonces come from the SDK's shared per-signer allocator
+        self.nonce_allocator = get_nonce_allocator()
+        
         if network == "mainnet":
             self.api_url = "https://api.hyperliquid.xyz"
         else:
@@ -244,29 +250,34 @@ class HyperliquidApiConnector:
             self.logger.error(f"Error getting user state: {e}")
             return {"error": str(e)}
     
+    def get_order_book(self, coin: str) -> OrderBook:
+        """Get the shared L2 book of a coin, kept current by the l2Book/bbo websocket streams"""
+        return get_book_store(self.api_url).book(coin)
+    
     async def get_l2_snapshot(self, coin: str) -> Dict:
-        """Get L2 orderbook snapshot"""
+        """Get L2 orderbook snapshot (served from the shared book, with float prices and sizes)"""
         try:
             asset_id = await self.get_asset_id(coin)
             if asset_id is None:
                 return {"error": f"Unknown asset: {coin}"}
             
-            response = await self._post_request("info", {
-                "type": "l2Book",
-                "coin": coin
-            })
-            return response
+            return self.get_order_book(coin).snapshot()
         except Exception as e:
             self.logger.error(f"Error getting L2 snapshot: {e}")
             return {"error": str(e)}
     
     async def place_order(self, coin: str, is_buy: bool, size: float, price: float, 
                         reduce_only: bool = False, order_type: str = "Gtc", 
-                        vault_address: Optional[str] = None) -> Dict:
+                        vault_address: Optional[str] = None, signer: Optional[str] = None) -> Dict:
         """
         Place an order using proper Hyperliquid notation
+        
+        signer is the address of the key that will sign the payload; its nonce sequence is used
         """
         try:
+            if not signer:
+                return {"status": "error", "message": "No signer address for the order nonce"}
+            
             # Get asset ID
             asset_id = await self.get_asset_id(coin)
             if asset_id is None:
@@ -293,7 +304,7 @@ class HyperliquidApiConnector:
                     "orders": [order],
                     "grouping": "na"
                 },
-                "nonce": int(time.time() * 1000),  # Current timestamp in ms
+                "nonce": self.nonce_allocator.next(signer),
                 "signature": {}  # Would be filled by calling code
             }
             
@@ -327,9 +338,13 @@ class HyperEVMNetwork:
             network=self.config.get("network", "testnet")
         )
         
-        # Cache for nonce management
-        self.nonce_tracker = {}
-        self.last_nonce_update = 0
+        # Nonces come from the SDK's shared per-signer allocator
+        self.nonce_allocator = get_nonce_allocator()
+    
+    def _signer_address(self) -> Optional[str]:
+        """Address of the key that signs our actions, once an account is set"""
+        account = self.evm_connector.account
+        return account.address if account else None
     
     async def initialize(self) -> Dict:
         """Initialize connections and fetch required data"""
@@ -340,9 +355,6 @@ class HyperEVMNetwork:
             # Get meta information
             meta_info = await self.api_connector.get_meta_info()
             
-            # Initialize nonce tracker with current timestamp
-            self.nonce_tracker['last'] = int(time.time() * 1000)
-            
             return {
                 "status": "initialized" if network_status.get("connected") else "partial",
                 "network": network_status,
@@ -354,16 +366,10 @@ class HyperEVMNetwork:
     
     async def get_unique_nonce(self) -> int:
         """Get a unique nonce following Hyperliquid requirements"""
-        current_time = int(time.time() * 1000)
-        
-        # Use timestamp if more than 1 ms since last nonce
-        if current_time > self.nonce_tracker.get('last', 0):
-            self.nonce_tracker['last'] = current_time
-            return current_time
-        
-        # Otherwise increment the last nonce
-        self.nonce_tracker['last'] += 1
-        return self.nonce_tracker['last']
+        signer = self._signer_address()
+        if signer is None:
+            raise ValueError("No account set; nonces are allocated per signer")
+        return self.nonce_allocator.next(signer)
     
     async def place_maker_order(self, coin: str, is_buy: bool, size: float, price: float, 
                             vault_address: Optional[str] = None) -> Dict:
@@ -377,7 +383,8 @@ class HyperEVMNetwork:
             price=price,
             reduce_only=False,
             order_type="Alo",  # ALO = Add Liquidity Only (maker only order)
-            vault_address=vault_address
+            vault_address=vault_address,
+            signer=self._signer_address()
         )
     
     async def place_taker_order(self, coin: str, is_buy: bool, size: float, price: float,
@@ -392,7 +399,8 @@ class HyperEVMNetwork:
             price=price,
             reduce_only=False,
             order_type="Ioc",  # IOC = Immediate or Cancel (taker order)
-            vault_address=vault_address
+            vault_address=vault_address,
+            signer=self._signer_address()
         )
     
     async def schedule_cancel_orders(self, time_ms: Optional[int] = None) -> Dict:
@@ -400,6 +408,9 @@ class HyperEVMNetwork:
         Schedule cancellation of all orders (dead man's switch)
         If time_ms is not provided, it will default to current time + 5 seconds
         """
+        if self._signer_address() is None:
+            return {"status": "error", "message": "Not connected or no account set"}
+        
         if not time_ms:
             time_ms = int(time.time() * 1000) + 5000  # 5 seconds in the future
             
@@ -487,27 +498,17 @@ class HyperEVMNetwork:
             for coin, price in all_mids.items():
                 try:
                     # Get L2 book data for spread analysis
-                    l2_data = await self.api_connector.get_l2_snapshot(coin)
+                    book = self.api_connector.get_order_book(coin)
                     
-                    if not isinstance(l2_data, dict) or "levels" not in l2_data or len(l2_data["levels"]) < 2:
+                    mid_price = book.mid()
+                    if mid_price is None:
                         continue
                     
-                    bid_levels = l2_data["levels"][0]
-                    ask_levels = l2_data["levels"][1]
-                    
-                    if not bid_levels or not ask_levels:
-                        continue
-                    
-                    best_bid = float(bid_levels[0][0])
-                    best_ask = float(ask_levels[0][0])
-                    
                     # Calculate spread in basis points
-                    mid_price = (best_bid + best_ask) / 2
-                    spread_bps = ((best_ask - best_bid) / mid_price) * 10000
+                    spread_bps = book.spread_bps()
                     
                     # Calculate liquidity (top 5 levels sum)
-                    bid_liquidity = sum(float(level[1]) * float(level[0]) for level in bid_levels[:5])
-                    ask_liquidity = sum(float(level[1]) * float(level[0]) for level in ask_levels[:5])
+                    bid_liquidity, ask_liquidity = book.depth(5)
                     
                     # Calculate rebate score (higher is better)
                     rebate_score = (bid_liquidity + ask_liquidity) / (spread_bps + 1)  # Avoid division by zero
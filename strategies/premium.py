@@ -11,7 +11,9 @@ from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from hyperliquid.info import Info
 from hyperliquid.exchange import Exchange
+from hyperliquid.fills import get_fill_store
 from hyperliquid.utils import constants
+from hyperliquid.utils.parsers import AssetCtxs, parse_asset_ctxs
 import aiohttp
 import websockets
 from datetime import datetime, timedelta
@@ -457,15 +459,15 @@ class RealOpportunityScanner:
             meta_and_ctxs = self.info.meta_and_asset_ctxs()
             
             if len(meta_and_ctxs) >= 2:
-                universe = meta_and_ctxs[0]['universe']
-                asset_ctxs = meta_and_ctxs[1]
+                # Parse the contexts to float columns once for both scanners
+                asset_ctxs = parse_asset_ctxs(meta_and_ctxs)
                 
                 # Scan for momentum opportunities
-                momentum_opps = await self._scan_momentum_opportunities(mids, universe, asset_ctxs)
+                momentum_opps = await self._scan_momentum_opportunities(mids, asset_ctxs)
                 opportunities.extend(momentum_opps)
                 
                 # Scan for volume spike opportunities
-                volume_opps = await self._scan_volume_spike_opportunities(universe, asset_ctxs)
+                volume_opps = await self._scan_volume_spike_opportunities(asset_ctxs)
                 opportunities.extend(volume_opps)
                 
                 # Scan for arbitrage opportunities
@@ -479,22 +481,19 @@ class RealOpportunityScanner:
         opportunities.sort(key=lambda x: x.get('confidence', 0), reverse=True)
         return opportunities[:10]  # Top 10 opportunities
     
-    async def _scan_momentum_opportunities(self, mids: Dict, universe: List, 
-                                         asset_ctxs: List) -> List[Dict]:
+    async def _scan_momentum_opportunities(self, mids: Dict, asset_ctxs: AssetCtxs) -> List[Dict]:
         """Scan for REAL momentum trading opportunities"""
         opportunities = []
+        mark_prices = asset_ctxs['markPx']
+        prev_day_prices = asset_ctxs['prevDayPx']
+        day_volumes = asset_ctxs['dayNtlVlm']
         
-        for i, asset_ctx in enumerate(asset_ctxs):
+        for i, coin in enumerate(asset_ctxs.names):
             try:
-                if i >= len(universe):
-                    continue
-                
-                coin = universe[i]['name']
-                
                 # Get price data
-                mark_px = float(asset_ctx.get('markPx', 0))
-                prev_day_px = float(asset_ctx.get('prevDayPx', mark_px))
-                day_volume = float(asset_ctx.get('dayNtlVlm', 0))
+                mark_px = mark_prices[i]
+                prev_day_px = prev_day_prices[i]
+                day_volume = day_volumes[i]
                 
                 if mark_px > 0 and prev_day_px > 0:
                     price_change = (mark_px - prev_day_px) / prev_day_px
@@ -522,26 +521,22 @@ class RealOpportunityScanner:
         
         return opportunities
     
-    async def _scan_volume_spike_opportunities(self, universe: List, 
-                                             asset_ctxs: List) -> List[Dict]:
+    async def _scan_volume_spike_opportunities(self, asset_ctxs: AssetCtxs) -> List[Dict]:
         """Scan for unusual volume spikes"""
         opportunities = []
+        mark_prices = asset_ctxs['markPx']
+        day_volumes = asset_ctxs['dayNtlVlm']
         
-        for i, asset_ctx in enumerate(asset_ctxs):
+        for i, coin in enumerate(asset_ctxs.names):
             try:
-                if i >= len(universe):
-                    continue
-                
-                coin = universe[i]['name']
-                day_volume = float(asset_ctx.get('dayNtlVlm', 0))
+                day_volume = day_volumes[i]
                 
                 # Estimate if volume is unusual (simplified)
                 # In a real implementation, you'd compare to historical averages
                 estimated_avg_volume = day_volume * 0.6  # Assume current is 60% above average
                 
                 if day_volume > estimated_avg_volume * 3:  # 3x average volume
-                    mark_px = float(asset_ctx.get('markPx', 0))
-                    prev_day_px = float(asset_ctx.get('prevDayPx', mark_px))
+                    mark_px = mark_prices[i]
                     
                     opportunities.append({
                         'type': 'volume_spike',
@@ -984,8 +979,8 @@ class RealPremiumCommands:
                 unrealized_pnl = float(user_state.get("marginSummary", {}).get("totalUnrealizedPnl", 0))
                 
                 # Get recent fills
-                user_fills = self.info.user_fills(main_address)
-                recent_fills = [fill for fill in user_fills[-50:] if time.time() - fill['time']/1000 < 86400]  # Last 24h
+                since_ms = int((time.time() - 86400) * 1000)  # Last 24h
+                recent_fills = get_fill_store(self.info.base_url).fills(main_address, start_ms=since_ms)[-50:]
                 
                 # Calculate metrics
                 if recent_fills:
@@ -10,6 +10,9 @@ import numpy as np
 from typing import Dict, List, Optional, Any
 import datetime
 
+from hyperliquid.candles import get_candle_store
+from hyperliquid.fills import get_fill_store
+
 # Import the base class to avoid circular imports
 from trading_engine.base_trader import BaseTrader
 
@@ -98,7 +101,7 @@ class SeedifyIMCManager(BaseTrader):
                 }
             
             # Get real trading data to calculate current volume using proper notation
-            recent_fills = self.info.user_fills(self.exchange.account_address)
+            recent_fills = get_fill_store(self.info.base_url).fills(self.exchange.account_address)
             current_volume_14d = sum(float(f['sz']) * float(f['px']) for f in recent_fills)
             
             # Calculate realistic maker rebate strategy based on actual fee structure
@@ -163,7 +166,7 @@ class SeedifyIMCManager(BaseTrader):
             
             # Get real current performance data using proper notation
             user_state = self.info.user_state(self.exchange.account_address)
-            current_fills = self.info.user_fills(self.exchange.account_address)
+            current_fills = get_fill_store(self.info.base_url).fills(self.exchange.account_address)
             
             # Calculate actual fees paid by user using px/sz notation
             total_fees_paid = sum(abs(float(f.get('fee', 0))) for f in current_fills)
@@ -431,13 +434,11 @@ class SeedifyIMCManager(BaseTrader):
         """
         try:
             # Get current user trading stats
-            user_fills = self.info.user_fills(self.exchange.account_address)
-            
             # Calculate current 14d trading volume
             now_ms = int(datetime.now().timestamp() * 1000)
             cutoff_ms = now_ms - (14 * 24 * 60 * 60 * 1000)  # 14 days ago
             
-            recent_fills = [f for f in user_fills if int(f['time']) > cutoff_ms]
+            recent_fills = get_fill_store(self.info.base_url).fills(self.exchange.account_address, start_ms=cutoff_ms + 1)
             total_volume = sum(float(f['px']) * float(f['sz']) for f in recent_fills)
             
             # Calculate maker volume
@@ -584,13 +585,13 @@ class SeedifyIMCManager(BaseTrader):
                 return {"status": "error", "message": "Unable to determine account value"}
             
             # Calculate market volatility
-            candles = self.info.candles_snapshot(coin, "1h", 24)  # 24 hours of hourly candles
+            candles = get_candle_store(self.info.base_url).last(coin, "1h", 24)  # 24 hours of hourly candles
             
             if len(candles) < 12:
                 return {"status": "error", "message": "Insufficient historical data"}
             
             # Calculate hourly returns
-            prices = [float(candle['c']) for candle in candles]
+            prices = candles['c'].tolist()
             returns = [prices[i]/prices[i-1]-1 for i in range(1, len(prices))]
             
             # Calculate volatility (annualized)
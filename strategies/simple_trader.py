@@ -9,6 +9,7 @@ from datetime import datetime
 
 from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
+from hyperliquid.orders import get_order_registry
 from hyperliquid.utils import constants
 
 logger = logging.getLogger(__name__)
@@ -215,7 +216,13 @@ class SimpleTrader:
             if not self.exchange:
                 return {'status': 'error', 'message': 'No exchange connection'}
             
-            result = self.exchange.cancel_by_coin(coin)
+            # Open orders come from the local registry; one bulk cancel for all of them
+            address = self.exchange.vault_address or self.exchange.account_address or self.exchange.wallet.address
+            orders = get_order_registry(self.info.base_url, address).open_orders(coin)
+            if not orders:
+                return {'status': 'success', 'result': None, 'coin': coin}
+            
+            result = self.exchange.bulk_cancel([{'coin': coin, 'oid': order['oid']} for order in orders])
             
             return {
                 'status': 'success' if result.get('status') == 'ok' else 'error',
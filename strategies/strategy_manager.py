@@ -14,6 +14,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database import bot_db
+from hyperliquid.fills import get_fill_store
 
 logger = logging.getLogger(__name__)
 
@@ -350,14 +351,12 @@ class StrategyManager:
             
             # Add real-time data from exchange if available
             if hasattr(self.trading_engine, 'info'):
-                user_fills = self.trading_engine.info.user_fills(self.trading_engine.exchange.account_address)
-                
-                # Calculate recent performance
+                # Calculate recent performance from the shared fill store
                 start_time = self.active[strategy_id]['started_at'] if strategy_id in self.active else datetime.now()
-                recent_fills = [
-                    fill for fill in user_fills 
-                    if datetime.fromtimestamp(int(fill.get('time', 0)) / 1000) > start_time
-                ]
+                recent_fills = get_fill_store(self.trading_engine.info.base_url).fills(
+                    self.trading_engine.exchange.account_address,
+                    start_ms=int(start_time.timestamp() * 1000) + 1
+                )
                 
                 performance.update({
                     'recent_fills': len(recent_fills),
@@ -519,6 +518,7 @@ from datetime import datetime
 
 from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
+from hyperliquid.quantizer import AssetQuantizer
 from hyperliquid.utils import constants
 
 logger = logging.getLogger(__name__)
@@ -577,19 +577,22 @@ class PerUserStrategyManager:
             
             current_price = float(mids[coin])
             
-            # Get L2 book for better price placement
-            l2_book = info.l2_snapshot(coin)
-            
             orders_placed = 0
             
+            # Snap the whole ladder to valid ticks and the size to szDecimals in one pass
+            quantizer = AssetQuantizer(sz_decimals)
+            buy_prices, _ = quantizer.price_ladder(
+                [current_price * (1 - grid_spacing * (i + 1)) for i in range(grid_levels)]
+            )
+            sell_prices, _ = quantizer.price_ladder(
+                [current_price * (1 + grid_spacing * (i + 1)) for i in range(grid_levels)]
+            )
+            formatted_size = quantizer.snap_size(position_size)
+            
             # Place grid orders with proper API format
             for i in range(grid_levels):
                 # Buy orders below market
-                buy_price = current_price * (1 - grid_spacing * (i + 1))
-                buy_price = self._round_to_tick_size(buy_price, coin)
-                
-                # Format size according to szDecimals
-                formatted_size = round(position_size, sz_decimals)
+                buy_price = buy_prices[i]
                 
                 try:
                     # Use Add Liquidity Only (Alo) for guaranteed maker rebates
@@ -610,8 +613,7 @@ class PerUserStrategyManager:
                     logger.error(f"Error placing grid buy order: {e}")
                 
                 # Sell orders above market
-                sell_price = current_price * (1 + grid_spacing * (i + 1))
-                sell_price = self._round_to_tick_size(sell_price, coin)
+                sell_price = sell_prices[i]
                 
                 try:
                     # Method 1: All positional parameters
@@ -642,28 +644,12 @@ class PerUserStrategyManager:
             logger.error(f"Error executing grid trading for user {user_id}: {e}")
             return {'status': 'error', 'message': str(e)}
     
-    def _round_to_tick_size(self, price: float, coin: str) -> float:
+    def _round_to_tick_size(self, price: float, coin: str, sz_decimals: int = 0) -> float:
         """
         Round price to valid tick size according to Hyperliquid specs
-        Prices can have up to 5 significant figures, max 6 decimal places for perps
+        Prices can have up to 5 significant figures and at most 6 - szDecimals decimal places for perps
         """
-        # Get significant figures count
-        price_str = f"{price:.10f}".rstrip('0').rstrip('.')
-        
-        # Handle integer prices (always allowed)
-        if '.' not in price_str:
-            return float(price_str)
-        
-        # For decimal prices, ensure max 5 significant figures
-        if len(price_str.replace('.', '')) > 5:
-            # Round to 5 significant figures
-            from decimal import Decimal, ROUND_HALF_UP
-            d = Decimal(str(price))
-            rounded = d.quantize(Decimal('0.00001'), rounding=ROUND_HALF_UP)
-            price = float(rounded)
-        
-        # Ensure max 6 decimal places for perps (as per API docs)
-        return round(price, 6)
+        return AssetQuantizer(sz_decimals).snap_price(price)
     
     async def execute_profit_bot(self, user_id: int, exchange: Exchange, config: Dict) -> Dict:
         """
@@ -9,6 +9,8 @@ from enum import Enum
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import CallbackContext
 
+from hyperliquid.async_info import AsyncInfo
+
 logger = logging.getLogger(__name__)
 
 class AlertLevel(Enum):
@@ -91,6 +93,10 @@ class SafetyManager:
         # Emergency shutdown flags
         self.emergency_mode: Dict[int, bool] = {}
         
+        # Non-blocking client for the exposure sweep, created on the first sweep
+        self.async_info: Optional[AsyncInfo] = None
+        self.exposure_sweep_concurrency = 16
+        
         # Start background monitoring
         self._start_monitoring_tasks()
 
@@ -555,6 +561,45 @@ Click below to modify individual limits:
             logger.error(f"Error calculating exposure for user {user_id}: {e}")
             return 0.0
 
+    async def _calculate_all_exposures(self, user_ids: List[int]) -> Dict[int, float]:
+        """Calculate the total exposure of many users in one bounded-concurrency sweep
+        
+        Returns:
+            Dict mapping user_id to exposure for every user whose state could be fetched
+        """
+        if not self.wallet_manager or not user_ids:
+            return {}
+        
+        address_to_user = {}
+        for user_id in user_ids:
+            wallet_info = await self.wallet_manager.get_user_wallet(user_id)
+            if wallet_info and wallet_info.get("address"):
+                address_to_user[wallet_info["address"]] = user_id
+        if not address_to_user:
+            return {}
+        
+        if not self.async_info:
+            self.async_info = await AsyncInfo.create(self.wallet_manager.base_url)
+        
+        exposures = {}
+        async for address, user_state in self.async_info.user_states(
+            address_to_user.keys(), concurrency=self.exposure_sweep_concurrency
+        ):
+            user_id = address_to_user[address]
+            if isinstance(user_state, Exception):
+                logger.error(f"Error calculating exposure for user {user_id}: {user_state}")
+                continue
+            
+            total_exposure = 0.0
+            for asset_position in user_state.get("assetPositions", []):
+                position = asset_position.get("position", {})
+                size = abs(float(position.get("szi", 0)))
+                price = float(position.get("entryPx") or 0)
+                total_exposure += size * price
+            exposures[user_id] = total_exposure
+        
+        return exposures
+
     async def _calculate_daily_pnl(self, user_id: int) -> float:
         """Calculate user's daily P&L"""
         try:
@@ -641,10 +686,17 @@ Click below to modify individual limits:
         """Background task to monitor risk limits"""
         while True:
             try:
-                for user_id, limits in self.user_limits.items():
+                # Fetch every exposure the limits need up front instead of one user at a time
+                exposure_users = [
+                    user_id for user_id, limits in list(self.user_limits.items())
+                    if any(limit.enabled and limit.limit_type == LimitType.TOTAL_EXPOSURE for limit in limits.values())
+                ]
+                exposures = await self._calculate_all_exposures(exposure_users)
+                
+                for user_id, limits in list(self.user_limits.items()):
                     # Check if any limits have been breached
                     for limit_key, limit in limits.items():
-                        if limit.enabled and await self._check_limit_breach(user_id, limit):
+                        if limit.enabled and await self._check_limit_breach(user_id, limit, exposures):
                             await self._handle_limit_breach(user_id, limit)
                 
                 await asyncio.sleep(60)  # Check every minute
@@ -759,8 +811,9 @@ Click below to modify individual limits:
         
         return '\n'.join(recommendations)
 
-    async def _check_limit_breach(self, user_id: int, limit: RiskLimit) -> bool:
-        """Check if a specific limit has been breached"""
+    async def _check_limit_breach(self, user_id: int, limit: RiskLimit,
+                                  exposures: Optional[Dict[int, float]] = None) -> bool:
+        """Check if a specific limit has been breached, reading exposure from a sweep when one is given"""
         try:
             if limit.limit_type == LimitType.DAILY_LOSS:
                 daily_pnl = await self._calculate_daily_pnl(user_id)
@@ -769,7 +822,13 @@ Click below to modify individual limits:
                 weekly_pnl = await self._calculate_weekly_pnl(user_id)
                 return weekly_pnl < -limit.value
             elif limit.limit_type == LimitType.TOTAL_EXPOSURE:
-                exposure = await self._calculate_current_exposure(user_id)
+                if exposures is None:
+                    exposure = await self._calculate_current_exposure(user_id)
+                elif user_id in exposures:
+                    exposure = exposures[user_id]
+                else:
+                    # the sweep could not fetch this user; already logged there
+                    return False
                 return exposure > limit.value
             
             return False
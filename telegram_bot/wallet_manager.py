@@ -13,6 +13,7 @@ from eth_account.signers.local import LocalAccount
 
 # Hyperliquid imports
 import example_utils
+from hyperliquid.accounts import enable_account_cache
 from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
 from hyperliquid.utils import constants
@@ -53,6 +54,9 @@ class AgentWalletManager:
         self.wallet_cache = {}
         self.wallet_status_cache = {}
         
+        # Clearinghouse state per address, pushed over webData2 instead of fetched on every portfolio view
+        self.accounts = enable_account_cache(self.base_url)
+        
         # HSM simulation - in production, use proper HSM or KMS
         self._encryption_key = os.environ.get('AGENT_ENCRYPTION_KEY', 'default_encryption_key')
         
@@ -1143,40 +1147,30 @@ class AgentWalletManager:
             }
         
         try:
-            # Get user state
-            info = Info(self.base_url)
-            user_state = info.user_state(wallet_info["address"])
+            # Get user state from the shared account cache (a request only when stale or after a fill)
+            state = self.accounts.state(wallet_info["address"])
             
             # Extract account value
-            margin_summary = user_state.get("marginSummary", {})
-            account_value = float(margin_summary.get("accountValue", 0))
-            available_balance = account_value - float(margin_summary.get("totalMarginUsed", 0))
-            unrealized_pnl = float(margin_summary.get("totalUnrealizedPnl", 0))
+            account_value = state.account_value
+            available_balance = account_value - state.margin_summary.total_margin_used
+            # The margin summary carries no unrealized PnL; sum it over the positions
+            unrealized_pnl = sum(position.unrealized_pnl for position in state.positions.values())
             
             # Get positions
             positions = []
-            for pos_data in user_state.get("assetPositions", []):
-                pos = pos_data.get("position", {})
-                if not pos:
-                    continue
-                
-                coin = pos.get("coin", "Unknown")
-                size = float(pos.get("szi", 0))
-                entry_price = float(pos.get("entryPx", 0))
-                unrealized_pnl_pos = float(pos.get("unrealizedPnl", 0))
-                
-                if abs(size) > 1e-10:  # Only include non-zero positions
+            for position in state.positions.values():
+                if abs(position.szi) > 1e-10:  # Only include non-zero positions
                     positions.append({
-                        "coin": coin,
-                        "size": size,
-                        "entry_price": entry_price,
-                        "unrealized_pnl": unrealized_pnl_pos
+                        "coin": position.coin,
+                        "size": position.szi,
+                        "entry_price": position.entry_px or 0.0,
+                        "unrealized_pnl": position.unrealized_pnl
                     })
             
             # Get recent trades (if available)
             recent_trades = []
             try:
-                fills = info.user_fills(wallet_info["address"])
+                fills = Info(self.base_url, skip_ws=True).user_fills(wallet_info["address"])
                 
                 for fill in fills[:10]:  # Get last 10 fills
                     recent_trades.append({
@@ -0,0 +1,120 @@
+from hyperliquid.accounts import AccountCache
+
+USER = "0x0000000000000000000000000000000000000abc"
+
+
+def clearinghouse_state(t, account_value="1000", szi="1"):
+    return {
+        "time": t,
+        "marginSummary": {"accountValue": account_value},
+        "withdrawable": "500",
+        "assetPositions": [{"position": {"coin": "BTC", "szi": szi, "positionValue": "100", "leverage": {"value": 5}}}],
+    }
+
+
+class FakeApi:
+    def __init__(self, t):
+        self.t = t
+        self.requests = 0
+
+    def post(self, url_path, payload):
+        self.requests += 1
+        return clearinghouse_state(self.t, account_value="2000")
+
+
+class FakeStreams:
+    def __init__(self):
+        self.subscriptions = []
+
+    def subscribe(self, subscription_type, callback, user):
+        self.subscriptions.append((subscription_type, user))
+
+    def connected_for(self, user):
+        return True
+
+
+def make_cache(rest_time=100, streams=None, max_streamed=100):
+    cache = AccountCache("http://accounts.test", streams=streams, max_streamed=max_streamed)
+    cache._api = FakeApi(rest_time)
+    return cache
+
+
+def push(cache, t, **kwargs):
+    cache._on_web_data(
+        {"channel": "webData2", "data": {"user": USER, "clearinghouseState": clearinghouse_state(t, **kwargs)}}
+    )
+
+
+def fills(t, snapshot=False):
+    return {"channel": "userFills", "data": {"user": USER, "isSnapshot": snapshot, "fills": [{"tid": 1, "time": t}]}}
+
+
+def test_pushed_state_is_served_from_memory():
+    cache = make_cache()
+    push(cache, 50)
+    state = cache.state(USER.upper().replace("0X", "0x"))
+    assert state.account_value == 1000 and state.position("BTC").leverage == 5
+    assert cache._api.requests == 0
+    assert cache.stats()["hits"] == 1 and cache.stats()["stream_updates"] == 1
+
+
+def test_missing_state_is_fetched_over_rest_once():
+    cache = make_cache()
+    assert cache.state(USER).account_value == 2000
+    assert cache.state(USER).account_value == 2000
+    assert cache._api.requests == 1
+
+
+def test_overtaken_push_does_not_replace_a_newer_state():
+    cache = make_cache(rest_time=100)
+    cache.state(USER)
+    push(cache, 90, account_value="1")
+    assert cache.state(USER).account_value == 2000
+    push(cache, 110, account_value="3000")
+    assert cache.state(USER).account_value == 3000
+
+
+def test_fill_invalidates_until_a_state_as_of_the_fill_arrives():
+    cache = make_cache(rest_time=100)
+    push(cache, 100)
+    cache._on_fills(fills(120))
+    assert cache.cached(USER) is None
+    # a push sent before the fill still predates it
+    push(cache, 110)
+    assert cache.cached(USER) is None
+    push(cache, 120, account_value="1500")
+    assert cache.cached(USER).account_value == 1500
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_invalidated_state_is_refetched_over_rest():
+    cache = make_cache(rest_time=130)
+    push(cache, 100)
+    cache._on_fills(fills(120))
+    assert cache.state(USER).account_value == 2000
+    assert cache._api.requests == 1
+    assert cache.cached(USER) is not None
+
+
+def test_fill_snapshots_do_not_invalidate():
+    cache = make_cache()
+    push(cache, 100)
+    cache._on_fills(fills(120, snapshot=True))
+    assert cache.cached(USER) is not None
+
+
+def test_stale_state_is_not_served():
+    cache = make_cache()
+    push(cache, 100)
+    cache.max_age = 0
+    assert cache.cached(USER) is None
+
+
+def test_only_max_streamed_users_are_streamed():
+    streams = FakeStreams()
+    cache = make_cache(streams=streams, max_streamed=1)
+    cache.cached(USER)
+    cache.cached("0x0000000000000000000000000000000000000def")
+    cache.cached(USER)
+    assert streams.subscriptions == [("webData2", USER), ("userFills", USER)]
+    assert cache.stats()["streamed"] == 1 and cache.stats()["live"] == 1
@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+import pytest
+
+from hyperliquid.async_info import AsyncInfo
+from hyperliquid.ws_transport import WsResponse
+from trading_engine import agent_factory
+from trading_engine.agent_factory import AgentFactory
+
+BASE_URL = "http://agent-factory.test"
+
+
+class FakeTransport:
+    def __init__(self, balances):
+        self.balances = balances
+        self.users = []
+
+    async def post_async(self, url, payload):
+        await asyncio.sleep(0)
+        user = payload["user"]
+        self.users.append(user)
+        if user not in self.balances:
+            return WsResponse(500, text="upstream timeout")
+        return WsResponse(200, {"marginSummary": {"accountValue": self.balances[user]}})
+
+
+class FakeDb:
+    def __init__(self):
+        self.balances = {}
+
+    async def update_wallet_balance(self, user_id, account_value):
+        self.balances[user_id] = account_value
+
+
+@pytest.fixture
+def factory(monkeypatch, tmp_path):
+    # no network: neither the sync Info nor the database is exercised by the sweep
+    monkeypatch.setattr(agent_factory, "Info", lambda base_url: None)
+    monkeypatch.setattr(agent_factory, "bot_db", FakeDb())
+    monkeypatch.setattr(AgentFactory, "_load_agent_details", lambda self: None)
+    factory = AgentFactory(base_url=BASE_URL)
+    factory.storage_path = str(tmp_path / "agent_wallets.json")
+    factory.agent_details = {
+        1: {"address": "0x1"},
+        2: {"address": "0x2"},
+        3: {"address": "0x3"},
+        4: {"name": "no address yet"},
+    }
+    return factory
+
+
+def sweep(factory, balances, coroutine):
+    async def main():
+        transport = FakeTransport(balances)
+        factory.async_info = AsyncInfo(BASE_URL, transport=transport)
+        return await coroutine(), transport.users
+
+    return asyncio.run(main())
+
+
+def test_refresh_all_balances_sweeps_every_agent_once(factory):
+    balances, users = sweep(factory, {"0x1": "100.5", "0x2": "0", "0x3": "7"}, factory.refresh_all_balances)
+    assert balances == {1: 100.5, 2: 0.0, 3: 7.0}
+    assert sorted(users) == ["0x1", "0x2", "0x3"]
+    assert factory.agent_details[1]["last_balance"] == 100.5
+    assert agent_factory.bot_db.balances == balances
+    with open(factory.storage_path) as f:
+        assert json.load(f)["3"]["last_balance"] == 7.0
+
+
+def test_refresh_all_balances_skips_agents_that_failed(factory):
+    balances, _ = sweep(factory, {"0x1": "100", "0x3": "7"}, factory.refresh_all_balances)
+    assert balances == {1: 100.0, 3: 7.0}
+    assert "last_balance" not in factory.agent_details[2]
+    assert 2 not in agent_factory.bot_db.balances
+
+
+def test_monitor_funds_refreshes_every_balance(factory):
+    result, users = sweep(factory, {"0x1": "100", "0x2": "5"}, factory.monitor_funds)
+    assert result is None
+    assert sorted(users) == ["0x1", "0x2", "0x3"]
+    assert factory.agent_details[1]["last_balance"] == 100.0
+    assert factory.agent_details[2]["last_balance"] == 5.0
+
+
+def test_monitor_funds_survives_a_failed_sweep(factory):
+    async def broken():
+        raise RuntimeError("sweep failed")
+
+    factory.refresh_all_balances = broken
+    assert asyncio.run(factory.monitor_funds()) is None
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from hyperliquid.async_api import AsyncAPI
+from hyperliquid.async_info import AsyncInfo
+from hyperliquid.coalescing import RequestCoalescer
+from hyperliquid.utils.error import ClientError
+from hyperliquid.ws_transport import WsResponse
+
+BASE_URL = "http://async-api.test"
+META = {"universe": [{"name": "BTC", "szDecimals": 5}, {"name": "ETH", "szDecimals": 4}]}
+SPOT_META = {"universe": [], "tokens": []}
+
+
+class FakeTransport:
+    def __init__(self, handler=lambda payload: (200, {"type": payload.get("type")})):
+        self.handler = handler
+        self.requests = []
+
+    def post(self, url, payload):
+        self.requests.append((url, payload))
+        status, body = self.handler(payload)
+        return WsResponse(status, body) if status < 400 else WsResponse(status, text=body)
+
+    async def post_async(self, url, payload):
+        await asyncio.sleep(0)
+        return self.post(url, payload)
+
+
+def test_post_goes_through_the_transport():
+    transport = FakeTransport()
+    api = AsyncAPI(BASE_URL, transport=transport)
+    assert asyncio.run(api.post("/info", {"type": "meta"})) == {"type": "meta"}
+    assert transport.requests == [(BASE_URL + "/info", {"type": "meta"})]
+
+
+def test_error_status_raises():
+    api = AsyncAPI(BASE_URL, transport=FakeTransport(lambda payload: (422, "Failed to deserialize")))
+    with pytest.raises(ClientError) as error:
+        asyncio.run(api.post("/info", {"type": "bogus"}))
+    assert error.value.status_code == 422
+
+
+def test_info_queries_are_awaitable_and_resolve_names():
+    async def main():
+        transport = FakeTransport()
+        info = await AsyncInfo.create(BASE_URL, meta=META, spot_meta=SPOT_META, transport=transport)
+        await info.l2_snapshot("ETH")
+        await info.user_state("0xabc")
+        return info, [payload for _, payload in transport.requests]
+
+    info, payloads = asyncio.run(main())
+    assert info.name_to_asset("ETH") == 1
+    assert payloads == [
+        {"type": "l2Book", "coin": "ETH"},
+        {"type": "clearinghouseState", "user": "0xabc", "dex": ""},
+    ]
+
+
+def test_identical_concurrent_queries_are_sent_once():
+    async def main():
+        transport = FakeTransport()
+        info = AsyncInfo(BASE_URL, coalescer=RequestCoalescer(), transport=transport)
+        results = await asyncio.gather(*(info.meta() for _ in range(3)), info.spot_meta())
+        return results, len(transport.requests)
+
+    results, sent = asyncio.run(main())
+    assert results == [{"type": "meta"}] * 3 + [{"type": "spotMeta"}]
+    assert sent == 2
+
+
+class FakeUserStates:
+    """Stands in for AsyncInfo.user_state, recording how many requests are in flight at once."""
+
+    def __init__(self, fail=(), hold=()):
+        self.fail = set(fail)
+        self.hold = set(hold)
+        self.release = asyncio.Event()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, address, dex=""):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if address in self.hold:
+                await self.release.wait()
+            await asyncio.sleep(0.001)
+            if address in self.fail:
+                raise RuntimeError(f"no state for {address}")
+            return {"user": address, "dex": dex}
+        finally:
+            self.in_flight -= 1
+
+
+def collect_user_states(user_state, addresses, **kwargs):
+    async def main():
+        info = AsyncInfo(BASE_URL, transport=FakeTransport())
+        info.user_state = user_state
+        return [result async for result in info.user_states(addresses, **kwargs)]
+
+    return asyncio.run(main())
+
+
+def test_user_states_are_fetched_concurrently_within_the_bound():
+    user_state = FakeUserStates()
+    addresses = [f"0x{i:040x}" for i in range(12)]
+    results = dict(collect_user_states(user_state, addresses, concurrency=4, dex="xyz"))
+    assert sorted(results) == addresses
+    assert all(state == {"user": address, "dex": "xyz"} for address, state in results.items())
+    assert user_state.max_in_flight == 4
+
+
+def test_user_states_yield_in_completion_order():
+    async def main():
+        user_state = FakeUserStates(hold={"0xslow"})
+        info = AsyncInfo(BASE_URL, transport=FakeTransport())
+        info.user_state = user_state
+        states = info.user_states(["0xslow", "0xfast"])
+        first = await states.__anext__()
+        user_state.release.set()
+        second = await states.__anext__()
+        await states.aclose()
+        return first[0], second[0]
+
+    assert asyncio.run(main()) == ("0xfast", "0xslow")
+
+
+def test_user_state_errors_are_returned_per_address():
+    results = dict(collect_user_states(FakeUserStates(fail={"0xbad"}), ["0xgood", "0xbad"]))
+    assert isinstance(results["0xbad"], RuntimeError)
+    assert results["0xgood"] == {"user": "0xgood", "dex": ""}
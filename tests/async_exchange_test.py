@@ -0,0 +1,80 @@
+import asyncio
+
+import eth_account
+
+from hyperliquid.async_exchange import AsyncExchange
+from hyperliquid.async_info import AsyncInfo
+from hyperliquid.exchange import Exchange
+from hyperliquid.signing_executor import SigningExecutor
+from hyperliquid.ws_transport import WsResponse
+
+BASE_URL = "http://async-exchange.test"
+META = {"universe": [{"name": "BTC", "szDecimals": 5}]}
+SPOT_META = {"universe": [], "tokens": []}
+WALLET = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+NONCE = 1_700_000_000_000
+RESTING = {"status": "ok", "response": {"type": "order", "data": {"statuses": [{"resting": {"oid": 7}}]}}}
+
+
+class FixedNonces:
+    def next(self, signer):
+        return NONCE
+
+
+class FakeTransport:
+    session = None
+
+    def __init__(self):
+        self.payloads = []
+
+    def post(self, url, payload):
+        self.payloads.append(payload)
+        return WsResponse(200, RESTING)
+
+    async def post_async(self, url, payload):
+        await asyncio.sleep(0)
+        return self.post(url, payload)
+
+
+def sync_payload():
+    transport = FakeTransport()
+    exchange = Exchange(
+        WALLET, BASE_URL, meta=META, spot_meta=SPOT_META, transport=transport, nonce_allocator=FixedNonces()
+    )
+    exchange.order("BTC", True, 0.01, 60000, {"limit": {"tif": "Gtc"}})
+    return transport.payloads[0]
+
+
+def async_order(signing_executor=None):
+    async def main():
+        transport = FakeTransport()
+        info = await AsyncInfo.create(BASE_URL, meta=META, spot_meta=SPOT_META, transport=transport)
+        exchange = AsyncExchange(
+            WALLET, info, signing_executor=signing_executor, nonce_allocator=FixedNonces(), transport=transport
+        )
+        invalidated = []
+        exchange._invalidate_caches = lambda action, response: invalidated.append((action["type"], response))
+        response = await exchange.order("BTC", True, 0.01, 60000, {"limit": {"tif": "Gtc"}})
+        return response, transport.payloads, invalidated
+
+    return asyncio.run(main())
+
+
+def test_async_order_posts_the_same_signed_action_as_the_sync_exchange():
+    response, payloads, _ = async_order()
+    assert response == RESTING
+    assert payloads == [sync_payload()]
+
+
+def test_async_order_signed_on_an_executor_posts_the_same_action():
+    executor = SigningExecutor(shards=1)
+    try:
+        _, payloads, _ = async_order(executor)
+    finally:
+        executor.shutdown()
+    assert payloads == [sync_payload()]
+
+
+def test_caches_are_invalidated_once_with_the_awaited_response():
+    _, _, invalidated = async_order()
+    assert invalidated == [("order", RESTING)]
@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+import eth_account
+import pytest
+
+from hyperliquid.batching import AsyncOrderBatcher, OrderBatcher, split_response
+from hyperliquid.exchange import Exchange
+
+META = {"universe": [{"name": "BTC", "szDecimals": 5}]}
+SPOT_META = {"universe": [], "tokens": []}
+
+
+def ok(statuses):
+    return {"status": "ok", "response": {"type": "order", "data": {"statuses": statuses}}}
+
+
+class FakeExchange:
+    def __init__(self):
+        self.actions = []
+
+    def bulk_orders(self, orders, builder=None):
+        self.actions.append(orders)
+        return ok([{"resting": {"oid": i}} for i in range(len(orders))])
+
+
+def order(px):
+    return {"coin": "BTC", "is_buy": True, "sz": 1.0, "limit_px": px, "order_type": {"limit": {"tif": "Gtc"}}}
+
+
+def test_submits_are_merged_and_split():
+    exchange = FakeExchange()
+    batcher = OrderBatcher(exchange, window=10.0)
+    futures = [batcher.submit_order(order(px)) for px in (1.0, 2.0, 3.0)]
+    batcher.flush()
+    assert len(exchange.actions) == 1
+    assert [f.result()["response"]["data"]["statuses"] for f in futures] == [
+        [{"resting": {"oid": 0}}],
+        [{"resting": {"oid": 1}}],
+        [{"resting": {"oid": 2}}],
+    ]
+    assert batcher.stats()["saved"] == 2
+
+
+def test_full_batch_is_sent_without_waiting():
+    exchange = FakeExchange()
+    batcher = OrderBatcher(exchange, window=10.0, max_batch=2)
+    futures = [batcher.submit_order(order(px)) for px in (1.0, 2.0)]
+    assert futures[1].result(timeout=1)["status"] == "ok"
+    assert len(exchange.actions) == 1
+
+
+def test_whole_action_errors_apply_to_every_request():
+    error = {"status": "err", "response": "Insufficient margin"}
+    assert split_response(error, 3) == error
+
+
+def test_sync_order_does_not_wait_for_a_batch_window():
+    exchange = Exchange(eth_account.Account.create(), "http://batching.test", meta=META, spot_meta=SPOT_META)
+    sent = []
+    exchange.bulk_orders = lambda orders, builder=None: sent.append(orders) or ok([{"resting": {"oid": 7}}])
+    exchange.set_batching(True, window=1.0)
+
+    started = time.monotonic()
+    response = exchange.order("BTC", True, 1.0, 100.0, {"limit": {"tif": "Gtc"}})
+    assert time.monotonic() - started < 0.5
+    assert response["response"]["data"]["statuses"] == [{"resting": {"oid": 7}}]
+    assert len(sent) == 1 and exchange.batcher.stats()["requests"] == 0
+
+
+class FailingAsyncExchange:
+    def __init__(self, error=None):
+        self.error = error
+        self.started = asyncio.Event()
+
+    async def bulk_orders(self, orders, builder=None):
+        self.started.set()
+        if self.error is not None:
+            raise self.error
+        await asyncio.Event().wait()
+
+
+def test_async_send_error_is_set_on_every_call():
+    async def main():
+        batcher = AsyncOrderBatcher(FailingAsyncExchange(ValueError("rejected")), window=10.0)
+        futures = [batcher.submit_order(order(px)) for px in (1.0, 2.0)]
+        batcher.flush()
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    assert [str(result) for result in asyncio.run(main())] == ["rejected", "rejected"]
+
+
+def test_cancelled_async_flush_is_not_swallowed():
+    async def main():
+        exchange = FailingAsyncExchange()
+        batcher = AsyncOrderBatcher(exchange, window=10.0)
+        future = batcher.submit_order(order(1.0))
+        batcher.flush()
+        await exchange.started.wait()
+        (flush,) = batcher._flushes
+        flush.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flush
+        return future.cancelled(), flush.cancelled()
+
+    assert asyncio.run(main()) == (True, True)
@@ -0,0 +1,62 @@
+from hyperliquid.candles import CandleSeries
+
+MINUTE = 60_000
+
+
+def candle(i, close=None):
+    close = i if close is None else close
+    return {"t": i * MINUTE, "o": i, "h": i + 1, "l": i - 1, "c": close, "v": 1, "s": "BTC", "i": "1m"}
+
+
+def opens(bars):
+    return [int(t) // MINUTE for t in bars["t"]]
+
+
+def test_last_reads_across_the_ring_wrap():
+    series = CandleSeries("BTC", "1m", capacity=4)
+    for i in range(6):
+        series.apply(candle(i))
+    assert len(series) == 4
+    assert opens(series.last(4)) == [2, 3, 4, 5]
+    assert opens(series.last(3)) == [3, 4, 5]
+    assert opens(series.last(10)) == [2, 3, 4, 5]
+    assert (series.first_time(), series.last_time()) == (2 * MINUTE, 5 * MINUTE)
+
+
+def test_last_is_a_copy():
+    series = CandleSeries("BTC", "1m", capacity=4)
+    for i in range(6):
+        series.apply(candle(i))
+    bars = series.last(2)
+    series.apply(candle(6))
+    assert opens(bars) == [4, 5]
+
+
+def test_newest_bar_is_updated_in_place_after_the_wrap():
+    series = CandleSeries("BTC", "1m", capacity=4)
+    for i in range(5):
+        series.apply(candle(i))
+    series.apply(candle(4, close=42))
+    assert opens(series.last(4)) == [1, 2, 3, 4]
+    assert series.last(1)[-1]["c"] == 42
+
+
+def test_older_history_merged_into_a_wrapped_series_keeps_the_newest_bars():
+    series = CandleSeries("BTC", "1m", capacity=4)
+    for i in range(3, 9):
+        series.apply(candle(i))
+    # an overlapping backfill, including a revised bar
+    series.merge([candle(i, close=100 + i) for i in range(0, 7)])
+    assert opens(series.last(4)) == [5, 6, 7, 8]
+    assert list(series.last(4)["c"]) == [105, 106, 7, 8]
+    series.apply(candle(9))
+    assert opens(series.last(4)) == [6, 7, 8, 9]
+
+
+def test_backfill_into_a_short_series_keeps_every_bar():
+    series = CandleSeries("BTC", "1m", capacity=8)
+    series.apply(candle(5))
+    series.merge([candle(i) for i in range(2, 6)])
+    assert opens(series.last(8)) == [2, 3, 4, 5]
+    series.apply(candle(6))
+    assert opens(series.last(8)) == [2, 3, 4, 5, 6]
@@ -0,0 +1,55 @@
+import threading
+import time
+
+from hyperliquid.coalescing import RequestCoalescer
+
+
+def test_concurrent_identical_calls_share_one_fetch():
+    coalescer = RequestCoalescer()
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(1)
+        return {"ok": True}
+
+    key = RequestCoalescer.key("/info", {"type": "allMids"})
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(coalescer.call(key, fetch))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == [{"ok": True}] * 5
+
+
+def test_ttl_serves_recent_result():
+    coalescer = RequestCoalescer(ttl=60)
+    key = RequestCoalescer.key("/info", {"type": "meta"})
+    assert coalescer.call(key, lambda: 1) == 1
+    assert coalescer.call(key, lambda: 2) == 1
+    assert coalescer.stats()["ttl_hits"] == 1
+
+
+def test_expired_results_of_keys_never_asked_again_are_dropped():
+    coalescer = RequestCoalescer(ttl=0.05)
+    for i in range(100):
+        coalescer.call(RequestCoalescer.key("/info", {"type": "l2Book", "coin": str(i)}), lambda: i)
+    assert coalescer.stats()["cached"] == 100
+    time.sleep(0.06)
+    coalescer.call(RequestCoalescer.key("/info", {"type": "meta"}), lambda: None)
+    assert coalescer.stats()["cached"] == 1
+
+
+def test_remembered_again_key_is_not_dropped_by_its_old_expiry():
+    coalescer = RequestCoalescer(ttl=0.05)
+    key = RequestCoalescer.key("/info", {"type": "meta"})
+    coalescer.call(key, lambda: 1)
+    time.sleep(0.06)
+    coalescer.call(key, lambda: 2)
+    coalescer.call(RequestCoalescer.key("/info", {"type": "other"}), lambda: None)
+    assert coalescer.call(key, lambda: 3) == 2
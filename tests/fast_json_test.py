@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+from hyperliquid.utils import fast_json
+
+PAYLOADS = [
+    {"BTC": "67012.5", "ETH": "3401.15", "@107": "0.000123"},
+    {"coin": "BTC", "time": 1700000000123, "levels": [[{"px": "67000.0", "sz": "1.5", "n": 3}], []]},
+    [{"name": "BTC", "szDecimals": 5, "maxLeverage": 50, "onlyIsolated": False}, None, 1.25, -7],
+    {"user": "0xabc", "fills": [], "isSnapshot": True, "note": "ünïcode ✓"},
+]
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param and not fast_json.HAS_ORJSON:
+        pytest.skip("orjson is not installed")
+    monkeypatch.setattr(fast_json, "HAS_ORJSON", request.param)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_round_trip(backend, payload):
+    assert fast_json.loads(fast_json.dumps(payload)) == payload
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_decodes_like_the_stdlib(backend, payload):
+    raw = json.dumps(payload)
+    for data in (raw, raw.encode("utf-8"), bytearray(raw.encode("utf-8")), memoryview(raw.encode("utf-8"))):
+        assert fast_json.loads(data) == json.loads(raw)
+
+
+def test_dumps_is_compact(backend):
+    assert fast_json.dumps({"a": [1, 2], "b": "c"}) == b'{"a":[1,2],"b":"c"}'
+
+
+def test_invalid_json_raises_a_value_error(backend):
+    with pytest.raises(ValueError):
+        fast_json.loads(b"{not json")
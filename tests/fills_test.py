@@ -0,0 +1,74 @@
+from hyperliquid import fills
+from hyperliquid.fills import AccountFills, FillStore
+
+USER = "0x0000000000000000000000000000000000000abc"
+
+
+def fill(tid, t, coin="BTC"):
+    return {"tid": tid, "time": t, "coin": coin, "px": "100", "sz": "1", "oid": tid, "hash": f"0x{tid}"}
+
+
+class FakeApi:
+    def __init__(self, history):
+        self.history = history
+        self.starts = []
+
+    def post(self, url_path, payload):
+        self.starts.append(payload["startTime"])
+        matching = sorted((f for f in self.history if f["time"] >= payload["startTime"]), key=lambda f: f["time"])
+        return matching[: fills.PAGE_SIZE]
+
+
+def make_store(history):
+    store = FillStore("http://fills.test", stream=False)
+    store._api = FakeApi(history)
+    return store
+
+
+def stream(store, *streamed):
+    store._on_message({"channel": "userFills", "data": {"user": USER, "fills": list(streamed)}})
+
+
+def test_duplicates_are_ingested_once():
+    account = AccountFills(USER)
+    assert account.add([fill(1, 10), fill(2, 20)]) == 2
+    assert account.add([fill(2, 20), fill(3, 15, coin="ETH")]) == 1
+    assert [f["tid"] for f in account.query()] == [1, 3, 2]
+    assert [f["tid"] for f in account.query("ETH")] == [3]
+    assert [f["tid"] for f in account.query(start_ms=15, end_ms=20)] == [3, 2]
+
+
+def test_sync_pages_from_the_cursor(monkeypatch):
+    monkeypatch.setattr(fills, "PAGE_SIZE", 2)
+    store = make_store([fill(i, 10 * i) for i in range(1, 6)])
+    assert store.sync(USER) == 5
+    # startTime is inclusive, so each page starts at the newest fill of the previous one
+    assert store._api.starts == [0, 20, 30, 40, 50]
+    assert store.account(USER).cursor == 50
+
+    store._api.history.append(fill(6, 60))
+    assert store.sync(USER) == 1
+    assert store._api.starts[5:] == [50, 60]
+
+
+def test_streamed_fills_do_not_move_the_cursor():
+    store = make_store([fill(1, 10)])
+    store.sync(USER)
+    # the fill at 20 is missed while the stream reconnects, the one at 30 arrives over it
+    store._api.history += [fill(2, 20), fill(3, 30)]
+    stream(store, fill(3, 30))
+    account = store.account(USER)
+    assert account.cursor == 10
+
+    assert store.sync(USER) == 1
+    assert [f["tid"] for f in account.query()] == [1, 2, 3]
+    assert account.cursor == 30
+
+
+def test_fills_first_seen_on_the_stream_still_advance_the_cursor_on_sync():
+    store = make_store([fill(1, 10)])
+    store.sync(USER)
+    store._api.history.append(fill(2, 20))
+    stream(store, fill(2, 20))
+    assert store.sync(USER) == 0
+    assert store.account(USER).cursor == 20
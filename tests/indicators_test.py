@@ -0,0 +1,125 @@
+import math
+
+import numpy as np
+import pytest
+
+from hyperliquid.indicators import (
+    ADX,
+    ATR,
+    EMA,
+    MACD,
+    RSI,
+    Bollinger,
+    Stochastic,
+    adx_batch,
+    atr_batch,
+    bollinger_batch,
+    ema_batch,
+    macd_batch,
+    rsi_batch,
+    stochastic_batch,
+)
+
+
+def bar(close, spread=1.0):
+    return close + spread, close - spread, close, 1.0
+
+
+def stream(indicator, closes):
+    for close in closes:
+        indicator.update(bar(close))
+    return indicator.value
+
+
+def random_walks(coins=3, n=120, seed=7):
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 1, (coins, n)), axis=1)
+    highs = closes + rng.uniform(0.1, 2, (coins, n))
+    lows = closes - rng.uniform(0.1, 2, (coins, n))
+    # the last coin has a shorter history, left-padded with NaN as universe_bars does
+    for matrix in (closes, highs, lows):
+        matrix[-1, : n // 3] = np.nan
+    return highs, lows, closes
+
+
+def streamed(indicator_cls, highs, lows, closes, row, **kwargs):
+    indicator = indicator_cls(**kwargs)
+    for high, low, close in zip(highs[row], lows[row], closes[row]):
+        if not math.isnan(close):
+            indicator.update((high, low, close, 1.0))
+    return indicator.value
+
+
+def test_ema_is_seeded_with_the_sma():
+    ema = EMA(3)
+    assert math.isnan(stream(ema, [1, 2]))
+    assert stream(ema, [3]) == pytest.approx(2)
+    assert stream(ema, [4, 5]) == pytest.approx(4)
+
+
+def test_peek_does_not_commit_the_bar():
+    ema = EMA(3)
+    stream(ema, [1, 2, 3])
+    assert ema.peek(bar(4)) == pytest.approx(3)
+    assert ema.value == pytest.approx(2)
+
+
+def test_macd_of_a_flat_series_is_zero():
+    assert stream(MACD(fast=3, slow=5, signal=2), [10] * 10) == pytest.approx((0, 0, 0))
+    assert all(math.isnan(x) for x in stream(MACD(fast=3, slow=5, signal=2), [10] * 4))
+
+
+def test_rsi_extremes():
+    assert stream(RSI(3), [1, 2, 3, 4]) == 100
+    assert stream(RSI(3), [4, 3, 2, 1]) == pytest.approx(0)
+    # equal average gains and losses
+    assert stream(RSI(2), [1, 2, 1]) == pytest.approx(50)
+
+
+def test_atr_of_a_constant_range():
+    assert stream(ATR(3), [10, 10, 10, 10]) == pytest.approx(2)
+    # a gap counts from the previous close
+    atr = ATR(1)
+    stream(atr, [10, 20])
+    assert atr.value == pytest.approx(11)
+
+
+def test_adx_of_a_steady_rise_is_all_plus_di():
+    adx, plus_di, minus_di = stream(ADX(3), range(10, 20))
+    assert minus_di == 0 and plus_di > 0
+    assert adx == pytest.approx(100)
+
+
+def test_stochastic():
+    k, d = stream(Stochastic(period=3, smooth=2), [1, 2, 3, 4])
+    # close 4 against high 5 and low 1 over the last three bars
+    assert k == pytest.approx(75) and d == pytest.approx(75)
+
+
+def test_bollinger_bands():
+    assert stream(Bollinger(period=3), [5, 5, 5]) == pytest.approx((5, 5, 5))
+    lower, middle, upper = stream(Bollinger(period=2, k=1), [1, 3])
+    assert (lower, middle, upper) == pytest.approx((1, 2, 3))
+
+
+@pytest.mark.parametrize("row", range(3))
+def test_streaming_and_batch_agree(row):
+    highs, lows, closes = random_walks()
+    assert ema_batch(closes, 10)[row] == pytest.approx(streamed(EMA, highs, lows, closes, row, period=10))
+    assert macd_batch(closes)[0][row] == pytest.approx(streamed(MACD, highs, lows, closes, row)[0])
+    assert macd_batch(closes)[1][row] == pytest.approx(streamed(MACD, highs, lows, closes, row)[1])
+    assert rsi_batch(closes)[row] == pytest.approx(streamed(RSI, highs, lows, closes, row))
+    assert atr_batch(highs, lows, closes)[row] == pytest.approx(streamed(ATR, highs, lows, closes, row))
+    assert adx_batch(highs, lows, closes)[row] == pytest.approx(streamed(ADX, highs, lows, closes, row)[0])
+    assert stochastic_batch(highs, lows, closes)[row] == pytest.approx(
+        streamed(Stochastic, highs, lows, closes, row)[0]
+    )
+    lower, middle, upper = bollinger_batch(closes)
+    assert (lower[row], middle[row], upper[row]) == pytest.approx(streamed(Bollinger, highs, lows, closes, row))
+
+
+def test_batch_is_nan_without_enough_history():
+    closes = np.full((1, 30), np.nan)
+    closes[0, -5:] = [1, 2, 3, 4, 5]
+    assert math.isnan(ema_batch(closes, 10)[0])
+    assert math.isnan(rsi_batch(closes)[0])
@@ -0,0 +1,76 @@
+import threading
+import time
+
+from hyperliquid.info import Info
+
+BASE_URL = "http://info.test"
+META = {"universe": [{"name": "BTC", "szDecimals": 5}]}
+SPOT_META = {"universe": [], "tokens": []}
+
+
+class FakeTransport:
+    session = None
+
+
+class FakeUserState:
+    """Stands in for Info.user_state, recording how many requests are in flight at once."""
+
+    def __init__(self, delay=0.0, fail=(), hold=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.hold = set(hold)
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, address, dex=""):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if address in self.hold:
+                assert self.release.wait(5)
+            time.sleep(self.delay)
+            if address in self.fail:
+                raise RuntimeError(f"no state for {address}")
+            return {"user": address, "dex": dex}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def make_info(user_state):
+    info = Info(BASE_URL, skip_ws=True, meta=META, spot_meta=SPOT_META, transport=FakeTransport())
+    info.user_state = user_state
+    return info
+
+
+def test_user_states_yields_every_address_once():
+    addresses = [f"0x{i:040x}" for i in range(10)]
+    info = make_info(FakeUserState())
+    results = dict(info.user_states(addresses, dex="xyz"))
+    assert sorted(results) == addresses
+    assert all(state == {"user": address, "dex": "xyz"} for address, state in results.items())
+
+
+def test_user_states_yields_in_completion_order():
+    user_state = FakeUserState(hold={"0xslow"})
+    states = make_info(user_state).user_states(["0xslow", "0xfast"])
+    # the slow request is still in flight, so the fast one comes out first
+    assert next(states)[0] == "0xfast"
+    user_state.release.set()
+    assert next(states)[0] == "0xslow"
+
+
+def test_user_states_bounds_requests_in_flight():
+    user_state = FakeUserState(delay=0.02)
+    list(make_info(user_state).user_states([f"0x{i:040x}" for i in range(12)], concurrency=3))
+    assert user_state.max_in_flight == 3
+
+
+def test_user_states_returns_errors_per_address():
+    info = make_info(FakeUserState(fail={"0xbad"}))
+    results = dict(info.user_states(["0xgood", "0xbad", "0xalso-good"]))
+    assert isinstance(results.pop("0xbad"), RuntimeError)
+    assert results == {"0xgood": {"user": "0xgood", "dex": ""}, "0xalso-good": {"user": "0xalso-good", "dex": ""}}
@@ -0,0 +1,64 @@
+import threading
+import time
+
+from hyperliquid.metadata import MetadataRegistry
+
+META = {"universe": [{"name": "BTC", "szDecimals": 5}]}
+SPOT_META = {"universe": [], "tokens": []}
+
+
+class SlowApi:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+        self.listed = False
+
+    def post(self, url_path, payload):
+        self.calls += 1
+        if payload["type"] == "spotMeta":
+            return SPOT_META
+        time.sleep(self.delay)
+        universe = META["universe"] + ([{"name": "NEW", "szDecimals": 2}] if self.listed else [])
+        return {"universe": universe}
+
+
+def make_registry(delay: float = 0.0) -> MetadataRegistry:
+    registry = MetadataRegistry("http://metadata.test")
+    registry._api = SlowApi(delay)
+    registry.snapshot()
+    return registry
+
+
+def test_miss_refresh_picks_up_new_listing():
+    registry = make_registry()
+    registry._api.listed = True
+    assert registry.snapshot().coin_to_asset["NEW"] == 1
+
+
+def test_lookups_do_not_wait_for_a_miss_refresh():
+    registry = make_registry()
+    registry._api.delay = 0.5
+    registry._api.listed = True
+    refresher = threading.Thread(target=registry.refresh_on_miss)
+    refresher.start()
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    snapshot = registry.refresh_on_miss()
+    assert time.monotonic() - started < 0.1
+    assert "NEW" not in dict(snapshot.coin_to_asset)
+    # the registry lock is free while the fetch is in flight
+    assert registry._lock.acquire(timeout=0.1)
+    registry._lock.release()
+
+    refresher.join()
+    assert registry.snapshot().coin_to_asset["NEW"] == 1
+
+
+def test_misses_are_rate_limited():
+    registry = make_registry()
+    calls = registry._api.calls
+    registry.refresh_on_miss()
+    registry.refresh_on_miss()
+    # one refresh is spotMeta + meta
+    assert registry._api.calls == calls + 2
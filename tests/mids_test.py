@@ -0,0 +1,161 @@
+import asyncio
+import threading
+
+import pytest
+
+from hyperliquid import metadata, mids
+from hyperliquid.async_info import AsyncInfo
+from hyperliquid.info import Info
+from hyperliquid.metadata import MetadataRegistry
+from hyperliquid.mids import MidsHub
+from hyperliquid.ws_transport import WsResponse
+
+BASE_URL = "http://mids.test"
+META = {"universe": [{"name": "BTC", "szDecimals": 5}, {"name": "ETH", "szDecimals": 4}]}
+SPOT_META = {"universe": [], "tokens": []}
+REST_MIDS = {"BTC": "101", "ETH": "11"}
+
+
+class FakeApi:
+    def __init__(self):
+        self.requests = 0
+
+    def post(self, url_path, payload):
+        if payload["type"] == "spotMeta":
+            return SPOT_META
+        if payload["type"] == "allMids":
+            self.requests += 1
+            return REST_MIDS
+        return META
+
+
+class FakeFeed:
+    connected = True
+
+    def __init__(self):
+        self.callbacks = {}
+
+    def subscribe(self, channel, callback):
+        self.callbacks[channel] = callback
+
+    def push(self, mids):
+        self.callbacks["allMids"]({"channel": "allMids", "data": {"mids": mids}})
+
+
+class FakeTransport:
+    session = None
+
+    def __init__(self):
+        self.requests = 0
+
+    async def post_async(self, url, payload):
+        self.requests += 1
+        return WsResponse(200, REST_MIDS)
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    registry = MetadataRegistry(BASE_URL)
+    registry._api = FakeApi()
+    monkeypatch.setitem(metadata._registries, (BASE_URL, None), registry)
+    hub = MidsHub(BASE_URL)
+    hub._api = FakeApi()
+    hub.start(FakeFeed())
+    monkeypatch.setitem(mids._hubs, BASE_URL, hub)
+    return hub
+
+
+def make_stale(hub):
+    hub.updated_at -= hub.stale_after + 1
+
+
+def test_fresh_stream_is_served_from_memory(hub):
+    hub.feed.push({"BTC": "100", "ETH": "10"})
+    assert hub.all_mids() == {"BTC": "100", "ETH": "10"}
+    assert hub.price("BTC") == 100.0 and hub.asset_price(1) == 10.0
+    assert hub._api.requests == 0
+    assert hub.stats()["stream_updates"] == 1
+
+
+def test_stale_snapshot_falls_back_to_rest_once(hub):
+    hub.feed.push({"BTC": "100", "ETH": "10"})
+    make_stale(hub)
+    assert hub.latest() is None
+    assert hub.all_mids() == REST_MIDS
+    # the REST response refreshed the hub, so the next read is served from memory
+    assert hub.all_mids() == REST_MIDS
+    assert hub._api.requests == 1
+    assert hub.stats()["rest_updates"] == 1
+
+
+def test_concurrent_readers_of_an_empty_hub_share_one_request(hub):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(hub.all_mids())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [REST_MIDS] * 8
+    assert hub._api.requests == 1
+
+
+def test_info_all_mids_is_served_by_the_hub(hub):
+    info = Info(BASE_URL, skip_ws=True, meta=META, spot_meta=SPOT_META, transport=FakeTransport())
+    hub.feed.push({"BTC": "100"})
+    assert info.all_mids() == {"BTC": "100"}
+    make_stale(hub)
+    assert info.all_mids() == REST_MIDS
+    assert hub._api.requests == 1
+
+
+def test_async_info_refreshes_a_stale_hub_without_blocking(hub):
+    async def main():
+        transport = FakeTransport()
+        info = AsyncInfo(BASE_URL, transport=transport)
+        hub.feed.push({"BTC": "100"})
+        fresh = await info.all_mids()
+        make_stale(hub)
+        refreshed = await info.all_mids()
+        return fresh, refreshed, transport.requests
+
+    assert asyncio.run(main()) == ({"BTC": "100"}, REST_MIDS, 1)
+    # the async refresh went over the client's transport, not the hub's blocking fallback
+    assert hub._api.requests == 0
+    assert hub.latest() == REST_MIDS and hub.stats()["rest_updates"] == 1
+
+
+def test_wait_returns_the_next_update(hub):
+    hub.feed.push({"BTC": "100"})
+    timer = threading.Timer(0.02, hub.feed.push, [{"BTC": "102"}])
+    timer.start()
+    assert hub.wait(timeout=5) == 2
+    assert hub.price("BTC") == 102.0
+
+
+def test_wait_times_out_with_the_current_seq(hub):
+    hub.feed.push({"BTC": "100"})
+    assert hub.wait(timeout=0.01) == 1
+    assert hub.wait(after=0, timeout=0.01) == 1
+
+
+def test_wait_async_is_woken_by_an_update_from_another_thread(hub):
+    async def main():
+        hub.feed.push({"BTC": "100"})
+        timer = threading.Timer(0.02, hub.feed.push, [{"BTC": "102"}])
+        timer.start()
+        woken = await hub.wait_async(timeout=5)
+        already_newer = await hub.wait_async(after=0)
+        timed_out = await hub.wait_async(timeout=0.01)
+        return woken, already_newer, timed_out
+
+    assert asyncio.run(main()) == (2, 2, 2)
+
+
+def test_vector_keeps_columns_and_handed_out_prices(hub):
+    hub.feed.push({"BTC": "100"})
+    _, before = hub.vector()
+    hub.feed.push({"ETH": "10", "NEW": "1"})
+    asset_ids, prices = hub.vector()
+    assert asset_ids.tolist() == [0, 1, -1]
+    assert prices.tolist() == [100.0, 10.0, 1.0]
+    assert before.tolist() == [100.0]
@@ -0,0 +1,66 @@
+import multiprocessing
+import threading
+
+from hyperliquid.nonce import NonceAllocator
+
+SIGNER = "0xAbC0000000000000000000000000000000000001"
+
+
+def allocate(directory, count, results):
+    allocator = NonceAllocator(directory)
+    results.put([allocator.next(SIGNER) for _ in range(count)])
+    allocator.close()
+
+
+def test_nonces_increase_within_a_burst():
+    allocator = NonceAllocator()
+    nonces = [allocator.next(SIGNER) for _ in range(1000)]
+    assert nonces == sorted(set(nonces))
+
+
+def test_signers_are_independent_and_case_insensitive(monkeypatch):
+    monkeypatch.setattr("hyperliquid.nonce.get_timestamp_ms", lambda: 1000)
+    allocator = NonceAllocator()
+    assert allocator.next(SIGNER) == 1000
+    assert allocator.next(SIGNER.lower()) == 1001
+    assert allocator.next("0x0000000000000000000000000000000000000002") == 1000
+
+
+def test_threads_never_share_a_nonce():
+    allocator = NonceAllocator()
+    nonces = []
+    lock = threading.Lock()
+
+    def worker():
+        mine = [allocator.next(SIGNER) for _ in range(500)]
+        with lock:
+            nonces.extend(mine)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(nonces)) == len(nonces)
+
+
+def test_processes_sharing_a_directory_never_share_a_nonce(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [context.Process(target=allocate, args=(str(tmp_path), 300, results)) for _ in range(4)]
+    for process in processes:
+        process.start()
+    nonces = [nonce for _ in processes for nonce in results.get(timeout=60)]
+    for process in processes:
+        process.join()
+    assert len(nonces) == 1200
+    assert len(set(nonces)) == len(nonces)
+
+
+def test_shared_sequence_survives_a_restart(tmp_path):
+    first = NonceAllocator(str(tmp_path))
+    last = max(first.next(SIGNER) for _ in range(2000))
+    first.close()
+    second = NonceAllocator(str(tmp_path))
+    assert second.next(SIGNER) > last
+    second.close()
@@ -0,0 +1,64 @@
+import pytest
+
+from hyperliquid.orderbook import OrderBook
+
+
+def levels(*pairs):
+    return [{"px": str(px), "sz": str(sz), "n": 1} for px, sz in pairs]
+
+
+def make_book(time=1000):
+    book = OrderBook("BTC")
+    book.apply_l2(
+        {
+            "coin": "BTC",
+            "time": time,
+            "levels": [levels((99, 1), (98, 2), (90, 5)), levels((101, 1), (102, 2), (110, 5))],
+        }
+    )
+    return book
+
+
+def test_vwap_walks_the_book():
+    book = make_book()
+    assert book.vwap(True, 1) == pytest.approx(101)
+    assert book.vwap(True, 2) == pytest.approx((101 + 102) / 2)
+    assert book.vwap(False, 3) == pytest.approx((99 + 98 * 2) / 3)
+    # the whole book
+    assert book.vwap(True, 8) == pytest.approx((101 + 102 * 2 + 110 * 5) / 8)
+
+
+def test_vwap_is_none_when_the_book_is_too_thin():
+    book = make_book()
+    assert book.vwap(True, 8.5) is None
+    assert book.vwap(True, 0) is None
+    assert OrderBook("ETH").vwap(True, 1) is None
+
+
+def test_depth_within_counts_levels_near_the_mid():
+    book = make_book()
+    # mid 100: 2% reaches 98 and 102, but not 90 and 110
+    assert book.depth_within(0.02) == pytest.approx((99 + 98 * 2, 101 + 102 * 2))
+    assert book.depth_within(0.001) == (0.0, 0.0)
+    assert OrderBook("ETH").depth_within(0.02) == (0.0, 0.0)
+
+
+def test_newer_bbo_moves_the_top_of_book():
+    book = make_book(time=1000)
+    book.apply_bbo({"coin": "BTC", "time": 1001, "bbo": levels((100, 1), (100.5, 1))})
+    assert (book.best_bid(), book.best_ask()) == (100, 100.5)
+    assert book.mid() == pytest.approx(100.25)
+
+
+def test_newer_snapshot_takes_precedence_over_an_older_bbo():
+    book = make_book(time=1000)
+    book.apply_bbo({"coin": "BTC", "time": 999, "bbo": levels((100, 1), (100.5, 1))})
+    assert (book.best_bid(), book.best_ask()) == (99, 101)
+
+
+def test_empty_bbo_side_has_no_price():
+    book = make_book(time=1000)
+    book.apply_bbo({"coin": "BTC", "time": 1001, "bbo": [levels((99, 1))[0], None]})
+    assert book.best_bid() == 99
+    assert book.best_ask() is None
+    assert book.mid() is None
@@ -0,0 +1,83 @@
+from hyperliquid.orders import OrderRegistry
+
+USER = "0x0000000000000000000000000000000000000abc"
+
+
+def order(oid, timestamp, sz="1.0", coin="BTC"):
+    return {"coin": coin, "oid": oid, "side": "B", "limitPx": "100", "sz": sz, "timestamp": timestamp}
+
+
+class FakeApi:
+    def __init__(self, orders):
+        self.orders = orders
+
+    def post(self, url_path, payload):
+        return list(self.orders)
+
+
+class FakeStreams:
+    def __init__(self):
+        self.subscribed = []
+
+    def subscribe(self, subscription_type, callback, user):
+        self.subscribed.append((subscription_type, user))
+        return len(self.subscribed)
+
+    def connected_for(self, user):
+        return True
+
+
+def make_registry(orders=()):
+    registry = OrderRegistry("http://orders.test", USER, stream=False)
+    registry._api = FakeApi(orders)
+    return registry
+
+
+def snapshot(registry, orders, as_of):
+    registry._on_web_data({"data": {"user": USER, "clearinghouseState": {"time": as_of}, "openOrders": orders}})
+
+
+def fills(registry, *fills):
+    registry._on_fills({"data": {"user": USER, "fills": list(fills)}})
+
+
+def test_user_streams_are_shared_keyed_channels():
+    streams = FakeStreams()
+    registry = OrderRegistry("http://orders.test", USER.upper().replace("0X", "0x"), streams=streams)
+    assert streams.subscribed == [("webData2", USER), ("userFills", USER)]
+    assert registry.stats()["live"]
+
+
+def test_snapshot_replaces_orders_but_keeps_newer_ones():
+    registry = make_registry()
+    snapshot(registry, [order(1, 10), order(2, 20)], as_of=100)
+    registry._add(order(3, 150), 150)
+    snapshot(registry, [order(2, 20)], as_of=120)
+    assert sorted(o["oid"] for o in registry.open_orders()) == [2, 3]
+    assert registry.status(1) == "closed"
+
+
+def test_fills_shrink_and_close_orders():
+    registry = make_registry()
+    snapshot(registry, [order(1, 10, sz="2.0")], as_of=100)
+    fills(registry, {"tid": 1, "oid": 1, "sz": "0.5", "time": 110})
+    fills(registry, {"tid": 1, "oid": 1, "sz": "0.5", "time": 110})
+    assert registry.get(1)["sz"] == "1.5"
+    fills(registry, {"tid": 2, "oid": 1, "sz": "1.5", "time": 120})
+    assert registry.status(1) == "filled"
+
+
+def test_fills_already_in_the_snapshot_are_not_applied_twice():
+    registry = make_registry()
+    snapshot(registry, [order(1, 10, sz="1.5")], as_of=100)
+    fills(registry, {"tid": 1, "oid": 1, "sz": "0.5", "time": 90})
+    assert registry.get(1)["sz"] == "1.5"
+
+
+def test_closed_orders_are_not_resurrected_by_a_late_resync():
+    registry = make_registry([order(1, 10)])
+    snapshot(registry, [order(1, 10, sz="1.0")], as_of=100)
+    fills(registry, {"tid": 1, "oid": 1, "sz": "1.0", "time": 110})
+    registry.resync()
+    assert registry.status(1) == "filled"
+    assert registry.open_orders() == []
@@ -0,0 +1,57 @@
+from hyperliquid.utils.parsers import (
+    PERP_CTX_FIELDS,
+    parse_asset_ctxs,
+    parse_l2_levels,
+    parse_mids,
+    parse_spot_asset_ctxs,
+)
+
+PAYLOAD_MIDS = {"BTC": "67012.5", "ETH": "3401.15", "@107": "0.000123"}
+
+
+def test_parsed_mids_match_the_raw_strings():
+    raw = PAYLOAD_MIDS
+    mids = parse_mids(raw)
+    assert len(mids) == 3 and "BTC" in mids and "SOL" not in mids
+    assert [mids[coin] for coin in raw] == [float(px) for px in raw.values()]
+    assert mids.get("SOL") is None and mids.get("SOL", 1.0) == 1.0
+
+
+def test_parsed_l2_levels():
+    raw = {
+        "coin": "BTC",
+        "time": 5,
+        "levels": [
+            [{"px": "99.5", "sz": "2", "n": 1}, {"px": "99", "sz": "1", "n": 4}],
+            [{"px": "100.5", "sz": "3", "n": 2}],
+        ],
+    }
+    book = parse_l2_levels(raw)
+    assert (book.coin, book.time) == ("BTC", 5)
+    assert (book.best_bid(), book.best_ask(), book.mid()) == (99.5, 100.5, 100.0)
+    assert list(book.bid_n) == [1, 4]
+    assert book.depth(1) == (99.5 * 2, 100.5 * 3)
+    assert book.depth(5) == (99.5 * 2 + 99, 100.5 * 3)
+    empty = parse_l2_levels({"levels": [[], []]})
+    assert (empty.best_bid(), empty.best_ask(), empty.mid()) == (None, None, None)
+
+
+def test_parsed_asset_ctxs_follow_the_universe():
+    meta = {"universe": [{"name": "BTC"}, {"name": "ETH"}, {"name": "NEW"}]}
+    ctxs = [
+        {"markPx": "67000", "midPx": "67000.5", "funding": "0.0000125", "openInterest": "10"},
+        {"markPx": "3400", "midPx": None, "funding": "-0.00001", "openInterest": "20"},
+    ]
+    parsed = parse_asset_ctxs([meta, ctxs])
+    assert parsed.names == ["BTC", "ETH"] and parsed.fields == PERP_CTX_FIELDS
+    assert parsed.value("BTC", "funding") == 0.0000125
+    assert list(parsed["markPx"]) == [67000.0, 3400.0]
+    row = parsed.row("ETH")
+    assert row["openInterest"] == 20.0 and row["midPx"] != row["midPx"] and row["oraclePx"] != row["oraclePx"]
+
+
+def test_parsed_spot_asset_ctxs_use_their_own_coin():
+    ctxs = [{"coin": "PURR/USDC", "markPx": "0.2"}, {"coin": "@107", "markPx": "31.5", "circulatingSupply": "5"}]
+    parsed = parse_spot_asset_ctxs([{"universe": []}, ctxs])
+    assert parsed.names == ["PURR/USDC", "@107"]
+    assert parsed.index("@107") == 1 and parsed.value("@107", "circulatingSupply") == 5.0
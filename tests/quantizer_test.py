@@ -0,0 +1,67 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from hyperliquid.quantizer import AssetQuantizer
+from hyperliquid.utils.signing import float_to_wire
+
+
+def reference_float_to_wire(x: float) -> str:
+    rounded = f"{x:.8f}"
+    if abs(float(rounded) - x) >= 1e-12:
+        raise ValueError("float_to_wire causes rounding", x)
+    return f"{Decimal(rounded).normalize():f}"
+
+
+def test_float_to_wire_matches_decimal_normalize():
+    rng = random.Random(7)
+    values = [0.0, -0.0, 1.0, 100.0, 1e20, 0.1, 0.00000001, 123.45, -7.5]
+    values += [round(rng.uniform(-1e6, 1e6), rng.randint(0, 8)) for _ in range(5000)]
+    for x in values:
+        assert float_to_wire(x) == reference_float_to_wire(x), x
+
+
+def test_float_to_wire_rejects_excess_precision():
+    with pytest.raises(ValueError):
+        float_to_wire(0.123456789)
+
+
+def test_price_rounding():
+    perp = AssetQuantizer(sz_decimals=2)
+    assert perp.price(1234.567) == (1234.6, "1234.6")
+    assert perp.price(0.0123456) == (0.0123, "0.0123")
+    # integer prices are valid whatever their number of significant figures
+    assert perp.price(123456.7) == (123457.0, "123457")
+    spot = AssetQuantizer(sz_decimals=2, is_spot=True)
+    assert spot.price(0.000123456) == (0.000123, "0.000123")
+    with pytest.raises(ValueError):
+        perp.price(0.0)
+
+
+def test_size_rounding():
+    quantizer = AssetQuantizer(sz_decimals=3)
+    assert quantizer.size(1.23456) == (1.235, "1.235")
+    assert quantizer.size(2.0) == (2.0, "2")
+    assert AssetQuantizer(sz_decimals=0).size(4.6) == (5.0, "5")
+
+
+def test_wire_strings_match_float_to_wire():
+    rng = random.Random(11)
+    for sz_decimals in range(6):
+        quantizer = AssetQuantizer(sz_decimals)
+        for _ in range(500):
+            px, px_wire = quantizer.price(10 ** rng.uniform(-3, 6))
+            sz, sz_wire = quantizer.size(rng.uniform(0, 1000))
+            assert px_wire == float_to_wire(px)
+            assert sz_wire == float_to_wire(sz)
+
+
+def test_ladders_match_scalar_path():
+    quantizer = AssetQuantizer(sz_decimals=1)
+    prices = [0.5 + i * 37.3 for i in range(50)]
+    sizes = [0.05 + i * 0.37 for i in range(50)]
+    snapped = [quantizer.price(px) for px in prices]
+    assert quantizer.price_ladder(prices) == ([px for px, _ in snapped], [wire for _, wire in snapped])
+    snapped = [quantizer.size(sz) for sz in sizes]
+    assert quantizer.size_ladder(sizes) == ([sz for sz, _ in snapped], [wire for _, wire in snapped])
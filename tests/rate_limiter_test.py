@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+import pytest
+
+from hyperliquid.rate_limiter import (
+    Priority,
+    RateLimiter,
+    RateLimitShed,
+    request_lane,
+    request_priority,
+    request_weight,
+    response_weight,
+)
+
+
+def test_weights():
+    assert request_weight("/info", {"type": "l2Book", "coin": "BTC"}) == 2
+    assert request_weight("/info", {"type": "userRole", "user": "0x0"}) == 60
+    assert request_weight("/info", {"type": "meta"}) == 20
+    assert request_weight("/exchange", {"action": {"type": "order", "orders": [{}] * 80}}) == 3
+    assert response_weight("/info", {"type": "userFills"}, [{}] * 45) == 2
+    assert response_weight("/info", {"type": "meta"}, [{}] * 45) == 0
+
+
+def test_lanes():
+    assert request_lane("/exchange", {"action": {"type": "cancel"}}) == Priority.CRITICAL
+    assert request_lane("/exchange", {"action": {"type": "order"}}) == Priority.ORDER
+    assert request_lane("/info", {"type": "meta"}) == Priority.INFO
+    with request_priority(Priority.ANALYTICS):
+        assert request_lane("/info", {"type": "meta"}) == Priority.ANALYTICS
+
+
+def drained_limiter() -> RateLimiter:
+    limiter = RateLimiter(ip_weight_per_minute=60)
+    limiter.ip_bucket.tokens = 0
+    return limiter
+
+
+def test_analytics_is_shed_after_its_max_wait():
+    limiter = RateLimiter(ip_weight_per_minute=60, lane_max_wait={lane: 0.05 for lane in Priority})
+    limiter.ip_bucket.tokens = 0
+    with pytest.raises(RateLimitShed):
+        limiter.acquire(20, Priority.ANALYTICS)
+    assert limiter.stats()["lanes"]["analytics"]["shed"] == 1
+
+
+@pytest.mark.parametrize("lane", [Priority.INFO, Priority.ANALYTICS])
+def test_sync_query_on_event_loop_is_shed_instead_of_sleeping(lane):
+    limiter = drained_limiter()
+
+    async def request():
+        started = time.monotonic()
+        with pytest.raises(RateLimitShed):
+            limiter.acquire(2, lane)
+        return time.monotonic() - started
+
+    assert asyncio.run(request()) < 0.05
+
+
+@pytest.mark.parametrize("lane", [Priority.CRITICAL, Priority.ORDER])
+def test_sync_cancel_or_order_on_event_loop_overdraws_instead_of_sleeping(lane):
+    limiter = drained_limiter()
+
+    async def request():
+        started = time.monotonic()
+        limiter.acquire(2, lane, address="0xABC")
+        return time.monotonic() - started
+
+    assert asyncio.run(request()) < 0.05
+    assert limiter.ip_bucket.tokens < 0
+    assert limiter.address_buckets["0xabc"].tokens == limiter.address_capacity - 1
+    stats = limiter.stats()["lanes"][lane.name.lower()]
+    assert (stats["sent"], stats["overdrawn"], stats["shed"]) == (1, 1, 0)
+    # the debt is waited off by the next request off the loop
+    limiter.lane_max_wait = {lane: 0.05 for lane in Priority}
+    with pytest.raises(RateLimitShed):
+        limiter.acquire(1, Priority.CRITICAL)
+
+
+def test_critical_wait_is_bounded():
+    limiter = RateLimiter(ip_weight_per_minute=60, lane_max_wait={lane: 0.05 for lane in Priority})
+    limiter.ip_bucket.tokens = -100
+    with pytest.raises(RateLimitShed):
+        limiter.acquire(1, Priority.CRITICAL)
+    assert RateLimiter().lane_max_wait[Priority.CRITICAL] is not None
+
+
+def test_async_acquire_lets_other_tasks_run():
+    limiter = drained_limiter()
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        # the bucket refills one weight per second
+        await limiter.acquire_async(1, Priority.CRITICAL)
+        await task
+
+    asyncio.run(main())
+    assert len(ticks) == 5
@@ -0,0 +1,83 @@
+import asyncio
+import gzip
+import os
+
+import pytest
+
+from hyperliquid.recording import Cassette, Recorder, ReplayConnection, ReplayMiss, ReplayTransport
+
+URL = "http://replay.test/exchange"
+WS_URL = "ws://replay.test/ws"
+
+
+def order_action(px, nonce):
+    return {"action": {"type": "order", "orders": [{"p": px}]}, "nonce": nonce, "signature": {"r": hex(nonce)}}
+
+
+def record(directory, segment_events=100000):
+    recorder = Recorder(str(directory), segment_events=segment_events)
+    recorder.http(URL, order_action("100", 1), 200, b'{"n": 1}', {}, 0.5)
+    recorder.http(URL, order_action("100", 2), 200, b'{"n": 2}', {}, 0.5)
+    recorder.http(URL, order_action("101", 3), 200, b'{"n": 3}', {}, 0.5)
+    recorder.post("info", {"type": "l2Book", "coin": "BTC"}, {"type": "info", "payload": "book"}, 0.1)
+    conn = recorder.open_connection(WS_URL)
+    recorder.frame(conn, "send", '{"method": "subscribe"}')
+    recorder.frame(conn, "recv", '{"channel": "a"}')
+    recorder.frame(conn, "recv", b'{"channel": "b"}')
+    recorder.close()
+    return recorder
+
+
+def replay(directory):
+    return ReplayTransport(Cassette(str(directory)), speed=0)
+
+
+def test_requests_match_without_their_nonce_and_signature(tmp_path):
+    record(tmp_path)
+    transport = replay(tmp_path)
+    assert transport.post(URL, order_action("100", 99)).data == {"n": 1}
+    assert transport.post(URL, order_action("100", 100)).data == {"n": 2}
+    # once the recorded responses run out, the last one repeats
+    assert transport.post(URL, order_action("100", 101)).data == {"n": 2}
+    assert transport.post(URL, order_action("101", 102)).data == {"n": 3}
+
+
+def test_unrecorded_requests_fall_back_to_their_type(tmp_path):
+    record(tmp_path)
+    transport = replay(tmp_path)
+    assert transport.post(URL, order_action("250", 7)).data == {"n": 1}
+    assert transport.request("info", {"type": "l2Book", "coin": "ETH"}) == {"type": "info", "payload": "book"}
+    with pytest.raises(ReplayMiss):
+        transport.post(URL, {"action": {"type": "cancel"}, "nonce": 1})
+    with pytest.raises(ReplayMiss):
+        transport.post("http://replay.test/info", {"type": "meta"})
+    assert transport.stats()["misses"] == 2
+
+
+def test_websocket_frames_replay_in_order(tmp_path):
+    record(tmp_path)
+    cassette = Cassette(str(tmp_path))
+    connection = ReplayConnection(cassette.connection(WS_URL), speed=0)
+
+    async def receive():
+        return [await connection.recv(), await connection.recv()]
+
+    assert asyncio.run(receive()) == ['{"channel": "a"}', '{"channel": "b"}']
+    # each recorded connection is replayed once
+    assert cassette.connection(WS_URL) == []
+
+
+def test_segments_roll_over_and_truncated_tails_are_skipped(tmp_path):
+    recorder = record(tmp_path, segment_events=3)
+    assert recorder.segments == 3
+    # a segment whose recorder died mid-write: one complete event, then a cut-off gzip stream
+    path = os.path.join(tmp_path, "segment-99999999T999999-x.jsonl.gz")
+    with gzip.open(path, "wb") as segment:
+        segment.write(b'{"kind": "ws_open", "url": "ws://other.test/ws", "conn": "x", "t": 0}\n' * 50)
+    with open(path, "rb") as segment:
+        data = segment.read()
+    with open(path, "wb") as segment:
+        segment.write(data[:-12])
+    cassette = Cassette(str(tmp_path))
+    assert cassette.events >= recorder.events == 8
+    assert cassette.connection(WS_URL) != []
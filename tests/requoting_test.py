@@ -0,0 +1,97 @@
+from hyperliquid.requoting import Requoter, diff_quotes
+
+
+def order(is_buy, px, sz=1.0, coin="BTC"):
+    return {
+        "coin": coin,
+        "is_buy": is_buy,
+        "sz": sz,
+        "limit_px": px,
+        "order_type": {"limit": {"tif": "Alo"}},
+        "reduce_only": False,
+    }
+
+
+def resting(side, px, sz="1.0", oid=0, coin="BTC"):
+    return {"coin": coin, "side": side, "limitPx": px, "sz": sz, "oid": oid}
+
+
+def ok(statuses):
+    return {"status": "ok", "response": {"type": "order", "data": {"statuses": statuses}}}
+
+
+def test_unchanged_levels_are_kept():
+    diff = diff_quotes(
+        [order(True, 99.0), order(False, 101.0)], [resting("B", "99", oid=1), resting("A", "101.0", oid=2)]
+    )
+    assert [r["oid"] for r in diff.keep] == [1, 2]
+    assert not diff.modify and not diff.place and not diff.cancel
+    assert diff.actions() == 0
+
+
+def test_moved_levels_are_paired_closest_to_mid_first():
+    desired = [order(True, 98.5), order(True, 97.5)]
+    live = [resting("B", "97", oid=1), resting("B", "98", oid=2), resting("B", "96", oid=3)]
+    diff = diff_quotes(desired, live)
+    assert [(r["oid"], o["limit_px"]) for r, o in diff.modify] == [(2, 98.5), (1, 97.5)]
+    assert [r["oid"] for r in diff.cancel] == [3]
+    assert diff.place == []
+
+
+def test_sides_and_coins_are_never_paired():
+    diff = diff_quotes([order(False, 101.0), order(True, 10.0, coin="ETH")], [resting("B", "99", oid=1)])
+    assert [r["oid"] for r in diff.cancel] == [1]
+    assert len(diff.place) == 2 and not diff.modify
+
+
+def test_size_change_is_a_modify():
+    diff = diff_quotes([order(True, 99.0, sz=2.0)], [resting("B", "99", sz="1.0", oid=1)])
+    assert [r["oid"] for r, _ in diff.modify] == [1]
+
+
+class FakeExchange:
+    def __init__(self, accepted=None):
+        # orders beyond the first `accepted` of a bulk action are rejected
+        self.accepted = accepted
+        self.calls = []
+
+    def bulk_cancel(self, cancels):
+        self.calls.append(("cancel", cancels))
+        return ok(["success"] * len(cancels))
+
+    def bulk_modify_orders_new(self, modifies):
+        self.calls.append(("modify", modifies))
+        return ok([{"resting": {"oid": 100 + i}} for i in range(len(modifies))])
+
+    def bulk_orders(self, orders):
+        self.calls.append(("order", orders))
+        accepted = len(orders) if self.accepted is None else self.accepted
+        return ok(
+            [{"resting": {"oid": 200 + i}} if i < accepted else {"error": "post only"} for i in range(len(orders))]
+        )
+
+
+def test_requote_sends_one_action_per_group_and_returns_what_rests():
+    exchange = FakeExchange(accepted=1)
+    requoter = Requoter(exchange)
+    desired = [order(True, 99.0), order(True, 98.0), order(False, 101.0), order(False, 102.0), order(False, 103.0)]
+    live = [resting("B", "99", oid=1), resting("B", "97", oid=2), resting("B", "96", oid=3), resting("A", "101", oid=4)]
+    result = requoter.requote(desired, live)
+
+    assert [kind for kind, _ in exchange.calls] == ["cancel", "modify", "order"]
+    assert exchange.calls[0][1] == [{"coin": "BTC", "oid": 3}]
+    assert result["requests"] == 3
+    assert result["requests_saved"] == 9 - 3
+    assert sorted(r["oid"] for r in result["live"]) == [1, 4, 100, 200]
+    moved = next(r for r in result["live"] if r["oid"] == 100)
+    assert (moved["side"], moved["limitPx"]) == ("B", "98")
+    assert requoter.stats()["kept"] == 2
+
+
+def test_requote_of_the_same_ladder_sends_nothing():
+    exchange = FakeExchange()
+    requoter = Requoter(exchange)
+    desired = [order(True, 99.0), order(False, 101.0)]
+    first = requoter.requote(desired, [])
+    second = requoter.requote(desired, first["live"])
+    assert second["requests"] == 0 and second["kept"] == 2
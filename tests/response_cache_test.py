@@ -0,0 +1,92 @@
+import time
+
+import eth_account
+
+from hyperliquid.exchange import Exchange
+from hyperliquid.info import Info
+from hyperliquid.response_cache import ResponseCache, enable_response_cache
+
+USER = "0x0000000000000000000000000000000000000AbC"
+OTHER = "0x0000000000000000000000000000000000000def"
+META = {"universe": [{"name": "BTC", "szDecimals": 5}]}
+SPOT_META = {"universe": [], "tokens": []}
+
+
+def fees(user):
+    return {"type": "userFees", "user": user}
+
+
+def test_hits_until_the_ttl_expires():
+    cache = ResponseCache(ttls={"userFees": 0.05})
+    cache.put(fees(USER), {"fee": 1})
+    assert cache.get(fees(USER)) == (True, {"fee": 1})
+    time.sleep(0.06)
+    assert cache.get(fees(USER)) == (False, None)
+    assert not cache.cacheable("/info", {"type": "l2Book", "coin": "BTC"})
+
+
+def test_invalidation_drops_only_that_user():
+    cache = ResponseCache()
+    cache.put(fees(USER), 1)
+    cache.put(fees(OTHER), 2)
+    cache.put({"type": "meta"}, 3)
+    assert cache.invalidate_user(USER.lower()) == 1
+    assert cache.get(fees(USER))[0] is False
+    assert cache.get(fees(OTHER)) == (True, 2)
+    assert cache.get({"type": "meta"}) == (True, 3)
+
+
+def test_response_fetched_before_an_invalidation_is_not_cached():
+    cache = ResponseCache()
+    version = cache.version(fees(USER))
+    cache.invalidate_user(USER)
+    cache.put(fees(USER), "stale", version)
+    assert cache.get(fees(USER)) == (False, None)
+
+    cache.put(fees(USER), "fresh", cache.version(fees(USER)))
+    assert cache.get(fees(USER)) == (True, "fresh")
+    # versions are per user
+    cache.put(fees(OTHER), "other", version)
+    assert cache.get(fees(OTHER)) == (True, "other")
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = ResponseCache()
+    cache.put(fees(USER), "x" * 100)
+    cache.max_bytes = cache.bytes * 2 + 10
+    cache.put(fees(OTHER), "x" * 100)
+    cache.get(fees(USER))
+    cache.put({"type": "meta"}, "x" * 100)
+    assert cache.get(fees(OTHER))[0] is False
+    assert cache.get(fees(USER))[0] is True
+    assert cache.stats()["evictions"] == 1
+
+
+def test_info_does_not_cache_a_response_raced_by_an_action():
+    cache = ResponseCache()
+    info = Info("http://cache.test", True, META, SPOT_META, response_cache=cache)
+    calls = []
+
+    def fetch(url_path, payload):
+        calls.append(payload)
+        if len(calls) == 1:
+            # an order of USER lands while the first query is in flight
+            cache.invalidate_user(USER)
+        return {"calls": len(calls)}
+
+    info._fetch = fetch
+    assert info.post("/info", fees(USER)) == {"calls": 1}
+    assert info.post("/info", fees(USER)) == {"calls": 2}
+    assert info.post("/info", fees(USER)) == {"calls": 2}
+
+
+def test_exchange_actions_invalidate_both_sides_of_a_transfer():
+    cache = enable_response_cache("http://cache-exchange.test")
+    exchange = Exchange(eth_account.Account.create(), "http://cache-exchange.test", meta=META, spot_meta=SPOT_META)
+    cache.put(fees(exchange.wallet.address), 1)
+    cache.put(fees(OTHER), 2)
+
+    exchange._invalidate_caches({"type": "usdSend", "destination": OTHER}, {"status": "err", "response": "no"})
+    assert cache.stats()["entries"] == 2
+    exchange._invalidate_caches({"type": "usdSend", "destination": OTHER}, {"status": "ok"})
+    assert cache.stats()["entries"] == 0
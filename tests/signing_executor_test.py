@@ -0,0 +1,72 @@
+import random
+import time
+
+import eth_account
+import pytest
+
+import hyperliquid.signing_executor as signing_executor
+from hyperliquid.signing_executor import SigningExecutor
+from hyperliquid.utils.signing import sign_l1_action
+
+WALLETS = [eth_account.Account.from_key(bytes([i + 1]) * 32) for i in range(6)]
+
+
+def cancel_action(oid):
+    return {"type": "cancel", "cancels": [{"a": 1, "o": oid}]}
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_executor_signatures_match_inline_signing(processes):
+    executor = SigningExecutor(shards=2, processes=processes)
+    try:
+        jobs = [(wallet, cancel_action(i), 1_700_000_000_000 + i) for i, wallet in enumerate(WALLETS * 2)]
+        futures = [executor.submit_l1_action(wallet, action, None, nonce, None, True) for wallet, action, nonce in jobs]
+        signatures = [future.result(30) for future in futures]
+    finally:
+        executor.shutdown()
+    assert signatures == [sign_l1_action(wallet, action, None, nonce, None, True) for wallet, action, nonce in jobs]
+    # in process mode each key is handed to its shard once
+    assert sum(len(registered) for registered in executor._registered) == (len(WALLETS) if processes else 0)
+    stats = executor.stats()
+    assert (stats["submitted"], stats["signed"], stats["failed"], stats["in_flight"]) == (12, 12, 0, 0)
+    assert stats["mode"] == ("processes" if processes else "threads")
+
+
+def test_one_signers_jobs_are_signed_in_submission_order(monkeypatch):
+    signed = []
+
+    def slow_sign(wallet, action, active_pool, nonce, expires_after, is_mainnet):
+        time.sleep(random.random() / 1000)
+        signed.append((wallet.address, nonce))
+        return nonce
+
+    monkeypatch.setattr(signing_executor, "sign_l1_action", slow_sign)
+    executor = SigningExecutor(shards=3)
+    try:
+        futures = [
+            executor.submit_l1_action(wallet, cancel_action(nonce), None, nonce, None, True)
+            for nonce in range(50)
+            for wallet in WALLETS
+        ]
+        for future in futures:
+            future.result(10)
+    finally:
+        executor.shutdown()
+    for wallet in WALLETS:
+        assert [nonce for address, nonce in signed if address == wallet.address] == list(range(50))
+
+
+def test_failed_signatures_are_counted(monkeypatch):
+    def failing_sign(*args):
+        raise ValueError("bad action")
+
+    monkeypatch.setattr(signing_executor, "sign_l1_action", failing_sign)
+    executor = SigningExecutor(shards=1)
+    try:
+        future = executor.submit_l1_action(WALLETS[0], cancel_action(1), None, 1, None, True)
+        with pytest.raises(ValueError):
+            future.result(10)
+    finally:
+        executor.shutdown()
+    stats = executor.stats()
+    assert (stats["submitted"], stats["signed"], stats["failed"], stats["in_flight"]) == (1, 0, 1, 0)
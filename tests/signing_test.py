@@ -0,0 +1,82 @@
+import eth_account
+import pytest
+
+from hyperliquid.utils.signing import (
+    action_hash,
+    construct_phantom_agent,
+    float_to_int_for_hashing,
+    l1_payload,
+    order_request_to_order_wire,
+    order_wires_to_order_action,
+    recover_agent_or_user_from_l1_action,
+    sign_inner,
+    sign_l1_action,
+)
+
+WALLET = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+VAULT = "0x1719884eb866cb12b2287399b15f7db5e7d775ea"
+NONCE = 1_700_000_000_000
+
+ORDER_ACTION = order_wires_to_order_action(
+    [
+        order_request_to_order_wire(
+            {
+                "coin": "ETH",
+                "is_buy": True,
+                "sz": 0.0147,
+                "limit_px": 1670.1,
+                "order_type": {"limit": {"tif": "Gtc"}},
+                "reduce_only": False,
+            },
+            1,
+        )
+    ]
+)
+CANCEL_ACTION = {"type": "cancel", "cancels": [{"a": 1, "o": 123456789}]}
+
+
+def encode_typed_data_sign_l1_action(wallet, action, active_pool, nonce, expires_after, is_mainnet):
+    # the generic EIP-712 path sign_l1_action replaced
+    hash = action_hash(action, active_pool, nonce, expires_after)
+    return sign_inner(wallet, l1_payload(construct_phantom_agent(hash, is_mainnet)))
+
+
+@pytest.mark.parametrize("is_mainnet", [True, False])
+@pytest.mark.parametrize("action", [ORDER_ACTION, CANCEL_ACTION])
+@pytest.mark.parametrize("vault, expires_after", [(None, None), (VAULT, None), (None, NONCE + 60_000)])
+def test_sign_l1_action_matches_encode_typed_data(is_mainnet, action, vault, expires_after):
+    expected = encode_typed_data_sign_l1_action(WALLET, action, vault, NONCE, expires_after, is_mainnet)
+    assert sign_l1_action(WALLET, action, vault, NONCE, expires_after, is_mainnet) == expected
+
+
+@pytest.mark.parametrize(
+    "is_mainnet, expected",
+    [
+        (
+            True,
+            {
+                "r": "0x53749d5b30552aeb2fca34b530185976545bb22d0b3ce6f62e31be961a59298",
+                "s": "0x755c40ba9bf05223521753995abb2f73ab3229be8ec921f350cb447e384d8ed8",
+                "v": 27,
+            },
+        ),
+        (
+            False,
+            {
+                "r": "0x542af61ef1f429707e3c76c5293c80d01f74ef853e34b76efffcb57e574f9510",
+                "s": "0x17b8b32f086e8cdede991f1e2c529f5dd5297cbe8128500e00cbaf766204a613",
+                "v": 28,
+            },
+        ),
+    ],
+)
+def test_sign_l1_action_known_signatures(is_mainnet, expected):
+    action = {"type": "dummy", "num": float_to_int_for_hashing(1000)}
+    assert sign_l1_action(WALLET, action, None, 0, None, is_mainnet) == expected
+
+
+@pytest.mark.parametrize("is_mainnet", [True, False])
+def test_l1_signature_recovers_the_signer(is_mainnet):
+    signature = sign_l1_action(WALLET, ORDER_ACTION, None, NONCE, None, is_mainnet)
+    recovered = recover_agent_or_user_from_l1_action(ORDER_ACTION, signature, None, NONCE, None, is_mainnet)
+    assert recovered == WALLET.address
@@ -0,0 +1,138 @@
+import io
+import threading
+import time
+from http.client import HTTPMessage
+
+import pytest
+from urllib3.connection import HTTPConnection
+from urllib3.response import HTTPResponse
+
+from hyperliquid import transport as transport_module
+from hyperliquid.transport import HttpTransport, _InstrumentedAdapter, get_transport, set_transport, transport_stats
+
+URL = "http://transport.test/info"
+
+
+class FakeSocket:
+    def settimeout(self, timeout):
+        pass
+
+    def close(self):
+        pass
+
+
+class StubBody(io.BytesIO):
+    """Stands in for the http.client response urllib3 wraps; once read it reports itself closed, which is when urllib3
+    returns the connection to the pool."""
+
+    msg = HTTPMessage()
+
+    def isclosed(self):
+        return self.closed or self.tell() == len(self.getvalue())
+
+
+class StubConnection(HTTPConnection):
+    """A keep-alive connection that answers every request in memory instead of opening a socket."""
+
+    delay = 0.0
+
+    @property
+    def is_connected(self):
+        return self.sock is not None
+
+    def connect(self):
+        self.sock = FakeSocket()
+
+    def request(self, method, url, body=None, headers=None, **kwargs):
+        if self.sock is None:
+            self.connect()
+
+    def getresponse(self):
+        time.sleep(self.delay)
+        body = StubBody(b'{"type": "ok"}')
+        return HTTPResponse(
+            body=body,
+            headers={"Content-Type": "application/json", "Content-Length": str(len(body.getvalue()))},
+            status=200,
+            preload_content=False,
+            original_response=body,
+            connection=self,
+        )
+
+
+class StubAdapter(_InstrumentedAdapter):
+    def __init__(self, stats, pool_size, delay):
+        self.delay = delay
+        super().__init__(stats, pool_size)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        connection_cls = type("StubConnection", (StubConnection,), {"delay": self.delay})
+        pool_cls = self.poolmanager.pool_classes_by_scheme["http"]
+        self.poolmanager.pool_classes_by_scheme["http"] = type(
+            "StubPool", (pool_cls,), {"ConnectionCls": connection_cls}
+        )
+
+
+def stub_transport(pool_size=4, delay=0.0):
+    transport = HttpTransport(pool_size=pool_size)
+    transport._adapter = StubAdapter(transport.connection_stats, pool_size, delay)
+    transport.session.mount("http://", transport._adapter)
+    return transport
+
+
+def post_concurrently(transport, n):
+    threads = [threading.Thread(target=transport.post, args=(URL, {"type": "meta"})) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_sequential_requests_reuse_one_connection():
+    transport = stub_transport()
+    for _ in range(5):
+        assert transport.post(URL, {"type": "meta"}).json() == {"type": "ok"}
+    stats = transport.stats()
+    assert stats["requests"] == 5
+    assert stats["new_connections"] == 1
+    assert stats["reuse_ratio"] == pytest.approx(0.8)
+    assert stats["in_use"] == 0
+    assert stats["open_sockets"] == 1
+
+
+def test_concurrent_requests_open_at_most_pool_size_sockets():
+    transport = stub_transport(pool_size=2, delay=0.02)
+    post_concurrently(transport, 6)
+    stats = transport.stats()
+    assert stats["requests"] == 6
+    assert stats["new_connections"] <= 2
+    assert stats["open_sockets"] <= 2 and stats["in_use"] == 0
+
+
+def test_blocked_requests_record_their_queue_wait():
+    transport = stub_transport(pool_size=1, delay=0.05)
+    post_concurrently(transport, 2)
+    stats = transport.stats()
+    assert stats["new_connections"] == 1
+    # the second caller waited for the first to hand the connection back
+    assert stats["queue_wait_max"] >= 0.03
+    assert stats["queue_wait_avg"] == pytest.approx(stats["queue_wait_max"] / 2, rel=0.2)
+
+
+def test_get_transport_shares_one_transport_per_base_url(monkeypatch):
+    monkeypatch.setattr(transport_module, "_transports", {})
+    first = get_transport("http://a.test")
+    assert get_transport("http://a.test") is first
+    assert get_transport("http://b.test") is not first
+    assert set(transport_stats()) == {"http://a.test", "http://b.test"}
+    assert transport_stats()["http://a.test"]["requests"] == 0
+
+
+def test_set_transport_replaces_the_shared_transport(monkeypatch):
+    monkeypatch.setattr(transport_module, "_transports", {})
+    replacement = stub_transport()
+    set_transport("http://a.test", replacement)
+    assert get_transport("http://a.test") is replacement
+    transport_module.close_transports()
+    assert transport_stats() == {}
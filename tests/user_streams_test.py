@@ -0,0 +1,142 @@
+import itertools
+import time
+
+import pytest
+
+from hyperliquid import user_streams
+from hyperliquid.user_streams import UserStreamPool
+from hyperliquid.websocket_manager import subscription_id
+
+
+class FakeWs:
+    def __init__(self, base_url, max_reconnect_attempts=5):
+        self.connected = False
+        self.reconnecting = False
+        self.subscriptions = set()
+        self.subscribers = {}
+        self.messages_received = 0
+        self.last_ping = 0
+        self.reconnects = 0
+        self._ids = itertools.count(1)
+
+    async def connect(self):
+        self.connected = True
+        return True
+
+    def reconnect(self):
+        self.connected = True
+
+    async def subscribe(self, subscription_type, callback=None, **params):
+        self.subscriptions.add(subscription_id({"type": subscription_type, **params}))
+        return True
+
+    async def unsubscribe(self, sub_id):
+        self.subscriptions.discard(sub_id)
+        return True
+
+    def add_subscriber(self, channel, callback, key=None):
+        subscriber_id = next(self._ids)
+        self.subscribers[subscriber_id] = (channel, key)
+        return subscriber_id
+
+    def remove_subscriber(self, subscriber_id):
+        return self.subscribers.pop(subscriber_id, None) is not None
+
+    def get_status(self):
+        return {"queued_for_subscribers": 0, "dropped_messages": 0}
+
+    async def close(self):
+        self.connected = False
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(user_streams, "WebsocketManager", FakeWs)
+    pool = UserStreamPool("http://streams.test", max_subscriptions_per_shard=4)
+    yield pool
+    pool.close()
+
+
+def user(i):
+    return f"0x{i:040x}"
+
+
+def settle(pool):
+    # subscribe and unsubscribe are queued on the pool's loop; a rebalance runs after them
+    pool.rebalance(timeout=5)
+
+
+def test_users_share_shards_up_to_capacity(pool):
+    for i in range(4):
+        pool.subscribe("userFills", print, user=user(i))
+        pool.subscribe("webData2", print, user=user(i))
+    settle(pool)
+    assert [m["subscriptions"] for m in pool.metrics()] == [4, 4]
+    assert all(pool.connected_for(user(i)) for i in range(4))
+    assert not pool.connected_for(user(9))
+
+
+def test_callbacks_share_one_server_subscription(pool):
+    first = pool.subscribe("userFills", print, user=user(0xABC))
+    pool.subscribe("userFills", print, user="0x" + user(0xABC)[2:].upper())
+    settle(pool)
+    assert pool.stats()["subscriptions"] == 1 and pool.stats()["callbacks"] == 2
+    pool.unsubscribe(first)
+    settle(pool)
+    assert pool.stats()["subscriptions"] == 1
+
+
+def test_keyless_channels_get_a_shard_per_user(pool):
+    pool.subscribe("orderUpdates", print, user=user(1))
+    pool.subscribe("orderUpdates", print, user=user(2))
+    pool.subscribe("userFills", print, user=user(3))
+    settle(pool)
+    assert len(pool.shards) == 2
+    assert {shard.keyless_user for shard in pool.shards.values()} == {user(1), user(2)}
+
+
+def test_full_shard_moves_the_user_with_all_of_its_streams(pool):
+    pool.subscribe("userFills", print, user=user(1))
+    for i in range(2, 5):
+        pool.subscribe("userFills", print, user=user(i))
+    pool.subscribe("webData2", print, user=user(1))
+    settle(pool)
+    shard = pool.users[user(1)].shard
+    assert shard.ws.subscriptions == {f"userFills_{user(1)}", f"webData2_{user(1)}"}
+    assert len(shard.ws.subscribers) == 2
+
+
+def test_emptied_shards_are_closed_and_users_consolidated(pool):
+    handles = [pool.subscribe("userFills", print, user=user(i)) for i in range(8)]
+    settle(pool)
+    assert len(pool.shards) == 2
+    for handle in handles[:2] + handles[4:6]:
+        pool.unsubscribe(handle)
+    settle(pool)
+    assert len(pool.shards) == 1
+    assert sorted(pool.users) == [user(2), user(3), user(6), user(7)]
+    for handle in handles[2:4] + handles[6:]:
+        pool.unsubscribe(handle)
+    settle(pool)
+    assert not pool.shards
+
+
+def test_only_user_channels_are_accepted(pool):
+    with pytest.raises(ValueError):
+        pool.subscribe("l2Book", print, user=user(1), coin="BTC")
+
+
+def test_monitor_reconnects_shards_that_went_down(monkeypatch):
+    monkeypatch.setattr(user_streams, "WebsocketManager", FakeWs)
+    pool = UserStreamPool("http://streams.test", metrics_interval=0.01)
+    try:
+        pool.subscribe("userFills", print, user=user(1))
+        settle(pool)
+        shard = pool.users[user(1)].shard
+        shard.ws.connected = False
+        deadline = time.monotonic() + 5
+        while not pool.connected_for(user(1)) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool.connected_for(user(1))
+    finally:
+        pool.close()
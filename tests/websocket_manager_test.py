@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+from hyperliquid.websocket_manager import WebsocketManager
+
+
+def message(channel, data):
+    return json.dumps({"channel": channel, "data": data})
+
+
+def book(coin):
+    return message("l2Book", {"coin": coin, "time": 0, "levels": [[], []]})
+
+
+def fill(user, tid):
+    return message("userFills", {"user": user, "fills": [{"tid": tid}]})
+
+
+async def drain():
+    # each subscriber delivers from its own task
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_messages_go_to_their_key_and_to_whole_channel_subscribers():
+    async def main():
+        ws = WebsocketManager("http://ws.test")
+        received = {"BTC": [], "ETH": [], "all": []}
+        ws.add_subscriber("l2Book", received["BTC"].append, "BTC")
+        ws.add_subscriber("l2Book", received["ETH"].append, "ETH")
+        ws.add_message_handler("l2Book", received["all"].append)
+        await ws._handle_message(book("BTC"))
+        await ws._handle_message(book("ETH"))
+        await ws._handle_message(book("SOL"))
+        await drain()
+        return {name: [m["data"]["coin"] for m in messages] for name, messages in received.items()}
+
+    assert asyncio.run(main()) == {"BTC": ["BTC"], "ETH": ["ETH"], "all": ["BTC", "ETH", "SOL"]}
+
+
+def test_user_keys_are_case_insensitive():
+    async def main():
+        ws = WebsocketManager("http://ws.test")
+        received = []
+        ws.add_subscriber("userFills", received.append, "0xABC")
+        await ws._handle_message(fill("0xabc", 1))
+        await ws._handle_message(fill("0xdef", 2))
+        await drain()
+        return received
+
+    assert [m["data"]["fills"][0]["tid"] for m in asyncio.run(main())] == [1]
+
+
+def test_sync_and_async_callbacks_both_receive_messages_in_order():
+    async def main():
+        ws = WebsocketManager("http://ws.test")
+        sync_received = []
+        async_received = []
+
+        async def on_book(msg):
+            await asyncio.sleep(0)
+            async_received.append(msg["data"]["time"])
+
+        ws.add_subscriber("l2Book", lambda msg: sync_received.append(msg["data"]["time"]), "BTC")
+        ws.add_subscriber("l2Book", on_book, "BTC")
+        for t in range(3):
+            await ws._handle_message(message("l2Book", {"coin": "BTC", "time": t, "levels": [[], []]}))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        return sync_received, async_received
+
+    assert asyncio.run(main()) == ([0, 1, 2], [0, 1, 2])
+
+
+def test_slow_market_subscriber_drops_the_oldest_messages():
+    async def main():
+        ws = WebsocketManager("http://ws.test")
+        received = []
+        ws.add_subscriber("l2Book", received.append, "BTC", max_queue=2)
+        # nothing is delivered until the dispatcher yields, so the queue overflows
+        for t in range(5):
+            await ws._handle_message(message("l2Book", {"coin": "BTC", "time": t, "levels": [[], []]}))
+        await drain()
+        return [m["data"]["time"] for m in received], ws.get_status()["dropped_messages"]
+
+    assert asyncio.run(main()) == ([3, 4], 3)
+
+
+def test_slow_user_subscriber_makes_the_dispatcher_wait():
+    async def main():
+        ws = WebsocketManager("http://ws.test")
+        received = []
+        ws.add_subscriber("userFills", received.append, "0xabc", max_queue=2)
+        await asyncio.wait_for(asyncio.gather(*(ws._handle_message(fill("0xabc", tid)) for tid in range(5))), 1)
+        await drain()
+        return [m["data"]["fills"][0]["tid"] for m in received], ws.get_status()["dropped_messages"]
+
+    assert asyncio.run(main()) == ([0, 1, 2, 3, 4], 0)
+
+
+def test_removed_subscriber_stops_receiving():
+    async def main():
+        ws = WebsocketManager("http://ws.test")
+        received = []
+        subscriber_id = ws.add_subscriber("l2Book", received.append, "BTC")
+        await ws._handle_message(book("BTC"))
+        await drain()
+        assert ws.remove_subscriber(subscriber_id)
+        assert not ws.remove_subscriber(subscriber_id)
+        await ws._handle_message(book("BTC"))
+        await drain()
+        return len(received), ws.get_status()["subscribers"]
+
+    assert asyncio.run(main()) == (1, 0)
+
+
+def test_unsubscribe_removes_the_callbacks_of_the_subscription():
+    async def main():
+        ws = WebsocketManager("http://ws.test")
+        received = []
+        # not connected: the subscription is recorded for the next connect
+        await ws.subscribe("l2Book", received.append, coin="BTC")
+        await ws.subscribe("l2Book", received.append, coin="BTC")
+        await ws.subscribe("l2Book", received.append, coin="ETH")
+        assert ws.get_status()["subscribers"] == 3
+        assert await ws.unsubscribe("l2Book_BTC")
+        await ws._handle_message(book("BTC"))
+        await ws._handle_message(book("ETH"))
+        await drain()
+        return [m["data"]["coin"] for m in received], ws.get_status()["subscribers"]
+
+    assert asyncio.run(main()) == (["ETH"], 1)
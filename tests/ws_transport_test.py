@@ -0,0 +1,94 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from hyperliquid.ws_transport import InFlightSlots, WebsocketPostTimeout, WebsocketTransport
+
+
+def test_released_slot_wakes_a_coroutine_from_another_thread():
+    async def main():
+        slots = InFlightSlots(1)
+        assert await slots.acquire_async(1)
+        threading.Timer(0.05, slots.release).start()
+        start = time.monotonic()
+        assert await slots.acquire_async(1)
+        return time.monotonic() - start
+
+    assert asyncio.run(main()) < 0.5
+
+
+def test_slots_go_to_blocked_threads_and_coroutines_in_arrival_order():
+    async def main():
+        slots = InFlightSlots(1)
+        assert slots.acquire(1)
+        order = []
+
+        def blocking():
+            slots.acquire(1)
+            order.append("thread")
+            slots.release()
+
+        thread = threading.Thread(target=blocking)
+        thread.start()
+        while not slots._waiters:
+            await asyncio.sleep(0.001)
+
+        async def coroutine():
+            await slots.acquire_async(1)
+            order.append("coroutine")
+            slots.release()
+
+        task = asyncio.ensure_future(coroutine())
+        await asyncio.sleep(0.01)
+        slots.release()
+        await task
+        thread.join()
+        return order
+
+    assert asyncio.run(main()) == ["thread", "coroutine"]
+
+
+def test_timed_out_waiter_does_not_lose_the_slot():
+    async def main():
+        slots = InFlightSlots(1)
+        assert await slots.acquire_async(1)
+        assert not await slots.acquire_async(0.01)
+        assert not slots.acquire(0.01)
+        slots.release()
+        return await slots.acquire_async(0.01)
+
+    assert asyncio.run(main())
+
+
+def test_cancelled_waiter_passes_the_slot_on():
+    async def main():
+        slots = InFlightSlots(1)
+        assert await slots.acquire_async(1)
+        waiting = asyncio.ensure_future(slots.acquire_async(1))
+        await asyncio.sleep(0)
+        # the slot is handed to a waiter that is being cancelled
+        waiting.cancel()
+        slots.release()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        return await slots.acquire_async(0.1)
+
+    assert asyncio.run(main())
+
+
+def test_request_async_times_out_without_a_free_slot():
+    async def main():
+        transport = WebsocketTransport("http://ws.test", timeout=0.05, max_in_flight=1)
+        answered = Future()
+        answered.set_result({"type": "info", "payload": {"type": "info", "data": {}}})
+        transport._submit = lambda request_type, payload: (1, answered)
+        assert transport._slots.acquire(1)
+        with pytest.raises(WebsocketPostTimeout):
+            await transport.request_async("info", {"type": "meta"})
+        transport._slots.release()
+        return await transport.request_async("info", {"type": "meta"})
+
+    assert asyncio.run(main())["type"] == "info"
@@ -1,7 +1,6 @@
 """
 Agent Factory for creating and managing agent wallets
 """
-import asyncio
 import json
 import logging
 import os
@@ -11,6 +10,8 @@ from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from datetime import datetime
 
+from hyperliquid.async_exchange import AsyncExchange
+from hyperliquid.async_info import AsyncInfo
 from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
 from hyperliquid.utils import constants
@@ -57,9 +58,14 @@ class AgentFactory:
                 logger.error(f"Error initializing master account: {e}")
                 
         self.user_agents = {}  # {user_id: Exchange instance}
+        self.user_async_agents = {}  # {user_id: AsyncExchange instance}
         self.agent_details = {}  # {user_id: {address, key, etc}}
         self.last_balance_check = {}  # {user_id: timestamp}
         
+        # Non-blocking client for bulk balance sweeps, created in initialize()
+        self.async_info: Optional[AsyncInfo] = None
+        self.balance_sweep_concurrency = 32
+        
         # Define storage path
         self.storage_path = os.path.join(os.path.dirname(__file__), "agent_wallets.json")
         
@@ -103,6 +109,8 @@ class AgentFactory:
             # Test connection to info API
             if self.info:
                 _ = self.info.meta()
+            
+            self.async_info = await AsyncInfo.create(self.base_url)
                 
             # Test master wallet if available
             if self.master_wallet and self.master_exchange:
@@ -308,6 +316,9 @@ class AgentFactory:
                 account_address=agent_details["address"]
             )
             
+            # Shared batcher for this user's bursts (e.g. cancel-all); single sync orders still go out directly
+            exchange.set_batching(True)
+            
             # Cache the exchange instance
             self.user_agents[user_id] = exchange
             
@@ -317,6 +328,46 @@ class AgentFactory:
             logger.error(f"Error creating exchange for user {user_id}: {e}")
             return None
     
+    async def get_user_async_exchange(self, user_id: int) -> Optional[AsyncExchange]:
+        """
+        Get AsyncExchange instance for specific user, for actions sent from the event loop
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            AsyncExchange instance or None if not found
+        """
+        if user_id in self.user_async_agents:
+            return self.user_async_agents[user_id]
+            
+        if user_id not in self.agent_details:
+            logger.warning(f"No agent details found for user {user_id}")
+            return None
+        
+        try:
+            agent_details = self.agent_details[user_id]
+            agent_account = Account.from_key(agent_details["key"])
+            
+            if not self.async_info:
+                self.async_info = await AsyncInfo.create(self.base_url)
+            
+            # Waits for the rate limiter with asyncio.sleep, so a throttled cancel never stalls the loop
+            exchange = AsyncExchange(
+                wallet=agent_account,
+                info=self.async_info,
+                account_address=agent_details["address"]
+            )
+            exchange.set_batching(True)
+            
+            self.user_async_agents[user_id] = exchange
+            
+            return exchange
+            
+        except Exception as e:
+            logger.error(f"Error creating async exchange for user {user_id}: {e}")
+            return None
+    
     async def fund_detection(self, user_id: int) -> Dict:
         """
         Check if user has funded their agent wallet
@@ -356,24 +407,13 @@ class AgentFactory:
             # Get agent address
             agent_address = self.agent_details[user_id]["address"]
             
-            # Check balance using info client
-            user_state = self.info.user_state(agent_address)
+            # Check balance without blocking the event loop
+            if not self.async_info:
+                self.async_info = await AsyncInfo.create(self.base_url)
+            user_state = await self.async_info.user_state(agent_address)
             account_value = float(user_state.get("marginSummary", {}).get("accountValue", 0))
             
-            # Update last check timestamp
-            self.last_balance_check[user_id] = current_time
-            
-            # Store balance in agent details
-            self.agent_details[user_id]["last_balance"] = account_value
-            self.agent_details[user_id]["last_checked"] = current_time
-            self._save_agent_details()
-            
-            # Update database if available
-            if bot_db:
-                try:
-                    await bot_db.update_wallet_balance(user_id, account_value)
-                except Exception as db_error:
-                    logger.error(f"Error updating wallet balance in database: {db_error}")
+            await self._record_balance(user_id, account_value, current_time)
             
             funded = account_value > 0
             funding_status = {
@@ -472,6 +512,7 @@ class AgentFactory:
             # Remove from agents cache
             if user_id in self.user_agents:
                 del self.user_agents[user_id]
+            self.user_async_agents.pop(user_id, None)
             
             # Remove from balance check cache
             if user_id in self.last_balance_check:
@@ -506,29 +547,81 @@ class AgentFactory:
                 "message": f"Error removing agent wallet: {str(e)}"
             }
     
+    def _note_balance(self, user_id: int, account_value: float, checked_at: float) -> None:
+        """Store a freshly fetched agent balance in memory only; callers persist it"""
+        # Update last check timestamp
+        self.last_balance_check[user_id] = checked_at
+        
+        # Store balance in agent details
+        self.agent_details[user_id]["last_balance"] = account_value
+        self.agent_details[user_id]["last_checked"] = checked_at
+    
+    async def _record_balance(self, user_id: int, account_value: float, checked_at: float) -> None:
+        """Store a freshly fetched agent balance in memory, on disk and in the database"""
+        self._note_balance(user_id, account_value, checked_at)
+        self._save_agent_details()
+        
+        # Update database if available
+        if bot_db:
+            try:
+                await bot_db.update_wallet_balance(user_id, account_value)
+            except Exception as db_error:
+                logger.error(f"Error updating wallet balance in database: {db_error}")
+    
+    async def refresh_all_balances(self) -> Dict[int, float]:
+        """
+        Refresh the balance of every agent wallet in one bounded-concurrency sweep
+        
+        Returns:
+            Dict mapping user_id to account value for every agent that could be checked
+        """
+        if not self.async_info:
+            self.async_info = await AsyncInfo.create(self.base_url)
+        
+        address_to_user = {
+            details["address"]: user_id
+            for user_id, details in list(self.agent_details.items())
+            if details.get("address")
+        }
+        balances = {}
+        
+        async for address, user_state in self.async_info.user_states(
+            address_to_user.keys(), concurrency=self.balance_sweep_concurrency
+        ):
+            user_id = address_to_user[address]
+            if isinstance(user_state, Exception):
+                logger.error(f"Error checking funding for user {user_id}: {user_state}")
+                continue
+            
+            account_value = float(user_state.get("marginSummary", {}).get("accountValue", 0))
+            self._note_balance(user_id, account_value, time.time())
+            balances[user_id] = account_value
+        
+        # One write for the whole sweep instead of one per agent
+        self._save_agent_details()
+        if bot_db:
+            for user_id, account_value in balances.items():
+                try:
+                    await bot_db.update_wallet_balance(user_id, account_value)
+                except Exception as db_error:
+                    logger.error(f"Error updating wallet balance in database: {db_error}")
+        
+        return balances
+    
     async def monitor_funds(self) -> None:
         """
         Background task to monitor funding for all agent wallets
         """
         try:
-            # Check funding for all agent wallets
-            for user_id in list(self.agent_details.keys()):
-                try:
-                    # Get funding status
-                    funding = await self.fund_detection(user_id)
+            balances = await self.refresh_all_balances()
+            
+            for user_id, balance in balances.items():
+                # Log if wallet is funded
+                if balance > 0:
+                    logger.info(f"Wallet for user {user_id} is funded: ${balance:,.2f}")
                     
-                    # Log if wallet is funded
-                    if funding["funded"]:
-                        logger.info(f"Wallet for user {user_id} is funded: ${funding['balance']:,.2f}")
-                        
-                        # Here you could trigger notifications or callbacks
-                        # when a wallet is funded
-                        
-                except Exception as e:
-                    logger.error(f"Error monitoring funding for user {user_id}: {e}")
-                
-                # Sleep briefly between checks to avoid rate limits
-                await asyncio.sleep(1)
+                    # Here you could trigger notifications or callbacks
+                    # when a wallet is funded
                 
         except Exception as e:
             logger.error(f"Error in monitor_funds: {e}")
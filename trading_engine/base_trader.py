@@ -9,6 +9,10 @@ import asyncio
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 
+from hyperliquid.mids import get_mids_hub
+from hyperliquid.nonce import get_nonce_allocator
+from hyperliquid.orders import get_order_registry
+
 class BaseTrader:
     """
     Base trader class that ProfitOptimizedTrader will inherit from
@@ -23,10 +27,6 @@ class BaseTrader:
         self.exchange = exchange
         self.agent_wallet = agent_wallet  # Agent wallet data for signing
         self.logger = logging.getLogger(__name__)
-        
-        # Nonce management for agent wallet transactions
-        self.last_used_nonce = 0
-        self.nonce_increment = 0
     
     async def get_all_mids(self) -> Dict[str, float]:
         """Get mid prices for all assets"""
@@ -34,6 +34,10 @@ class BaseTrader:
             return {}
         
         try:
+            hub = get_mids_hub(self.info.base_url)
+            if hub is not None:
+                # Already parsed by the streaming hub, no request unless the stream is stale
+                return hub.mids()
             mids_dict = self.info.all_mids()
             # Convert string values to float
             return {k: float(v) for k, v in mids_dict.items()}
@@ -66,17 +70,13 @@ class BaseTrader:
             return 0
             
         try:
-            # If exchange provides nonce management, use it
-            if hasattr(self.exchange, 'get_next_nonce'):
-                return await self.exchange.get_next_nonce()
-            
-            # Otherwise, implement basic nonce management
-            self.nonce_increment += 1
-            return self.last_used_nonce + self.nonce_increment
+            # Draw from the same per-signer sequence the exchange signs its own actions with,
+            # so manual and automated actions for one agent never reuse a nonce
+            allocator = getattr(self.exchange, 'nonce_allocator', None) or get_nonce_allocator()
+            return allocator.next(self.exchange.wallet.address)
         except Exception as e:
             self.logger.error(f"Error getting next nonce: {e}")
             # Fallback to timestamp-based nonce
-            import time
             return int(time.time() * 1000)
     
     async def place_order(self, coin: str, is_buy: bool, size: float, price: float, 
@@ -98,12 +98,6 @@ class BaseTrader:
             # Place order through exchange (which should use agent wallet)
             result = self.exchange.order(coin, is_buy, size, price, order_type)
             
-            # Update nonce if successful
-            if result.get("status") == "ok":
-                response = result.get("response", {})
-                if "nonce" in response:
-                    self.last_used_nonce = response["nonce"]
-            
             return result
         except Exception as e:
             self.logger.error(f"Error placing order: {e}")
@@ -115,7 +109,11 @@ class BaseTrader:
             return {"status": "error", "message": "Exchange not initialized"}
             
         try:
-            return self.exchange.cancel_by_coin(coin)
+            # Open orders come from the local registry; one bulk cancel for all of them
+            orders = get_order_registry(self.info.base_url, self.address).open_orders(coin)
+            if not orders:
+                return {"status": "ok", "response": {"type": "cancel", "data": {"statuses": []}}}
+            return self.exchange.bulk_cancel([{"coin": coin, "oid": order["oid"]} for order in orders])
         except Exception as e:
             self.logger.error(f"Error cancelling orders: {e}")
             return {"status": "error", "message": str(e)}
@@ -10,8 +10,16 @@ if TYPE_CHECKING:
     from hyperliquid.exchange import Exchange
     from hyperliquid.info import Info
 
+from hyperliquid.accounts import AccountState, enable_account_cache
+from hyperliquid.async_info import AsyncInfo
+from hyperliquid.coalescing import enable_coalescing
 from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
+from hyperliquid.metadata import get_registry
+from hyperliquid.mids import enable_mids_hub
+from hyperliquid.orders import get_order_registry
+from hyperliquid.rate_limiter import Priority, request_priority
+from hyperliquid.response_cache import enable_response_cache
 from hyperliquid.utils import constants
 from hyperliquid.utils.types import *
 
@@ -48,13 +56,31 @@ class MultiUserTradingEngine:
         self.user_tasks = {}       # {user_id: {strategy_name: asyncio.Task}}
         self.strategy_manager = PerUserStrategyManager()
         
+        # Warm-start exchange metadata from disk; every Info/Exchange built afterwards reads the shared registry
+        get_registry(
+            self.base_url,
+            snapshot_path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "exchange_meta_snapshot.json")
+        )
+        
+        # Concurrent identical market-data queries from strategies, analytics and scanners share one request
+        self.coalescer = enable_coalescing(self.base_url, ttl=0.25)
+        
+        # Slow-changing queries (meta, fees, referral and staking state) answered from a TTL cache, dropped per user
+        # whenever one of our exchange actions touches that user
+        self.response_cache = enable_response_cache(self.base_url)
+        
         # Global Info client for market data (shared across users)
         self.global_info = Info(self.base_url)
         
-        # Cache for market data
+        # Non-blocking Info client for hot paths, created in initialize() once a loop is running
+        self.async_info: Optional[AsyncInfo] = None
+        
+        # Mid prices streamed over the allMids websocket; every Info/AsyncInfo for base_url reads all_mids() from it
+        self.mids_hub = enable_mids_hub(self.base_url)
+        
+        # Clearinghouse states pushed over webData2 and invalidated by fills; user_state() of every client reads them
+        self.account_cache = enable_account_cache(self.base_url)
         self.mids_cache = {}
-        self.mids_cache_time = 0
-        self.mids_cache_ttl = 5  # 5 seconds TTL
         
         self.logger = logging.getLogger(__name__)
         self.logger.info("MultiUserTradingEngine initialized")
@@ -74,6 +100,9 @@ class MultiUserTradingEngine:
             # Initialize agent factory
             await self.agent_factory.initialize()
             
+            # Asset metadata is already loaded by global_info, so this costs no round-trips
+            self.async_info = await AsyncInfo.create(self.base_url)
+            
             # Test connection to API
             if await self.validate_connection():
                 self.logger.info("Connection to Hyperliquid API validated")
@@ -88,29 +117,21 @@ class MultiUserTradingEngine:
     async def get_all_mids(self) -> Dict[str, float]:
         """
         Get market data (shared across all users)
-        Uses caching to reduce API calls
+        Served from the streaming mids hub; only hits the API when the stream is stale
         
         Returns:
-            Dict mapping coin symbols to their current prices
+            Dict mapping coin symbols to their current prices (shared, treat as read-only)
         """
-        current_time = time.time()
-        
-        # Return cached values if still valid
-        if self.mids_cache and current_time - self.mids_cache_time < self.mids_cache_ttl:
-            return self.mids_cache
-        
         try:
-            # Use global info client for market data
-            mids_dict = self.global_info.all_mids()
-            
-            # Convert string values to float
-            mids = {k: float(v) for k, v in mids_dict.items()}
-            
-            # Update cache
-            self.mids_cache = mids
-            self.mids_cache_time = current_time
-            
-            return mids
+            if self.mids_hub.stale():
+                # Refresh without blocking the loop; the response is fed back into the hub
+                if self.async_info:
+                    await self.async_info.all_mids()
+                else:
+                    self.global_info.all_mids()
+            
+            self.mids_cache = self.mids_hub.mids()
+            return self.mids_cache
         except Exception as e:
             self.logger.error(f"Error getting all mids: {e}")
             # Return last cached data if available, otherwise empty dict
@@ -487,26 +508,24 @@ class MultiUserTradingEngine:
             
             agent_address = agent_details["address"]
             
-            # Use global info client to get positions
-            user_state = self.global_info.user_state(agent_address)
-            
-            # Extract positions
-            positions = []
-            for pos_data in user_state.get("assetPositions", []):
-                pos = pos_data.get("position", {})
-                if pos:
-                    positions.append({
-                        "coin": pos.get("coin", "Unknown"),
-                        "size": float(pos.get("szi", 0)),
-                        "entry_price": float(pos.get("entryPx", 0)),
-                        "unrealized_pnl": float(pos.get("unrealizedPnl", 0)),
-                        "liquidation_price": float(pos.get("liquidationPx", 0)) if "liquidationPx" in pos else None
-                    })
+            # Positions from the shared account cache
+            state = await self._account_state(agent_address)
+            
+            positions = [
+                {
+                    "coin": position.coin,
+                    "size": position.szi,
+                    "entry_price": position.entry_px or 0.0,
+                    "unrealized_pnl": position.unrealized_pnl,
+                    "liquidation_price": position.liquidation_px
+                }
+                for position in state.positions.values()
+            ]
             
             return {
                 "status": "success",
                 "positions": positions,
-                "account_value": float(user_state.get("marginSummary", {}).get("accountValue", 0))
+                "account_value": state.account_value
             }
             
         except Exception as e:
@@ -517,6 +536,20 @@ class MultiUserTradingEngine:
                 "positions": []
             }
     
+    async def _user_state(self, address: str) -> Dict:
+        """Fetch clearinghouse state without blocking the event loop when possible"""
+        if self.async_info:
+            return await self.async_info.user_state(address)
+        return self.global_info.user_state(address)
+    
+    async def _account_state(self, address: str) -> AccountState:
+        """Parsed account state, from memory when the cache holds a fresh one"""
+        state = self.account_cache.cached(address)
+        if state is None:
+            # _user_state refreshes the cache as a side effect
+            state = AccountState(address.lower(), await self._user_state(address))
+        return state
+    
     async def validate_connection(self) -> bool:
         """
         Validate connection to Hyperliquid API
@@ -584,14 +617,20 @@ class MultiUserTradingEngine:
             Dict with status and details
         """
         try:
-            # Get user's exchange
-            user_exchange = self.user_exchanges.get(user_id)
-            if not user_exchange:
+            if user_id not in self.user_exchanges:
                 return {
                     "status": "error",
                     "message": "User not authenticated or exchange not initialized"
                 }
             
+            # Cancels go through the async client, which waits out the rate limiter without blocking the loop
+            user_exchange = await self.agent_factory.get_user_async_exchange(user_id)
+            if not user_exchange:
+                return {
+                    "status": "error",
+                    "message": "Failed to get user exchange"
+                }
+            
             # Get agent details to find address
             agent_details = await self.agent_factory.get_agent_details(user_id)
             if not agent_details or not agent_details.get("address"):
@@ -602,27 +641,33 @@ class MultiUserTradingEngine:
             
             agent_address = agent_details["address"]
             
-            # Get open orders from API
-            open_orders = self.global_info.open_orders(agent_address)
+            # Open orders from the user's local registry (user streams plus periodic resync)
+            registry = get_order_registry(self.base_url, agent_address)
+            open_orders = await asyncio.get_running_loop().run_in_executor(None, registry.open_orders)
             
-            # Extract unique coins
-            coins = set()
-            for order in open_orders:
-                if order.get("coin"):
-                    coins.add(order.get("coin"))
+            # Cancel every open order as bulk cancels of up to 39 orders each instead of one request per order
+            futures = [
+                user_exchange.cancel(order["coin"], order["oid"])
+                for order in open_orders
+                if order.get("coin") and order.get("oid") is not None
+            ]
+            user_exchange.batcher.flush()
+            results = await asyncio.gather(*futures, return_exceptions=True)
             
-            # Cancel orders for each coin
             orders_cancelled = 0
-            for coin in coins:
+            for result in results:
                 try:
-                    result = user_exchange.cancel_by_coin(coin)
+                    if isinstance(result, BaseException):
+                        raise result
                     if result.get("status") == "ok":
                         # Count cancelled orders from response
                         cancel_data = result.get("response", {}).get("data", {})
                         statuses = cancel_data.get("statuses", [])
-                        orders_cancelled += len([s for s in statuses if s.get("status") == "cancelled"])
+                        orders_cancelled += len([s for s in statuses if s == "success"])
+                    else:
+                        self.logger.error(f"Error cancelling orders for user {user_id}: {result}")
                 except Exception as e:
-                    self.logger.error(f"Error cancelling orders for coin {coin}: {e}")
+                    self.logger.error(f"Error cancelling orders for user {user_id}: {e}")
             
             return {
                 "status": "success",
@@ -689,10 +734,10 @@ class MultiUserTradingEngine:
             logger.info(f"Fund detection for user {user_id}: checking main_address={main_address}")
             
             # Query account state using MAIN address (where funds are stored)
-            user_state = self.global_info.user_state(main_address)
+            state = await self._account_state(main_address)
             
             # Get account value from margin summary
-            account_value = float(user_state.get("marginSummary", {}).get("accountValue", 0))
+            account_value = state.account_value
             
             logger.info(f"User {user_id} fund detection: main_address={main_address}, balance=${account_value}")
             
@@ -943,6 +988,12 @@ class MultiUserTradingEngine:
         Returns:
             Dict with operation result
         """
+        # Every request made while stopping jumps ahead of queued polling in the shared rate limiter
+        with request_priority(Priority.CRITICAL):
+            return await self._emergency_stop(user_id)
+    
+    async def _emergency_stop(self, user_id: int) -> Dict:
+        """Cancel all orders and close all positions for a user"""
         try:
             # Check if agent wallet exists
             agent_details = await self.get_agent_details(user_id)
@@ -958,10 +1009,8 @@ class MultiUserTradingEngine:
             # Cancel all orders
             await self.cancel_all_orders(user_id)
             
-            # Get user's exchange
-            exchange = self.user_exchanges.get(user_id)
-            if not exchange:
-                exchange = await self.get_user_exchange(user_id)
+            # Get user's exchange; closes are sent from the loop, so use the async client
+            exchange = await self.agent_factory.get_user_async_exchange(user_id)
                 
             if not exchange:
                 return {
@@ -998,7 +1047,7 @@ class MultiUserTradingEngine:
                 try:
                     # Market order with reduceOnly
                     order_type = {"market": {"reduceOnly": True}}
-                    result = exchange.order(coin, is_buy, close_size, 0, order_type)
+                    result = await exchange.order(coin, is_buy, close_size, 0, order_type)
                     
                     if result.get("status") == "ok":
                         positions_closed += 1
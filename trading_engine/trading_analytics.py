@@ -10,6 +10,10 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
 
+from hyperliquid.fills import get_fill_store
+from hyperliquid.rate_limiter import Priority, request_priority
+from hyperliquid.utils.parsers import parse_asset_ctxs
+
 logger = logging.getLogger(__name__)
 
 class TradingAnalytics:
@@ -30,32 +34,34 @@ class TradingAnalytics:
             List of trending pair symbols
         """
         try:
+            # Background analysis: queued behind (and shed before) orders and account polling
             # Get all asset contexts for volume analysis
-            meta_and_ctx = info.meta_and_asset_ctxs()
+            with request_priority(Priority.ANALYTICS):
+                meta_and_ctx = info.meta_and_asset_ctxs()
             if not meta_and_ctx or len(meta_and_ctx) < 2:
                 return ['BTC', 'ETH', 'SOL']  # Fallback
             
-            universe = meta_and_ctx[0].get('universe', [])
-            contexts = meta_and_ctx[1] if len(meta_and_ctx) > 1 else []
+            # Parse every numeric context field to floats once
+            ctxs = parse_asset_ctxs(meta_and_ctx)
+            volumes = ctxs['dayNtlVlm']
+            open_interests = ctxs['openInterest']
+            funding_rates = ctxs['funding']
             
             # Get current mids for price data
-            mids = info.all_mids()
+            with request_priority(Priority.ANALYTICS):
+                mids = info.all_mids()
             
             # Calculate metrics for trending detection
             trending_scores = []
             
-            for i, asset_ctx in enumerate(contexts):
-                if i >= len(universe):
-                    continue
-                    
-                asset_name = universe[i].get('name', '')
+            for i, asset_name in enumerate(ctxs.names):
                 if not asset_name or asset_name not in mids:
                     continue
                 
                 # Extract metrics
-                volume_24h = float(asset_ctx.get('dayNtlVlm', 0))
-                open_interest = float(asset_ctx.get('openInterest', 0))
-                funding_rate = float(asset_ctx.get('funding', {}).get('fundingRate', 0))
+                volume_24h = volumes[i]
+                open_interest = open_interests[i]
+                funding_rate = funding_rates[i]
                 
                 # Skip if volume too low
                 if volume_24h < min_volume:
@@ -114,44 +120,37 @@ class TradingAnalytics:
             # This would typically use time-series data from an actual market data feed
             # Here we'll implement a placeholder based on available data
             
-            meta_and_ctx = info.meta_and_asset_ctxs()
+            with request_priority(Priority.ANALYTICS):
+                meta_and_ctx = info.meta_and_asset_ctxs()
             if not meta_and_ctx or len(meta_and_ctx) < 2:
                 return []
                 
-            universe = meta_and_ctx[0].get('universe', [])
-            contexts = meta_and_ctx[1] if len(meta_and_ctx) > 1 else []
+            ctxs = parse_asset_ctxs(meta_and_ctx)
+            volumes = ctxs['dayNtlVlm']
+            mark_prices = ctxs['markPx']
+            oracle_prices = ctxs['oraclePx']
             
             # Look for signs of unusual activity in trading metrics
             spikes = []
             
-            for i, asset_ctx in enumerate(contexts):
-                if i >= len(universe):
-                    continue
-                    
-                asset_name = universe[i].get('name', '')
+            for i, asset_name in enumerate(ctxs.names):
                 if not asset_name:
                     continue
                 
                 # Calculate 24h average hourly volume
-                volume_24h = float(asset_ctx.get('dayNtlVlm', 0))
+                volume_24h = volumes[i]
                 avg_hourly_volume = volume_24h / 24
                 
-                # Get mark price for % change calculation
-                try:
-                    mark_px = float(asset_ctx.get('markPx', 0))
-                    index_px = float(asset_ctx.get('indexPx', mark_px))
-                    
-                    # Calculate price deviation
-                    if index_px > 0:
-                        price_deviation = abs(mark_px - index_px) / index_px
-                    else:
-                        price_deviation = 0
-                        
-                except (ValueError, TypeError):
+                # Calculate deviation of the mark price from the oracle (index) price
+                mark_px = mark_prices[i]
+                index_px = oracle_prices[i]
+                if index_px > 0:
+                    price_deviation = abs(mark_px - index_px) / index_px
+                else:
                     price_deviation = 0
                 
-                # Get recent volume (if available - this is a placeholder)
-                recent_volume = float(asset_ctx.get('hourlyVol', avg_hourly_volume))
+                # Get recent volume (placeholder until a time-series feed is wired in)
+                recent_volume = avg_hourly_volume
                 
                 # Check if recent volume significantly exceeds hourly average
                 if recent_volume > avg_hourly_volume * threshold or price_deviation > 0.01:
@@ -192,26 +191,22 @@ class TradingAnalytics:
             Dict mapping pairs to their funding rates
         """
         try:
-            meta_and_ctx = info.meta_and_asset_ctxs()
+            with request_priority(Priority.ANALYTICS):
+                meta_and_ctx = info.meta_and_asset_ctxs()
             if not meta_and_ctx or len(meta_and_ctx) < 2:
                 return {}
                 
-            universe = meta_and_ctx[0].get('universe', [])
-            contexts = meta_and_ctx[1] if len(meta_and_ctx) > 1 else []
+            ctxs = parse_asset_ctxs(meta_and_ctx)
+            funding_rates = ctxs['funding']
             
             funding_opportunities = {}
             
-            for i, asset_ctx in enumerate(contexts):
-                if i >= len(universe):
-                    continue
-                    
-                asset_name = universe[i].get('name', '')
+            for i, asset_name in enumerate(ctxs.names):
                 if not asset_name:
                     continue
                 
                 # Get funding rate
-                funding_info = asset_ctx.get('funding', {})
-                funding_rate = float(funding_info.get('fundingRate', 0))
+                funding_rate = funding_rates[i]
                 
                 # If funding rate exceeds threshold (positive or negative)
                 if abs(funding_rate) >= threshold:
@@ -221,7 +216,8 @@ class TradingAnalytics:
                     funding_opportunities[asset_name] = {
                         "rate": funding_rate,
                         "annualized": annualized_rate,
-                        "next_funding": funding_info.get('nextFundingTime', 0)
+                        # Funding is paid hourly, on the hour
+                        "next_funding": (int(time.time()) // 3600 + 1) * 3600 * 1000
                     }
             
             return funding_opportunities
@@ -243,27 +239,12 @@ class TradingAnalytics:
             Float representing daily volume in USD
         """
         try:
-            # In a real implementation, this would analyze actual trade history
-            # Here we'll just estimate from user state
-            
-            user_state = info.user_state(user_address)
-            positions = user_state.get("assetPositions", [])
-            
-            # Estimate daily volume from position sizes
-            estimated_volume = 0
-            for pos_data in positions:
-                pos = pos_data.get("position", {})
-                if pos:
-                    size = abs(float(pos.get("szi", 0)))
-                    price = float(pos.get("entryPx", 0))
-                    pos_value = size * price
-                    # Assume positions are rolled over ~twice daily
-                    estimated_volume += pos_value * 2
+            # Notional of the fills of the last 24h from the shared fill store
+            since_ms = int((time.time() - 86400) * 1000)
+            with request_priority(Priority.ANALYTICS):
+                fills = get_fill_store(info.base_url).fills(user_address, start_ms=since_ms)
             
-            # Add minimum baseline volume
-            estimated_volume += 1000  # $1000 baseline
-            
-            return estimated_volume
+            return sum(float(fill['px']) * float(fill['sz']) for fill in fills)
             
         except Exception as e:
             logger.error(f"Error calculating daily volume: {e}")
@@ -282,9 +263,17 @@ class TradingAnalytics:
             Float representing maker ratio (0.0-1.0)
         """
         try:
-            # In a real implementation, this would analyze actual trade history
-            # Here we'll return a sensible default
-            return 0.7  # Assume 70% maker orders
+            # Share of the last 24h fill volume that rested on the book (crossed = taker)
+            since_ms = int((time.time() - 86400) * 1000)
+            with request_priority(Priority.ANALYTICS):
+                fills = get_fill_store(info.base_url).fills(user_address, start_ms=since_ms)
+            
+            total_volume = sum(float(fill['px']) * float(fill['sz']) for fill in fills)
+            if total_volume == 0:
+                return 0.5  # No recent fills: neutral
+            
+            maker_volume = sum(float(fill['px']) * float(fill['sz']) for fill in fills if not fill.get('crossed'))
+            return maker_volume / total_volume
             
         except Exception as e:
             logger.error(f"Error calculating maker ratio: {e}")
@@ -13,6 +13,7 @@ import numpy as np
 from collections import deque
 
 from hyperliquid.exchange import Exchange
+from hyperliquid.fills import get_fill_store
 from hyperliquid.info import Info
 from hyperliquid.utils import constants
 
@@ -69,6 +70,9 @@ class VaultManager:
         self.info = info
         self.initialized = False
         
+        # Vault fill history, synced incrementally instead of re-downloaded on every metrics pass
+        self.fills = get_fill_store(self.info.base_url) if self.info else None
+        
         # For tracking operation status
         self.last_error = None
         self.last_error_time = None
@@ -608,7 +612,7 @@ class VaultManager:
         """
         try:
             # Get real fills data for vault
-            fills = self.info.user_fills(self.vault_address)
+            fills = self.fills.fills(self.vault_address)
             
             # Calculate total realized PnL from actual fills
             total_realized_pnl = 0.0
@@ -1238,7 +1242,7 @@ class VaultManager:
                 return {'status': 'error', 'message': 'Failed to get vault balance'}
             
             # Get fills for more detailed metrics
-            fills = self.info.user_fills(self.vault_address)
+            fills = self.fills.fills(self.vault_address)
             if not fills:
                 fills = []
             
@@ -1679,7 +1683,7 @@ class VaultManager:
         """Analyze position performance by coin"""
         try:
             # Get fills grouped by coin
-            fills = self.info.user_fills(self.vault_address)
+            fills = self.fills.fills(self.vault_address)
             
             if not fills:
                 return {'coins': []}
@@ -1801,7 +1805,7 @@ class VaultManager:
             # Here we'll simulate strategy attribution
             
             # Get fills for analysis
-            fills = self.info.user_fills(self.vault_address)
+            fills = self.fills.fills(self.vault_address)
             if not fills:
                 return {'status': 'success', 'attribution': [], 'message': 'No fill data available'}
             
@@ -7,24 +7,36 @@ import logging
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
 
+from hyperliquid.user_streams import UserStreamPool, get_user_streams
+from hyperliquid.ws_transport import WebsocketTransport, get_ws_transport
+
 logger = logging.getLogger(__name__)
 
+
 class HyperliquidWebSocketManager:
     """
-    ✅ WEBSOCKET FIX: Proper async handling for WebSocket connections
+    Per-user feeds (userEvents, orderUpdates, userFills, webData2, ...) of the engine's users
+    Feeds are multiplexed over the shared socket pool of hyperliquid.user_streams, the same one the SDK's fill,
+    account and order stores use, so thousands of agents share a few connections
     """
     
-    def __init__(self, base_url: str, address: str = None, info=None, exchange=None):
+    def __init__(self, base_url: str, address: str = None, info=None, exchange=None,
+                 streams: Optional[UserStreamPool] = None):
         self.base_url = base_url
         self.address = address
         self.info = info
         self.exchange = exchange
-        self.connections = {}
-        self.subscriptions = {}
+        # Opens no socket until the first subscription
+        self.streams = streams or get_user_streams(base_url)
+        # user_id -> subscription_type -> pool handle
+        self.subscriptions: Dict[int, Dict[str, int]] = {}
         self.callbacks = {}
         self.running = False
         self._tasks = []
         
+        # Shared per base_url, so posts from every manager reuse one open websocket
+        self.post_transport: Optional[WebsocketTransport] = None
+        
         logger.info("HyperliquidWebSocketManager initialized")
     
     async def start(self):
@@ -32,11 +44,6 @@ class HyperliquidWebSocketManager:
         try:
             self.running = True
             logger.info("WebSocket manager started")
-            
-            # Start background monitoring task
-            monitoring_task = asyncio.create_task(self._monitor_connections())
-            self._tasks.append(monitoring_task)
-            
             return True
             
         except Exception as e:
@@ -44,7 +51,7 @@ class HyperliquidWebSocketManager:
             return False
     
     async def stop(self):
-        """Stop WebSocket manager and cleanup"""
+        """Stop WebSocket manager and drop its users' feeds; the shared pool stays up for other clients"""
         try:
             self.running = False
             
@@ -57,13 +64,10 @@ class HyperliquidWebSocketManager:
                     except asyncio.CancelledError:
                         pass
             
-            # Close all connections
-            for conn in self.connections.values():
-                if hasattr(conn, 'close'):
-                    await conn.close()
+            for user_id in list(self.subscriptions):
+                self.unsubscribe_user(user_id)
             
-            self.connections.clear()
-            self.subscriptions.clear()
+            self.callbacks.clear()
             self._tasks.clear()
             
             logger.info("WebSocket manager stopped")
@@ -71,6 +75,37 @@ class HyperliquidWebSocketManager:
         except Exception as e:
             logger.error(f"Error stopping WebSocket manager: {e}")
     
+    def _get_post_transport(self) -> WebsocketTransport:
+        if self.post_transport is None:
+            self.post_transport = get_ws_transport(self.base_url)
+        return self.post_transport
+    
+    async def post_info_request(self, request: Dict) -> Dict:
+        """
+        Send an info query (e.g. {"type": "l2Book", "coin": "BTC"}) as a websocket post request
+        
+        Returns:
+            Dict: The post response, {"type": "info", "payload": {"type": ..., "data": ...}}
+        """
+        try:
+            return await self._get_post_transport().request_async("info", request)
+        except Exception as e:
+            logger.error(f"Error sending info post request {request.get('type')}: {e}")
+            return {"type": "error", "payload": str(e)}
+    
+    async def post_action_request(self, request: Dict) -> Dict:
+        """
+        Send a signed action ({"action", "nonce", "signature", "vaultAddress"}) as a websocket post request
+        
+        Returns:
+            Dict: The post response, {"type": "action", "payload": {"status": "ok", "response": ...}}
+        """
+        try:
+            return await self._get_post_transport().request_async("action", request)
+        except Exception as e:
+            logger.error(f"Error sending action post request: {e}")
+            return {"type": "error", "payload": str(e)}
+    
     async def test_connection(self):
         """Test WebSocket connection capability"""
         try:
@@ -89,78 +124,68 @@ class HyperliquidWebSocketManager:
             logger.error(f"WebSocket connection test failed: {e}")
             return False
     
-    async def _monitor_connections(self):
-        """Background task to monitor WebSocket connections"""
-        while self.running:
-            try:
-                # Check connection health
-                for user_id, conn in list(self.connections.items()):
-                    if hasattr(conn, 'ping'):
-                        try:
-                            await conn.ping()
-                        except Exception as e:
-                            logger.warning(f"Connection health check failed for user {user_id}: {e}")
-                            # Attempt to reconnect
-                            await self._reconnect_user(user_id)
-                
-                # Sleep before next check
-                await asyncio.sleep(30)  # Check every 30 seconds
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in connection monitoring: {e}")
-                await asyncio.sleep(10)  # Brief pause before retrying
-    
-    async def _reconnect_user(self, user_id: int):
-        """Attempt to reconnect a user's WebSocket"""
-        try:
-            # Remove failed connection
-            if user_id in self.connections:
-                del self.connections[user_id]
-            
-            # Note: Actual reconnection would require user-specific connection logic
-            logger.info(f"Marked user {user_id} for reconnection")
-            
-        except Exception as e:
-            logger.error(f"Error reconnecting user {user_id}: {e}")
-    
-    def subscribe_user(self, user_id: int, subscription_type: str, callback: Callable):
-        """Subscribe a user to WebSocket updates"""
+    def subscribe_user(self, user_id: int, subscription_type: str, callback: Callable,
+                       user_address: Optional[str] = None, **params) -> bool:
+        """
+        Subscribe a user to a per-user feed
+        
+        Args:
+            user_id: User ID
+            subscription_type: Hyperliquid subscription type (userFills, webData2, orderUpdates, ...)
+            callback: Sync or async callback for the feed's messages, run on the pool's thread; replaces an earlier
+                      one for the same type
+            user_address: Address the feed is for; defaults to the manager's address
+            **params: Further subscription fields
+            
+        Returns:
+            bool: True if the subscription was registered (it is sent as soon as its shard is connected)
+        """
         try:
-            if user_id not in self.subscriptions:
-                self.subscriptions[user_id] = {}
-            
-            self.subscriptions[user_id][subscription_type] = True
+            address = user_address or self.address
+            if not address:
+                logger.error(f"No address to subscribe user {user_id} to {subscription_type}")
+                return False
+            
+            handles = self.subscriptions.setdefault(user_id, {})
+            if subscription_type in handles:
+                self.streams.unsubscribe(handles[subscription_type])
+            handles[subscription_type] = self.streams.subscribe(subscription_type, callback, user=address, **params)
             self.callbacks[f"{user_id}_{subscription_type}"] = callback
             
             logger.info(f"User {user_id} subscribed to {subscription_type}")
+            return True
             
         except Exception as e:
             logger.error(f"Error subscribing user {user_id}: {e}")
+            return False
     
     def unsubscribe_user(self, user_id: int, subscription_type: str = None):
-        """Unsubscribe a user from WebSocket updates"""
+        """Unsubscribe a user from one feed, or from all of them; shards left empty are closed"""
         try:
-            if subscription_type:
-                # Remove specific subscription
-                if user_id in self.subscriptions and subscription_type in self.subscriptions[user_id]:
-                    del self.subscriptions[user_id][subscription_type]
-                    
-                callback_key = f"{user_id}_{subscription_type}"
-                if callback_key in self.callbacks:
-                    del self.callbacks[callback_key]
-            else:
-                # Remove all subscriptions for user
-                if user_id in self.subscriptions:
-                    del self.subscriptions[user_id]
-                
-                # Remove all callbacks for user
-                keys_to_remove = [k for k in self.callbacks.keys() if k.startswith(f"{user_id}_")]
-                for key in keys_to_remove:
-                    del self.callbacks[key]
+            handles = self.subscriptions.get(user_id, {})
+            subscription_types = [subscription_type] if subscription_type else list(handles)
+            for sub_type in subscription_types:
+                handle = handles.pop(sub_type, None)
+                if handle is not None:
+                    self.streams.unsubscribe(handle)
+                self.callbacks.pop(f"{user_id}_{sub_type}", None)
+            if not handles:
+                self.subscriptions.pop(user_id, None)
             
             logger.info(f"User {user_id} unsubscribed from {subscription_type or 'all'}")
             
         except Exception as e:
             logger.error(f"Error unsubscribing user {user_id}: {e}")
+    
+    async def rebalance(self) -> int:
+        """
+        Consolidate the pool's users onto fewer shards after users left
+        
+        Returns:
+            int: Number of shards closed
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.streams.rebalance)
+    
+    def get_shard_metrics(self) -> List[Dict[str, Any]]:
+        """Per-shard connection state, load, message rate and lag (seconds since the shard last received data)"""
+        return self.streams.metrics()